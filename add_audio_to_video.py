@@ -10,11 +10,18 @@
 2. audio/ 폴더에 음성 파일을 넣으세요
 3. 이 프로그램을 실행하세요
 
+배치 모드 (질문 없이 작업 파일대로 여러 개를 동시에 처리):
+  python add_audio_to_video.py --batch jobs.json [--workers N] [--report 결과.json]
+
+대화형/배치 모두 작업마다 단계별 시간을 traces/tasks.jsonl에 기록합니다.
+(python task_trace.py summary --workflow audio)
+
 지원 형식:
 - 동영상: MP4, AVI, MOV, MKV
 - 음성: MP3, WAV, AAC, M4A, OGG
 """
 
+import io
 import os
 import sys
 import subprocess
@@ -22,14 +29,21 @@ import shutil
 import time
 import json
 from pathlib import Path
+from datetime import datetime
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 from rich.prompt import Prompt, Confirm
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeElapsedColumn
-from rich.text import Text
 import tempfile
 import re
+import asr_backends
+import encoding_profiles
+import mp4_meta
+import parallel_encoder
+import task_trace
+import transcription_service
+import transcription_cache
 
 # Rich Console 초기화
 console = Console()
@@ -43,6 +57,21 @@ class AudioVideoMerger:
         self.videos_dir = "videos"
         self.audio_dir = "audio"
         self.output_dir = "videos_with_audio"
+        # 음성 인식 설정 (엔진/모델 크기는 config.txt의 asr_backend, asr_model)
+        asr_config = asr_backends.read_asr_config()
+        self.asr_backend = asr_config['backend']
+        self.whisper_model = asr_config['model']
+        self.whisper_language = "ko"
+        # 이 길이(초) 이상인 오디오는 무음 기준으로 나눠 병렬 인식
+        self.chunked_min_duration = 120
+        # 자막 적용 방식: burn (영상에 새김, 재인코딩) / soft (자막 트랙으로 추가, 재인코딩 없음)
+        self.subtitle_mode = "burn"
+        # 재인코딩할 때 사용할 인코딩 프로필 (config.txt의 encode_profile)
+        self.encode_profile = encoding_profiles.get_profile()
+        # 이 길이(초) 이상인 영상을 재인코딩할 때는 키프레임 구간으로 나눠 병렬 인코딩
+        self.parallel_min_duration = 120
+        # 마지막 음성 인식에 걸린 시간 (초, 캐시에서 가져왔으면 None) → 작업 기록의 transcribe 단계
+        self.last_transcription_elapsed = None
         
         # 필요한 폴더 생성
         self.create_directories()
@@ -66,12 +95,8 @@ class AudioVideoMerger:
             return False
     
     def check_whisper(self) -> bool:
-        """Whisper 설치 확인"""
-        try:
-            import whisper
-            return True
-        except ImportError:
-            return False
+        """설정된 음성 인식 엔진 설치 확인 (패키지 존재만 확인하고 torch는 불러오지 않음)"""
+        return transcription_service.is_available(self.asr_backend)
     
     def show_ffmpeg_install_guide(self):
         """ffmpeg 설치 안내"""
@@ -91,7 +116,8 @@ class AudioVideoMerger:
         console.print(Panel(
             "[bold yellow]🎤 자막 생성 기능을 사용하려면 Whisper 설치가 필요합니다.[/bold yellow]\n\n"
             "[bold yellow]설치 방법:[/bold yellow]\n"
-            "• pip install openai-whisper\n\n"
+            "• pip install openai-whisper\n"
+            "• pip install faster-whisper  [dim](CPU에서 더 빠른 int8 엔진, config.txt에 asr_backend=faster-whisper)[/dim]\n\n"
             "[bold cyan]💡 Whisper 없이도 기본 음성 합치기 기능은 사용 가능합니다.[/bold cyan]",
             title="[bold yellow]Whisper 권장[/bold yellow]",
             border_style="yellow"
@@ -142,11 +168,19 @@ class AudioVideoMerger:
         video_table.add_column("번호", style="cyan", width=6)
         video_table.add_column("파일명", style="white", width=40)
         video_table.add_column("크기", style="green", width=10)
+        video_table.add_column("길이", style="yellow", width=8)
+        video_table.add_column("해상도", style="blue", width=12)
+        
+        # 모든 파일 정보를 한 번에 조회 (MP4는 파일에서 직접 읽고, 나머지만 ffprobe를 동시에 실행)
+        infos = mp4_meta.probe_many([os.path.join(self.videos_dir, file) for file in video_files])
         
         for i, file in enumerate(video_files, 1):
             file_path = os.path.join(self.videos_dir, file)
             file_size = os.path.getsize(file_path) / (1024 * 1024)  # MB
-            video_table.add_row(str(i), file, f"{file_size:.1f}MB")
+            info = infos.get(file_path)
+            duration = f"{info['duration']:.1f}초" if info else "-"
+            resolution = f"{info['video']['width']}x{info['video']['height']}" if info and info['video'] else "-"
+            video_table.add_row(str(i), file, f"{file_size:.1f}MB", duration, resolution)
         
         console.print(video_table)
         console.print()
@@ -183,11 +217,15 @@ class AudioVideoMerger:
         audio_table.add_column("번호", style="cyan", width=6)
         audio_table.add_column("파일명", style="white", width=40)
         audio_table.add_column("크기", style="green", width=10)
+        audio_table.add_column("길이", style="yellow", width=8)
+        
+        infos = mp4_meta.probe_many([os.path.join(self.audio_dir, file) for file in audio_files])
         
         for i, file in enumerate(audio_files, 1):
             file_path = os.path.join(self.audio_dir, file)
             file_size = os.path.getsize(file_path) / (1024 * 1024)  # MB
-            audio_table.add_row(str(i), file, f"{file_size:.1f}MB")
+            info = infos.get(file_path)
+            audio_table.add_row(str(i), file, f"{file_size:.1f}MB", f"{info['duration']:.1f}초" if info else "-")
         
         console.print(audio_table)
         console.print()
@@ -207,43 +245,97 @@ class AudioVideoMerger:
                 return None
     
     def get_media_duration(self, file_path: str) -> float:
-        """미디어 파일의 길이 가져오기 (초 단위)"""
-        try:
-            result = subprocess.run([
-                "ffprobe", "-v", "quiet", "-print_format", "json", "-show_entries",
-                "format=duration", file_path
-            ], capture_output=True, text=True, check=True)
-            
-            data = json.loads(result.stdout)
-            return float(data["format"]["duration"])
-        except:
-            return 0.0
+        """미디어 파일의 길이 가져오기 (초 단위, MP4는 파일에서 직접 읽고 나머지는 캐시된 ffprobe 결과)"""
+        return mp4_meta.get_duration(file_path)
     
     def transcribe_audio(self, audio_path: str) -> dict:
         """오디오 파일에서 텍스트 추출"""
+        # 같은 오디오를 이전에 인식했다면 캐시된 결과를 바로 사용
+        cached = transcription_cache.get(audio_path, self.whisper_model, self.whisper_language, self.asr_backend)
+        if cached:
+            console.print(f"[bold green]✅ 캐시된 음성 인식 결과 사용: {len(cached['segments'])}개 세그먼트[/bold green]")
+            return cached
+        
         if not self.whisper_available:
             console.print("[bold red]❌ Whisper가 설치되지 않아 자막 생성을 건너뜁니다.[/bold red]")
             return None
             
         try:
-            import whisper
-            
             console.print("[bold yellow]🎤 음성 인식 시작...[/bold yellow]")
             
-            # Whisper 모델 로드 (base 모델 사용)
-            model = whisper.load_model("base")
+            if transcription_service.worker_status():
+                console.print("[dim]상주 워커의 Whisper 모델을 사용합니다.[/dim]")
+            elif not transcription_service.is_model_loaded(self.whisper_model, self.asr_backend):
+                console.print(f"[dim]{self.asr_backend} '{self.whisper_model}' 모델을 로드하는 중... (프로세스당 한 번)[/dim]")
+            
+            audio_duration = self.get_media_duration(audio_path)
+            start_time = time.time()
             
-            # 음성 인식 수행
-            result = model.transcribe(audio_path, language="ko")
+            # 긴 오디오는 무음 구간에서 나눠 여러 프로세스로 병렬 인식
+            chunked = audio_duration >= self.chunked_min_duration
+            if chunked:
+                console.print(f"[dim]긴 오디오({audio_duration:.0f}초)를 나눠서 병렬로 인식합니다.[/dim]")
             
-            console.print(f"[bold green]✅ 음성 인식 완료: {len(result['segments'])}개 세그먼트[/bold green]")
+            # 음성 인식 수행 (모델은 프로세스/워커에서 재사용)
+            result = transcription_service.transcribe(audio_path, model_name=self.whisper_model,
+                                                      language=self.whisper_language, backend=self.asr_backend,
+                                                      chunked=chunked)
             
-            return result
+            return self.finish_transcription(audio_path, result, time.time() - start_time, audio_duration)
             
         except Exception as e:
             console.print(f"[bold red]❌ 음성 인식 오류: {str(e)}[/bold red]")
             return None
     
+    def finish_transcription(self, audio_path: str, result: dict, elapsed: float, audio_duration: float) -> dict:
+        """음성 인식 결과 출력 및 캐시 저장"""
+        self.last_transcription_elapsed = elapsed
+        if 'stats' in result:
+            console.print(f"[dim]청크 {result['stats']['chunks']}개 × 워커 {result['stats']['workers']}개[/dim]")
+        console.print(f"[bold green]✅ 음성 인식 완료: {len(result['segments'])}개 세그먼트[/bold green]")
+        if audio_duration > 0:
+            console.print(f"[dim]⏱️  {elapsed:.1f}초 소요 (실시간 배율 RTF {elapsed / audio_duration:.2f})[/dim]")
+        
+        # 다음 실행에서 재사용할 수 있도록 캐시에 저장
+        transcription_cache.put(audio_path, self.whisper_model, self.whisper_language, result, self.asr_backend)
+        
+        return result
+    
+    def start_transcription(self, audio_path: str):
+        """음성 인식을 별도 프로세스에서 미리 시작 (캐시에 있거나 Whisper가 없으면 None)
+        
+        음성 파일만 있으면 되므로 동영상 합치기와 동시에 진행할 수 있습니다.
+        """
+        if not self.whisper_available:
+            return None
+        if transcription_cache.get(audio_path, self.whisper_model, self.whisper_language, self.asr_backend):
+            return None
+        
+        chunked = self.get_media_duration(audio_path) >= self.chunked_min_duration
+        job = transcription_service.BackgroundTranscription(
+            audio_path, self.whisper_model, self.whisper_language, self.asr_backend, chunked
+        )
+        console.print("[dim]🎤 음성 인식을 백그라운드에서 시작했습니다.[/dim]")
+        return job
+    
+    def wait_for_transcription(self, job, audio_path: str) -> dict:
+        """백그라운드 음성 인식 결과 기다리기 (작업이 없으면 바로 인식)"""
+        if job is None:
+            return self.transcribe_audio(audio_path)
+        
+        if job.done():
+            outcome = job.result()
+        else:
+            with console.status("[bold yellow]🎤 음성 인식이 끝나기를 기다리는 중...[/bold yellow]"):
+                outcome = job.result()
+        
+        if 'error' in outcome:
+            console.print(f"[bold red]❌ 음성 인식 오류: {outcome['error']}[/bold red]")
+            return None
+        
+        return self.finish_transcription(audio_path, outcome['result'], outcome['elapsed'],
+                                         self.get_media_duration(audio_path))
+    
     def create_subtitle_file(self, transcription: dict, subtitle_path: str) -> bool:
         """자막 파일 생성 (SRT 형식)"""
         try:
@@ -278,25 +370,36 @@ class AudioVideoMerger:
         seconds = seconds % 60
         return f"{hours:02d}:{minutes:02d}:{seconds:06.3f}".replace('.', ',')
     
-    def add_subtitles_to_video(self, video_path: str, subtitle_path: str, output_path: str) -> bool:
-        """동영상에 자막 추가"""
+    def add_subtitles_to_video(self, video_path: str, subtitle_path: str, output_path: str, mode: str = None) -> bool:
+        """동영상에 자막 추가
+
+        mode가 "soft"이면 자막을 mov_text 트랙으로 넣고 영상/음성은 복사만 하므로 1초 안에 끝납니다.
+        "burn"이면 자막을 영상에 직접 새기기 때문에 전체를 재인코딩합니다 (자막 트랙을 지원하지 않는 플랫폼용).
+        """
+        if (mode or self.subtitle_mode) == "soft":
+            return self.mux_soft_subtitles(video_path, subtitle_path, output_path)
+
         try:
-            # 경로에서 특수 문자 이스케이프 처리
-            escaped_subtitle_path = subtitle_path.replace('\\', '/').replace(':', '\\:')
-            
-            # 자막 필터 명령어 구성
-            subtitle_filter = f"subtitles='{escaped_subtitle_path}':force_style='FontName=NanumGothic,FontSize=24,PrimaryColour=&H00FFFFFF,OutlineColour=&H00000000,BackColour=&HFF000000,BorderStyle=1,Outline=2,Shadow=0,MarginV=20'"
-            
-            cmd = [
-                "ffmpeg", "-i", video_path,
-                "-vf", subtitle_filter,
-                "-c:v", "libx264",  # 비디오 재인코딩 필요
-                "-preset", "fast",
-                "-c:a", "copy",
-                "-y", output_path
-            ]
-            
-            console.print("[bold yellow]🎬 자막 추가 중...[/bold yellow]")
+            # 자막 필터 명령어 구성 (프로필에 해상도 축소가 있으면 자막을 새긴 뒤 축소)
+            video_filters = [self.build_subtitle_filter(subtitle_path)]
+            profile_scale = encoding_profiles.scale_filter(self.encode_profile)
+            if profile_scale:
+                video_filters.append(profile_scale)
+            
+            # 긴 영상은 구간 병렬 인코딩 (음성은 원본 그대로 복사)
+            if self.should_encode_parallel(self.get_media_duration(video_path)):
+                if self.encode_video_parallel(video_path, output_path, ",".join(video_filters)):
+                    console.print("[bold green]✅ 자막 추가 완료[/bold green]")
+                    return True
+                console.print("[bold yellow]⚠️ 병렬 인코딩에 실패해 ffmpeg 하나로 다시 인코딩합니다.[/bold yellow]")
+            
+            cmd = (
+                ["ffmpeg", "-i", video_path, "-vf", ",".join(video_filters)]
+                + encoding_profiles.video_args(self.encode_profile)  # 비디오 재인코딩 필요
+                + ["-c:a", "copy", "-y", output_path]
+            )
+            
+            console.print(f"[bold yellow]🎬 자막 추가 중... (인코딩 프로필: {self.encode_profile['name']})[/bold yellow]")
             console.print(f"[dim]자막 파일: {subtitle_path}[/dim]")
             
             # Progress 표시와 함께 실행
@@ -338,6 +441,90 @@ class AudioVideoMerger:
             console.print(f"[bold red]❌ 자막 추가 오류: {str(e)}[/bold red]")
             return False
     
+    def build_subtitle_filter(self, subtitle_path: str) -> str:
+        """자막을 영상에 새기는 subtitles 필터"""
+        # 경로에서 특수 문자 이스케이프 처리
+        escaped_subtitle_path = subtitle_path.replace('\\', '/').replace(':', '\\:')
+        return f"subtitles='{escaped_subtitle_path}':force_style='FontName=NanumGothic,FontSize=24,PrimaryColour=&H00FFFFFF,OutlineColour=&H00000000,BackColour=&HFF000000,BorderStyle=1,Outline=2,Shadow=0,MarginV=20'"
+    
+    def should_encode_parallel(self, video_duration: float) -> bool:
+        """구간 병렬 인코딩을 사용할지 결정 (긴 영상이고 동시에 돌릴 코어가 있을 때)"""
+        return video_duration >= self.parallel_min_duration and parallel_encoder.default_workers() > 1
+    
+    def encode_video_parallel(self, video_path: str, output_path: str, video_filter: str) -> bool:
+        """영상을 키프레임 구간으로 나눠 병렬 재인코딩 (음성은 원본에서 복사)"""
+        workers = parallel_encoder.default_workers()
+        with console.status(f"[bold yellow]⚡ 구간 병렬 인코딩 중... (ffmpeg {workers}개 동시 실행)[/bold yellow]"):
+            result = parallel_encoder.encode_parallel(
+                video_path, output_path, video_filter,
+                encoding_profiles.video_args(self.encode_profile), workers
+            )
+        
+        if result['ok']:
+            console.print(f"[dim]⚡ {result['segments']}개 구간을 병렬 인코딩했습니다 ({result['elapsed']:.1f}초)[/dim]")
+            return True
+        console.print(f"[bold red]❌ 병렬 인코딩 오류:[/bold red] {result['error']}")
+        return False
+    
+    def mux_soft_subtitles(self, video_path: str, subtitle_path: str, output_path: str) -> bool:
+        """자막을 mov_text 트랙으로 추가 (영상/음성은 스트림 복사)"""
+        cmd = [
+            "ffmpeg", "-i", video_path, "-i", subtitle_path,
+            "-map", "0:v", "-map", "0:a?", "-map", "1:0",
+            "-c:v", "copy", "-c:a", "copy", "-c:s", "mov_text",
+            "-metadata:s:s:0", f"language={self.subtitle_language_code()}",
+            "-disposition:s:0", "default",
+            "-y", output_path
+        ]
+
+        console.print("[bold yellow]🎬 자막 트랙 추가 중... (재인코딩 없음)[/bold yellow]")
+        console.print(f"[dim]자막 파일: {subtitle_path}[/dim]")
+
+        try:
+            result = subprocess.run(cmd, capture_output=True, text=True)
+            if result.returncode == 0:
+                console.print("[bold green]✅ 자막 트랙 추가 완료 (플레이어에서 자막을 켜고 끌 수 있습니다)[/bold green]")
+                return True
+            console.print(f"[bold red]❌ 자막 트랙 추가 실패:[/bold red]\n{result.stderr}")
+            return False
+        except Exception as e:
+            console.print(f"[bold red]❌ 자막 트랙 추가 오류: {str(e)}[/bold red]")
+            return False
+
+    def subtitle_language_code(self) -> str:
+        """자막 트랙 언어 태그 (ISO 639-2)"""
+        codes = {'ko': 'kor', 'en': 'eng', 'ja': 'jpn', 'zh': 'chi'}
+        return codes.get(self.whisper_language, 'und')
+
+    def benchmark_subtitle_modes(self, video_path: str, subtitle_path: str) -> dict:
+        """burn(재인코딩) / soft(자막 트랙) 방식 처리 시간 비교"""
+        results = {}
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for mode in ["soft", "burn"]:
+                output_path = os.path.join(temp_dir, f"bench_{mode}.mp4")
+                start = time.time()
+                ok = self.add_subtitles_to_video(video_path, subtitle_path, output_path, mode=mode)
+                elapsed = time.time() - start
+                results[mode] = {
+                    'ok': ok,
+                    'elapsed': elapsed,
+                    'size_mb': os.path.getsize(output_path) / (1024 * 1024) if ok else 0.0
+                }
+
+        table = Table(title="[bold blue]⏱️ 자막 적용 방식 비교[/bold blue]", show_header=True, header_style="bold magenta")
+        table.add_column("방식", style="cyan")
+        table.add_column("처리 시간", style="green", justify="right")
+        table.add_column("파일 크기", style="yellow", justify="right")
+        for mode, label in [("soft", "soft (자막 트랙)"), ("burn", "burn (영상에 새김)")]:
+            r = results[mode]
+            table.add_row(label, f"{r['elapsed']:.2f}초" if r['ok'] else "실패", f"{r['size_mb']:.1f}MB")
+        console.print(table)
+
+        if results['soft']['ok'] and results['burn']['ok'] and results['soft']['elapsed'] > 0:
+            speedup = results['burn']['elapsed'] / results['soft']['elapsed']
+            console.print(f"[bold cyan]⚡ soft 방식이 {speedup:.0f}배 빠릅니다.[/bold cyan]")
+        return results
+
     def show_subtitle_preview(self, subtitle_path: str) -> None:
         """자막 파일 미리보기"""
         try:
@@ -470,9 +657,124 @@ class AudioVideoMerger:
                 console.print("\n[bold red]❌ 사용자가 취소했습니다.[/bold red]")
                 return None
     
+    def find_title_font(self) -> str:
+        """제목용 한글 폰트 경로 찾기"""
+        # macOS 한글 폰트 경로들
+        korean_fonts = [
+            "/System/Library/Fonts/AppleSDGothicNeo.ttc",  # Apple SD Gothic Neo
+            "/System/Library/Fonts/Supplemental/AppleGothic.ttf",  # Apple Gothic
+            "/Library/Fonts/NanumGothic.ttf",  # 나눔고딕 (설치된 경우)
+            "/System/Library/Fonts/Supplemental/Arial Unicode.ttf",  # Arial Unicode
+        ]
+        
+        # 사용 가능한 첫 번째 폰트 찾기
+        for font in korean_fonts:
+            if os.path.exists(font):
+                return font
+        
+        console.print("[bold yellow]⚠️ 한글 폰트를 찾을 수 없습니다. 기본 폰트를 사용합니다.[/bold yellow]")
+        return "/System/Library/Fonts/Helvetica.ttc"
+    
+    def build_title_filter(self, music_title: str, artist_name: str = None,
+                           title_font_size: int = 64, artist_font_size: int = 36) -> str:
+        """뮤직비디오 스타일 제목/아티스트 drawtext 필터"""
+        # 제목 텍스트 준비
+        title_text = music_title.replace("'", "\\'").replace(":", "\\:")
+        artist_text = artist_name.replace("'", "\\'").replace(":", "\\:") if artist_name else ""
+        
+        # drawtext 필터 구성 - 한글 지원 폰트 사용
+        font_path = self.find_title_font()
+        
+        title_filter = (
+            f"drawtext=text='{title_text}':fontfile='{font_path}':fontsize={title_font_size}:"
+            f"fontcolor=white:borderw=4:bordercolor=black:x=(w-text_w)/2:y=(h/2-text_h)-30:"
+            f"enable='between(t,0.5,5.5)':alpha='if(lt(t,1),t-0.5,if(gt(t,5),1-(t-5)/0.5,1))'"
+        )
+        
+        if not artist_text:
+            return title_filter
+        
+        # 아티스트 이름 추가
+        artist_filter = (
+            f"drawtext=text='{artist_text}':fontfile='{font_path}':fontsize={artist_font_size}:"
+            f"fontcolor=white:borderw=3:bordercolor=black:x=(w-text_w)/2:y=(h/2)+30:"
+            f"enable='between(t,0.5,5.5)':alpha='if(lt(t,1),t-0.5,if(gt(t,5),1-(t-5)/0.5,1))'"
+        )
+        return f"{title_filter},{artist_filter}"
+    
+    def build_merge_command(self, video_path: str, audio_path: str, output_path: str, audio_mode: str = "replace",
+                            music_title: str = None, artist_name: str = None, title_font_size: int = 64,
+                            artist_font_size: int = 36, subtitle_path: str = None, subtitle_mode: str = None,
+                            intermediate_path: str = None) -> list:
+        """음성 합치기 + 제목 + 자막을 하나의 필터 그래프로 묶은 ffmpeg 명령어 구성
+        
+        영상은 [제목 drawtext] → [자막] 순서로 한 번만 디코딩/인코딩합니다.
+        intermediate_path를 주면 자막을 넣기 직전 단계를 split해서 자막 없는 버전도 함께 저장합니다.
+        """
+        subtitle_mode = subtitle_mode or self.subtitle_mode
+        burn_subtitles = bool(subtitle_path) and subtitle_mode == "burn"
+        soft_subtitles = bool(subtitle_path) and subtitle_mode == "soft"
+        
+        cmd = ["ffmpeg", "-y", "-i", video_path, "-i", audio_path]
+        if soft_subtitles:
+            cmd += ["-i", subtitle_path]
+        
+        graph = []
+        
+        # 영상: 제목/자막이 있을 때만 재인코딩, 없으면 스트림 복사
+        title_filter = self.build_title_filter(music_title, artist_name, title_font_size, artist_font_size) if music_title else None
+        subtitle_filter = self.build_subtitle_filter(subtitle_path) if burn_subtitles else None
+        encode_video = bool(title_filter or subtitle_filter)
+        
+        if encode_video:
+            # 프로필에 해상도 축소가 있으면 제목/자막을 원본 크기로 그린 뒤 마지막에 축소
+            profile_scale = encoding_profiles.scale_filter(self.encode_profile)
+            if intermediate_path:
+                graph.append(f"[0:v]{title_filter or 'null'},split=2[vtitle][vbase0]")
+                graph.append(f"[vtitle]{','.join(f for f in (subtitle_filter, profile_scale) if f) or 'null'}[v]")
+                graph.append(f"[vbase0]{profile_scale or 'null'}[vbase]")
+            else:
+                graph.append(f"[0:v]{','.join(f for f in (title_filter, subtitle_filter, profile_scale) if f)}[v]")
+            video_main, video_base = "[v]", "[vbase]"
+            video_codec = encoding_profiles.video_args(self.encode_profile)
+        else:
+            video_main = video_base = "0:v:0"
+            video_codec = ["-c:v", "copy"]
+        
+        # 음성: 대체 또는 믹싱
+        if audio_mode == "mix":
+            # 기존 음성과 믹싱
+            if intermediate_path:
+                graph.append("[0:a][1:a]amix=inputs=2:duration=shortest,asplit=2[a][abase]")
+            else:
+                graph.append("[0:a][1:a]amix=inputs=2:duration=shortest[a]")
+            audio_main, audio_base = "[a]", "[abase]"
+            shortest = []
+        else:
+            # 기존 음성 대체
+            audio_main = audio_base = "1:a:0"
+            shortest = ["-shortest"]
+        
+        if graph:
+            cmd += ["-filter_complex", ";".join(graph)]
+        
+        cmd += ["-map", video_main, "-map", audio_main]
+        if soft_subtitles:
+            cmd += ["-map", "2:0", "-c:s", "mov_text",
+                    "-metadata:s:s:0", f"language={self.subtitle_language_code()}",
+                    "-disposition:s:0", "default"]
+        audio_codec = encoding_profiles.audio_args(self.encode_profile)
+        cmd += video_codec + audio_codec + shortest + [output_path]
+        
+        if intermediate_path:
+            cmd += ["-map", video_base, "-map", audio_base] + video_codec + audio_codec + shortest + [intermediate_path]
+        
+        return cmd
+    
     def merge_audio_video(self, video_path: str, audio_path: str, output_path: str, audio_mode: str = "replace", 
-                          music_title: str = None, artist_name: str = None, title_font_size: int = 64, artist_font_size: int = 36) -> bool:
-        """동영상과 음성 파일 합치기"""
+                          music_title: str = None, artist_name: str = None, title_font_size: int = 64, artist_font_size: int = 36,
+                          subtitle_path: str = None, subtitle_mode: str = None, intermediate_path: str = None) -> bool:
+        """동영상과 음성 파일 합치기 (제목, 자막까지 한 번의 인코딩으로 처리)"""
         try:
             # 파일 길이 확인
             video_duration = self.get_media_duration(video_path)
@@ -481,90 +783,46 @@ class AudioVideoMerger:
             console.print(f"[bold cyan]📹 동영상 길이:[/bold cyan] {video_duration:.1f}초")
             console.print(f"[bold cyan]🎵 음성 길이:[/bold cyan] {audio_duration:.1f}초")
             
-            # ffmpeg 명령어 구성
-            if music_title:
-                # 제목이 있는 경우 drawtext 필터 추가
-                # 제목 텍스트 준비
-                title_text = music_title.replace("'", "\\'").replace(":", "\\:")
-                artist_text = artist_name.replace("'", "\\'").replace(":", "\\:") if artist_name else ""
-                
-                # drawtext 필터 구성 - 한글 지원 폰트 사용
-                # macOS 한글 폰트 경로들
-                korean_fonts = [
-                    "/System/Library/Fonts/AppleSDGothicNeo.ttc",  # Apple SD Gothic Neo
-                    "/System/Library/Fonts/Supplemental/AppleGothic.ttf",  # Apple Gothic
-                    "/Library/Fonts/NanumGothic.ttf",  # 나눔고딕 (설치된 경우)
-                    "/System/Library/Fonts/Supplemental/Arial Unicode.ttf",  # Arial Unicode
+            # 음성 트랙이 없는 동영상은 믹싱할 수 없으므로 대체 모드로 처리
+            video_info = mp4_meta.probe(video_path)
+            if audio_mode == "mix" and video_info and not video_info['has_audio']:
+                console.print("[bold yellow]⚠️ 동영상에 음성 트랙이 없어 믹싱 대신 새 음성으로 대체합니다.[/bold yellow]")
+                audio_mode = "replace"
+            
+            # 긴 영상에 제목/자막을 새길 때는 영상만 먼저 구간 병렬 인코딩한 뒤
+            # 음성 합치기는 영상 스트림 복사로 처리 (자막 없는 버전을 함께 만들 때는 한 번에 처리)
+            subtitle_mode = subtitle_mode or self.subtitle_mode
+            burn_subtitles = bool(subtitle_path) and subtitle_mode == "burn"
+            parallel_video = None
+            if (music_title or burn_subtitles) and not intermediate_path and self.should_encode_parallel(video_duration):
+                video_filters = [
+                    self.build_title_filter(music_title, artist_name, title_font_size, artist_font_size) if music_title else None,
+                    self.build_subtitle_filter(subtitle_path) if burn_subtitles else None,
+                    encoding_profiles.scale_filter(self.encode_profile)
                 ]
-                
-                # 사용 가능한 첫 번째 폰트 찾기
-                font_path = None
-                for font in korean_fonts:
-                    if os.path.exists(font):
-                        font_path = font
-                        break
-                
-                if not font_path:
-                    console.print("[bold yellow]⚠️ 한글 폰트를 찾을 수 없습니다. 기본 폰트를 사용합니다.[/bold yellow]")
-                    font_path = "/System/Library/Fonts/Helvetica.ttc"
-                
-                title_filter = (
-                    f"drawtext=text='{title_text}':fontfile='{font_path}':fontsize={title_font_size}:"
-                    f"fontcolor=white:borderw=4:bordercolor=black:x=(w-text_w)/2:y=(h/2-text_h)-30:"
-                    f"enable='between(t,0.5,5.5)':alpha='if(lt(t,1),t-0.5,if(gt(t,5),1-(t-5)/0.5,1))'"
-                )
-                
-                if artist_text:
-                    # 아티스트 이름 추가
-                    artist_filter = (
-                        f"drawtext=text='{artist_text}':fontfile='{font_path}':fontsize={artist_font_size}:"
-                        f"fontcolor=white:borderw=3:bordercolor=black:x=(w-text_w)/2:y=(h/2)+30:"
-                        f"enable='between(t,0.5,5.5)':alpha='if(lt(t,1),t-0.5,if(gt(t,5),1-(t-5)/0.5,1))'"
-                    )
-                    video_filter = f"{title_filter},{artist_filter}"
-                else:
-                    video_filter = title_filter
-                
-                if audio_mode == "replace":
-                    # 기존 음성 대체 + 제목
-                    cmd = [
-                        "ffmpeg", "-i", video_path, "-i", audio_path,
-                        "-filter_complex", f"[0:v]{video_filter}[v]",
-                        "-map", "[v]", "-map", "1:a:0",
-                        "-c:v", "libx264", "-preset", "fast", "-c:a", "aac",
-                        "-shortest", "-y", output_path
-                    ]
-                else:  # mix
-                    # 기존 음성과 믹싱 + 제목
-                    cmd = [
-                        "ffmpeg", "-i", video_path, "-i", audio_path,
-                        "-filter_complex", 
-                        f"[0:v]{video_filter}[v];[0:a][1:a]amix=inputs=2:duration=shortest[a]",
-                        "-map", "[v]", "-map", "[a]",
-                        "-c:v", "libx264", "-preset", "fast", "-c:a", "aac",
-                        "-y", output_path
-                    ]
+                fd, parallel_video = tempfile.mkstemp(suffix=".mp4", dir=self.output_dir)
+                os.close(fd)
+                if not self.encode_video_parallel(video_path, parallel_video, ",".join(f for f in video_filters if f)):
+                    os.remove(parallel_video)
+                    parallel_video = None
+                    console.print("[bold yellow]⚠️ 병렬 인코딩에 실패해 ffmpeg 하나로 다시 인코딩합니다.[/bold yellow]")
+            
+            # ffmpeg 명령어 구성
+            if parallel_video:
+                cmd = self.build_merge_command(parallel_video, audio_path, output_path, audio_mode,
+                                               subtitle_path=None if burn_subtitles else subtitle_path,
+                                               subtitle_mode=subtitle_mode)
             else:
-                # 제목 없는 경우 (기존 코드)
-                if audio_mode == "replace":
-                    # 기존 음성 대체
-                    cmd = [
-                        "ffmpeg", "-i", video_path, "-i", audio_path,
-                        "-c:v", "copy", "-c:a", "aac", "-map", "0:v:0", "-map", "1:a:0",
-                        "-shortest", "-y", output_path
-                    ]
-                else:  # mix
-                    # 기존 음성과 믹싱
-                    cmd = [
-                        "ffmpeg", "-i", video_path, "-i", audio_path,
-                        "-filter_complex", "[0:a][1:a]amix=inputs=2:duration=shortest[a]",
-                        "-map", "0:v", "-map", "[a]", "-c:v", "copy", "-c:a", "aac",
-                        "-y", output_path
-                    ]
-            
-            console.print(f"[bold yellow]🔄 음성 합치기 시작...[/bold yellow]")
+                cmd = self.build_merge_command(video_path, audio_path, output_path, audio_mode,
+                                               music_title, artist_name, title_font_size, artist_font_size,
+                                               subtitle_path, subtitle_mode, intermediate_path)
+            
+            console.print(f"[bold yellow]🔄 음성 합치기 시작... (인코딩 프로필: {self.encode_profile['name']})[/bold yellow]")
             if music_title:
                 console.print(f"[bold cyan]🎵 제목 추가: {music_title}{' - ' + artist_name if artist_name else ''}[/bold cyan]")
+            if subtitle_path:
+                mode_label = "자막 트랙" if (subtitle_mode or self.subtitle_mode) == "soft" else "영상에 새김"
+                console.print(f"[bold cyan]📝 자막 추가 ({mode_label}): {os.path.basename(subtitle_path)}[/bold cyan]")
             
             # 진행률 표시와 함께 ffmpeg 실행
             with Progress(
@@ -597,9 +855,15 @@ class AudioVideoMerger:
                 stdout, stderr = process.communicate()
                 progress.update(task, completed=100)
                 
+                # 병렬 인코딩한 임시 영상 정리
+                if parallel_video and os.path.exists(parallel_video):
+                    os.remove(parallel_video)
+                
                 if process.returncode == 0:
                     console.print(f"[bold green]✅ 성공적으로 완료되었습니다![/bold green]")
                     console.print(f"[bold cyan]📁 저장 위치:[/bold cyan] {output_path}")
+                    if intermediate_path:
+                        console.print(f"[bold cyan]📁 자막 없는 버전:[/bold cyan] {intermediate_path}")
                     return True
                 else:
                     console.print(f"[bold red]❌ 오류 발생:[/bold red] {stderr}")
@@ -609,6 +873,54 @@ class AudioVideoMerger:
             console.print(f"[bold red]❌ 예외 발생:[/bold red] {str(e)}")
             return False
     
+    
+    def prepare_subtitles(self, transcription: dict, subtitle_filename: str) -> tuple:
+        """인식 결과로 자막 파일을 만들고 미리보기/편집/적용 여부 확인
+        
+        Returns:
+            tuple: (자막 파일 경로 또는 None, 동영상에 적용 여부, 자막 없는 버전 유지 여부)
+        """
+        if not transcription:
+            return None, False, False
+        
+        # 자막 파일 생성
+        subtitle_path = os.path.join(self.output_dir, subtitle_filename)
+        if not self.create_subtitle_file(transcription, subtitle_path):
+            return None, False, False
+        
+        # 자막 미리보기 표시
+        self.show_subtitle_preview(subtitle_path)
+        
+        # 자막 파일 경로 안내
+        console.print(f"\n[bold cyan]📁 자막 파일 위치:[/bold cyan] {subtitle_path}")
+        console.print("[dim]자막 파일을 외부 편집기로 수정할 수 있습니다.[/dim]\n")
+        
+        # 자막 편집 여부 확인
+        if Confirm.ask("[bold yellow]자막을 편집하시겠습니까?[/bold yellow]", default=False):
+            self.edit_subtitle_file(subtitle_path)
+            # 편집 후 다시 미리보기
+            console.print("\n[bold yellow]📝 편집된 자막:[/bold yellow]")
+            self.show_subtitle_preview(subtitle_path)
+        
+        # 외부에서 편집한 자막 파일 사용 옵션
+        if Confirm.ask("\n[bold yellow]외부에서 편집한 자막 파일을 사용하시겠습니까?[/bold yellow]", default=False):
+            # 기존 자막 파일 목록 표시
+            subtitle_files = self.get_subtitle_files()
+            if subtitle_files:
+                selected_subtitle = self.select_subtitle_file(subtitle_files)
+                if selected_subtitle:
+                    subtitle_path = selected_subtitle
+                    console.print(f"[bold green]✅ 선택된 자막 파일: {os.path.basename(subtitle_path)}[/bold green]")
+                    self.show_subtitle_preview(subtitle_path)
+        
+        # 자막 적용 여부 최종 확인
+        if not Confirm.ask("\n[bold yellow]이 자막을 동영상에 적용하시겠습니까?[/bold yellow]", default=True):
+            console.print("[bold cyan]자막 적용을 건너뛰었습니다. 자막 파일은 별도로 저장되었습니다.[/bold cyan]")
+            return subtitle_path, False, False
+        
+        keep_intermediate = Confirm.ask("[bold yellow]자막 없는 버전도 따로 저장하시겠습니까?[/bold yellow]", default=False)
+        return subtitle_path, True, keep_intermediate
+    
     def run(self):
         """메인 실행 함수"""
         console.print(Panel(
@@ -640,6 +952,9 @@ class AudioVideoMerger:
         if not audio_path:
             return
         
+        # 음성 인식은 음성 파일만 있으면 되므로 지금 바로 백그라운드에서 시작
+        transcription_job = self.start_transcription(audio_path)
+        
         # 음성 모드 선택
         console.print("\n[bold yellow]🎛️ 음성 처리 모드 선택:[/bold yellow]")
         audio_mode = Prompt.ask(
@@ -662,6 +977,15 @@ class AudioVideoMerger:
         
         if self.whisper_available:
             add_subtitles = Confirm.ask("\n[bold yellow]🎤 음성에서 자막을 생성하시겠습니까?[/bold yellow]", default=False)
+            if add_subtitles:
+                console.print("\n[bold yellow]🎬 자막 적용 방식 선택:[/bold yellow]")
+                console.print("• [cyan]soft[/cyan]: 자막 트랙으로 추가 (1초 이내, 플레이어에서 켜고 끄기, 음성 합치기와 인식을 동시에 진행)")
+                console.print("• [cyan]burn[/cyan]: 영상에 직접 새김 (재인코딩, 자막 트랙을 지원하지 않는 SNS 업로드용)")
+                self.subtitle_mode = Prompt.ask("자막 방식", choices=["soft", "burn"], default=self.subtitle_mode)
+            elif transcription_job:
+                # 자막이 필요 없으면 미리 시작한 인식 중단
+                transcription_job.cancel()
+                transcription_job = None
             
             # 뮤직비디오 스타일 제목 추가 옵션 (자막과 별개로 물어봄)
             if Confirm.ask("\n[bold yellow]🎵 뮤직비디오 스타일 제목을 추가하시겠습니까?[/bold yellow]", default=False):
@@ -696,6 +1020,15 @@ class AudioVideoMerger:
         else:
             self.show_whisper_install_guide()
         
+        # 제목이나 자막을 영상에 새기면 재인코딩하므로 인코딩 프로필 선택
+        if music_title or (add_subtitles and self.subtitle_mode == "burn"):
+            profiles = encoding_profiles.load_profiles()
+            console.print("\n[bold yellow]🎞️ 인코딩 프로필 선택:[/bold yellow]")
+            for name, profile in profiles.items():
+                console.print(f"• [cyan]{name}[/cyan]: {profile['description']} (preset {profile['preset']}, CRF {profile['crf']})")
+            profile_name = Prompt.ask("인코딩 프로필", choices=list(profiles), default=self.encode_profile['name'])
+            self.encode_profile = encoding_profiles.get_profile(profile_name)
+        
         # 출력 파일명 생성
         video_name = Path(video_path).stem
         audio_name = Path(audio_path).stem
@@ -705,71 +1038,71 @@ class AudioVideoMerger:
         
         # 최종 확인
         if not Confirm.ask(f"\n[bold yellow]동영상과 음성을 합치시겠습니까?[/bold yellow]"):
+            if transcription_job:
+                transcription_job.cancel()
             console.print("[bold red]❌ 작업이 취소되었습니다.[/bold red]")
             return
         
-        # 합치기 실행
-        if music_title:
-            success = self.merge_audio_video(video_path, audio_path, output_path, audio_mode, 
-                                           music_title, artist_name, title_font_size, artist_font_size)
-        else:
-            success = self.merge_audio_video(video_path, audio_path, output_path, audio_mode)
-        
-        # 자막 처리
         subtitle_path = None
         final_output_path = output_path
+        started = time.time()
+        timings = {}
+        self.last_transcription_elapsed = None
         
-        if success and add_subtitles:
-            # 음성 인식 및 자막 생성
-            transcription = self.transcribe_audio(audio_path)
+        def timed(stage, func, *args, **kwargs):
+            """단계별 시간 누적 (자막 미리보기/편집처럼 입력을 기다리는 시간은 빼고 기록)"""
+            step = time.time()
+            value = func(*args, **kwargs)
+            timings[stage] = round(timings.get(stage, 0) + time.time() - step, 2)
+            return value
+        
+        if add_subtitles and self.subtitle_mode == "soft":
+            # soft 자막은 스트림 복사로 붙이므로 음성 합치기를 백그라운드 음성 인식과 동시에 진행
+            success = timed('render', self.merge_audio_video, video_path, audio_path, output_path, audio_mode,
+                            music_title, artist_name, title_font_size, artist_font_size)
+            
+            # 둘 중 늦게 끝나는 작업만 기다린 뒤 자막 미리보기/편집
+            transcription = self.wait_for_transcription(transcription_job, audio_path)
+            subtitle_path, apply_subtitles, keep_intermediate = self.prepare_subtitles(
+                transcription, f"{video_name}_with_{audio_name}_{timestamp}.srt")
             
-            if transcription:
-                # 자막 파일 생성
-                subtitle_filename = f"{video_name}_with_{audio_name}_{timestamp}.srt"
-                subtitle_path = os.path.join(self.output_dir, subtitle_filename)
+            if success and apply_subtitles:
+                final_output_filename = f"{video_name}_with_{audio_name}_subtitled_{timestamp}.mp4"
+                final_output_path = os.path.join(self.output_dir, final_output_filename)
                 
-                if self.create_subtitle_file(transcription, subtitle_path):
-                    # 자막 미리보기 표시
-                    self.show_subtitle_preview(subtitle_path)
-                    
-                    # 자막 파일 경로 안내
-                    console.print(f"\n[bold cyan]📁 자막 파일 위치:[/bold cyan] {subtitle_path}")
-                    console.print("[dim]자막 파일을 외부 편집기로 수정할 수 있습니다.[/dim]\n")
-                    
-                    # 자막 편집 여부 확인
-                    if Confirm.ask("[bold yellow]자막을 편집하시겠습니까?[/bold yellow]", default=False):
-                        self.edit_subtitle_file(subtitle_path)
-                        # 편집 후 다시 미리보기
-                        console.print("\n[bold yellow]📝 편집된 자막:[/bold yellow]")
-                        self.show_subtitle_preview(subtitle_path)
-                    
-                    # 외부에서 편집한 자막 파일 사용 옵션
-                    if Confirm.ask("\n[bold yellow]외부에서 편집한 자막 파일을 사용하시겠습니까?[/bold yellow]", default=False):
-                        # 기존 자막 파일 목록 표시
-                        subtitle_files = self.get_subtitle_files()
-                        if subtitle_files:
-                            selected_subtitle = self.select_subtitle_file(subtitle_files)
-                            if selected_subtitle:
-                                subtitle_path = selected_subtitle
-                                console.print(f"[bold green]✅ 선택된 자막 파일: {os.path.basename(subtitle_path)}[/bold green]")
-                                self.show_subtitle_preview(subtitle_path)
-                    
-                    # 자막 적용 여부 최종 확인
-                    if Confirm.ask("\n[bold yellow]이 자막을 동영상에 적용하시겠습니까?[/bold yellow]", default=True):
-                        # 자막이 포함된 최종 동영상 생성
-                        final_output_filename = f"{video_name}_with_{audio_name}_subtitled_{timestamp}.mp4"
-                        final_output_path = os.path.join(self.output_dir, final_output_filename)
-                        
-                        if self.add_subtitles_to_video(output_path, subtitle_path, final_output_path):
-                            # 임시 파일 삭제 (자막 없는 버전)
-                            os.remove(output_path)
-                            success = True
-                        else:
-                            # 자막 추가 실패시 기본 버전 유지
-                            final_output_path = output_path
-                    else:
-                        console.print("[bold cyan]자막 적용을 건너뛰었습니다. 자막 파일은 별도로 저장되었습니다.[/bold cyan]")
-                        final_output_path = output_path
+                if timed('mux', self.mux_soft_subtitles, output_path, subtitle_path, final_output_path):
+                    # 자막 없는 버전은 요청한 경우에만 유지
+                    if not keep_intermediate:
+                        os.remove(output_path)
+                else:
+                    # 자막 추가 실패시 기본 버전 유지
+                    final_output_path = output_path
+        elif add_subtitles:
+            # burn은 음성/제목/자막을 한 번에 인코딩해야 하므로 인식이 끝난 뒤 렌더링
+            # (인식은 음성 파일을 고른 직후부터 옵션을 입력하는 동안 이미 진행됨)
+            transcription = self.wait_for_transcription(transcription_job, audio_path)
+            subtitle_path, apply_subtitles, keep_intermediate = self.prepare_subtitles(
+                transcription, f"{video_name}_with_{audio_name}_{timestamp}.srt")
+            
+            if apply_subtitles:
+                final_output_filename = f"{video_name}_with_{audio_name}_subtitled_{timestamp}.mp4"
+                final_output_path = os.path.join(self.output_dir, final_output_filename)
+                success = timed('render', self.merge_audio_video, video_path, audio_path, final_output_path, audio_mode,
+                                music_title, artist_name, title_font_size, artist_font_size,
+                                subtitle_path=subtitle_path,
+                                intermediate_path=output_path if keep_intermediate else None)
+                if not success:
+                    # 자막 적용 실패시 자막 없는 버전이라도 생성
+                    console.print("[bold yellow]⚠️ 자막 없이 다시 합칩니다.[/bold yellow]")
+                    final_output_path = output_path
+                    success = timed('render', self.merge_audio_video, video_path, audio_path, output_path, audio_mode,
+                                    music_title, artist_name, title_font_size, artist_font_size)
+            else:
+                success = timed('render', self.merge_audio_video, video_path, audio_path, output_path, audio_mode,
+                                music_title, artist_name, title_font_size, artist_font_size)
+        else:
+            success = timed('render', self.merge_audio_video, video_path, audio_path, output_path, audio_mode,
+                            music_title, artist_name, title_font_size, artist_font_size)
         
         if success:
             # 결과 표시
@@ -799,6 +1132,273 @@ class AudioVideoMerger:
                 title="[bold red]실패[/bold red]",
                 border_style="red"
             ))
+        
+        # 배치 작업과 같은 형식으로 단계별 시간 기록 (render에는 mux 시간도 포함)
+        if 'mux' in timings:
+            timings['render'] = round(timings.get('render', 0) + timings['mux'], 2)
+        if self.last_transcription_elapsed is not None:
+            timings['subtitles'] = round(self.last_transcription_elapsed, 2)
+        self.trace_job({
+            'name': Path(final_output_path).stem,
+            'ok': success,
+            'elapsed': round(time.time() - started, 2),
+            'timings': timings,
+            'profile': self.encode_profile['name'],
+            'output': final_output_path if success else None,
+            'size_mb': round(os.path.getsize(final_output_path) / (1024 * 1024), 2) if success else None
+        })
+    
+    def load_batch_jobs(self, jobs_path: str) -> list:
+        """배치 작업 파일 읽기 (defaults 값을 각 작업에 채워 넣음)
+
+        형식: {"defaults": {...}, "jobs": [{"video": ..., "audio": ..., ...}]} 또는 작업 목록만
+        """
+        with open(jobs_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        
+        if isinstance(data, list):
+            data = {'jobs': data}
+        defaults = data.get('defaults', {})
+        
+        jobs = []
+        for i, job in enumerate(data.get('jobs', []), 1):
+            job = dict(defaults, **job)
+            job.setdefault('name', f"job{i:03d}")
+            jobs.append(job)
+        return jobs
+    
+    def validate_batch_job(self, job: dict) -> str:
+        """작업 설정 확인 (문제가 없으면 None, 있으면 오류 메시지)"""
+        for key, folder in (('video', self.videos_dir), ('audio', self.audio_dir)):
+            path = job.get(key)
+            if not path:
+                return f"'{key}' 항목이 없습니다."
+            # 파일 이름만 적으면 videos/, audio/ 폴더에서 찾음
+            if not os.path.exists(path) and os.path.exists(os.path.join(folder, path)):
+                job[key] = os.path.join(folder, path)
+            elif not os.path.exists(path):
+                return f"파일을 찾을 수 없습니다: {path}"
+        
+        if job.get('audio_mode', 'replace') not in ("replace", "mix"):
+            return f"알 수 없는 음성 처리 방식: {job['audio_mode']} (replace, mix)"
+        if job.get('subtitles', 'none') not in ("none", "soft", "burn"):
+            return f"알 수 없는 자막 방식: {job['subtitles']} (none, soft, burn)"
+        if job.get('subtitle_file') and not os.path.exists(job['subtitle_file']):
+            return f"자막 파일을 찾을 수 없습니다: {job['subtitle_file']}"
+        if job.get('profile') and job['profile'] not in encoding_profiles.load_profiles():
+            return f"알 수 없는 인코딩 프로필: {job['profile']}"
+        return None
+    
+    def run_job(self, job: dict) -> dict:
+        """작업 하나를 질문 없이 처리 (배치 모드)
+        
+        Returns:
+            dict: {'name', 'ok', 'output', 'subtitle', 'elapsed', 'timings', 'error'}
+        """
+        started = time.time()
+        timings = {}
+        report = {'name': job['name'], 'video': job['video'], 'audio': job['audio'],
+                  'ok': False, 'output': None, 'subtitle': None}
+        
+        if job.get('profile'):
+            self.encode_profile = encoding_profiles.get_profile(job['profile'])
+        report['profile'] = self.encode_profile['name']
+        
+        video_path = job['video']
+        audio_path = job['audio']
+        audio_mode = job.get('audio_mode', 'replace')
+        subtitle_mode = job.get('subtitles', 'none')
+        music_title = job.get('title') or None
+        artist_name = job.get('artist') or None
+        title_font_size = int(job.get('title_font_size', 64))
+        artist_font_size = int(job.get('artist_font_size', 36))
+        
+        base_name = Path(job['output']).stem if job.get('output') else \
+            f"{Path(video_path).stem}_with_{Path(audio_path).stem}_{job['name']}_{int(started)}"
+        output_path = os.path.join(self.output_dir, f"{base_name}.mp4")
+        
+        # 자막 준비 (작업 파일에 자막이 있으면 그대로, 없으면 음성 인식 결과로 생성)
+        subtitle_path = None
+        if subtitle_mode != "none":
+            step = time.time()
+            if job.get('subtitle_file'):
+                subtitle_path = job['subtitle_file']
+            else:
+                transcription = self.transcribe_audio(audio_path)
+                candidate = os.path.join(self.output_dir, f"{base_name}.srt")
+                if transcription and self.create_subtitle_file(transcription, candidate):
+                    subtitle_path = candidate
+            timings['subtitles'] = round(time.time() - step, 2)
+            if not subtitle_path:
+                report['error'] = "자막을 만들지 못했습니다."
+                report['elapsed'] = round(time.time() - started, 2)
+                return report
+            report['subtitle'] = subtitle_path
+        
+        step = time.time()
+        title_args = (music_title, artist_name, title_font_size, artist_font_size)
+        final_output_path = output_path
+        if subtitle_path:
+            final_output_path = os.path.join(self.output_dir, f"{base_name}_subtitled.mp4")
+            keep_intermediate = bool(job.get('keep_unsubtitled'))
+            if subtitle_mode == "soft":
+                # 합친 뒤 자막 트랙만 스트림 복사로 추가
+                success = self.merge_audio_video(video_path, audio_path, output_path, audio_mode, *title_args)
+                if success:
+                    step_mux = time.time()
+                    success = self.mux_soft_subtitles(output_path, subtitle_path, final_output_path)
+                    timings['mux'] = round(time.time() - step_mux, 2)
+                    if success and not keep_intermediate:
+                        os.remove(output_path)
+            else:
+                success = self.merge_audio_video(video_path, audio_path, final_output_path, audio_mode, *title_args,
+                                                 subtitle_path=subtitle_path, subtitle_mode="burn",
+                                                 intermediate_path=output_path if keep_intermediate else None)
+            if keep_intermediate and success:
+                report['unsubtitled_output'] = output_path
+        else:
+            success = self.merge_audio_video(video_path, audio_path, output_path, audio_mode, *title_args)
+        timings['render'] = round(time.time() - step, 2)
+        
+        report['ok'] = success
+        report['elapsed'] = round(time.time() - started, 2)
+        report['timings'] = timings
+        if success:
+            report['output'] = final_output_path
+            report['size_mb'] = round(os.path.getsize(final_output_path) / (1024 * 1024), 2)
+        else:
+            report['error'] = "ffmpeg 처리에 실패했습니다."
+        return report
+    
+    def run_batch(self, jobs_path: str, workers: int = None, report_path: str = None) -> dict:
+        """작업 파일의 작업들을 프로세스 풀에서 동시에 처리하고 JSON 결과 저장"""
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+
+        if not self.check_ffmpeg():
+            self.show_ffmpeg_install_guide()
+            return None
+        
+        try:
+            jobs = self.load_batch_jobs(jobs_path)
+        except (OSError, ValueError) as e:
+            console.print(f"[bold red]❌ 작업 파일을 읽을 수 없습니다: {e}[/bold red]")
+            return None
+        if not jobs:
+            console.print("[bold red]❌ 작업 파일에 작업이 없습니다.[/bold red]")
+            return None
+        
+        # 작업마다 ffmpeg가 여러 스레드를 쓰므로 코어 수 기준으로 동시 작업 수 제한
+        workers = max(1, min(workers or parallel_encoder.default_workers(), len(jobs)))
+        started = time.time()
+        results = [None] * len(jobs)
+        runnable = []
+        output_names = {}
+        for i, job in enumerate(jobs):
+            error = self.validate_batch_job(job)
+            if not error and job.get('output'):
+                # output은 파일 이름만 사용해 출력 폴더에 저장하므로 이름이 같으면 동시에 같은 파일을 씀
+                stem = Path(job['output']).stem
+                if stem in output_names:
+                    error = f"출력 파일 이름이 '{output_names[stem]}' 작업과 같습니다: {stem}"
+                else:
+                    output_names[stem] = job['name']
+            if error:
+                results[i] = {'name': job['name'], 'ok': False, 'error': error}
+                console.print(f"[bold red]❌ {job['name']}: {error}[/bold red]")
+            else:
+                runnable.append(i)
+        
+        console.print(Panel(
+            f"[bold cyan]작업 {len(jobs)}개[/bold cyan] (실행 {len(runnable)}개) | 동시 실행 {workers}개\n"
+            f"[dim]작업 파일: {jobs_path}[/dim]",
+            title="[bold blue]🎬 배치 모드[/bold blue]",
+            border_style="blue"
+        ))
+        
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # 같은 음성을 쓰는 작업이 많으므로 자막이 필요한 음성은 먼저 한 번씩만 인식해 캐시에 저장
+            pending_audio = sorted({
+                jobs[i]['audio'] for i in runnable
+                if jobs[i].get('subtitles', 'none') != "none" and not jobs[i].get('subtitle_file')
+                and not transcription_cache.get(jobs[i]['audio'], self.whisper_model, self.whisper_language, self.asr_backend)
+            })
+            if pending_audio and self.whisper_available:
+                with console.status(f"[bold yellow]🎤 음성 {len(pending_audio)}개 인식 중...[/bold yellow]"):
+                    for future in as_completed([executor.submit(_batch_transcribe, audio) for audio in pending_audio]):
+                        audio, error = future.result()
+                        if error:
+                            console.print(f"[bold red]❌ 음성 인식 실패 ({os.path.basename(audio)}): {error}[/bold red]")
+            
+            with Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                BarColumn(),
+                TextColumn("{task.completed}/{task.total}"),
+                TimeElapsedColumn(),
+                console=console
+            ) as progress:
+                task = progress.add_task("작업 처리 중...", total=len(runnable))
+                futures = {executor.submit(_batch_run_job, jobs[i]): i for i in runnable}
+                for future in as_completed(futures):
+                    job = jobs[futures[future]]
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        result = {'name': job['name'], 'ok': False, 'error': str(e)}
+                    results[futures[future]] = result
+                    self.trace_job(result)
+                    status = "✅" if result['ok'] else "❌"
+                    detail = os.path.basename(result['output']) if result['ok'] else result.get('error', '')
+                    progress.console.print(f"{status} {job['name']} ({result.get('elapsed', 0):.1f}초) {detail}")
+                    progress.advance(task)
+        
+        succeeded = sum(1 for r in results if r['ok'])
+        elapsed = time.time() - started
+        report = {
+            'created_at': datetime.now().isoformat(timespec='seconds'),
+            'jobs_file': os.path.abspath(jobs_path),
+            'workers': workers,
+            'elapsed': round(elapsed, 2),
+            'succeeded': succeeded,
+            'failed': len(results) - succeeded,
+            'jobs': results
+        }
+        
+        report_path = report_path or os.path.join(
+            self.output_dir, f"batch_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+        with open(report_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        
+        console.print(Panel(
+            f"[bold green]✅ 성공 {succeeded}개[/bold green] / [bold red]❌ 실패 {len(results) - succeeded}개[/bold red]\n"
+            f"[cyan]전체 시간:[/cyan] {elapsed:.1f}초 (작업 시간 합계 {sum(r.get('elapsed', 0) for r in results):.1f}초)\n"
+            f"[cyan]결과 파일:[/cyan] {report_path}",
+            title="[bold green]배치 완료[/bold green]",
+            border_style="green"
+        ))
+        return report
+    
+    def trace_job(self, result: dict):
+        """작업 하나의 단계별 시간 기록 (encode: 오디오 합치기 인코딩, mux: 자막 트랙 추가)"""
+        timings = result.get('timings', {})
+        finished = time.time()
+        elapsed = result.get('elapsed')
+        task_trace.write_record(task_trace.task_record(
+            'audio',
+            {
+                'transcribe': timings.get('subtitles'),
+                'encode': timings['render'] - timings.get('mux', 0) if 'render' in timings else None,
+                'mux': timings.get('mux')
+            },
+            name=result['name'],
+            profile=result.get('profile'),
+            status='completed' if result['ok'] else 'failed',
+            started=round(finished - elapsed, 3) if elapsed is not None else None,
+            finished=round(finished, 3),
+            total=elapsed,
+            output=result.get('output'),
+            size_mb=result.get('size_mb')
+        ))
     
     def show_folder_links(self):
         """폴더 링크 표시"""
@@ -817,10 +1417,66 @@ class AudioVideoMerger:
         ))
         console.print()
 
+# 배치 모드 워커 프로세스 상태 (프로세스마다 한 번 만들어 음성 인식 모델 등을 재사용)
+_batch_merger = None
+
+
+def _get_batch_merger() -> AudioVideoMerger:
+    """워커 프로세스의 AudioVideoMerger (화면 출력은 작업별 로그로 모음)"""
+    global _batch_merger, console
+    console = Console(file=io.StringIO(), width=120)
+    if _batch_merger is None:
+        _batch_merger = AudioVideoMerger()
+        # 작업 단위로 이미 병렬 처리하므로 작업 안에서는 다시 나누지 않음
+        _batch_merger.chunked_min_duration = float('inf')
+        _batch_merger.parallel_min_duration = float('inf')
+    _batch_merger.encode_profile = encoding_profiles.get_profile()
+    return _batch_merger
+
+
+def _batch_transcribe(audio_path: str) -> tuple:
+    """배치 워커: 음성 인식 후 캐시에 저장"""
+    merger = _get_batch_merger()
+    if merger.transcribe_audio(audio_path):
+        return audio_path, None
+    log = console.file.getvalue().strip().splitlines()
+    return audio_path, log[-1] if log else "음성 인식 실패"
+
+
+def _batch_run_job(job: dict) -> dict:
+    """배치 워커: 작업 하나 처리 (실패하면 로그 마지막 부분을 오류로 포함)"""
+    merger = _get_batch_merger()
+    try:
+        result = merger.run_job(job)
+    except Exception as e:
+        result = {'name': job['name'], 'ok': False, 'error': str(e)}
+    if not result['ok']:
+        result['log'] = console.file.getvalue().strip().splitlines()[-10:]
+    return result
+
 def main():
     """메인 함수"""
     try:
         merger = AudioVideoMerger()
+        if len(sys.argv) > 1 and sys.argv[1] == "--batch":
+            args = sys.argv[2:]
+            if not args or args[0].startswith("--"):
+                console.print("[bold yellow]사용법:[/bold yellow] python add_audio_to_video.py --batch <jobs.json> [--workers N] [--report 결과.json]")
+                return
+            options = dict(zip(args[1::2], args[2::2]))
+            try:
+                workers = int(options['--workers']) if '--workers' in options else None
+            except ValueError:
+                console.print("[bold red]❌ --workers 값은 숫자여야 합니다.[/bold red]")
+                return
+            merger.run_batch(args[0], workers, options.get('--report'))
+            return
+        if len(sys.argv) > 1 and sys.argv[1] == "--bench-subtitles":
+            if len(sys.argv) < 4:
+                console.print("[bold yellow]사용법:[/bold yellow] python add_audio_to_video.py --bench-subtitles <동영상> <자막.srt>")
+                return
+            merger.benchmark_subtitle_modes(sys.argv[2], sys.argv[3])
+            return
         merger.run()
     except KeyboardInterrupt:
         console.print("\n[bold red]❌ 사용자가 프로그램을 종료했습니다.[/bold red]")
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+🎙️ 음성 인식 엔진 (ASR Backends)
+================================
+
+음성 인식 엔진을 교체할 수 있도록 공통 인터페이스를 제공합니다.
+
+지원 엔진:
+- whisper:         openai-whisper (PyTorch, CPU에서는 fp32)
+- faster-whisper:  CTranslate2 기반 int8 양자화 엔진 (CPU에서 수 배 빠름)
+
+모델 크기: tiny, base, small, medium, large-v3 (엔진 공통)
+
+config.txt 설정:
+  asr_backend=faster-whisper
+  asr_model=small
+"""
+
+import os
+import threading
+import importlib.util
+from typing import Optional
+
+DEFAULT_BACKEND = "whisper"
+DEFAULT_MODEL = "base"
+MODEL_SIZES = ["tiny", "base", "small", "medium", "large-v3"]
+
+
+class ASRBackend:
+    """음성 인식 엔진 공통 인터페이스
+
+    transcribe()는 Whisper와 같은 형식의 dict를 반환합니다:
+    {'text': str, 'language': str, 'segments': [{'id', 'start', 'end', 'text'}]}
+    """
+
+    name = ""
+    package = ""
+
+    def __init__(self, model_size: str = DEFAULT_MODEL, threads: int = 0):
+        self.model_size = model_size
+        self.threads = threads
+        self.model = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def is_available(cls) -> bool:
+        """엔진 패키지 설치 여부 (패키지를 불러오지 않고 확인)"""
+        return importlib.util.find_spec(cls.package) is not None
+
+    def load(self) -> None:
+        """모델을 처음 사용할 때 한 번만 로드"""
+        with self._lock:
+            if self.model is None:
+                self.model = self._load_model()
+
+    def transcribe(self, audio, language: Optional[str] = "ko", **options) -> dict:
+        """음성 인식 (audio는 파일 경로 또는 16kHz float32 배열)"""
+        self.load()
+        with self._lock:
+            return self._transcribe(audio, language, **options)
+
+    def _load_model(self):
+        raise NotImplementedError
+
+    def _transcribe(self, audio, language: Optional[str], **options) -> dict:
+        raise NotImplementedError
+
+
+class WhisperBackend(ASRBackend):
+    """openai-whisper 엔진 (기존 동작)"""
+
+    name = "whisper"
+    package = "whisper"
+
+    def _load_model(self):
+        import whisper
+        if self.threads:
+            try:
+                import torch
+                torch.set_num_threads(self.threads)
+            except ImportError:
+                pass
+        return whisper.load_model(self.model_size)
+
+    def _transcribe(self, audio, language, **options) -> dict:
+        # CPU에서는 fp16을 지원하지 않으므로 명시적으로 fp32 사용 (경고 메시지 방지)
+        options.setdefault('fp16', False)
+        result = self.model.transcribe(audio, language=language, **options)
+        return _slim_result(result['text'], result.get('language', language), result['segments'])
+
+
+class FasterWhisperBackend(ASRBackend):
+    """faster-whisper 엔진 (CTranslate2 int8 양자화, CPU 전용 설정)"""
+
+    name = "faster-whisper"
+    package = "faster_whisper"
+
+    def _load_model(self):
+        from faster_whisper import WhisperModel
+        return WhisperModel(self.model_size, device="cpu", compute_type="int8",
+                            cpu_threads=self.threads or 0)
+
+    def _transcribe(self, audio, language, **options) -> dict:
+        # openai-whisper 전용 옵션 제거
+        options.pop('fp16', None)
+
+        segments, info = self.model.transcribe(audio, language=language, beam_size=5, **options)
+        # segments는 제너레이터라서 순회할 때 실제 인식이 진행됨
+        segments = [{'start': s.start, 'end': s.end, 'text': s.text} for s in segments]
+        return _slim_result("".join(s['text'] for s in segments), info.language, segments)
+
+
+BACKENDS = {
+    WhisperBackend.name: WhisperBackend,
+    FasterWhisperBackend.name: FasterWhisperBackend,
+}
+
+# 프로세스 전역 엔진 캐시 ((엔진, 모델 크기) → 로드된 엔진)
+_instances = {}
+_instances_lock = threading.Lock()
+
+
+def _slim_result(text: str, language: Optional[str], segments: list) -> dict:
+    """엔진별 결과를 JSON으로 보낼 수 있는 공통 형식으로 변환"""
+    return {
+        'text': str(text),
+        'language': language,
+        'segments': [
+            {'id': i, 'start': float(s['start']), 'end': float(s['end']), 'text': str(s['text'])}
+            for i, s in enumerate(segments)
+        ]
+    }
+
+
+def available_backends() -> list:
+    """설치된 엔진 이름 목록"""
+    return [name for name, backend in BACKENDS.items() if backend.is_available()]
+
+
+def get_backend(name: str = DEFAULT_BACKEND, model_size: str = DEFAULT_MODEL, threads: int = 0) -> ASRBackend:
+    """엔진 인스턴스 반환 (같은 엔진/모델은 프로세스 안에서 재사용)"""
+    if name not in BACKENDS:
+        raise ValueError(f"알 수 없는 음성 인식 엔진: {name} (사용 가능: {', '.join(BACKENDS)})")
+
+    with _instances_lock:
+        key = (name, model_size)
+        backend = _instances.get(key)
+        if backend is None:
+            backend = BACKENDS[name](model_size, threads)
+            _instances[key] = backend
+        return backend
+
+
+def is_loaded(name: str = DEFAULT_BACKEND, model_size: str = DEFAULT_MODEL) -> bool:
+    """엔진 모델이 현재 프로세스에 로드되어 있는지 확인"""
+    backend = _instances.get((name, model_size))
+    return backend is not None and backend.model is not None
+
+
+def loaded_models() -> list:
+    """현재 프로세스에 로드된 '엔진/모델' 목록"""
+    return sorted(f"{name}/{size}" for (name, size), b in _instances.items() if b.model is not None)
+
+
+def read_asr_config(config_path: str = "config.txt") -> dict:
+    """config.txt에서 음성 인식 엔진 설정 읽기"""
+    config = {'backend': DEFAULT_BACKEND, 'model': DEFAULT_MODEL}
+    if not os.path.exists(config_path):
+        return config
+
+    try:
+        with open(config_path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if line and not line.startswith("#") and "=" in line:
+                    key, value = line.split("=", 1)
+                    key = key.strip()
+                    value = value.strip()
+
+                    if key == "asr_backend" and value in BACKENDS:
+                        config['backend'] = value
+                    elif key == "asr_model" and value:
+                        config['model'] = value
+    except OSError:
+        pass
+
+    return config
+
+
+def write_asr_config(backend: str, model_size: str, config_path: str = "config.txt") -> None:
+    """config.txt의 음성 인식 엔진 설정 갱신 (없으면 파일 끝에 추가)"""
+    lines = []
+    if os.path.exists(config_path):
+        with open(config_path, "r", encoding="utf-8") as f:
+            lines = f.readlines()
+
+    values = {'asr_backend': backend, 'asr_model': model_size}
+    updated = []
+    for line in lines:
+        key = line.split("=", 1)[0].strip()
+        if key in values and not line.lstrip().startswith("#"):
+            updated.append(f"{key}={values.pop(key)}\n")
+        else:
+            updated.append(line)
+
+    if values:
+        if updated and not updated[-1].endswith("\n"):
+            updated[-1] += "\n"
+        updated.append("\n# 음성 인식 엔진 (whisper, faster-whisper) 및 모델 크기\n")
+        for key, value in values.items():
+            updated.append(f"{key}={value}\n")
+
+    with open(config_path, "w", encoding="utf-8") as f:
+        f.writelines(updated)
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+📊 음성 인식 엔진 벤치마크 (ASR Benchmark)
+=========================================
+
+로컬 코퍼스(음성 파일 + 정답 SRT)로 엔진/모델 크기별 속도와 정확도를 측정합니다.
+
+- 실시간 배율(RTF): 인식 시간 ÷ 오디오 길이 (모델 로드 시간 제외, 1.0보다 작으면 실시간보다 빠름)
+- 단어 오류율(WER): 정답 자막 대비 (치환 + 삭제 + 삽입) ÷ 정답 단어 수
+
+코퍼스 구성 (asr_corpus 폴더):
+  asr_corpus/song1.mp3
+  asr_corpus/song1.srt     ← 같은 이름의 정답 자막
+
+사용법:
+  python asr_benchmark.py                                   # 설치된 엔진 × tiny/base/small
+  python asr_benchmark.py --models base small medium        # 모델 크기 지정
+  python asr_benchmark.py --target-rtf 0.3                  # 목표 RTF 안에서 가장 정확한 설정 추천
+  python asr_benchmark.py --target-rtf 0.3 --apply          # 추천 설정을 config.txt에 저장
+"""
+
+import os
+import re
+import json
+import time
+import argparse
+from datetime import datetime
+
+import asr_backends
+from chunked_transcription import load_audio, SAMPLE_RATE
+
+CORPUS_DIR = "asr_corpus"
+AUDIO_EXTENSIONS = ['.mp3', '.wav', '.m4a', '.aac', '.flac', '.ogg']
+DEFAULT_MODELS = ["tiny", "base", "small"]
+
+
+def parse_srt(srt_path: str) -> str:
+    """SRT 파일에서 자막 텍스트만 추출"""
+    with open(srt_path, 'r', encoding='utf-8-sig') as f:
+        content = f.read()
+
+    lines = []
+    for line in content.splitlines():
+        line = line.strip()
+        if not line or line.isdigit() or '-->' in line:
+            continue
+        lines.append(line)
+    return " ".join(lines)
+
+
+def normalize_words(text: str) -> list:
+    """WER 비교용 정규화: 소문자, 문장부호 제거, 공백 기준 단어 분리"""
+    text = re.sub(r"[^\w\s']", " ", text.lower())
+    return text.split()
+
+
+def word_error_rate(reference: str, hypothesis: str) -> float:
+    """단어 단위 편집 거리로 WER 계산"""
+    ref = normalize_words(reference)
+    hyp = normalize_words(hypothesis)
+    if not ref:
+        return 0.0 if not hyp else 1.0
+
+    # 한 줄씩만 유지하는 레벤슈타인 거리
+    previous = list(range(len(hyp) + 1))
+    for i, ref_word in enumerate(ref, 1):
+        current = [i] + [0] * len(hyp)
+        for j, hyp_word in enumerate(hyp, 1):
+            current[j] = min(
+                previous[j] + 1,                                # 삭제
+                current[j - 1] + 1,                             # 삽입
+                previous[j - 1] + (ref_word != hyp_word)        # 치환
+            )
+        previous = current
+    return previous[-1] / len(ref)
+
+
+def load_corpus(corpus_dir: str = CORPUS_DIR) -> list:
+    """정답 SRT가 있는 음성 파일 목록"""
+    if not os.path.exists(corpus_dir):
+        return []
+
+    items = []
+    for file in sorted(os.listdir(corpus_dir)):
+        name, ext = os.path.splitext(file)
+        srt_path = os.path.join(corpus_dir, name + ".srt")
+        if ext.lower() in AUDIO_EXTENSIONS and os.path.exists(srt_path):
+            audio_path = os.path.join(corpus_dir, file)
+            items.append({
+                'audio': audio_path,
+                'reference': parse_srt(srt_path),
+                'duration': len(load_audio(audio_path)) / SAMPLE_RATE
+            })
+    return items
+
+
+def benchmark_config(backend_name: str, model_size: str, corpus: list, language: str, threads: int) -> dict:
+    """엔진/모델 하나로 코퍼스 전체를 인식하고 RTF, WER 측정"""
+    backend = asr_backends.BACKENDS[backend_name](model_size, threads)
+
+    start = time.time()
+    backend.load()
+    load_time = time.time() - start
+
+    total_audio = 0.0
+    total_elapsed = 0.0
+    total_errors = 0.0
+    total_words = 0
+    files = []
+
+    for item in corpus:
+        start = time.time()
+        result = backend.transcribe(item['audio'], language)
+        elapsed = time.time() - start
+
+        wer = word_error_rate(item['reference'], result['text'])
+        words = len(normalize_words(item['reference']))
+
+        total_audio += item['duration']
+        total_elapsed += elapsed
+        total_errors += wer * words
+        total_words += words
+        files.append({
+            'audio': os.path.basename(item['audio']),
+            'duration': round(item['duration'], 2),
+            'elapsed': round(elapsed, 2),
+            'rtf': round(elapsed / item['duration'], 3) if item['duration'] else 0.0,
+            'wer': round(wer, 4)
+        })
+
+    return {
+        'backend': backend_name,
+        'model': model_size,
+        'load_time': round(load_time, 2),
+        'rtf': round(total_elapsed / total_audio, 3) if total_audio else 0.0,
+        'wer': round(total_errors / total_words, 4) if total_words else 0.0,
+        'files': files
+    }
+
+
+def pick_config(results: list, target_rtf: float):
+    """목표 RTF를 만족하는 설정 중 WER이 가장 낮은 설정 (없으면 None)"""
+    candidates = [r for r in results if 'error' not in r and r['rtf'] <= target_rtf]
+    if not candidates:
+        return None
+    return min(candidates, key=lambda r: (r['wer'], r['rtf']))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="음성 인식 엔진 속도/정확도 벤치마크")
+    parser.add_argument("--corpus", default=CORPUS_DIR, help=f"코퍼스 폴더 (기본: {CORPUS_DIR})")
+    parser.add_argument("--backends", nargs="+", help="측정할 엔진 (기본: 설치된 엔진 전체)")
+    parser.add_argument("--models", nargs="+", default=DEFAULT_MODELS, help="측정할 모델 크기")
+    parser.add_argument("--language", default="ko", help="인식 언어 (기본: ko)")
+    parser.add_argument("--threads", type=int, default=0, help="엔진 CPU 스레드 수 (기본: 자동)")
+    parser.add_argument("--target-rtf", type=float, help="목표 실시간 배율 (예: 0.3)")
+    parser.add_argument("--apply", action="store_true", help="추천 설정을 config.txt에 저장")
+    parser.add_argument("--output", help="결과 JSON 파일 (기본: asr_benchmark_YYYYMMDD_HHMMSS.json)")
+    args = parser.parse_args()
+
+    backends = args.backends or asr_backends.available_backends()
+    missing = [b for b in backends if b not in asr_backends.BACKENDS or not asr_backends.BACKENDS[b].is_available()]
+    if missing:
+        print(f"❌ 설치되지 않았거나 알 수 없는 엔진: {', '.join(missing)}")
+        return
+    if not backends:
+        print("❌ 설치된 음성 인식 엔진이 없습니다. (pip install openai-whisper 또는 faster-whisper)")
+        return
+
+    corpus = load_corpus(args.corpus)
+    if not corpus:
+        print(f"❌ '{args.corpus}' 폴더에 정답 SRT가 있는 음성 파일이 없습니다.")
+        print("💡 song1.mp3 와 song1.srt 처럼 같은 이름으로 넣어주세요.")
+        return
+
+    total_audio = sum(item['duration'] for item in corpus)
+    print(f"📊 코퍼스: {len(corpus)}개 파일 ({total_audio:.1f}초)")
+    print(f"🎙️  엔진: {', '.join(backends)} | 모델: {', '.join(args.models)}")
+    print()
+
+    results = []
+    for backend_name in backends:
+        for model_size in args.models:
+            print(f"⏳ {backend_name}/{model_size} 측정 중...")
+            try:
+                result = benchmark_config(backend_name, model_size, corpus, args.language, args.threads)
+                print(f"   로드 {result['load_time']:.1f}초 | RTF {result['rtf']:.3f} | WER {result['wer'] * 100:.1f}%")
+            except Exception as e:
+                result = {'backend': backend_name, 'model': model_size, 'error': str(e)}
+                print(f"   ❌ 실패: {e}")
+            results.append(result)
+
+    print()
+    print(f"{'엔진':<16}{'모델':<10}{'RTF':>8}{'WER':>9}{'로드':>8}")
+    for r in results:
+        if 'error' in r:
+            print(f"{r['backend']:<16}{r['model']:<10}{'실패':>8}")
+        else:
+            print(f"{r['backend']:<16}{r['model']:<10}{r['rtf']:>8.3f}{r['wer'] * 100:>8.1f}%{r['load_time']:>7.1f}s")
+
+    report = {
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'corpus': os.path.abspath(args.corpus),
+        'files': len(corpus),
+        'audio_duration': round(total_audio, 2),
+        'language': args.language,
+        'threads': args.threads,
+        'results': results
+    }
+
+    if args.target_rtf is not None:
+        best = pick_config(results, args.target_rtf)
+        print()
+        if best:
+            print(f"✅ 목표 RTF {args.target_rtf} 이하에서 가장 정확한 설정: "
+                  f"{best['backend']}/{best['model']} (RTF {best['rtf']:.3f}, WER {best['wer'] * 100:.1f}%)")
+            report['recommended'] = {'backend': best['backend'], 'model': best['model']}
+            if args.apply:
+                asr_backends.write_asr_config(best['backend'], best['model'])
+                print("💾 config.txt에 asr_backend, asr_model을 저장했습니다.")
+        else:
+            print(f"⚠️  목표 RTF {args.target_rtf}를 만족하는 설정이 없습니다.")
+
+    output = args.output or f"asr_benchmark_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"📁 결과 저장: {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+🎤 분할 병렬 음성 인식 (Chunked Transcription)
+=============================================
+
+긴 노래나 나레이션을 무음 구간에서 나눈 뒤 여러 프로세스에서 동시에 인식하고,
+전체 시간 기준으로 타임스탬프를 맞춰 다시 이어 붙입니다.
+
+- 무음 검출: 프레임 에너지(RMS dB) 기반의 빠른 VAD
+- 병렬 처리: 워커 프로세스마다 지정한 스레드 수로 Whisper 실행
+- 이어 붙이기: 청크 경계에서 중복된 세그먼트/단어 제거
+- 실시간 배율(RTF): 처리 시간 ÷ 오디오 길이 (1.0보다 작으면 실시간보다 빠름)
+
+사용법:
+  python chunked_transcription.py <음성파일> [워커수] [워커당스레드수]
+"""
+
+import os
+import sys
+import time
+import subprocess
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+import numpy as np
+
+import asr_backends
+import transcription_service
+
+SAMPLE_RATE = 16000          # Whisper 입력 샘플레이트
+FRAME_MS = 30                # VAD 프레임 길이
+CHUNK_SECONDS = 30           # 목표 청크 길이 (Whisper 윈도우와 동일)
+SEARCH_SECONDS = 5           # 목표 지점 앞뒤로 무음을 찾는 범위
+MIN_SILENCE_MS = 240         # 분할 지점으로 인정할 최소 무음 길이
+HARD_SPLIT_OVERLAP = 1.0     # 무음을 못 찾아 강제로 자를 때 앞뒤로 겹치는 길이 (초)
+DEDUP_MAX_WORDS = 6          # 경계에서 비교할 최대 중복 단어 수
+
+
+def load_audio(audio_path: str, sample_rate: int = SAMPLE_RATE) -> np.ndarray:
+    """ffmpeg로 오디오를 16kHz 모노 float32 배열로 디코딩 (whisper.load_audio와 동일한 형식)"""
+    cmd = [
+        "ffmpeg", "-nostdin", "-v", "quiet", "-i", audio_path,
+        "-f", "s16le", "-ac", "1", "-ar", str(sample_rate), "-"
+    ]
+    result = subprocess.run(cmd, capture_output=True, check=True)
+    return np.frombuffer(result.stdout, np.int16).astype(np.float32) / 32768.0
+
+
+def frame_energy_db(samples: np.ndarray, sample_rate: int = SAMPLE_RATE, frame_ms: int = FRAME_MS) -> np.ndarray:
+    """프레임별 RMS 에너지(dB) 계산"""
+    frame_len = int(sample_rate * frame_ms / 1000)
+    frame_count = len(samples) // frame_len
+    if frame_count == 0:
+        return np.zeros(0, dtype=np.float32)
+
+    frames = samples[:frame_count * frame_len].reshape(frame_count, frame_len)
+    rms = np.sqrt(np.mean(np.square(frames), axis=1))
+    return 20.0 * np.log10(rms + 1e-10)
+
+
+def find_split_points(samples: np.ndarray, sample_rate: int = SAMPLE_RATE,
+                      chunk_seconds: float = CHUNK_SECONDS, search_seconds: float = SEARCH_SECONDS) -> list:
+    """무음 구간에서 분할 지점 찾기
+
+    Returns:
+        list: (샘플 위치, 무음 여부) 목록. 무음을 찾지 못한 경계는 에너지가 가장 낮은 지점에서 자릅니다.
+    """
+    energy = frame_energy_db(samples, sample_rate)
+    if len(energy) == 0:
+        return []
+
+    # 곡마다 음량이 다르므로 임계값은 하위 10% 에너지 기준으로 잡되 최대 음량보다 20dB 이상 낮게 유지
+    threshold = min(np.percentile(energy, 10) + 6.0, energy.max() - 20.0)
+    silent = energy < threshold
+
+    # 최소 무음 길이 이상 연속된 프레임만 분할 후보로 사용
+    min_frames = max(1, MIN_SILENCE_MS // FRAME_MS)
+    run = np.convolve(silent.astype(np.float32), np.ones(min_frames, dtype=np.float32), mode="same")
+    candidates = run >= min_frames
+
+    frame_len = int(sample_rate * FRAME_MS / 1000)
+    chunk_frames = int(chunk_seconds * 1000 / FRAME_MS)
+    search_frames = int(search_seconds * 1000 / FRAME_MS)
+
+    splits = []
+    pos = 0
+    while len(energy) - pos > chunk_frames + search_frames:
+        target = pos + chunk_frames
+        lo, hi = target - search_frames, target + search_frames
+        window = np.flatnonzero(candidates[lo:hi]) + lo
+
+        if len(window):
+            split = int(window[np.argmin(np.abs(window - target))])
+            is_silent = True
+        else:
+            split = int(np.argmin(energy[lo:hi]) + lo)
+            is_silent = False
+
+        splits.append((split * frame_len, is_silent))
+        pos = split
+
+    return splits
+
+
+def build_chunks(total_samples: int, splits: list, sample_rate: int = SAMPLE_RATE) -> list:
+    """분할 지점으로 청크 구간 생성 (강제 분할 경계는 앞뒤로 겹치게 잘라 단어가 끊기지 않게 함)
+
+    Returns:
+        list: {'start', 'end', 'boundary_start', 'boundary_end'} (모두 샘플 단위)
+    """
+    overlap = int(HARD_SPLIT_OVERLAP * sample_rate)
+    boundaries = [(0, True)] + list(splits) + [(total_samples, True)]
+
+    chunks = []
+    for (left, left_silent), (right, right_silent) in zip(boundaries, boundaries[1:]):
+        start = left if left_silent else max(0, left - overlap)
+        end = right if right_silent else min(total_samples, right + overlap)
+        chunks.append({
+            'start': start,
+            'end': end,
+            'boundary_start': left,
+            'boundary_end': right
+        })
+    return chunks
+
+
+def _init_worker(backend: str, model_name: str, threads: int) -> None:
+    """워커 프로세스 초기화: 스레드 수 제한 후 모델을 한 번 로드"""
+    os.environ["OMP_NUM_THREADS"] = str(threads)
+    asr_backends.get_backend(backend, model_name, threads).load()
+
+
+def _transcribe_chunk(args: tuple) -> list:
+    """워커에서 청크 하나를 인식 (타임스탬프는 청크 시작 기준)"""
+    audio, backend, model_name, language = args
+    engine = asr_backends.get_backend(backend, model_name)
+    result = engine.transcribe(audio, language, condition_on_previous_text=False)
+    return result['segments']
+
+
+def _strip_repeated_words(previous_text: str, text: str) -> str:
+    """앞 세그먼트 끝 단어들이 다음 세그먼트 앞에서 반복되면 제거"""
+    prev_words = previous_text.split()
+    words = text.split()
+    for n in range(min(DEDUP_MAX_WORDS, len(prev_words), len(words)), 0, -1):
+        if prev_words[-n:] == words[:n]:
+            return " ".join(words[n:])
+    return text
+
+
+def stitch_segments(chunks: list, chunk_segments: list, sample_rate: int = SAMPLE_RATE) -> list:
+    """청크별 결과를 전체 타임라인으로 이어 붙이기
+
+    겹친 구간의 세그먼트는 중간 시점이 청크 경계 안쪽에 있는 것만 남기고,
+    경계에서 반복된 단어는 뒤쪽 세그먼트에서 잘라냅니다.
+    """
+    stitched = []
+    for chunk, segments in zip(chunks, chunk_segments):
+        offset = chunk['start'] / sample_rate
+        lo = chunk['boundary_start'] / sample_rate
+        hi = chunk['boundary_end'] / sample_rate
+
+        for segment in segments:
+            start = segment['start'] + offset
+            end = segment['end'] + offset
+            middle = (start + end) / 2
+            if middle < lo or middle >= hi:
+                continue
+
+            text = segment['text'].strip()
+            if stitched:
+                text = _strip_repeated_words(stitched[-1]['text'], text)
+                start = max(start, stitched[-1]['end'])
+            if not text or end <= start:
+                continue
+
+            stitched.append({
+                'id': len(stitched),
+                'start': round(start, 3),
+                'end': round(end, 3),
+                'text': text
+            })
+    return stitched
+
+
+def default_workers(threads: int) -> int:
+    """CPU 코어 수와 워커당 스레드 수로 워커 수 결정"""
+    return max(1, (os.cpu_count() or 1) // max(1, threads))
+
+
+def transcribe_chunked(audio_path: str, model_name: str = transcription_service.DEFAULT_MODEL,
+                       language: str = transcription_service.DEFAULT_LANGUAGE,
+                       workers: Optional[int] = None, threads: int = 2,
+                       backend: str = transcription_service.DEFAULT_BACKEND) -> dict:
+    """긴 오디오를 무음 기준으로 나눠 병렬 인식
+
+    Returns:
+        dict: Whisper 형식 결과 + 'stats' (오디오 길이, 처리 시간, 실시간 배율 등)
+    """
+    started = time.time()
+    samples = load_audio(audio_path)
+    duration = len(samples) / SAMPLE_RATE
+
+    splits = find_split_points(samples)
+    chunks = build_chunks(len(samples), splits)
+    workers = min(workers or default_workers(threads), len(chunks))
+
+    jobs = [(samples[c['start']:c['end']], backend, model_name, language) for c in chunks]
+
+    # torch는 fork 이후 스레드 풀이 꼬일 수 있으므로 spawn 사용
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                             initializer=_init_worker, initargs=(backend, model_name, threads)) as executor:
+        chunk_segments = list(executor.map(_transcribe_chunk, jobs))
+
+    segments = stitch_segments(chunks, chunk_segments)
+    elapsed = time.time() - started
+
+    return {
+        'text': " ".join(s['text'] for s in segments),
+        'language': language,
+        'segments': segments,
+        'stats': {
+            'audio_duration': duration,
+            'elapsed': elapsed,
+            'rtf': elapsed / duration if duration else 0.0,
+            'chunks': len(chunks),
+            'silent_splits': sum(1 for _, silent in splits if silent),
+            'workers': workers,
+            'threads': threads,
+            'backend': backend
+        }
+    }
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("🎤 분할 병렬 음성 인식")
+        print("=" * 30)
+        print()
+        print("사용법:")
+        print("  python chunked_transcription.py <음성파일> [워커수] [워커당스레드수]")
+        return
+
+    audio_path = sys.argv[1]
+    if not os.path.exists(audio_path):
+        print(f"❌ 파일을 찾을 수 없습니다: {audio_path}")
+        return
+    asr_config = asr_backends.read_asr_config()
+    if not transcription_service.is_available(asr_config['backend']):
+        print(f"❌ 음성 인식 엔진이 설치되지 않았습니다: {asr_config['backend']}")
+        return
+
+    try:
+        threads = int(sys.argv[3]) if len(sys.argv) > 3 else 2
+        workers = int(sys.argv[2]) if len(sys.argv) > 2 else default_workers(threads)
+    except ValueError:
+        print("❌ 워커 수와 스레드 수는 숫자여야 합니다.")
+        return
+
+    print(f"🎤 분할 병렬 인식: {audio_path} (워커 {workers}개 × 스레드 {threads}개)")
+    result = transcribe_chunked(audio_path, model_name=asr_config['model'], workers=workers,
+                                threads=threads, backend=asr_config['backend'])
+    stats = result['stats']
+
+    for segment in result['segments']:
+        print(f"[{segment['start']:8.2f} → {segment['end']:8.2f}] {segment['text']}")
+
+    print()
+    print(f"📊 오디오 길이: {stats['audio_duration']:.1f}초")
+    print(f"📊 청크: {stats['chunks']}개 (무음 분할 {stats['silent_splits']}개)")
+    print(f"⏱️  처리 시간: {stats['elapsed']:.1f}초")
+    print(f"⚡ 실시간 배율(RTF): {stats['rtf']:.2f}")
+
+
+if __name__ == "__main__":
+    main()
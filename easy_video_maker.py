@@ -21,21 +21,20 @@ import time
 import json
 import os
 import sys
-import base64
-import mimetypes
+import threading
+import contextlib
 from typing import Optional
 import logging
 import subprocess
-from PIL import Image
-import cv2
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeElapsedColumn
 from rich.prompt import Prompt, Confirm
-from rich.text import Text
-from rich.columns import Columns
-from rich.align import Align
+from video_events import EventBus, JsonlLogger, MetricsAggregator
+from task_trace import TraceRecorder, DEFAULT_TRACE_FILE
+
+# OpenCV/numpy/Pillow(image_prep, scene_analyzer), image_helper, rich.progress는 쓰는 함수 안에서 불러옴
+# → --check, --list 같은 명령은 이 라이브러리들을 읽지 않고 바로 시작 (python startup_bench.py로 확인)
 
 # 로그 설정 (사용자가 볼 필요 없는 기술적 정보는 숨김)
 logging.basicConfig(level=logging.WARNING)
@@ -44,88 +43,65 @@ logger = logging.getLogger(__name__)
 # Rich Console 초기화
 console = Console()
 
+
 class EasyVideoMaker:
-    """쉬운 동영상 생성기"""
+    """쉬운 동영상 생성기 (엔진)
+    
+    화면에 직접 출력하거나 입력을 받지 않고, 진행 상황은 이벤트 버스로 알립니다.
+    (이벤트 종류는 video_events.EVENT_TYPES, 터미널 화면은 RichRenderer 구독자가 담당)
+    """
     
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, events: Optional[EventBus] = None):
         self.api_key = api_key
         self.base_url = "https://ark.ap-southeast.bytepluses.com"
         self.headers = {
             "Content-Type": "application/json",
             "Authorization": f"Bearer {api_key}"
         }
+        # 구독자가 없는 버스면 이벤트를 만들지 않고 바로 돌아옴 (서비스에 넣어 조용히 실행)
+        self.events = events if events is not None else EventBus()
+    
+    def _emit(self, event: str, **fields):
+        self.events.emit(event, **fields)
+    
+    def _notice(self, level: str, message: str, **fields):
+        """상태 안내 이벤트 (level: info, success, warning, error)"""
+        self.events.emit('notice', level=level, message=message, **fields)
     
     def check_task_status(self, task_id: str) -> Optional[dict]:
-        """특정 작업의 상태 확인"""
-        print(f"🔍 작업 상태를 확인합니다: {task_id}")
-        
+        """특정 작업의 상태 조회 (API 응답 그대로 반환, 실패하면 None)"""
         check_url = f"{self.base_url}/api/v3/contents/generations/tasks/{task_id}"
         
         try:
             response = requests.get(check_url, headers=self.headers)
             response.raise_for_status()
-            result = response.json()
-            
-            status = result.get("status")
-            created_at = result.get("created_at")
-            updated_at = result.get("updated_at")
-            
-            print(f"📊 작업 정보:")
-            print(f"   ID: {task_id}")
-            print(f"   상태: {status}")
-            
-            if created_at:
-                created_time = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(created_at))
-                print(f"   생성 시간: {created_time}")
-            
-            if updated_at:
-                updated_time = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(updated_at))
-                print(f"   업데이트 시간: {updated_time}")
-            
-            if status == "succeeded":
-                video_url = result.get("content", {}).get("video_url")
-                if video_url:
-                    print(f"✅ 완료! 동영상 다운로드 가능")
-                    print(f"   다운로드 URL: {video_url}")
-                    
-                    # 토큰 사용량 표시
-                    usage = result.get("usage", {})
-                    if usage.get("completion_tokens"):
-                        print(f"   토큰 사용량: {usage['completion_tokens']:,}")
-                    
-                    # 다운로드 옵션 제공
-                    download = input("\n📥 지금 다운로드하시겠습니까? (y/n): ").strip().lower()
-                    if download == 'y':
-                        return self._download_video(video_url)
-                    
-            elif status == "failed":
-                error_info = result.get("error", {})
-                error_code = error_info.get("code", "Unknown")
-                error_message = error_info.get("message", "알 수 없는 오류")
-                
-                print(f"❌ 실패:")
-                print(f"   오류 코드: {error_code}")
-                print(f"   오류 내용: {error_message}")
-                
-            elif status in ["queued", "running"]:
-                print(f"⏳ 진행 중... 잠시 후 다시 확인해보세요.")
-                
-            return result
-            
+            return response.json()
         except requests.exceptions.RequestException as e:
-            print(f"❌ 네트워크 오류: {e}")
+            self._notice('error', f"❌ 네트워크 오류: {e}")
             return None
         except Exception as e:
-            print(f"❌ 오류: 상태 확인 실패 - {e}")
+            self._notice('error', f"❌ 오류: 상태 확인 실패 - {e}")
             return None
     
-    def create_video_batch(self, prompts: list, image_url: str = None, video_config: dict = None, start_index: int = 1, end_index: int = None) -> list:
-        """여러 프롬프트로 배치 동영상 생성"""
+    def create_video_batch(self, prompts: list, image_url: str = None, video_config: dict = None, start_index: int = 1, end_index: int = None, concurrency: int = 1, merge_groups: bool = False) -> list:
+        """여러 프롬프트로 배치 동영상 생성
+        
+        prompts는 프롬프트 문자열 목록이나 prompt_file 항목 목록입니다.
+        항목의 settings는 video_config를 덮어쓰고(이미지는 image_file), 같은 chain 항목은
+        이전 클립의 마지막 프레임에서 이어서 순서대로 생성합니다.
+        concurrency가 2 이상이면 그 수만큼 단위(프롬프트 하나 또는 체인 하나)를 동시에 처리합니다.
+        merge_groups가 True면 성공한 클립을 장면(scene)별로, 장면이 없으면 체인별로 합칩니다.
+        """
+        import image_prep
+        import prompt_file
+        
         if video_config is None:
             video_config = {}
         
+        entries = prompt_file.normalize_entries(prompts)
+        
         # 인덱스 범위 조정
-        total_prompts = len(prompts)
+        total_prompts = len(entries)
         if end_index is None:
             end_index = total_prompts
         
@@ -134,130 +110,188 @@ class EasyVideoMaker:
         end_index = min(end_index, total_prompts)
         
         if start_index > end_index:
-            print("❌ 오류: 시작 인덱스가 종료 인덱스보다 큽니다.")
+            self._notice('error', "❌ 오류: 시작 인덱스가 종료 인덱스보다 큽니다.")
             return []
         
-        # 범위에 해당하는 프롬프트만 선택
-        selected_prompts = prompts[start_index-1:end_index]
-        batch_size = len(selected_prompts)
+        # 범위에 해당하는 프롬프트만 선택 (체인은 한 단위로 묶어 순서대로 처리)
+        units = prompt_file.group_units(entries[start_index-1:end_index])
+        concurrency = max(1, min(concurrency, len(units)))
         
-        print(f"🎬 배치 동영상 생성을 시작합니다")
-        print(f"📋 범위: {start_index}-{end_index} ({batch_size}개 / 전체 {total_prompts}개)")
-        print("=" * 50)
+        self._emit('batch_started', start=start_index, end=end_index, total=total_prompts, concurrency=concurrency,
+                   units=len(units), chains=sum(1 for unit in units if unit[0].get('chain')))
         
+        if concurrency > 1:
+            from concurrent.futures import ThreadPoolExecutor
+            
+            # 같은 로컬 이미지를 작업마다 동시에 준비하지 않도록 먼저 한 번씩 준비 (이후 작업은 캐시 재사용)
+            images = [image_url] + [entry['settings'].get('image_file') for unit in units for entry in unit]
+            for image in dict.fromkeys(images):
+                if image and os.path.exists(image):
+                    self.encode_image_to_base64(image)
+            
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                futures = [
+                    executor.submit(self._run_batch_unit, unit, end_index, image_url, video_config)
+                    for unit in units
+                ]
+                results = [result for future in futures for result in future.result()]
+        else:
+            results = []
+            for n, unit in enumerate(units):
+                results.extend(self._run_batch_unit(unit, end_index, image_url, video_config))
+                
+                # 다음 작업 전에 잠시 대기 (API 제한 방지)
+                if n < len(units) - 1:
+                    self._notice('info', "⏸️  잠시 대기 중... (3초)")
+                    time.sleep(3)
+        
+        results.sort(key=lambda r: r['index'])
+        
+        # 결과 요약
+        self._emit(
+            'batch_finished',
+            start=start_index,
+            end=end_index,
+            completed=sum(1 for r in results if r['status'] == 'completed'),
+            failed=sum(1 for r in results if r['status'] in ['generation_failed', 'download_failed', 'submission_failed']),
+            pending=sum(1 for r in results if r['status'] in ['callback_pending']),
+            prep_stats=image_prep.format_stats()
+        )
+        
+        if merge_groups:
+            results.extend(self._merge_batch_groups(results))
+        
+        return results
+    
+    def _run_batch_unit(self, unit: list, end_index: int, image_url: str, video_config: dict) -> list:
+        """배치의 실행 단위 하나 처리 (프롬프트 하나, 또는 체인의 클립을 순서대로)
+        
+        클립 이미지는 항목의 image → 이전 클립의 마지막 프레임(체인) → 배치 이미지 순으로 정합니다.
+        """
         results = []
+        previous_frame = None
         
-        for i, prompt in enumerate(selected_prompts, start_index):
-            print(f"\n📝 [{i}/{end_index}] 프롬프트: {prompt[:60]}{'...' if len(prompt) > 60 else ''}")
+        for n, entry in enumerate(unit):
+            if n > 0:
+                # 체인의 다음 클립 전에 잠시 대기 (API 제한 방지)
+                self._notice('info', "⏸️  잠시 대기 중... (3초)")
+                time.sleep(3)
             
-            if image_url:
-                if os.path.exists(image_url):
-                    print(f"🖼️  이미지: {os.path.basename(image_url)}")
-                else:
-                    print(f"🖼️  이미지: URL")
-            else:
-                print("📝 텍스트-to-비디오")
+            config = {**video_config, **entry['settings']}
+            clip_image = entry['settings'].get('image_file') or previous_frame or image_url
+            has_next = n < len(unit) - 1
+            result = self._run_batch_item(entry['index'], end_index, entry, clip_image, config, extract_frame=has_next)
+            results.append(result)
             
-            # 동영상 생성
-            task_id = self._start_generation(prompt.strip(), image_url, video_config)
+            # 체인이면 마지막 프레임을 다음 클립의 시작 이미지로 준비
+            previous_frame = None
+            if has_next and result['status'] == 'completed':
+                frame_path = result.get('extracted_frame_path')
+                encoded_image = self.encode_image_to_base64(frame_path) if frame_path else None
+                if encoded_image:
+                    previous_frame = f"data:image/jpeg;base64,{encoded_image}"
+                else:
+                    self._notice('warning', f"⚠️  [{entry['chain']}] 프레임 준비 실패, 다음 클립은 기본 이미지로 진행")
+            elif has_next and result['status'] != 'callback_pending':
+                self._notice('warning', f"⚠️  [{entry['chain']}] 클립 {entry['index']} 생성 실패, 다음 클립은 기본 이미지로 진행")
+        
+        return results
+    
+    def _run_batch_item(self, i: int, end_index: int, entry: dict, image_url: str, video_config: dict, extract_frame: bool = False) -> dict:
+        """배치의 프롬프트 하나 처리 (접수 → 대기 → 다운로드, extract_frame이면 마지막 프레임 추출까지)"""
+        import prompt_file
+        
+        prompt = entry['prompt']
+        self._emit('clip_started', mode='batch', index=i, total=end_index, prompt=prompt, image=image_url,
+                   chain=entry.get('chain'), scene=entry.get('scene'), settings=prompt_file.describe_settings(entry))
+        
+        result = {
+            'index': i,
+            'prompt': prompt,
+            'task_id': None,
+            'status': 'submission_failed',
+            'video_path': None,
+            'chain': entry.get('chain'),
+            'scene': entry.get('scene'),
+            'settings': entry.get('settings', {})
+        }
+        
+        # 동영상 생성 (설정은 접수 중에 바뀔 수 있어 작업마다 복사해서 사용)
+        task_id = self._start_generation(prompt, image_url, dict(video_config))
+        
+        if task_id:
+            result['task_id'] = task_id
+            result['status'] = 'submitted'
             
-            if task_id:
-                print(f"✅ 작업 접수: {task_id}")
+            # 콜백 URL이 설정되지 않은 경우에만 대기
+            if not video_config.get('callback_url'):
+                video_url = self._wait_for_video(task_id)
                 
-                result = {
-                    'index': i,
-                    'prompt': prompt.strip(),
-                    'task_id': task_id,
-                    'status': 'submitted',
-                    'video_path': None
-                }
-                
-                # 콜백 URL이 설정되지 않은 경우에만 대기
-                if not video_config.get('callback_url'):
-                    print("⏳ 완료 대기 중...")
-                    video_url = self._wait_for_video(task_id)
+                if video_url:
+                    # 파일명에 인덱스 추가
+                    timestamp = int(time.time())
+                    filepath = os.path.join("videos", f"batch_{i:02d}_{timestamp}.mp4")
                     
-                    if video_url:
-                        # 파일명에 인덱스 추가
-                        timestamp = int(time.time())
-                        filename = f"batch_{i:02d}_{timestamp}.mp4"
-                        filepath = os.path.join("videos", filename)
-                        
-                        # 다운로드 폴더 확인
-                        if not os.path.exists("videos"):
-                            os.makedirs("videos")
-                        
-                        # 다운로드
-                        downloaded_path = self._download_video_to_path(video_url, filepath)
-                        if downloaded_path:
-                            result['status'] = 'completed'
-                            result['video_path'] = downloaded_path
-                            print(f"✅ [{i}/{end_index}] 완료: {downloaded_path}")
-                        else:
-                            result['status'] = 'download_failed'
-                            print(f"❌ [{i}/{end_index}] 다운로드 실패")
+                    downloaded_path = self._download_video_to_path(video_url, filepath)
+                    if downloaded_path:
+                        result['status'] = 'completed'
+                        result['video_path'] = downloaded_path
+                        if extract_frame:
+                            result['extracted_frame_path'] = self.extract_last_frame(downloaded_path)
                     else:
-                        result['status'] = 'generation_failed'
-                        print(f"❌ [{i}/{end_index}] 생성 실패")
+                        result['status'] = 'download_failed'
                 else:
-                    print(f"📞 [{i}/{end_index}] 콜백 대기 중...")
-                    result['status'] = 'callback_pending'
+                    result['status'] = 'generation_failed'
             else:
-                result = {
-                    'index': i,
-                    'prompt': prompt.strip(),
-                    'task_id': None,
-                    'status': 'submission_failed',
-                    'video_path': None
-                }
-                print(f"❌ [{i}/{end_index}] 작업 접수 실패")
-            
-            results.append(result)
-            
-            # 다음 작업 전에 잠시 대기 (API 제한 방지)
-            if i < end_index:
-                print("⏸️  잠시 대기 중... (3초)")
-                time.sleep(3)
+                result['status'] = 'callback_pending'
         
-        # 결과 요약
-        print("\n" + "=" * 50)
-        print("📊 배치 처리 결과:")
-        
-        completed = sum(1 for r in results if r['status'] == 'completed')
-        failed = sum(1 for r in results if r['status'] in ['generation_failed', 'download_failed', 'submission_failed'])
-        pending = sum(1 for r in results if r['status'] in ['callback_pending'])
-        
-        print(f"✅ 완료: {completed}개")
-        print(f"❌ 실패: {failed}개")
-        if pending > 0:
-            print(f"📞 콜백 대기: {pending}개")
-        
-        return results
+        self._emit('clip_finished', mode='batch', index=i, total=end_index, task_id=result['task_id'],
+                   status=result['status'], video_path=result['video_path'], chain=result['chain'], scene=result['scene'])
+        return result
+    
+    def _merge_batch_groups(self, results: list) -> list:
+        """성공한 배치 클립을 장면별(없으면 체인별)로 합치기 → 합친 결과 목록"""
+        groups = {}
+        for r in results:
+            group = r.get('scene') or r.get('chain')
+            if group and r['status'] == 'completed':
+                groups.setdefault(group, []).append(r['video_path'])
+        
+        merged = []
+        for group, video_paths in groups.items():
+            if len(video_paths) < 2:
+                self._notice('info', f"📝 [{group}] 성공한 클립이 {len(video_paths)}개라 합치지 않습니다.")
+                continue
+            slug = "".join(c if c.isalnum() or c in "-_" else "_" for c in group)
+            output_path = os.path.join("videos", f"{slug}_{int(time.time())}.mp4")
+            merged_path = self.merge_videos(video_paths, output_path)
+            if merged_path:
+                merged.append({
+                    'index': 'merged',
+                    'prompt': f'합친 동영상 [{group}] ({len(video_paths)}개 클립)',
+                    'task_id': None,
+                    'status': 'merged',
+                    'video_path': merged_path,
+                    'chain': None,
+                    'scene': group
+                })
+        return merged
     
     def merge_videos(self, video_paths: list, output_path: str = None) -> Optional[str]:
         """여러 동영상 파일을 하나로 합치기 (ffmpeg 사용)"""
+        import tempfile
+        import scene_analyzer
+        
         if not video_paths:
-            console.print(Panel(
-                "[bold red]❌ 합칠 동영상이 없습니다.[/bold red]",
-                title="[bold red]합치기 오류[/bold red]",
-                border_style="red"
-            ))
+            self._emit('merge_failed', code='NoClips', message="합칠 동영상이 없습니다.")
             return None
         
         if len(video_paths) == 1:
-            console.print(Panel(
-                "[bold yellow]⚠️  동영상이 1개뿐입니다. 합치기가 필요 없습니다.[/bold yellow]",
-                title="[bold yellow]합치기 불필요[/bold yellow]",
-                border_style="yellow"
-            ))
+            self._notice('warning', "⚠️  동영상이 1개뿐입니다. 합치기가 필요 없습니다.", title="합치기 불필요")
             return video_paths[0]
         
-        console.print()
-        console.print(Panel(
-            f"[bold cyan]🎬 {len(video_paths)}개의 동영상을 하나로 합치는 중...[/bold cyan]",
-            title="[bold cyan]동영상 합치기[/bold cyan]",
-            border_style="cyan"
-        ))
+        self._emit('merging', clips=len(video_paths))
+        started = time.time()
         
         try:
             # 출력 파일명 생성
@@ -266,141 +300,127 @@ class EasyVideoMaker:
                 output_path = os.path.join("videos", f"merged_video_{timestamp}.mp4")
             
             # videos 폴더 확인
-            if not os.path.exists("videos"):
-                os.makedirs("videos")
+            os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
             
             # 입력 파일들이 모두 존재하는지 확인
             for video_path in video_paths:
                 if not os.path.exists(video_path):
-                    console.print(Panel(
-                        f"[bold red]❌ 동영상 파일을 찾을 수 없습니다:[/bold red] {video_path}",
-                        title="[bold red]파일 오류[/bold red]",
-                        border_style="red"
-                    ))
+                    self._emit('merge_failed', code='MissingFile', message=f"동영상 파일을 찾을 수 없습니다: {video_path}")
                     return None
             
-            # ffmpeg 명령어 구성 (concat demuxer 사용)
-            # 임시 파일 목록 생성
-            import tempfile
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-                concat_file = f.name
-                for video_path in video_paths:
-                    # 경로에 특수문자가 있을 경우를 대비해 절대경로 사용
-                    abs_path = os.path.abspath(video_path)
-                    f.write(f"file '{abs_path}'\n")
-            
-            # ffmpeg 명령어 실행
-            cmd = [
-                'ffmpeg',
-                '-f', 'concat',
-                '-safe', '0',
-                '-i', concat_file,
-                '-c', 'copy',  # 재인코딩 없이 복사 (빠름)
-                '-y',  # 출력 파일 덮어쓰기
-                output_path
-            ]
+            # 클립 끝에 멈춰 있는 구간(정지 꼬리)은 잘라내고, 이어 붙이는 곳에서 화면이 튀는지 확인
+            outpoints = [None] * len(video_paths)
+            if scene_analyzer.load_settings()['trim_tail']:
+                analyses = scene_analyzer.analyze_many(video_paths)
+                outpoints = [
+                    analyses[p]['content_end'] if analyses.get(p) and analyses[p]['static_tail'] else None
+                    for p in video_paths
+                ]
+            jumps = scene_analyzer.handoff_jumps(video_paths, outpoints)
+            
+            trimmed = [(p, end) for p, end in zip(video_paths, outpoints) if end is not None]
+            if trimmed or jumps:
+                self._emit(
+                    'merge_analyzed',
+                    trimmed=[{'path': p, 'content_end': round(end, 3)} for p, end in trimmed],
+                    jumps=[{'from': video_paths[j['index']], 'to': video_paths[j['index'] + 1], 'score': j['score']} for j in jumps]
+                )
             
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                BarColumn(),
-                TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-                TimeElapsedColumn(),
-                console=console,
-                transient=True
-            ) as progress:
-                task = progress.add_task("동영상 합치는 중...", total=100)
+            # 정지 꼬리가 있는 클립은 스마트 컷으로 프레임 단위로 잘라 임시 파일로 만든 뒤 이어 붙임
+            # (concat의 outpoint는 스트림 복사라 키프레임 사이에서 자르지 못하고 이음매에서 타임스탬프가 겹침)
+            with tempfile.TemporaryDirectory(prefix="merge_") as temp_dir:
+                inputs = self._trim_clips(video_paths, outpoints, temp_dir)
+                if inputs is None:
+                    return None
                 
-                # ffmpeg 프로세스 실행
-                import subprocess
-                process = subprocess.Popen(
-                    cmd,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    universal_newlines=True
-                )
+                # ffmpeg concat demuxer용 임시 파일 목록 생성
+                concat_file = os.path.join(temp_dir, "concat.txt")
+                with open(concat_file, 'w', encoding='utf-8') as f:
+                    for video_path in inputs:
+                        # 경로에 특수문자가 있을 경우를 대비해 절대경로 사용
+                        f.write(f"file '{os.path.abspath(video_path)}'\n")
                 
-                # 진행률 업데이트 (추정)
-                start_time = time.time()
-                while process.poll() is None:
-                    elapsed = time.time() - start_time
-                    # 동영상 개수와 예상 시간을 기반으로 진행률 추정
-                    estimated_total = len(video_paths) * 10  # 동영상당 약 10초 추정
-                    progress_percent = min(95, (elapsed / estimated_total) * 100)
-                    progress.update(task, completed=progress_percent)
-                    time.sleep(0.5)
+                cmd = [
+                    'ffmpeg',
+                    '-f', 'concat',
+                    '-safe', '0',
+                    '-i', concat_file,
+                    '-c', 'copy',  # 재인코딩 없이 복사 (빠름)
+                    '-y',  # 출력 파일 덮어쓰기
+                    output_path
+                ]
+                process = subprocess.run(cmd, capture_output=True, text=True)
                 
-                # 프로세스 완료 대기
-                stdout, stderr = process.communicate()
-                progress.update(task, completed=100)
-            
-            # 임시 파일 삭제
-            try:
-                os.unlink(concat_file)
-            except:
-                pass
-            
-            if process.returncode == 0:
-                # 파일 크기 확인
-                if os.path.exists(output_path):
-                    file_size = os.path.getsize(output_path) / (1024 * 1024)
-                    console.print()
-                    console.print(Panel(
-                        f"[bold green]✅ 동영상 합치기 완료![/bold green]\n\n"
-                        f"[bold blue]📁 출력 파일:[/bold blue] {output_path}\n"
-                        f"[bold blue]📊 파일 크기:[/bold blue] {file_size:.1f} MB\n"
-                        f"[bold blue]🎬 합친 클립 수:[/bold blue] {len(video_paths)}개",
-                        title="[bold green]합치기 성공[/bold green]",
-                        border_style="green"
-                    ))
-                    return output_path
-                else:
-                    console.print(Panel(
-                        "[bold red]❌ 출력 파일이 생성되지 않았습니다.[/bold red]",
-                        title="[bold red]합치기 실패[/bold red]",
-                        border_style="red"
-                    ))
+                if process.returncode != 0:
+                    error_msg = process.stderr.strip() if process.stderr else "알 수 없는 오류"
+                    self._emit('merge_failed', code='FfmpegError', message=error_msg)
                     return None
-            else:
-                error_msg = stderr.strip() if stderr else "알 수 없는 오류"
-                console.print()
-                console.print(Panel(
-                    f"[bold red]❌ ffmpeg 오류:[/bold red]\n\n{error_msg}\n\n"
-                    "[bold yellow]💡 해결방법:[/bold yellow]\n"
-                    "1. ffmpeg가 설치되어 있는지 확인하세요\n"
-                    "2. 동영상 파일이 손상되지 않았는지 확인하세요\n"
-                    "3. 충분한 디스크 공간이 있는지 확인하세요",
-                    title="[bold red]합치기 실패[/bold red]",
-                    border_style="red"
-                ))
-                return None
                 
+                if not os.path.exists(output_path):
+                    self._emit('merge_failed', code='NoOutput', message="출력 파일이 생성되지 않았습니다.")
+                    return None
+                
+                # 이음매에서 프레임이 겹치거나 빠지지 않았는지 확인 (합친 영상 프레임 수 = 클립 프레임 수 합)
+                mismatch = self._frame_count_mismatch(inputs, output_path)
+                if mismatch:
+                    self._emit('merge_failed', code='FrameMismatch', message=mismatch)
+                    return None
+            
+            self._emit('merged', path=output_path, clips=len(video_paths), size_bytes=os.path.getsize(output_path),
+                       elapsed=round(time.time() - started, 2))
+            return output_path
+        
         except FileNotFoundError:
-            console.print(Panel(
-                "[bold red]❌ ffmpeg를 찾을 수 없습니다.[/bold red]\n\n"
-                "[bold yellow]💡 설치 방법:[/bold yellow]\n"
-                "• macOS: brew install ffmpeg\n"
-                "• Ubuntu/Debian: sudo apt install ffmpeg\n"
-                "• Windows: https://ffmpeg.org/download.html",
-                title="[bold red]ffmpeg 없음[/bold red]",
-                border_style="red"
-            ))
+            self._emit('merge_failed', code='FfmpegMissing', message="ffmpeg를 찾을 수 없습니다.")
             return None
         except Exception as e:
-            console.print()
-            console.print(Panel(
-                f"[bold red]❌ 동영상 합치기 실패:[/bold red] {e}",
-                title="[bold red]합치기 오류[/bold red]",
-                border_style="red"
-            ))
+            self._emit('merge_failed', code='Error', message=str(e))
             return None
-
+    
+    def _trim_clips(self, video_paths: list, outpoints: list, temp_dir: str) -> Optional[list]:
+        """outpoint가 있는 클립만 0 ~ outpoint로 스마트 컷 (이어 붙일 파일 목록, 실패하면 None)"""
+        import video_trimmer
+        from concurrent.futures import ThreadPoolExecutor
+        
+        def trim(i):
+            if outpoints[i] is None:
+                return video_paths[i], None
+            trimmed_path = os.path.join(temp_dir, f"clip_{i:03d}.mp4")
+            result = video_trimmer.smart_trim(video_paths[i], trimmed_path, 0.0, outpoints[i])
+            return trimmed_path, None if result['ok'] else result['error']
+        
+        jobs = [i for i in range(len(video_paths)) if outpoints[i] is not None]
+        with ThreadPoolExecutor(max_workers=max(1, min(4, len(jobs)))) as executor:
+            results = list(executor.map(trim, range(len(video_paths))))
+        
+        for video_path, (_, error) in zip(video_paths, results):
+            if error:
+                self._emit('merge_failed', code='TrimFailed', message=f"정지 꼬리를 잘라내지 못했습니다: {video_path} - {error}")
+                return None
+        return [path for path, _ in results]
+    
+    def _frame_count_mismatch(self, inputs: list, output_path: str) -> Optional[str]:
+        """합친 영상의 프레임(패킷) 수가 클립 프레임 수 합과 다르면 오류 메시지 (MP4가 아니면 확인하지 않음)"""
+        import mp4_meta
+        
+        infos = [mp4_meta.read_metadata(p) for p in inputs + [output_path]]
+        if not all(info and info['video'] for info in infos):
+            return None
+        expected = sum(info['video']['frames'] for info in infos[:-1])
+        merged = infos[-1]['video']['frames']
+        if merged == expected:
+            return None
+        return f"합친 동영상의 프레임 수({merged})가 클립 프레임 수의 합({expected})과 다릅니다."
+    
     def extract_last_frame(self, video_path: str, output_path: str = None) -> Optional[str]:
         """동영상에서 마지막 프레임을 추출하여 이미지로 저장"""
+        import cv2
+        import image_prep
+        
         if not os.path.exists(video_path):
-            print(f"❌ 동영상 파일을 찾을 수 없습니다: {video_path}")
+            self._notice('error', f"❌ 동영상 파일을 찾을 수 없습니다: {video_path}")
             return None
-            
+        
         if output_path is None:
             # 자동으로 경로 생성 (동영상명_last_frame.jpg)
             base_name = os.path.splitext(os.path.basename(video_path))[0]
@@ -408,74 +428,68 @@ class EasyVideoMaker:
             output_path = os.path.join(output_dir, f"{base_name}_last_frame.jpg")
         
         try:
+            started = time.time()
             # OpenCV로 동영상 읽기
             cap = cv2.VideoCapture(video_path)
-            
-            # 마지막 프레임으로 이동
-            frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
-            if frame_count == 0:
-                print(f"❌ 동영상에서 프레임을 읽을 수 없습니다: {video_path}")
-                return None
+            try:
+                # 마지막 프레임으로 이동
+                frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+                if frame_count == 0:
+                    self._notice('error', f"❌ 동영상에서 프레임을 읽을 수 없습니다: {video_path}")
+                    return None
                 
-            # 마지막 프레임 추출
-            cap.set(cv2.CAP_PROP_POS_FRAMES, frame_count - 1)
-            ret, frame = cap.read()
+                # 마지막 프레임 추출
+                cap.set(cv2.CAP_PROP_POS_FRAMES, frame_count - 1)
+                ret, frame = cap.read()
+            finally:
+                cap.release()
             
             if not ret:
-                print(f"❌ 마지막 프레임을 읽을 수 없습니다: {video_path}")
+                self._notice('error', f"❌ 마지막 프레임을 읽을 수 없습니다: {video_path}")
                 return None
             
-            # 이미지 저장 (BGR을 RGB로 변환)
-            frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            pil_image = Image.fromarray(frame_rgb)
-            
-            # 이미지 크기 최적화 (Base64 인코딩을 위해 더 작게)
-            max_dimension = 1280  # 더 작은 크기로 제한
-            if pil_image.width > max_dimension or pil_image.height > max_dimension:
-                ratio = min(max_dimension / pil_image.width, max_dimension / pil_image.height)
-                new_width = int(pil_image.width * ratio)
-                new_height = int(pil_image.height * ratio)
-                pil_image = pil_image.resize((new_width, new_height), Image.Resampling.LANCZOS)
-                print(f"🔧 이미지 크기 조정: {new_width}x{new_height}")
-            
-            # 파일 크기 최적화를 위해 더 낮은 품질로 저장
-            pil_image.save(output_path, "JPEG", quality=60, optimize=True)
-            
-            cap.release()
-            
-            print(f"✅ 마지막 프레임 추출 완료: {output_path}")
+            # BGR 배열을 그대로 축소/압축해 저장 (PIL 변환 없음), 다음 클립 업로드용 이미지도 함께 준비
+            saved = image_prep.save_frame(frame, output_path)
+            self._emit('frame_extracted', video_path=video_path, frame_path=output_path,
+                       width=saved['width'], height=saved['height'], resized=saved['width'] != frame.shape[1],
+                       elapsed=round(time.time() - started, 3))
             return output_path
-            
+        
         except Exception as e:
-            print(f"❌ 프레임 추출 실패: {e}")
+            self._notice('error', f"❌ 프레임 추출 실패: {e}")
             return None
     
-    def create_video_chain(self, prompts: list, initial_image_url: str = None, video_config: dict = None, start_index: int = 1) -> list:
-        """연속된 동영상 체인 생성 (이전 클립의 마지막 프레임을 다음 클립의 첫 프레임으로 사용)"""
-        print(f"🎬 연속 동영상 체인 생성을 시작합니다! ({len(prompts)}개 클립)")
-        print("🔗 각 클립의 마지막 프레임이 다음 클립의 시작 이미지로 사용됩니다.")
-        print()
+    def create_video_chain(self, prompts: list, initial_image_url: str = None, video_config: dict = None, start_index: int = 1, merge=False) -> list:
+        """연속된 동영상 체인 생성 (이전 클립의 마지막 프레임을 다음 클립의 첫 프레임으로 사용)
+        
+        prompts는 프롬프트 문자열 목록이나 prompt_file 항목 목록입니다. (항목의 settings는 그 클립에만 적용,
+        image가 있으면 이전 프레임 대신 그 이미지에서 시작)
+        merge: 성공한 클립 합치기 여부 (True/False, 또는 성공한 클립 수를 받아 bool을 돌려주는 함수)
+        """
+        import image_prep
+        import prompt_file
+        
+        entries = prompt_file.normalize_entries(prompts)
+        end_index = start_index + len(entries) - 1
+        self._emit('chain_started', start=start_index, end=end_index, image=bool(initial_image_url))
         
         results = []
         current_image_url = initial_image_url
         
-        for i, prompt in enumerate(prompts):
+        for i, entry in enumerate(entries):
             clip_number = start_index + i
-            print(f"\n{'='*50}")
-            print(f"🎥 클립 {clip_number}/{start_index + len(prompts) - 1} 생성 중...")
-            print(f"📝 프롬프트: {prompt[:100]}{'...' if len(prompt) > 100 else ''}")
-            
-            if current_image_url:
-                print(f"🖼️  시작 이미지: 이전 클립의 마지막 프레임 사용")
+            prompt = entry['prompt']
+            clip_config = {**(video_config or {}), **entry['settings']}
+            if entry['settings'].get('image_file'):
+                current_image_url = entry['settings']['image_file']
+                image_label = 'initial'
             else:
-                print(f"🖼️  시작 이미지: 없음 (텍스트 전용)")
+                image_label = 'previous_frame' if current_image_url and i > 0 else ('initial' if current_image_url else None)
+            self._emit('clip_started', mode='chain', index=clip_number, total=end_index, prompt=prompt,
+                       image=image_label, settings=_settings_summary(clip_config, bool(current_image_url)))
             
             # 동영상 생성
-            video_path = self.create_video(
-                description=prompt,
-                image_url=current_image_url,
-                video_config=video_config
-            )
+            video_path = self._generate(prompt, current_image_url, clip_config)
             
             # 결과 정리
             result = {
@@ -495,107 +509,67 @@ class EasyVideoMaker:
                     if encoded_image:
                         current_image_url = f"data:image/jpeg;base64,{encoded_image}"
                         result['extracted_frame_path'] = frame_path
-                        print(f"✅ 다음 클립용 프레임 준비 완료")
+                        self._notice('success', "✅ 다음 클립용 프레임 준비 완료")
                     else:
-                        print(f"⚠️  프레임 인코딩 실패, 다음 클립은 텍스트 전용으로 진행")
+                        self._notice('warning', "⚠️  프레임 인코딩 실패, 다음 클립은 텍스트 전용으로 진행")
                         current_image_url = None
                 else:
-                    print(f"⚠️  프레임 추출 실패, 다음 클립은 텍스트 전용으로 진행")
+                    self._notice('warning', "⚠️  프레임 추출 실패, 다음 클립은 텍스트 전용으로 진행")
                     current_image_url = None
             else:
-                print(f"⚠️  클립 {clip_number} 생성 실패, 다음 클립은 텍스트 전용으로 진행")
+                self._notice('warning', f"⚠️  클립 {clip_number} 생성 실패, 다음 클립은 텍스트 전용으로 진행")
                 current_image_url = None
             
+            self._emit('clip_finished', mode='chain', index=clip_number, total=end_index, status=result['status'],
+                       video_path=result['local_path'], frame_path=result.get('extracted_frame_path'))
             results.append(result)
             
             # 다음 작업 전에 잠시 대기 (API 제한 방지)
-            if i < len(prompts) - 1:
-                print("⏸️  잠시 대기 중... (5초)")
+            if i < len(entries) - 1:
+                self._notice('info', "⏸️  잠시 대기 중... (5초)")
                 time.sleep(5)
         
         # 결과 요약
-        console.print()
-        completed = sum(1 for r in results if r and r.get('status') == 'completed')
-        failed = sum(1 for r in results if not r or r.get('status') in ['generation_failed', 'download_failed', 'submission_failed'])
-        
-        # 결과 테이블 생성
-        result_table = Table(title="[bold blue]🔗 연속 동영상 체인 생성 결과[/bold blue]", show_header=True, header_style="bold magenta")
-        result_table.add_column("항목", style="cyan", width=15)
-        result_table.add_column("개수", style="white", width=10)
-        
-        result_table.add_row("✅ 완료", f"[bold green]{completed}개[/bold green]")
-        result_table.add_row("❌ 실패", f"[bold red]{failed}개[/bold red]")
-        
-        console.print(result_table)
-        
-        successful_clips = [r for r in results if r and r.get('status') == 'completed']
-        if successful_clips:
-            console.print()
-            clips_table = Table(title="[bold blue]📁 생성된 동영상 파일들[/bold blue]", show_header=True, header_style="bold magenta")
-            clips_table.add_column("클립 번호", style="cyan", width=10)
-            clips_table.add_column("파일 경로", style="white", width=50)
-            
-            for i, result in enumerate(successful_clips):
-                clip_num = start_index + results.index(result)
-                file_path = result.get('local_path', '파일 없음')
-                clips_table.add_row(str(clip_num), file_path)
-            
-            console.print(clips_table)
-            
-            # 합치기 옵션 제공
-            if len(successful_clips) > 1:
-                console.print()
-                merge_option = Confirm.ask(
-                    f"[bold cyan]🎬 {len(successful_clips)}개의 클립을 하나의 동영상으로 합치시겠습니까?[/bold cyan]",
-                    default=True
-                )
+        successful_clips = [r for r in results if r.get('status') == 'completed']
+        self._emit(
+            'chain_finished',
+            completed=len(successful_clips),
+            failed=len(results) - len(successful_clips),
+            clips=[{'index': r['clip_number'], 'path': r['local_path']} for r in successful_clips],
+            prep_stats=image_prep.format_stats()
+        )
+        
+        # 합치기
+        if len(successful_clips) > 1:
+            should_merge = merge(len(successful_clips)) if callable(merge) else bool(merge)
+            
+            if should_merge:
+                # 성공한 클립들의 경로 수집
+                video_paths = [r.get('local_path') for r in successful_clips if r.get('local_path') and os.path.exists(r.get('local_path'))]
                 
-                if merge_option:
-                    # 성공한 클립들의 경로 수집
-                    video_paths = [r.get('local_path') for r in successful_clips if r.get('local_path') and os.path.exists(r.get('local_path'))]
-                    
-                    if video_paths:
-                        merged_path = self.merge_videos(video_paths)
-                        if merged_path:
-                            # 결과에 합친 동영상 정보 추가
-                            merged_result = {
-                                'clip_number': 'merged',
-                                'prompt': f'합친 동영상 ({len(video_paths)}개 클립)',
-                                'status': 'merged',
-                                'local_path': merged_path
-                            }
-                            results.append(merged_result)
-                            
-                            console.print()
-                            console.print(Panel(
-                                f"[bold green]🎉 모든 클립이 성공적으로 합쳐졌습니다![/bold green]\n\n"
-                                f"[bold blue]📁 합친 동영상:[/bold blue] {merged_path}\n"
-                                f"[bold blue]🎬 총 클립 수:[/bold blue] {len(video_paths)}개",
-                                title="[bold green]체인 완성[/bold green]",
-                                border_style="green",
-                                padding=(1, 2)
-                            ))
-                    else:
-                        console.print(Panel(
-                            "[bold red]❌ 합칠 수 있는 동영상 파일이 없습니다.[/bold red]",
-                            title="[bold red]합치기 오류[/bold red]",
-                            border_style="red"
-                        ))
+                if video_paths:
+                    merged_path = self.merge_videos(video_paths)
+                    if merged_path:
+                        # 결과에 합친 동영상 정보 추가
+                        results.append({
+                            'clip_number': 'merged',
+                            'prompt': f'합친 동영상 ({len(video_paths)}개 클립)',
+                            'status': 'merged',
+                            'local_path': merged_path
+                        })
                 else:
-                    console.print(Panel(
-                        "[bold yellow]📝 개별 클립들이 각각 저장되어 있습니다.[/bold yellow]\n\n"
-                        "[bold cyan]💡 나중에 합치려면:[/bold cyan]\n"
-                        "videos/ 폴더의 파일들을 수동으로 합치거나\n"
-                        "ffmpeg 명령어를 사용하세요.",
-                        title="[bold yellow]개별 저장[/bold yellow]",
-                        border_style="yellow"
-                    ))
+                    self._emit('merge_failed', code='NoClips', message="합칠 수 있는 동영상 파일이 없습니다.")
+            else:
+                self._emit('merge_skipped', clips=len(successful_clips))
         
         return results
     
     def _download_video_to_path(self, video_url: str, filepath: str) -> Optional[str]:
         """동영상을 지정된 경로에 다운로드"""
+        self._emit('downloading', path=filepath)
+        started = time.time()
         try:
+            os.makedirs(os.path.dirname(filepath) or ".", exist_ok=True)
             response = requests.get(video_url, stream=True)
             response.raise_for_status()
             
@@ -603,16 +577,16 @@ class EasyVideoMaker:
                 for chunk in response.iter_content(chunk_size=8192):
                     f.write(chunk)
             
+            self._emit('downloaded', path=filepath, size_bytes=os.path.getsize(filepath),
+                       elapsed=round(time.time() - started, 3))
             return filepath
-            
+        
         except Exception as e:
-            print(f"❌ 다운로드 실패: {e}")
+            self._emit('download_failed', path=filepath, message=str(e))
             return None
-
-    def list_recent_tasks(self, limit: int = 10) -> Optional[list]:
-        """최근 작업 목록 조회"""
-        print(f"📋 최근 작업 {limit}개를 조회합니다...")
-        
+    
+    def list_recent_tasks(self, limit: int = 10) -> Optional[dict]:
+        """최근 작업 목록 조회 (API 응답: {'items': [...], 'total': N}, 실패하면 None)"""
         list_url = f"{self.base_url}/api/v3/contents/generations/tasks"
         params = {
             "page_num": 1,
@@ -622,211 +596,92 @@ class EasyVideoMaker:
         try:
             response = requests.get(list_url, headers=self.headers, params=params)
             response.raise_for_status()
-            result = response.json()
-            
-            tasks = result.get("items", [])
-            total = result.get("total", 0)
-            
-            if not tasks:
-                print("📭 최근 작업이 없습니다.")
-                return []
-            
-            print(f"📊 총 {total}개 작업 중 최근 {len(tasks)}개:")
-            print()
-            
-            for i, task in enumerate(tasks, 1):
-                task_id = task.get("id", "")
-                status = task.get("status", "")
-                created_at = task.get("created_at")
-                model = task.get("model", "")
-                
-                status_emoji = {
-                    "succeeded": "✅",
-                    "failed": "❌", 
-                    "running": "⏳",
-                    "queued": "🔄"
-                }.get(status, "❓")
-                
-                created_time = ""
-                if created_at:
-                    created_time = time.strftime('%m-%d %H:%M', time.localtime(created_at))
-                
-                print(f"{i:2d}. {status_emoji} {task_id} [{status}] {created_time}")
-                if model:
-                    model_short = model.split('-')[-1] if '-' in model else model
-                    print(f"     모델: {model_short}")
-                
-                # 실패한 경우 오류 정보 표시
-                if status == "failed":
-                    error_info = task.get("error", {})
-                    if error_info.get("code"):
-                        print(f"     오류: {error_info.get('code', '')}")
-                
-                print()
-            
-            return tasks
-            
+            return response.json()
         except requests.exceptions.RequestException as e:
-            print(f"❌ 네트워크 오류: {e}")
+            self._notice('error', f"❌ 네트워크 오류: {e}")
             return None
         except Exception as e:
-            print(f"❌ 오류: 작업 목록 조회 실패 - {e}")
+            self._notice('error', f"❌ 오류: 작업 목록 조회 실패 - {e}")
             return None
     
     def encode_image_to_base64(self, image_path: str) -> Optional[str]:
-        """로컬 이미지 파일을 Base64로 인코딩"""
+        """로컬 이미지 파일을 Base64로 인코딩 (같은 이미지는 실행 중 한 번만 준비)"""
+        import image_prep
+        
         try:
-            # 파일 존재 확인
-            if not os.path.exists(image_path):
-                print(f"❌ 이미지 파일을 찾을 수 없습니다: {image_path}")
-                return None
-            
-            # 파일 크기 확인 (5MB 제한)
-            file_size = os.path.getsize(image_path)
-            if file_size > 5 * 1024 * 1024:
-                print(f"❌ 이미지 파일이 너무 큽니다: {file_size / (1024*1024):.1f}MB (최대 5MB)")
-                return None
-            
-            # MIME 타입 확인
-            mime_type, _ = mimetypes.guess_type(image_path)
-            if not mime_type or not mime_type.startswith('image/'):
-                print(f"❌ 지원되지 않는 이미지 형식입니다: {image_path}")
-                print("💡 지원 형식: JPEG, PNG, WEBP, BMP, TIFF, GIF")
-                return None
-            
-            # 지원되는 형식 확인
-            supported_formats = ['image/jpeg', 'image/png', 'image/webp', 'image/bmp', 'image/tiff', 'image/gif']
-            if mime_type not in supported_formats:
-                print(f"❌ 지원되지 않는 이미지 형식입니다: {mime_type}")
-                print("💡 지원 형식: JPEG, PNG, WEBP, BMP, TIFF, GIF (모든 형식은 JPEG로 변환됩니다)")
-                return None
-            
-            print(f"📸 이미지를 Base64로 인코딩하는 중... ({file_size / 1024:.1f}KB)")
-            
-            # PNG나 다른 형식인 경우 JPEG 변환 알림
-            if mime_type != 'image/jpeg':
-                print(f"🔄 {mime_type.split('/')[-1].upper()} → JPEG 형식으로 변환합니다")
-            
-            # 이미지 최적화 (크기 줄이기)
-            from PIL import Image
-            with Image.open(image_path) as img:
-                # 이미지 크기를 최대 1024x1024로 제한
-                max_size = 1024
-                if img.width > max_size or img.height > max_size:
-                    ratio = min(max_size / img.width, max_size / img.height)
-                    new_width = int(img.width * ratio)
-                    new_height = int(img.height * ratio)
-                    img = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-                    print(f"🔧 Base64용 이미지 크기 조정: {new_width}x{new_height}")
-                
-                # RGB로 변환 (RGBA인 경우)
-                if img.mode in ('RGBA', 'LA'):
-                    background = Image.new('RGB', img.size, (255, 255, 255))
-                    background.paste(img, mask=img.split()[-1] if img.mode == 'RGBA' else None)
-                    img = background
-                elif img.mode != 'RGB':
-                    img = img.convert('RGB')
-                
-                # 메모리에서 JPEG로 압축
-                import io
-                img_buffer = io.BytesIO()
-                img.save(img_buffer, format='JPEG', quality=75, optimize=True)
-                img_buffer.seek(0)
-                
-                # Base64 인코딩
-                encoded_string = base64.b64encode(img_buffer.read()).decode('utf-8')
-            
-            # Base64 크기 확인 (API 제한 확인을 위해)
-            base64_size_mb = len(encoded_string) / (1024 * 1024)
-            print(f"✅ Base64 인코딩 완료! (크기: {base64_size_mb:.2f}MB)")
-            
-            if base64_size_mb > 8:  # Base64 크기 제한
-                print("⚠️  Base64 데이터가 너무 큽니다. 이미지를 더 작게 만들어보세요.")
-                return None
-            
-            # 순수 Base64 문자열만 반환 (data: prefix 없이)
-            return encoded_string
-            
+            prepared = image_prep.prepare(image_path)
+        except ValueError as e:
+            self._notice('error', f"❌ {e}")
+            return None
         except Exception as e:
-            print(f"❌ Base64 인코딩 실패: {e}")
+            self._notice('error', f"❌ Base64 인코딩 실패: {e}")
             return None
+        
+        self._emit('image_prepared', path=image_path, width=prepared['width'], height=prepared['height'],
+                   cached=prepared['cached'], original_width=prepared['original_width'],
+                   source_mime=prepared['source_mime'], quality=prepared['quality'],
+                   payload_bytes=len(prepared['base64']), elapsed=round(prepared['elapsed'], 3))
+        
+        # 순수 Base64 문자열만 반환 (data: prefix 없이)
+        return prepared['base64']
     
     def validate_image_dimensions(self, image_path: str) -> bool:
-        """이미지 크기 검증 (API 요구사항 확인)"""
+        """이미지 크기 검증 (API 요구사항 확인, 같은 내용의 이미지는 헤더를 다시 읽지 않음)"""
+        import image_prep
+        
         try:
-            from PIL import Image
-            
-            with Image.open(image_path) as img:
-                width, height = img.size
-                
-                # 화면비 확인 (0.4 ~ 2.5)
-                aspect_ratio = width / height
-                if aspect_ratio < 0.4 or aspect_ratio > 2.5:
-                    print(f"❌ 이미지 화면비가 범위를 벗어났습니다: {aspect_ratio:.2f}")
-                    print("💡 허용 범위: 0.4 ~ 2.5 (2:5 ~ 5:2)")
-                    return False
-                
-                # 픽셀 크기 확인
-                min_side = min(width, height)
-                max_side = max(width, height)
-                
-                if min_side < 300:
-                    print(f"❌ 이미지가 너무 작습니다: {min_side}px (최소 300px)")
-                    return False
-                
-                if max_side > 6000:
-                    print(f"❌ 이미지가 너무 큽니다: {max_side}px (최대 6000px)")
-                    return False
-                
-                print(f"✅ 이미지 크기 검증 통과: {width}x{height} (비율: {aspect_ratio:.2f})")
-                return True
-                
-        except ImportError:
-            print("⚠️  PIL 라이브러리가 없어서 이미지 크기 검증을 건너뜁니다.")
-            print("💡 정확한 검증을 위해 'pip install Pillow'를 실행하세요.")
-            return True
+            info = image_prep.image_info(image_path)
         except Exception as e:
-            print(f"⚠️  이미지 크기 검증 실패: {e}")
+            self._notice('warning', f"⚠️  이미지 크기 검증 실패: {e}")
             return True
-    
-    def create_video(self, description: str, image_url: str = None, video_config: dict = None) -> Optional[str]:
-        """동영상을 만들고 파일로 저장합니다"""
-        
-        if video_config is None:
-            video_config = {}
         
-        console.print()
-        console.print(Panel(
-            "[bold cyan]🎬 동영상 생성을 시작합니다...[/bold cyan]",
-            title="[bold blue]동영상 생성[/bold blue]",
-            border_style="blue"
-        ))
+        width, height = info['width'], info['height']
         
-        # 설정 정보 표시
-        info_table = Table(show_header=False, box=None, padding=(0, 1))
-        info_table.add_column("항목", style="cyan")
-        info_table.add_column("내용", style="white")
+        # 화면비 확인 (0.4 ~ 2.5)
+        aspect_ratio = info['aspect_ratio']
+        if aspect_ratio < 0.4 or aspect_ratio > 2.5:
+            self._notice('error', f"❌ 이미지 화면비가 범위를 벗어났습니다: {aspect_ratio:.2f}\n💡 허용 범위: 0.4 ~ 2.5 (2:5 ~ 5:2)")
+            return False
         
-        description_text = description[:50] + '...' if len(description) > 50 else description
-        info_table.add_row("📝 설명", description_text)
+        # 픽셀 크기 확인
+        min_side = min(width, height)
+        max_side = max(width, height)
         
-        if image_url:
-            info_table.add_row("🖼️  이미지", image_url)
-        else:
-            info_table.add_row("📝 모드", "텍스트만으로 동영상을 생성합니다")
+        if min_side < 300:
+            self._notice('error', f"❌ 이미지가 너무 작습니다: {min_side}px (최소 300px)")
+            return False
         
-        # 비디오 설정 표시
-        display_ratio = video_config.get('ratio', '16:9')
-        model_type = "Pro" if video_config.get('use_pro_model', False) else "Lite"
+        if max_side > 6000:
+            self._notice('error', f"❌ 이미지가 너무 큽니다: {max_side}px (최대 6000px)")
+            return False
         
-        if image_url and display_ratio not in ['adaptive', 'keep_ratio']:
-            display_ratio = f"{display_ratio} → adaptive (i2v 제한)"
+        self._notice('success', f"✅ 이미지 크기 검증 통과: {width}x{height} (비율: {aspect_ratio:.2f})")
+        return True
+    
+    def create_video(self, description: str, image_url: str = None, video_config: dict = None) -> Optional[str]:
+        """동영상을 만들고 파일로 저장합니다 (콜백 URL이 설정돼 있으면 기다리지 않고 작업 ID 반환)"""
+        if video_config is None:
+            video_config = {}
         
-        settings_text = f"{video_config.get('resolution', '720p')} | {display_ratio} | {video_config.get('duration', 5)}초 | {video_config.get('fps', 24)}fps | {model_type}"
-        info_table.add_row("⚙️  설정", settings_text)
+        self._emit('clip_started', mode='single', index=1, total=1, prompt=description, image=image_url,
+                   settings=_settings_summary(video_config, bool(image_url)))
+        result = self._generate(description, image_url, video_config)
         
-        console.print(info_table)
-        console.print()
+        if not result:
+            status = 'failed'
+        elif video_config.get('callback_url'):
+            status = 'callback_pending'
+        else:
+            status = 'completed'
+        self._emit('clip_finished', mode='single', index=1, total=1, status=status,
+                   task_id=result if status == 'callback_pending' else None,
+                   video_path=result if status == 'completed' else None)
+        return result
+    
+    def _generate(self, description: str, image_url: str = None, video_config: dict = None) -> Optional[str]:
+        """접수 → 완료 대기 → 다운로드 (콜백 모드면 작업 ID 반환)"""
+        if video_config is None:
+            video_config = {}
         
         # 1단계: 동영상 생성 요청
         task_id = self._start_generation(description, image_url, video_config)
@@ -835,15 +690,6 @@ class EasyVideoMaker:
         
         # 콜백 URL이 설정된 경우 기다리지 않고 task_id만 반환
         if video_config.get('callback_url'):
-            console.print(Panel(
-                "[bold green]📞 콜백 URL이 설정되어 있습니다.[/bold green]\n\n"
-                "[bold cyan]🔔 작업 완료 시 자동으로 알림을 받게 됩니다.[/bold cyan]\n\n"
-                f"[bold blue]📋 작업 ID:[/bold blue] {task_id}\n\n"
-                "[bold yellow]💡 수동으로 상태를 확인하려면:[/bold yellow]\n"
-                f"   python easy_video_maker.py --check {task_id}",
-                title="[bold green]콜백 모드[/bold green]",
-                border_style="green"
-            ))
             return task_id
         
         # 2단계: 완료까지 기다리기
@@ -869,13 +715,13 @@ class EasyVideoMaker:
         
         # 1080p 사용 시 Pro 모델 필요 경고
         if video_config.get('resolution') == '1080p' and not use_pro_model:
-            console.print(Panel(
-                "[bold yellow]⚠️  경고: 1080p 해상도는 Pro 모델에서만 지원됩니다.[/bold yellow]\n\n"
-                "[bold cyan]Pro 모델을 사용하려면 config.txt에서 use_pro_model=true로 설정하세요.[/bold cyan]\n\n"
-                "[bold blue]📝 720p로 변경하여 진행합니다.[/bold blue]",
-                title="[bold yellow]해상도 경고[/bold yellow]",
-                border_style="yellow"
-            ))
+            self._notice(
+                'warning',
+                "⚠️  경고: 1080p 해상도는 Pro 모델에서만 지원됩니다.\n\n"
+                "Pro 모델을 사용하려면 config.txt에서 use_pro_model=true로 설정하세요.\n\n"
+                "📝 720p로 변경하여 진행합니다.",
+                title="해상도 경고"
+            )
             video_config['resolution'] = '720p'
         
         # API 문서에 따른 파라미터 추가
@@ -911,7 +757,6 @@ class EasyVideoMaker:
             text_prompt += " " + " ".join(params)
         
         # 모델 선택 - pro 모델 선택시 seedance-1-0-pro-250528 사용
-        
         if image_url:
             if use_pro_model:
                 model = "seedance-1-0-pro-250528"
@@ -920,48 +765,34 @@ class EasyVideoMaker:
             
             # 로컬 파일인지 URL인지 확인
             if os.path.exists(image_url):
-                print(f"📁 로컬 이미지 파일 감지: {image_url}")
-                
                 # 이미지 크기 검증
                 if not self.validate_image_dimensions(image_url):
-                    print("❌ 이미지 크기 검증 실패")
+                    self._emit('submit_failed', message="이미지 크기 검증 실패")
                     return None
                 
-                # Base64로 인코딩
+                # Base64로 인코딩 (Pro 모델은 JPEG만 지원하므로 항상 JPEG로 변환)
                 base64_image = self.encode_image_to_base64(image_url)
                 if not base64_image:
+                    self._emit('submit_failed', message="이미지 준비 실패")
                     return None
                 
-                # Pro 모델은 JPEG만 지원하므로 항상 JPEG로 변환
                 final_image_url = f"data:image/jpeg;base64,{base64_image}"
-                print("🔄 로컬 이미지를 Base64로 변환하여 사용합니다")
             else:
                 final_image_url = image_url
-                print("🌐 URL 이미지를 사용합니다")
             
             content = [
                 {"type": "text", "text": text_prompt},
                 {"type": "image_url", "image_url": {"url": final_image_url}}
             ]
-            
-            if use_pro_model:
-                print("🎬 이미지-to-비디오 모드로 생성합니다 (Pro 모델)")
-            else:
-                print("🎬 이미지-to-비디오 모드로 생성합니다 (Lite 모델)")
         else:
             if use_pro_model:
                 model = "seedance-1-0-pro-250528"
             else:
                 model = "seedance-1-0-lite-t2v-250428"
-                
+            
             content = [
                 {"type": "text", "text": text_prompt}
             ]
-            
-            if use_pro_model:
-                print("📝 텍스트-to-비디오 모드로 생성합니다 (Pro 모델)")
-            else:
-                print("📝 텍스트-to-비디오 모드로 생성합니다 (Lite 모델)")
         
         data = {
             "model": model,
@@ -971,251 +802,592 @@ class EasyVideoMaker:
         # 콜백 URL이 설정되어 있으면 추가
         if video_config.get('callback_url'):
             data['callback_url'] = video_config['callback_url']
-            print(f"📞 콜백 URL 설정: {video_config['callback_url']}")
         
         try:
+            post_started = time.time()
             response = requests.post(url, headers=self.headers, json=data)
+            post_elapsed = round(time.time() - post_started, 3)
             
             if response.status_code != 200:
-                print(f"❌ API 오류: HTTP {response.status_code}")
                 try:
-                    error_data = response.json()
-                    print(f"📋 오류 상세:")
-                    print(f"   {error_data}")
-                except:
-                    print(f"📋 오류 내용: {response.text}")
+                    detail = response.json()
+                except ValueError:
+                    detail = response.text
+                self._emit('submit_failed', message=f"API 오류: HTTP {response.status_code}",
+                           http_status=response.status_code, detail=detail, elapsed=post_elapsed)
                 return None
             
             result = response.json()
             
             task_id = result.get("id")
             if task_id:
-                print("✅ 동영상 생성 요청이 접수되었습니다!")
+                self._emit('submitted', task_id=task_id, model=model, mode='i2v' if image_url else 't2v',
+                           pro=use_pro_model, callback_url=video_config.get('callback_url'), elapsed=post_elapsed)
                 return task_id
             else:
-                print("❌ 오류: 작업 ID를 받지 못했습니다.")
-                print(f"📋 응답 내용: {result}")
+                self._emit('submit_failed', message="작업 ID를 받지 못했습니다.", detail=result, elapsed=post_elapsed)
                 return None
-                
+        
         except requests.exceptions.RequestException as e:
-            print(f"❌ 네트워크 오류: {e}")
+            self._emit('submit_failed', message=f"네트워크 오류: {e}")
             return None
         except Exception as e:
-            print(f"❌ 예상치 못한 오류: {e}")
+            self._emit('submit_failed', message=f"예상치 못한 오류: {e}")
             return None
     
     def _wait_for_video(self, task_id: str) -> Optional[str]:
-        """동영상 완성까지 기다리기"""
-        console.print()
-        console.print(Panel(
-            "[bold cyan]⏳ 동영상을 만들고 있습니다. 잠시만 기다려주세요...[/bold cyan]\n\n"
-            "[dim](보통 1-3분 정도 걸립니다)[/dim]\n\n"
-            f"[bold blue]작업 ID:[/bold blue] {task_id}",
-            title="[bold cyan]동영상 생성 중[/bold cyan]",
-            border_style="cyan"
-        ))
+        """동영상 완성까지 기다리기 (queued는 5초, running은 10초마다 확인, 최대 60번)"""
+        self._emit('waiting', task_id=task_id)
         
         check_url = f"{self.base_url}/api/v3/contents/generations/tasks/{task_id}"
         start_time = time.time()
         
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-            TimeElapsedColumn(),
-            console=console,
-            transient=True
-        ) as progress:
-            task = progress.add_task("동영상 생성 중...", total=100)
-            
-            for i in range(60):  # 최대 10분 대기 (10초씩 60번)
-                try:
-                    response = requests.get(check_url, headers=self.headers)
-                    response.raise_for_status()
-                    result = response.json()
-                    
-                    status = result.get("status")
-                    elapsed_time = int(time.time() - start_time)
-                    
-                    # 진행률 업데이트 (시간 기반으로 추정)
-                    progress_percent = min(95, (elapsed_time / 180) * 100)  # 3분 기준으로 95%까지
-                    
-                    if status == "succeeded":
-                        progress.update(task, completed=100, description="[bold green]동영상 생성 완료![/bold green]")
-                        video_url = result.get("content", {}).get("video_url")
-                        if video_url:
-                            console.print()
-                            success_message = f"[bold green]🎉 동영상이 완성되었습니다![/bold green] (소요시간: {elapsed_time}초)"
-                            # 토큰 사용량 표시
-                            usage = result.get("usage", {})
-                            if usage.get("completion_tokens"):
-                                success_message += f"\n[bold blue]📊 토큰 사용량:[/bold blue] {usage['completion_tokens']:,} 토큰"
-                            
-                            console.print(Panel(
-                                success_message,
-                                title="[bold green]생성 성공[/bold green]",
-                                border_style="green"
-                            ))
-                            return video_url
-                        else:
-                            console.print(Panel(
-                                "[bold red]❌ 오류: 동영상 주소를 찾을 수 없습니다.[/bold red]",
-                                title="[bold red]생성 오류[/bold red]",
-                                border_style="red"
-                            ))
-                            return None
-                    
-                    elif status == "failed":
-                        error_info = result.get("error", {})
-                        error_code = error_info.get("code", "Unknown")
-                        error_message = error_info.get("message", "알 수 없는 오류")
-                        
-                        error_text = f"[bold red]❌ 동영상 생성 실패:[/bold red]\n\n"
-                        error_text += f"[bold yellow]오류 코드:[/bold yellow] {error_code}\n"
-                        error_text += f"[bold yellow]오류 내용:[/bold yellow] {error_message}\n\n"
-                        
-                        # 일반적인 오류에 대한 안내
-                        if "SensitiveContent" in error_code:
-                            error_text += "[bold cyan]💡 해결방법:[/bold cyan] 프롬프트 내용을 수정해서 다시 시도해보세요."
-                        elif "QuotaExceeded" in error_code:
-                            error_text += "[bold cyan]💡 해결방법:[/bold cyan] 잠시 후 다시 시도해보세요. (할당량 초과)"
-                        
-                        console.print()
-                        console.print(Panel(
-                            error_text,
-                            title="[bold red]생성 실패[/bold red]",
-                            border_style="red"
-                        ))
-                        return None
-                    
-                    elif status == "queued":
-                        progress.update(task, completed=progress_percent, description=f"[yellow]대기 중...[/yellow] ({elapsed_time}초)")
-                        time.sleep(5)  # 대기중일 때는 5초마다 확인
-                        
-                    elif status == "running":
-                        progress.update(task, completed=progress_percent, description=f"[green]생성 중...[/green] ({elapsed_time}초)")
-                        time.sleep(10)  # 실행중일 때는 10초마다 확인
-                        
-                    else:  # 기타 상태
-                        progress.update(task, completed=progress_percent, description=f"[cyan]작업 중... ({status})[/cyan] ({elapsed_time}초)")
-                        time.sleep(10)
-                
-                except requests.exceptions.RequestException as e:
-                    console.print()
-                    console.print(Panel(
-                        f"[bold red]❌ 네트워크 오류:[/bold red] {e}\n\n"
-                        "[bold yellow]💡 인터넷 연결을 확인하고 다시 시도해주세요.[/bold yellow]",
-                        title="[bold red]네트워크 오류[/bold red]",
-                        border_style="red"
-                    ))
-                    return None
-                except Exception as e:
-                    console.print()
-                    console.print(Panel(
-                        f"[bold red]❌ 오류: 상태 확인 실패[/bold red] - {e}",
-                        title="[bold red]시스템 오류[/bold red]",
-                        border_style="red"
-                    ))
+        for _ in range(60):  # 최대 10분 대기 (10초씩 60번)
+            try:
+                response = requests.get(check_url, headers=self.headers)
+                response.raise_for_status()
+                result = response.json()
+            except requests.exceptions.RequestException as e:
+                self._emit('failed', task_id=task_id, code='NetworkError', message=str(e), elapsed=int(time.time() - start_time))
+                return None
+            except Exception as e:
+                self._emit('failed', task_id=task_id, code='Error', message=f"상태 확인 실패 - {e}", elapsed=int(time.time() - start_time))
+                return None
+            
+            status = result.get("status")
+            elapsed_time = int(time.time() - start_time)
+            self._emit('polled', task_id=task_id, status=status, elapsed=elapsed_time)
+            
+            if status == "succeeded":
+                video_url = result.get("content", {}).get("video_url")
+                if not video_url:
+                    self._emit('failed', task_id=task_id, code='NoVideoUrl', message="동영상 주소를 찾을 수 없습니다.", elapsed=elapsed_time)
                     return None
+                self._emit('succeeded', task_id=task_id, video_url=video_url, elapsed=elapsed_time,
+                           tokens=result.get("usage", {}).get("completion_tokens"),
+                           created_at=result.get("created_at"), completed_at=result.get("updated_at"))
+                return video_url
+            
+            elif status == "failed":
+                error_info = result.get("error", {})
+                self._emit('failed', task_id=task_id, code=error_info.get("code", "Unknown"),
+                           message=error_info.get("message", "알 수 없는 오류"), elapsed=elapsed_time)
+                return None
+            
+            # 대기중일 때는 5초, 실행중(또는 기타 상태)일 때는 10초마다 확인
+            time.sleep(5 if status == "queued" else 10)
         
-        console.print()
-        console.print(Panel(
-            f"[bold red]⏰ 시간 초과: 10분이 지났습니다.[/bold red]\n\n"
-            "[bold yellow]💡 작업이 계속 진행 중일 수 있습니다. 잠시 후 다음 명령어로 확인해보세요:[/bold yellow]\n"
-            f"   python easy_video_maker.py --check {task_id}",
-            title="[bold red]시간 초과[/bold red]",
-            border_style="red"
-        ))
+        self._emit('failed', task_id=task_id, code='Timeout', message="10분이 지났습니다.", elapsed=int(time.time() - start_time))
         return None
     
     def _download_video(self, video_url: str) -> Optional[str]:
-        """동영상 다운로드"""
-        console.print()
-        console.print("[bold cyan]📥 동영상을 다운로드합니다...[/bold cyan]")
-        
-        try:
-            # 다운로드 폴더 만들기
-            if not os.path.exists("videos"):
-                os.makedirs("videos")
-            
-            # 파일명 만들기
-            timestamp = int(time.time())
-            filename = f"generated_video_{timestamp}.mp4"
-            filepath = os.path.join("videos", filename)
-            
-            # 다운로드
-            response = requests.get(video_url, stream=True)
-            response.raise_for_status()
-            
-            # 파일 크기 확인
-            total_size = int(response.headers.get('content-length', 0))
-            
-            with Progress(
+        """동영상 다운로드 (videos/generated_video_<시간>.mp4)"""
+        timestamp = int(time.time())
+        return self._download_video_to_path(video_url, os.path.join("videos", f"generated_video_{timestamp}.mp4"))
+
+
+def _settings_summary(video_config: dict, has_image: bool) -> str:
+    """화면 표시용 설정 요약 (해상도 | 화면비 | 길이 | fps | 모델)"""
+    display_ratio = video_config.get('ratio', '16:9')
+    model_type = "Pro" if video_config.get('use_pro_model', False) else "Lite"
+    
+    if has_image and display_ratio not in ['adaptive', 'keep_ratio']:
+        display_ratio = f"{display_ratio} → adaptive (i2v 제한)"
+    
+    return f"{video_config.get('resolution', '720p')} | {display_ratio} | {video_config.get('duration', 5)}초 | {video_config.get('fps', 24)}fps | {model_type}"
+
+
+class RichRenderer:
+    """엔진 이벤트를 rich 패널/표/진행 막대로 그리는 구독자
+    
+    진행 막대는 하나의 화면에 작업마다 한 줄씩 표시합니다. (배치를 동시에 돌려도 출력이 섞이지 않음)
+    """
+    
+    LEVEL_STYLES = {'info': None, 'success': 'green', 'warning': 'yellow', 'error': 'red'}
+    
+    def __init__(self, console: Console):
+        self.console = console
+        self._lock = threading.RLock()
+        self._progress = None
+        self._rows = {}
+    
+    def __call__(self, event: dict):
+        handler = getattr(self, f"_on_{event['event']}", None)
+        if handler is not None:
+            with self._lock:
+                handler(event)
+    
+    def close(self):
+        """진행 막대 정리 (중단되었을 때)"""
+        with self._lock:
+            if self._progress is not None:
+                self._progress.stop()
+                self._progress = None
+                self._rows = {}
+    
+    # 진행 막대 (작업마다 한 줄)
+    
+    def _start_row(self, key: str, description: str, total: Optional[float] = 100):
+        if self._progress is None:
+            from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeElapsedColumn
+            self._progress = Progress(
                 SpinnerColumn(),
                 TextColumn("[progress.description]{task.description}"),
                 BarColumn(),
                 TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-                TextColumn("•"),
-                TextColumn("{task.completed}/{task.total} MB"),
-                console=console,
+                TimeElapsedColumn(),
+                console=self.console,
                 transient=True
-            ) as progress:
-                task = progress.add_task("다운로드 중...", total=total_size // (1024 * 1024) if total_size > 0 else 100)
-                
-                with open(filepath, 'wb') as f:
-                    downloaded = 0
-                    for chunk in response.iter_content(chunk_size=8192):
-                        f.write(chunk)
-                        downloaded += len(chunk)
-                        if total_size > 0:
-                            progress.update(task, completed=downloaded // (1024 * 1024))
-                        else:
-                            # 파일 크기를 모르는 경우 진행률을 추정
-                            progress.update(task, completed=min(90, downloaded // (1024 * 1024)))
-                
-                if total_size == 0:
-                    progress.update(task, completed=100)
-            
-            # 파일 크기 표시
-            file_size = os.path.getsize(filepath) / (1024 * 1024)
-            
-            console.print()
-            console.print(Panel(
-                f"[bold green]✅ 완료! 동영상이 저장되었습니다:[/bold green]\n\n"
-                f"[bold blue]📁 파일 경로:[/bold blue] {filepath}\n"
-                f"[bold blue]📊 파일 크기:[/bold blue] {file_size:.1f} MB",
-                title="[bold green]다운로드 완료[/bold green]",
+            )
+            self._progress.start()
+        self._rows[key] = self._progress.add_task(description, total=total)
+    
+    def _update_row(self, key: str, **kwargs):
+        if key in self._rows:
+            self._progress.update(self._rows[key], **kwargs)
+    
+    def _end_row(self, key: str):
+        row = self._rows.pop(key, None)
+        if row is None:
+            return
+        self._progress.remove_task(row)
+        if not self._rows:
+            self._progress.stop()
+            self._progress = None
+    
+    # 안내
+    
+    def _on_notice(self, event):
+        style = self.LEVEL_STYLES.get(event['level'])
+        if event.get('title'):
+            self.console.print(Panel(
+                f"[bold]{event['message']}[/bold]",
+                title=f"[bold {style or 'blue'}]{event['title']}[/bold {style or 'blue'}]",
+                border_style=style or 'blue'
+            ))
+        else:
+            self.console.print(event['message'], style=style, markup=False, highlight=False)
+    
+    # 배치 / 체인
+    
+    def _on_batch_started(self, event):
+        print("🎬 배치 동영상 생성을 시작합니다")
+        print(f"📋 범위: {event['start']}-{event['end']} ({event['end'] - event['start'] + 1}개 / 전체 {event['total']}개)")
+        if event.get('chains'):
+            print(f"🔗 체인 {event['chains']}개 포함 (실행 단위 {event['units']}개, 체인 안의 클립은 순서대로 이어서 생성)")
+        if event['concurrency'] > 1:
+            print(f"⚡ 동시 실행: {event['concurrency']}개")
+        print("=" * 50)
+    
+    def _on_batch_finished(self, event):
+        print("\n" + "=" * 50)
+        print("📊 배치 처리 결과:")
+        print(f"✅ 완료: {event['completed']}개")
+        print(f"❌ 실패: {event['failed']}개")
+        if event['pending'] > 0:
+            print(f"📞 콜백 대기: {event['pending']}개")
+        if event.get('prep_stats'):
+            print(event['prep_stats'])
+    
+    def _on_chain_started(self, event):
+        print(f"🎬 연속 동영상 체인 생성을 시작합니다! ({event['end'] - event['start'] + 1}개 클립)")
+        print("🔗 각 클립의 마지막 프레임이 다음 클립의 시작 이미지로 사용됩니다.")
+        print()
+    
+    def _on_chain_finished(self, event):
+        self.console.print()
+        result_table = Table(title="[bold blue]🔗 연속 동영상 체인 생성 결과[/bold blue]", show_header=True, header_style="bold magenta")
+        result_table.add_column("항목", style="cyan", width=15)
+        result_table.add_column("개수", style="white", width=10)
+        result_table.add_row("✅ 완료", f"[bold green]{event['completed']}개[/bold green]")
+        result_table.add_row("❌ 실패", f"[bold red]{event['failed']}개[/bold red]")
+        self.console.print(result_table)
+        if event.get('prep_stats'):
+            self.console.print(event['prep_stats'])
+        
+        if event['clips']:
+            self.console.print()
+            clips_table = Table(title="[bold blue]📁 생성된 동영상 파일들[/bold blue]", show_header=True, header_style="bold magenta")
+            clips_table.add_column("클립 번호", style="cyan", width=10)
+            clips_table.add_column("파일 경로", style="white", width=50)
+            for clip in event['clips']:
+                clips_table.add_row(str(clip['index']), clip['path'] or '파일 없음')
+            self.console.print(clips_table)
+            self.console.print()
+    
+    # 클립
+    
+    def _on_clip_started(self, event):
+        prompt = event['prompt']
+        if event['mode'] == 'batch':
+            print(f"\n📝 [{event['index']}/{event['total']}] 프롬프트: {prompt[:60]}{'...' if len(prompt) > 60 else ''}")
+            image = event.get('image')
+            if image and image.startswith("data:"):
+                print("🖼️  이미지: 이전 클립의 마지막 프레임")
+            elif image:
+                print(f"🖼️  이미지: {os.path.basename(image) if os.path.exists(image) else 'URL'}")
+            else:
+                print("📝 텍스트-to-비디오")
+            if event.get('settings'):
+                print(f"⚙️  설정: {event['settings']}")
+            return
+        
+        if event['mode'] == 'chain':
+            print(f"\n{'='*50}")
+            print(f"🎥 클립 {event['index']}/{event['total']} 생성 중...")
+            print(f"📝 프롬프트: {prompt[:100]}{'...' if len(prompt) > 100 else ''}")
+            if event.get('image') == 'previous_frame':
+                print("🖼️  시작 이미지: 이전 클립의 마지막 프레임 사용")
+            elif event.get('image'):
+                print("🖼️  시작 이미지: 지정한 이미지")
+            else:
+                print("🖼️  시작 이미지: 없음 (텍스트 전용)")
+        
+        self.console.print()
+        self.console.print(Panel(
+            "[bold cyan]🎬 동영상 생성을 시작합니다...[/bold cyan]",
+            title="[bold blue]동영상 생성[/bold blue]",
+            border_style="blue"
+        ))
+        info_table = Table(show_header=False, box=None, padding=(0, 1))
+        info_table.add_column("항목", style="cyan")
+        info_table.add_column("내용", style="white")
+        info_table.add_row("📝 설명", prompt[:50] + '...' if len(prompt) > 50 else prompt)
+        image = event.get('image')
+        if image == 'previous_frame':
+            info_table.add_row("🖼️  이미지", "이전 클립의 마지막 프레임")
+        elif image == 'initial':
+            info_table.add_row("🖼️  이미지", "지정한 시작 이미지")
+        elif image and image.startswith("data:"):
+            info_table.add_row("🖼️  이미지", "준비된 이미지 (Base64)")
+        elif image:
+            info_table.add_row("🖼️  이미지", image)
+        else:
+            info_table.add_row("📝 모드", "텍스트만으로 동영상을 생성합니다")
+        if event.get('settings'):
+            info_table.add_row("⚙️  설정", event['settings'])
+        self.console.print(info_table)
+        self.console.print()
+    
+    def _on_clip_finished(self, event):
+        if event['mode'] == 'batch':
+            label = f"[{event['index']}/{event['total']}]"
+            status = event['status']
+            if status == 'completed':
+                print(f"✅ {label} 완료: {event['video_path']}")
+            elif status == 'callback_pending':
+                print(f"📞 {label} 콜백 대기 중...")
+            elif status == 'download_failed':
+                print(f"❌ {label} 다운로드 실패")
+            elif status == 'generation_failed':
+                print(f"❌ {label} 생성 실패")
+            else:
+                print(f"❌ {label} 작업 접수 실패")
+        elif event['mode'] == 'single' and event['status'] == 'callback_pending':
+            self.console.print(Panel(
+                "[bold green]📞 콜백 URL이 설정되어 있습니다.[/bold green]\n\n"
+                "[bold cyan]🔔 작업 완료 시 자동으로 알림을 받게 됩니다.[/bold cyan]\n\n"
+                f"[bold blue]📋 작업 ID:[/bold blue] {event['task_id']}\n\n"
+                "[bold yellow]💡 수동으로 상태를 확인하려면:[/bold yellow]\n"
+                f"   python easy_video_maker.py --check {event['task_id']}",
+                title="[bold green]콜백 모드[/bold green]",
                 border_style="green"
             ))
-            
-            return filepath
-            
-        except Exception as e:
-            console.print()
-            console.print(Panel(
-                f"[bold red]❌ 오류: 다운로드 실패[/bold red] - {e}",
-                title="[bold red]다운로드 오류[/bold red]",
+    
+    # 생성 작업
+    
+    def _on_image_prepared(self, event):
+        size_mb = event.get('payload_bytes', 0) / (1024 * 1024)
+        if event['cached']:
+            print(f"♻️  준비된 이미지 재사용: {event['width']}x{event['height']} (크기: {size_mb:.2f}MB)")
+            return
+        if event.get('source_mime') and event['source_mime'] != 'image/jpeg':
+            print(f"🔄 {event['source_mime'].split('/')[-1].upper()} → JPEG 형식으로 변환했습니다")
+        if event.get('original_width') and event['width'] != event['original_width']:
+            print(f"🔧 Base64용 이미지 크기 조정: {event['width']}x{event['height']}")
+        print(f"✅ Base64 인코딩 완료! (크기: {size_mb:.2f}MB, 품질 {event.get('quality')}, {event.get('elapsed', 0):.2f}초)")
+    
+    def _on_submitted(self, event):
+        mode = "이미지-to-비디오" if event['mode'] == 'i2v' else "텍스트-to-비디오"
+        model = "Pro" if event.get('pro') else "Lite"
+        print(f"🎬 {mode} 모드로 생성합니다 ({model} 모델)")
+        if event.get('callback_url'):
+            print(f"📞 콜백 URL 설정: {event['callback_url']}")
+        print(f"✅ 동영상 생성 요청이 접수되었습니다! ({event['task_id']})")
+    
+    def _on_submit_failed(self, event):
+        print(f"❌ 작업 접수 실패: {event['message']}")
+        if event.get('detail'):
+            print("📋 오류 상세:")
+            print(f"   {event['detail']}")
+    
+    def _on_waiting(self, event):
+        self.console.print()
+        self.console.print(Panel(
+            "[bold cyan]⏳ 동영상을 만들고 있습니다. 잠시만 기다려주세요...[/bold cyan]\n\n"
+            "[dim](보통 1-3분 정도 걸립니다)[/dim]\n\n"
+            f"[bold blue]작업 ID:[/bold blue] {event['task_id']}",
+            title="[bold cyan]동영상 생성 중[/bold cyan]",
+            border_style="cyan"
+        ))
+        self._start_row(event['task_id'], "동영상 생성 중...")
+    
+    def _on_polled(self, event):
+        elapsed = event['elapsed']
+        status = event['status']
+        # 진행률은 시간 기반으로 추정 (3분 기준으로 95%까지)
+        progress_percent = min(95, (elapsed / 180) * 100)
+        label = f"{event['task_id'][-8:]} " if len(self._rows) > 1 else ""
+        if status == "queued":
+            description = f"{label}[yellow]대기 중...[/yellow] ({elapsed}초)"
+        elif status == "running":
+            description = f"{label}[green]생성 중...[/green] ({elapsed}초)"
+        elif status == "succeeded":
+            description = f"{label}[bold green]동영상 생성 완료![/bold green]"
+            progress_percent = 100
+        else:
+            description = f"{label}[cyan]작업 중... ({status})[/cyan] ({elapsed}초)"
+        self._update_row(event['task_id'], completed=progress_percent, description=description)
+    
+    def _on_succeeded(self, event):
+        self._end_row(event['task_id'])
+        self.console.print()
+        success_message = f"[bold green]🎉 동영상이 완성되었습니다![/bold green] (소요시간: {event['elapsed']}초)"
+        if event.get('tokens'):
+            success_message += f"\n[bold blue]📊 토큰 사용량:[/bold blue] {event['tokens']:,} 토큰"
+        self.console.print(Panel(success_message, title="[bold green]생성 성공[/bold green]", border_style="green"))
+    
+    def _on_failed(self, event):
+        self._end_row(event['task_id'])
+        code = event['code']
+        self.console.print()
+        if code == 'Timeout':
+            self.console.print(Panel(
+                f"[bold red]⏰ 시간 초과: 10분이 지났습니다.[/bold red]\n\n"
+                "[bold yellow]💡 작업이 계속 진행 중일 수 있습니다. 잠시 후 다음 명령어로 확인해보세요:[/bold yellow]\n"
+                f"   python easy_video_maker.py --check {event['task_id']}",
+                title="[bold red]시간 초과[/bold red]",
                 border_style="red"
             ))
-            return None
+            return
+        if code == 'NetworkError':
+            self.console.print(Panel(
+                f"[bold red]❌ 네트워크 오류:[/bold red] {event['message']}\n\n"
+                "[bold yellow]💡 인터넷 연결을 확인하고 다시 시도해주세요.[/bold yellow]",
+                title="[bold red]네트워크 오류[/bold red]",
+                border_style="red"
+            ))
+            return
+        
+        error_text = f"[bold red]❌ 동영상 생성 실패:[/bold red]\n\n"
+        error_text += f"[bold yellow]오류 코드:[/bold yellow] {code}\n"
+        error_text += f"[bold yellow]오류 내용:[/bold yellow] {event['message']}\n\n"
+        # 일반적인 오류에 대한 안내
+        if "SensitiveContent" in code:
+            error_text += "[bold cyan]💡 해결방법:[/bold cyan] 프롬프트 내용을 수정해서 다시 시도해보세요."
+        elif "QuotaExceeded" in code:
+            error_text += "[bold cyan]💡 해결방법:[/bold cyan] 잠시 후 다시 시도해보세요. (할당량 초과)"
+        self.console.print(Panel(error_text, title="[bold red]생성 실패[/bold red]", border_style="red"))
+    
+    # 파일 처리
+    
+    def _on_downloading(self, event):
+        self.console.print(f"[bold cyan]📥 동영상을 다운로드합니다...[/bold cyan] {event['path']}")
+    
+    def _on_downloaded(self, event):
+        file_size = event['size_bytes'] / (1024 * 1024)
+        self.console.print(f"[bold green]✅ 다운로드 완료:[/bold green] {event['path']} ({file_size:.1f} MB, {event['elapsed']:.1f}초)")
+    
+    def _on_download_failed(self, event):
+        self.console.print(Panel(
+            f"[bold red]❌ 오류: 다운로드 실패[/bold red] - {event['message']}",
+            title="[bold red]다운로드 오류[/bold red]",
+            border_style="red"
+        ))
+    
+    def _on_frame_extracted(self, event):
+        if event.get('resized'):
+            print(f"🔧 이미지 크기 조정: {event['width']}x{event['height']}")
+        print(f"✅ 마지막 프레임 추출 완료: {event['frame_path']}")
+    
+    def _on_merging(self, event):
+        self.console.print()
+        self.console.print(Panel(
+            f"[bold cyan]🎬 {event['clips']}개의 동영상을 하나로 합치는 중...[/bold cyan]",
+            title="[bold cyan]동영상 합치기[/bold cyan]",
+            border_style="cyan"
+        ))
+        self._start_row('merge', "동영상 합치는 중...", total=None)
+    
+    def _on_merge_analyzed(self, event):
+        lines = [f"✂️  {os.path.basename(t['path'])}: {t['content_end']:.2f}초 이후 정지 구간 제외" for t in event['trimmed']]
+        lines += [
+            f"⚠️  {os.path.basename(j['from'])} → {os.path.basename(j['to'])}: 화면이 크게 바뀝니다 (차이 {j['score']:.2f})"
+            for j in event['jumps']
+        ]
+        self.console.print(Panel("\n".join(lines), title="[bold yellow]장면 분석[/bold yellow]", border_style="yellow"))
+    
+    def _on_merged(self, event):
+        self._end_row('merge')
+        file_size = event['size_bytes'] / (1024 * 1024)
+        self.console.print()
+        self.console.print(Panel(
+            f"[bold green]✅ 동영상 합치기 완료![/bold green]\n\n"
+            f"[bold blue]📁 출력 파일:[/bold blue] {event['path']}\n"
+            f"[bold blue]📊 파일 크기:[/bold blue] {file_size:.1f} MB\n"
+            f"[bold blue]🎬 합친 클립 수:[/bold blue] {event['clips']}개",
+            title="[bold green]합치기 성공[/bold green]",
+            border_style="green"
+        ))
+    
+    def _on_merge_failed(self, event):
+        self._end_row('merge')
+        code = event['code']
+        message = f"[bold red]❌ {event['message']}[/bold red]"
+        if code == 'FfmpegError':
+            message = (f"[bold red]❌ ffmpeg 오류:[/bold red]\n\n{event['message']}\n\n"
+                       "[bold yellow]💡 해결방법:[/bold yellow]\n"
+                       "1. ffmpeg가 설치되어 있는지 확인하세요\n"
+                       "2. 동영상 파일이 손상되지 않았는지 확인하세요\n"
+                       "3. 충분한 디스크 공간이 있는지 확인하세요")
+        elif code == 'FfmpegMissing':
+            message += ("\n\n[bold yellow]💡 설치 방법:[/bold yellow]\n"
+                        "• macOS: brew install ffmpeg\n"
+                        "• Ubuntu/Debian: sudo apt install ffmpeg\n"
+                        "• Windows: https://ffmpeg.org/download.html")
+        self.console.print(Panel(message, title="[bold red]합치기 실패[/bold red]", border_style="red"))
+    
+    def _on_merge_skipped(self, event):
+        self.console.print(Panel(
+            "[bold yellow]📝 개별 클립들이 각각 저장되어 있습니다.[/bold yellow]\n\n"
+            "[bold cyan]💡 나중에 합치려면:[/bold cyan]\n"
+            "videos/ 폴더의 파일들을 수동으로 합치거나\n"
+            "ffmpeg 명령어를 사용하세요.",
+            title="[bold yellow]개별 저장[/bold yellow]",
+            border_style="yellow"
+        ))
+    
+    # 실행 단위 (헤드리스)
+    
+    def _on_run_failed(self, event):
+        self.close()
+        self.console.print(f"[bold red]❌ 오류: {event['message']}[/bold red]")
+
+
+def create_event_bus(*subscribers) -> EventBus:
+    """터미널 화면(RichRenderer)을 기본으로 구독한 이벤트 버스"""
+    bus = EventBus()
+    bus.subscribe(RichRenderer(console))
+    for subscriber in subscribers:
+        bus.subscribe(subscriber)
+    return bus
+
+
+def print_task_status(task_id: str, result: dict):
+    """--check 결과 출력"""
+    status = result.get("status")
+    created_at = result.get("created_at")
+    updated_at = result.get("updated_at")
+    
+    print(f"📊 작업 정보:")
+    print(f"   ID: {task_id}")
+    print(f"   상태: {status}")
+    
+    if created_at:
+        created_time = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(created_at))
+        print(f"   생성 시간: {created_time}")
+    
+    if updated_at:
+        updated_time = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(updated_at))
+        print(f"   업데이트 시간: {updated_time}")
+    
+    if status == "succeeded":
+        video_url = result.get("content", {}).get("video_url")
+        if video_url:
+            print(f"✅ 완료! 동영상 다운로드 가능")
+            print(f"   다운로드 URL: {video_url}")
+            
+            # 토큰 사용량 표시
+            usage = result.get("usage", {})
+            if usage.get("completion_tokens"):
+                print(f"   토큰 사용량: {usage['completion_tokens']:,}")
+    
+    elif status == "failed":
+        error_info = result.get("error", {})
+        error_code = error_info.get("code", "Unknown")
+        error_message = error_info.get("message", "알 수 없는 오류")
+        
+        print(f"❌ 실패:")
+        print(f"   오류 코드: {error_code}")
+        print(f"   오류 내용: {error_message}")
+    
+    elif status in ["queued", "running"]:
+        print(f"⏳ 진행 중... 잠시 후 다시 확인해보세요.")
+
+
+def print_recent_tasks(result: dict):
+    """--list 결과 출력"""
+    tasks = result.get("items", [])
+    total = result.get("total", 0)
+    
+    if not tasks:
+        print("📭 최근 작업이 없습니다.")
+        return
+    
+    print(f"📊 총 {total}개 작업 중 최근 {len(tasks)}개:")
+    print()
+    
+    for i, task in enumerate(tasks, 1):
+        task_id = task.get("id", "")
+        status = task.get("status", "")
+        created_at = task.get("created_at")
+        model = task.get("model", "")
+        
+        status_emoji = {
+            "succeeded": "✅",
+            "failed": "❌", 
+            "running": "⏳",
+            "queued": "🔄"
+        }.get(status, "❓")
+        
+        created_time = ""
+        if created_at:
+            created_time = time.strftime('%m-%d %H:%M', time.localtime(created_at))
+        
+        print(f"{i:2d}. {status_emoji} {task_id} [{status}] {created_time}")
+        if model:
+            model_short = model.split('-')[-1] if '-' in model else model
+            print(f"     모델: {model_short}")
+        
+        # 실패한 경우 오류 정보 표시
+        if status == "failed":
+            error_info = task.get("error", {})
+            if error_info.get("code"):
+                print(f"     오류: {error_info.get('code', '')}")
+        
+        print()
 
 
 def read_batch_prompts_file(file_path: str = "batch_prompts.txt") -> Optional[list]:
-    """프롬프트 파일에서 여러 프롬프트 읽기"""
+    """프롬프트 파일에서 여러 프롬프트 읽기 (.txt / .jsonl / .yaml, 형식은 prompt_file.py 참고)
+    
+    프롬프트마다 설정과 체인/장면 묶음이 붙은 항목 목록을 반환합니다.
+    """
+    import prompt_file
+    
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            lines = f.readlines()
-        
-        prompts = []
-        for line_num, line in enumerate(lines, 1):
-            line = line.strip()
-            # 빈 줄이나 주석 줄 무시
-            if line and not line.startswith("#"):
-                prompts.append(line)
+        prompts = prompt_file.load_prompt_file(file_path)
         
         if prompts:
-            console.print(f"[bold green]📝 {len(prompts)}개의 프롬프트를 읽었습니다.[/bold green]")
+            groups = {entry['chain'] or entry['scene'] for entry in prompts} - {None}
+            custom = sum(1 for entry in prompts if entry['settings'])
+            detail = []
+            if custom:
+                detail.append(f"개별 설정 {custom}개")
+            if groups:
+                detail.append(f"체인/장면 {len(groups)}개")
+            console.print(f"[bold green]📝 {len(prompts)}개의 프롬프트를 읽었습니다.[/bold green]"
+                          + (f" ({', '.join(detail)})" if detail else ""))
             return prompts
         else:
             console.print(f"[bold yellow]⚠️ 경고: {file_path} 파일에 유효한 프롬프트가 없습니다.[/bold yellow]")
@@ -1225,31 +1397,36 @@ def read_batch_prompts_file(file_path: str = "batch_prompts.txt") -> Optional[li
         console.print(f"[bold red]❌ 오류: {file_path} 파일을 찾을 수 없습니다.[/bold red]")
         console.print("[bold yellow]📝 프롬프트 파일을 만들고 각 줄에 프롬프트를 작성해주세요.[/bold yellow]")
         return None
+    except ValueError as e:
+        console.print(f"❌ 오류: 프롬프트 파일 형식 - {e}", style="bold red", markup=False)
+        return None
     except Exception as e:
         console.print(f"[bold red]❌ 오류: {file_path} 파일 읽기 실패 - {e}[/bold red]")
         return None
 
-def read_prompt_file() -> str:
+def read_prompt_file(file_path: str = "prompt.txt") -> str:
     """prompt.txt 파일에서 동영상 설명 읽기"""
     try:
-        with open("prompt.txt", "r", encoding="utf-8") as f:
+        with open(file_path, "r", encoding="utf-8") as f:
             content = f.read().strip()
             if content:
                 return content
             else:
-                print("⚠️  경고: prompt.txt 파일이 비어있습니다.")
+                print(f"⚠️  경고: {file_path} 파일이 비어있습니다.")
                 return None
     except FileNotFoundError:
-        print("❌ 오류: prompt.txt 파일을 찾을 수 없습니다.")
-        print("📝 prompt.txt 파일을 만들고 동영상 설명을 작성해주세요.")
+        print(f"❌ 오류: {file_path} 파일을 찾을 수 없습니다.")
+        print(f"📝 {file_path} 파일을 만들고 동영상 설명을 작성해주세요.")
         return None
     except Exception as e:
-        print(f"❌ 오류: prompt.txt 파일 읽기 실패 - {e}")
+        print(f"❌ 오류: {file_path} 파일 읽기 실패 - {e}")
         return None
 
 
 def select_prompt_file_from_folder() -> Optional[str]:
     """prompt_lists 폴더에서 프롬프트 파일 선택"""
+    import prompt_file
+    
     prompt_lists_dir = "prompt_lists"
     
     # prompt_lists 폴더가 없으면 생성
@@ -1257,21 +1434,21 @@ def select_prompt_file_from_folder() -> Optional[str]:
         os.makedirs(prompt_lists_dir)
         console.print(Panel(
             f"[bold blue]📁 {prompt_lists_dir} 폴더를 생성했습니다.[/bold blue]\n\n"
-            "[bold yellow]💡 이 폴더에 프롬프트 파일(.txt)을 넣고 다시 실행하세요.[/bold yellow]",
+            "[bold yellow]💡 이 폴더에 프롬프트 파일(.txt, .jsonl, .yaml)을 넣고 다시 실행하세요.[/bold yellow]",
             title="[bold blue]폴더 생성[/bold blue]",
             border_style="blue"
         ))
         return None
     
-    # 텍스트 파일 찾기
+    # 프롬프트 파일 찾기 (.txt, .jsonl, .yaml)
     prompt_files = []
     for file in os.listdir(prompt_lists_dir):
-        if file.endswith('.txt'):
+        if file.endswith(('.txt', '.jsonl', '.yaml', '.yml')):
             prompt_files.append(file)
     
     if not prompt_files:
         console.print(Panel(
-            f"[bold red]❌ {prompt_lists_dir} 폴더에 프롬프트 파일(.txt)이 없습니다.[/bold red]\n\n"
+            f"[bold red]❌ {prompt_lists_dir} 폴더에 프롬프트 파일(.txt, .jsonl, .yaml)이 없습니다.[/bold red]\n\n"
             "[bold yellow]💡 프롬프트 파일을 생성하고 다시 실행하세요.[/bold yellow]",
             title="[bold red]프롬프트 파일 없음[/bold red]",
             border_style="red"
@@ -1291,10 +1468,8 @@ def select_prompt_file_from_folder() -> Optional[str]:
         
         # 프롬프트 수 계산
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                lines = f.readlines()
-            prompt_count = len([line for line in lines if line.strip() and not line.strip().startswith("#")])
-        except:
+            prompt_count = len(prompt_file.load_prompt_file(file_path))
+        except (OSError, ValueError):
             prompt_count = "?"
         
         prompt_table.add_row(str(i), file, f"{file_size:.1f}KB", str(prompt_count))
@@ -1330,6 +1505,8 @@ def select_prompt_file_from_folder() -> Optional[str]:
 
 def select_image_from_folder() -> Optional[str]:
     """images 폴더에서 이미지 선택"""
+    import image_helper
+    
     images_dir = "images"
     
     # images 폴더가 없으면 생성
@@ -1361,20 +1538,41 @@ def select_image_from_folder() -> Optional[str]:
         ))
         return None
     
+    image_files.sort()
+
+    # image_helper.py scan 결과가 있으면 이미지를 열지 않고 해상도/화면비/업로드 크기 표시
+    manifest = image_helper.load_manifest(images_dir)
+    
     # 이미지 파일 목록을 Table로 표시
     image_table = Table(title=f"[bold blue]📁 {images_dir} 폴더의 이미지 파일들[/bold blue]", show_header=True, header_style="bold magenta")
     image_table.add_column("번호", style="cyan", width=6)
     image_table.add_column("파일명", style="white", width=30)
     image_table.add_column("크기", style="green", width=10)
+    if manifest:
+        image_table.add_column("해상도", style="white", width=11)
+        image_table.add_column("비율", style="yellow", width=6)
+        image_table.add_column("업로드", style="green", width=30)
     
     for i, file in enumerate(image_files, 1):
         file_path = os.path.join(images_dir, file)
         file_size = os.path.getsize(file_path) / 1024  # KB
-        image_table.add_row(str(i), file, f"{file_size:.1f}KB")
+        row = [str(i), file, f"{file_size:.1f}KB"]
+        if manifest:
+            entry = manifest.get(file)
+            if entry is None:
+                row += ["-", "-", "[dim]검사 전[/dim]"]
+            elif 'error' in entry:
+                row += ["-", "-", f"[red]❌ {entry['error']}[/red]"]
+            else:
+                row += [f"{entry['width']}x{entry['height']}", entry['aspect_class'],
+                        f"{entry['prepared_width']}x{entry['prepared_height']} {entry['payload_bytes'] / 1024:.0f}KB"]
+        image_table.add_row(*row)
     
     image_table.add_row(str(len(image_files) + 1), "[yellow]이미지 없이 텍스트만 사용[/yellow]", "")
     
     console.print(image_table)
+    if not manifest:
+        console.print("[dim]💡 python image_helper.py scan 을 실행해 두면 해상도/화면비/업로드 크기를 미리 볼 수 있어요[/dim]")
     console.print()
     
     # 사용자 선택
@@ -1400,8 +1598,13 @@ def select_image_from_folder() -> Optional[str]:
             console.print("\n[bold red]❌ 사용자가 취소했습니다.[/bold red]")
             return None
 
-def read_config_file() -> dict:
-    """config.txt 파일에서 설정 읽기 (이미지 URL과 비디오 파라미터)"""
+def read_config_file(config_path: str = "config.txt", overrides: list = None) -> dict:
+    """설정 파일(기본 config.txt)에서 설정 읽기 (이미지 URL과 비디오 파라미터)
+
+    overrides: 파일 다음에 적용할 "key=value" 목록 (헤드리스 모드의 --set)
+    """
+    import prompt_file
+    
     config = {
         'resolution': '720p',
         'ratio': '16:9', 
@@ -1414,45 +1617,31 @@ def read_config_file() -> dict:
         'image_file': None,
         'use_pro_model': False
     }
+    lines = []
     try:
-        with open("config.txt", "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                # 주석이 아닌 설정 줄들 처리
-                if line and not line.startswith("#") and "=" in line:
-                    key, value = line.split("=", 1)
-                    key = key.strip()
-                    value = value.strip()
-                    
-                    if key == "resolution" and value in ["480p", "720p", "1080p"]:
-                        config['resolution'] = value
-                    elif key == "ratio" and value in ["16:9", "4:3", "1:1", "3:4", "9:16", "21:9", "9:21", "keep_ratio"]:
-                        config['ratio'] = value
-                    elif key == "duration" and value.isdigit() and int(value) in [5, 10]:
-                        config['duration'] = int(value)
-                    elif key == "fps" and value.isdigit() and int(value) in [16, 24]:
-                        config['fps'] = int(value)
-                    elif key == "watermark" and value.lower() in ["true", "false"]:
-                        config['watermark'] = value.lower() == "true"
-                    elif key == "seed" and (value == "-1" or (value.isdigit() and 0 <= int(value) <= 4294967295)):
-                        config['seed'] = int(value)
-                    elif key == "camerafixed" and value.lower() in ["true", "false"]:
-                        config['camerafixed'] = value.lower() == "true"
-                    elif key == "callback_url" and value.startswith("http"):
-                        config['callback_url'] = value
-                    elif key == "image_file" and value:
-                        config['image_file'] = value
-                    elif key == "use_pro_model" and value.lower() in ["true", "false"]:
-                        config['use_pro_model'] = value.lower() == "true"
-        
-        return config
-        
+        with open(config_path, "r", encoding="utf-8") as f:
+            lines = f.readlines()
     except FileNotFoundError:
-        print("ℹ️  config.txt 파일이 없습니다. 기본 설정을 사용합니다.")
-        return config
+        print(f"ℹ️  {config_path} 파일이 없습니다. 기본 설정을 사용합니다.")
     except Exception as e:
-        print(f"❌ 오류: config.txt 파일 읽기 실패 - {e}")
-        return config
+        print(f"❌ 오류: {config_path} 파일 읽기 실패 - {e}")
+    
+    for line in lines + list(overrides or []):
+        line = line.strip()
+        # 주석이 아닌 설정 줄들 처리
+        if line and not line.startswith("#") and "=" in line:
+            key, value = line.split("=", 1)
+            key = key.strip()
+            value = value.strip()
+            
+            # 값 검증은 프롬프트 파일과 같은 규칙 사용 (올바르지 않은 값은 무시)
+            try:
+                config_key, config_value = prompt_file.parse_setting(key, value)
+            except ValueError:
+                continue
+            config[config_key] = config_value
+    
+    return config
 
 
 def show_config_links(mode="normal"):
@@ -1517,7 +1706,11 @@ def create_example_files():
 
 # 더 많은 프롬프트를 추가하세요
 # 로봇이 미래 도시를 걸어다닙니다
-# 마법사가 마법의 숲에서 주문을 외웁니다"""
+# 마법사가 마법의 숲에서 주문을 외웁니다
+
+# 프롬프트마다 설정을 바꾸려면 줄 끝에 | 뒤로 key=value를 붙이세요
+# 예: 로봇이 미래 도시를 걸어다닙니다 | duration=10 ratio=9:16 seed=42 model=pro
+# @chain 이름 ~ @end 사이의 줄은 이전 클립의 마지막 프레임에서 이어서 생성합니다 (prompt_file.py 참고)"""
         
         with open("batch_prompts.txt", "w", encoding="utf-8") as f:
             f.write(example_batch_prompts)
@@ -1587,6 +1780,197 @@ use_pro_model=false
         print("💡 이 폴더에 이미지 파일을 넣으면 실행 시 선택할 수 있습니다.")
 
 
+def parse_range(text: str) -> tuple:
+    """범위 문자열 → (시작, 끝) ("3-7", "5"(5번만), "5-"(5번부터), "-4"(4번까지), 끝이 None이면 마지막까지)"""
+    try:
+        if "-" not in text:
+            start = end = int(text)
+        else:
+            first, last = text.split("-", 1)
+            start = int(first) if first.strip() else 1
+            end = int(last) if last.strip() else None
+    except ValueError:
+        raise ValueError(f"범위 형식이 올바르지 않습니다: {text} (예: 3-7, 5-, -4)")
+    if start < 1 or (end is not None and end < start):
+        raise ValueError(f"범위가 올바르지 않습니다: {text}")
+    return start, end
+
+
+def build_headless_parser():
+    """헤드리스 모드 인수 정의 (모든 선택을 옵션으로 받음)"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(
+        prog="easy_video_maker.py --headless",
+        description="묻지 않고 끝까지 실행하는 헤드리스 모드 (cron, CI, 다른 프로그램에서 호출). "
+                    "종료 코드: 0 모두 성공, 1 실패한 클립 있음, 2 입력/설정 오류"
+    )
+    parser.add_argument("mode", choices=["single", "batch", "chain"], help="single: 동영상 1개, batch: 프롬프트별 동영상, chain: 연속 체인")
+    parser.add_argument("--prompts", metavar="파일", help="프롬프트 파일 (batch/chain: .txt/.jsonl/.yaml 프롬프트 목록, single: 파일 전체, 기본 prompt.txt)")
+    parser.add_argument("--prompt", metavar="텍스트", help="single 모드에서 프롬프트를 직접 지정")
+    parser.add_argument("--image", metavar="경로|URL|none", help="시작 이미지 (생략하면 설정 파일의 image_file, none이면 텍스트 전용)")
+    parser.add_argument("--range", metavar="시작-끝", help="실행할 프롬프트 범위 (예: 3-7, 5-, -4)")
+    merge = parser.add_mutually_exclusive_group()
+    merge.add_argument("--merge", dest="merge", action="store_true", default=False,
+                       help="chain: 성공한 클립을 하나로 합침, batch: 프롬프트 파일의 장면(scene)/체인(chain)별로 합침")
+    merge.add_argument("--no-merge", dest="merge", action="store_false", help="합치지 않음 (기본)")
+    parser.add_argument("--config", default="config.txt", metavar="파일", help="설정 파일 (용도별 설정 파일을 골라 쓸 때, 기본 config.txt)")
+    parser.add_argument("--set", action="append", default=[], metavar="KEY=VALUE", help="설정 값 덮어쓰기 (여러 번 사용 가능, 예: --set duration=5)")
+    parser.add_argument("--concurrency", type=int, default=1, metavar="N", help="batch: 동시에 진행할 작업 수 (체인은 한 작업으로 셈, 기본 1)")
+    parser.add_argument("--events", action="store_true", help="stdout에 JSON Lines 이벤트 출력 (사람이 읽는 출력은 stderr로 이동)")
+    parser.add_argument("--report", metavar="파일", help="결과 리포트 JSON 경로 (batch 기본값: batch_report_<범위>_<시간>.json)")
+    parser.add_argument("--trace", default=DEFAULT_TRACE_FILE, metavar="파일|none",
+                        help=f"작업별 단계 시간 기록 JSONL (기본 {DEFAULT_TRACE_FILE}, none이면 기록하지 않음)")
+    return parser
+
+
+def run_headless(argv: list) -> int:
+    """헤드리스 모드 실행 → 종료 코드
+
+    --events면 stdout에는 JSON Lines 이벤트만 나가고, 패널/표/진행 메시지는 stderr로 보냅니다.
+    """
+    parser = build_headless_parser()
+    args = parser.parse_args(argv)
+    if args.concurrency < 1:
+        parser.error("--concurrency는 1 이상이어야 합니다.")
+    for item in args.set:
+        if "=" not in item:
+            parser.error(f"--set 형식이 올바르지 않습니다: {item} (KEY=VALUE)")
+    
+    # 구독자: 터미널 화면 + 통계 (+ --events면 stdout JSON Lines, 화면은 stderr로 이동하기 전에 stdout을 잡아 둠)
+    metrics = MetricsAggregator()
+    subscribers = [metrics] + ([JsonlLogger(sys.stdout)] if args.events else [])
+    if args.trace.lower() != "none":
+        subscribers.append(TraceRecorder(args.trace))
+    events = create_event_bus(*subscribers)
+    output = contextlib.redirect_stdout(sys.stderr) if args.events else contextlib.nullcontext()
+    with output:
+        try:
+            return _run_headless(args, events, metrics)
+        except KeyboardInterrupt:
+            events.emit('run_failed', mode=args.mode, message="사용자가 중단했습니다.")
+            return 130
+
+
+def _run_headless(args, events: EventBus, metrics: MetricsAggregator) -> int:
+    started = time.time()
+    
+    def fail(message: str) -> int:
+        events.emit('run_failed', mode=args.mode, message=message)
+        return 2
+    
+    api_key = os.getenv("ARK_API_KEY")
+    if not api_key:
+        return fail("API 키가 설정되지 않았습니다. (export ARK_API_KEY=your_api_key)")
+    
+    video_config = read_config_file(args.config, args.set)
+    
+    # 프롬프트
+    if args.mode == "single":
+        if args.range:
+            return fail("--range는 batch/chain 모드에서만 쓸 수 있습니다.")
+        prompt_text = args.prompt.strip() if args.prompt else read_prompt_file(args.prompts or "prompt.txt")
+        if not prompt_text:
+            return fail("프롬프트가 없습니다.")
+        prompts = [prompt_text]
+    else:
+        if not args.prompts:
+            return fail(f"{args.mode} 모드에는 --prompts 파일이 필요합니다.")
+        prompts = read_batch_prompts_file(args.prompts)
+        if not prompts:
+            return fail(f"{args.prompts}에서 프롬프트를 읽지 못했습니다.")
+    
+    # 범위
+    start_index, end_index = 1, len(prompts)
+    if args.range:
+        try:
+            start_index, end = parse_range(args.range)
+        except ValueError as e:
+            return fail(str(e))
+        end_index = min(end or len(prompts), len(prompts))
+        if start_index > end_index:
+            return fail(f"시작 번호 {start_index}가 프롬프트 개수 {len(prompts)}보다 큽니다.")
+    
+    # 이미지 (생략하면 설정 파일의 image_file)
+    image = args.image if args.image is not None else video_config.get('image_file')
+    if image and image.lower() == "none":
+        image = None
+    if image and not image.startswith(("http://", "https://", "data:")) and not os.path.exists(image):
+        return fail(f"이미지 파일을 찾을 수 없습니다: {image}")
+    
+    video_maker = EasyVideoMaker(api_key, events=events)
+    events.emit('run_started', mode=args.mode, prompts_file=args.prompts, total=len(prompts),
+                start=start_index, end=end_index, image=image, concurrency=args.concurrency,
+                config=args.config, merge=args.merge)
+    
+    report_file = args.report
+    merged_path = None
+    merge_failed = False
+    if args.mode == "batch":
+        results = video_maker.create_video_batch(prompts, image, video_config, start_index, end_index, args.concurrency,
+                                                 merge_groups=args.merge)
+        merged = [r for r in results if r.get('status') == 'merged']
+        results = [r for r in results if r.get('status') != 'merged']
+        merged_path = [r['video_path'] for r in merged] or None
+        if args.merge:
+            # 성공한 클립이 2개 이상인 묶음은 모두 합쳐져야 성공
+            groups = [r.get('scene') or r.get('chain') for r in results if r['status'] == 'completed']
+            merge_failed = len(merged) < len({g for g in groups if g and groups.count(g) > 1})
+        if not report_file:
+            report_file = f"batch_report_{start_index}-{end_index}_{int(time.time())}.json"
+    elif args.mode == "chain":
+        if args.concurrency > 1:
+            print("ℹ️  체인은 이전 클립의 마지막 프레임이 필요해 한 번에 하나씩 만듭니다. (--concurrency 무시)")
+        initial_image_url = image
+        if image and os.path.exists(image):
+            encoded_image = video_maker.encode_image_to_base64(image)
+            if not encoded_image:
+                return fail(f"시작 이미지를 준비하지 못했습니다: {image}")
+            initial_image_url = f"data:image/jpeg;base64,{encoded_image}"
+        results = video_maker.create_video_chain(prompts[start_index-1:end_index], initial_image_url, video_config,
+                                                 start_index, merge=args.merge)
+        merged_path = next((r['local_path'] for r in results if r.get('status') == 'merged'), None)
+        results = [r for r in results if r.get('status') != 'merged']
+        completed = sum(1 for r in results if r.get('status') == 'completed')
+        merge_failed = args.merge and completed > 1 and not merged_path
+    else:
+        result_path = video_maker.create_video(prompts[0], image, video_config)
+        if not result_path:
+            status = 'failed'
+        elif video_config.get('callback_url'):
+            status = 'callback_pending'
+        else:
+            status = 'completed'
+        results = [{
+            'index': 1,
+            'prompt': prompts[0],
+            'task_id': result_path if status == 'callback_pending' else None,
+            'status': status,
+            'video_path': result_path if status == 'completed' else None
+        }]
+    
+    completed = sum(1 for r in results if r.get('status') == 'completed')
+    pending = sum(1 for r in results if r.get('status') == 'callback_pending')
+    failed = len(results) - completed - pending
+    exit_code = 1 if failed or merge_failed else 0
+    
+    if report_file:
+        report = {'mode': args.mode, 'results': results, 'merged': merged_path} if args.mode != "batch" else results + merged
+        try:
+            with open(report_file, 'w', encoding='utf-8') as f:
+                json.dump(report, f, ensure_ascii=False, indent=2)
+            console.print(f"\n[bold green]📄 결과 리포트: {report_file}[/bold green]")
+        except Exception as e:
+            console.print(f"[bold yellow]⚠️  리포트 저장 실패: {e}[/bold yellow]")
+            report_file = None
+    
+    console.print(metrics.format_summary())
+    events.emit('run_finished', mode=args.mode, completed=completed, failed=failed, pending=pending,
+                merged=merged_path, report=report_file, elapsed=round(time.time() - started, 1),
+                exit_code=exit_code, metrics=metrics.summary())
+    return exit_code
+
+
 def main():
     """메인 실행 함수"""
     
@@ -1594,6 +1978,10 @@ def main():
     if len(sys.argv) > 1:
         command = sys.argv[1]
         
+        # 헤드리스 모드 (묻지 않고 실행, 종료 코드로 결과 전달)
+        if command == "--headless":
+            sys.exit(run_headless(sys.argv[2:]))
+        
         # API 키 확인
         api_key = os.getenv("ARK_API_KEY")
         if not api_key:
@@ -1601,12 +1989,22 @@ def main():
             print("💡 export ARK_API_KEY=your_api_key 를 먼저 실행하세요.")
             return
         
-        video_maker = EasyVideoMaker(api_key)
+        metrics = MetricsAggregator()
+        video_maker = EasyVideoMaker(api_key, create_event_bus(metrics, TraceRecorder()))
         
         if command == "--check" and len(sys.argv) > 2:
             # 특정 작업 상태 확인
             task_id = sys.argv[2]
-            video_maker.check_task_status(task_id)
+            print(f"🔍 작업 상태를 확인합니다: {task_id}")
+            result = video_maker.check_task_status(task_id)
+            if result:
+                print_task_status(task_id, result)
+                video_url = result.get("content", {}).get("video_url")
+                if result.get("status") == "succeeded" and video_url:
+                    # 다운로드 옵션 제공
+                    download = input("\n📥 지금 다운로드하시겠습니까? (y/n): ").strip().lower()
+                    if download == 'y':
+                        video_maker._download_video(video_url)
             return
         
         elif command == "--list":
@@ -1614,10 +2012,15 @@ def main():
             limit = 10
             if len(sys.argv) > 2 and sys.argv[2].isdigit():
                 limit = int(sys.argv[2])
-            video_maker.list_recent_tasks(limit)
+            print(f"📋 최근 작업 {limit}개를 조회합니다...")
+            result = video_maker.list_recent_tasks(limit)
+            if result is not None:
+                print_recent_tasks(result)
             return
         
         elif command == "--batch":
+            import prompt_file
+            
             # 배치 모드
             console.print(Panel(
                 "[bold cyan]🎬 배치 동영상 생성 모드[/bold cyan]",
@@ -1679,7 +2082,7 @@ def main():
             
             # 이미지 선택
             console.print()
-            console.print("[bold green]🖼️ 이미지 선택 (모든 동영상에 동일한 이미지 사용):[/bold green]")
+            console.print("[bold green]🖼️ 이미지 선택 (프롬프트에 이미지가 지정되지 않은 동영상에 사용):[/bold green]")
             image_url = select_image_from_folder()
             
             # 배치 설정 확인 테이블
@@ -1690,6 +2093,15 @@ def main():
             batch_table.add_row("전체 프롬프트", f"{total_prompts}개")
             batch_table.add_row("실행 범위", f"{start_index}-{end_index} ({end_index - start_index + 1}개)")
             
+            # 프롬프트 파일의 체인/장면 묶음
+            selected_entries = batch_prompts[start_index-1:end_index]
+            chains = list(dict.fromkeys(e['chain'] for e in selected_entries if e['chain']))
+            scenes = list(dict.fromkeys(e['scene'] for e in selected_entries if e['scene']))
+            if chains:
+                batch_table.add_row("체인", f"{', '.join(chains)} (이전 클립의 마지막 프레임에서 이어서 생성)")
+            if scenes:
+                batch_table.add_row("장면", ", ".join(scenes))
+            
             if image_url:
                 if os.path.exists(image_url):
                     batch_table.add_row("이미지", f"{os.path.basename(image_url)} (로컬)")
@@ -1706,12 +2118,13 @@ def main():
             console.print()
             preview_table = Table(title="[bold blue]📝 실행될 프롬프트 미리보기[/bold blue]", show_header=True, header_style="bold magenta")
             preview_table.add_column("번호", style="cyan", width=8)
-            preview_table.add_column("프롬프트", style="white", width=60)
+            preview_table.add_column("프롬프트", style="white", width=50)
+            preview_table.add_column("개별 설정", style="green", width=30)
             
             for i in range(start_index, min(start_index + 3, end_index + 1)):
-                prompt = batch_prompts[i-1]
+                prompt = batch_prompts[i-1]['prompt']
                 preview_text = prompt[:50] + '...' if len(prompt) > 50 else prompt
-                preview_table.add_row(str(i), preview_text)
+                preview_table.add_row(str(i), preview_text, prompt_file.describe_settings(batch_prompts[i-1]))
             
             if end_index - start_index + 1 > 3:
                 preview_table.add_row("...", f"(총 {end_index - start_index + 1}개)")
@@ -1729,8 +2142,15 @@ def main():
                 ))
                 return
             
+            # 묶음이 있으면 장면/체인별로 합칠지 미리 확인 (배치가 끝날 때까지 기다리지 않도록)
+            merge_groups = False
+            if chains or scenes:
+                merge_groups = Confirm.ask("[bold cyan]🎬 끝나면 성공한 클립을 장면/체인별로 합칠까요?[/bold cyan]", default=True)
+            
             # 배치 실행
-            results = video_maker.create_video_batch(batch_prompts, image_url, video_config, start_index, end_index)
+            results = video_maker.create_video_batch(batch_prompts, image_url, video_config, start_index, end_index,
+                                                     merge_groups=merge_groups)
+            console.print(metrics.format_summary())
             
             # 결과 저장
             timestamp = int(time.time())
@@ -1822,8 +2242,13 @@ def main():
                 prompts=selected_prompts,
                 initial_image_url=initial_image_url,
                 video_config=video_config,
-                start_index=start_index
+                start_index=start_index,
+                merge=lambda count: Confirm.ask(
+                    f"[bold cyan]🎬 {count}개의 클립을 하나의 동영상으로 합치시겠습니까?[/bold cyan]",
+                    default=True
+                )
             )
+            console.print(metrics.format_summary())
             
             # 결과 저장 (간단한 출력으로 대체)
             completed_count = len([r for r in results if r.get('status') == 'completed'])
@@ -1845,12 +2270,14 @@ def main():
                 "  python easy_video_maker.py --chain <시작> <끝>     # 연속 체인 (범위 지정)\n"
                 "  python easy_video_maker.py --check <task_id>       # 작업 상태 확인\n"
                 "  python easy_video_maker.py --list [개수]           # 최근 작업 목록\n"
+                "  python easy_video_maker.py --headless <모드> ...   # 묻지 않고 실행 (--headless -h 참고)\n"
                 "  python easy_video_maker.py --help                  # 이 도움말\n\n"
                 
                 "[bold yellow]배치 모드:[/bold yellow]\n"
                 "  1. batch_prompts.txt 파일에 각 줄마다 프롬프트 작성\n"
                 "  2. --batch 옵션으로 실행 (범위 지정 가능)\n"
-                "  3. 부분적으로 동영상 생성 (예: 1-5번만)\n\n"
+                "  3. 부분적으로 동영상 생성 (예: 1-5번만)\n"
+                "  4. 프롬프트별 설정: 줄 끝에 | duration=10 seed=42 image=images/a.png (.jsonl/.yaml도 가능)\n\n"
                 
                 "[bold green]연속 체인 모드:[/bold green]\n"
                 "  1. 각 클립의 마지막 프레임이 다음 클립의 시작 이미지로 사용\n"
@@ -1863,7 +2290,8 @@ def main():
                 "  python easy_video_maker.py --chain              # 연속 체인 전체\n"
                 "  python easy_video_maker.py --chain 1 3          # 1-3번 연속 체인\n"
                 "  python easy_video_maker.py --check cgt-2024****-**\n"
-                "  python easy_video_maker.py --list 20",
+                "  python easy_video_maker.py --list 20\n"
+                "  python easy_video_maker.py --headless batch --prompts prompt_lists/a.txt --range 1-5 --image none --concurrency 3 --events",
                 title="[bold blue]🎥 쉬운 동영상 생성기 - 명령어 도움말[/bold blue]",
                 border_style="blue",
                 padding=(1, 2)
@@ -2013,7 +2441,7 @@ def main():
     
     # 동영상 생성기 시작
     try:
-        video_maker = EasyVideoMaker(api_key)
+        video_maker = EasyVideoMaker(api_key, create_event_bus(TraceRecorder()))
         result_path = video_maker.create_video(prompt_text, image_url, video_config)
         
         if result_path:
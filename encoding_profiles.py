@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+🎞️ 인코딩 프로필 (Encoding Profiles)
+===================================
+
+영상을 다시 인코딩하는 모든 작업(제목 합성, 자막 새기기 등)이 같은 설정을 쓰도록
+이름 붙은 인코딩 프로필을 제공합니다.
+
+기본 프로필:
+- standard: 기존 설정 (preset fast, CRF 23)
+- draft:    검토용 빠른 미리보기 (ultrafast, 해상도 절반, CRF 32)
+- final:    최종 결과물 (slow, CRF 20)
+- archive:  보관용 고품질 (veryslow, CRF 16)
+
+config.txt 설정:
+  encode_profile=draft             # 기본으로 사용할 프로필
+  encode.final.crf=18              # 프로필 값 변경 (encode.<프로필>.<항목>=값)
+  encode.mobile.scale=0.75         # 새 프로필 추가 (standard를 기준으로 시작)
+
+사용법:
+1. python encoding_profiles.py list                       # 프로필 목록
+2. python encoding_profiles.py bench <샘플영상> [프로필...]  # 프로필별 인코딩 속도/용량 비교
+"""
+
+import os
+import re
+import sys
+import time
+import tempfile
+import subprocess
+from typing import Optional
+
+DEFAULT_PROFILE = "standard"
+
+PROFILES = {
+    'standard': {
+        'description': "기본 (기존 설정)",
+        'codec': "libx264", 'preset': "fast", 'crf': 23, 'scale': 1.0, 'audio_bitrate': "192k"
+    },
+    'draft': {
+        'description': "검토용 빠른 미리보기",
+        'codec': "libx264", 'preset': "ultrafast", 'crf': 32, 'scale': 0.5, 'audio_bitrate': "96k"
+    },
+    'final': {
+        'description': "최종 결과물",
+        'codec': "libx264", 'preset': "slow", 'crf': 20, 'scale': 1.0, 'audio_bitrate': "192k"
+    },
+    'archive': {
+        'description': "보관용 고품질",
+        'codec': "libx264", 'preset': "veryslow", 'crf': 16, 'scale': 1.0, 'audio_bitrate': "320k"
+    },
+}
+
+X264_PRESETS = ["ultrafast", "superfast", "veryfast", "faster", "fast", "medium", "slow", "slower", "veryslow"]
+
+
+def _parse_value(field: str, value: str):
+    """프로필 항목 값 검증 및 변환 (잘못된 값이면 None)"""
+    if field == "preset":
+        return value if value in X264_PRESETS else None
+    if field == "crf":
+        return int(value) if value.isdigit() and 0 <= int(value) <= 51 else None
+    if field == "scale":
+        try:
+            scale = float(value)
+        except ValueError:
+            return None
+        return scale if 0.1 <= scale <= 1.0 else None
+    if field == "audio_bitrate":
+        return value if re.fullmatch(r"\d+k", value) else None
+    if field in ("codec", "description"):
+        return value or None
+    return None
+
+
+def load_profiles(config_path: str = "config.txt") -> dict:
+    """기본 프로필에 config.txt의 encode.<프로필>.<항목> 설정을 반영"""
+    profiles = {name: dict(profile) for name, profile in PROFILES.items()}
+    if not os.path.exists(config_path):
+        return profiles
+
+    try:
+        with open(config_path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith("#") or "=" not in line:
+                    continue
+                key, value = line.split("=", 1)
+                parts = key.strip().split(".")
+                if len(parts) != 3 or parts[0] != "encode":
+                    continue
+
+                name, field = parts[1], parts[2]
+                parsed = _parse_value(field, value.strip())
+                if parsed is None:
+                    continue
+                if name not in profiles:
+                    profiles[name] = dict(PROFILES[DEFAULT_PROFILE], description=name)
+                profiles[name][field] = parsed
+    except OSError:
+        pass
+
+    return profiles
+
+
+def active_profile_name(config_path: str = "config.txt") -> str:
+    """config.txt의 encode_profile 값 (없으면 standard)"""
+    profiles = load_profiles(config_path)
+    if os.path.exists(config_path):
+        try:
+            with open(config_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if line.startswith("encode_profile=") and line.split("=", 1)[1].strip() in profiles:
+                        return line.split("=", 1)[1].strip()
+        except OSError:
+            pass
+    return DEFAULT_PROFILE
+
+
+def get_profile(name: Optional[str] = None, config_path: str = "config.txt") -> dict:
+    """프로필 가져오기 (이름이 없으면 config.txt에서 선택한 프로필)"""
+    profiles = load_profiles(config_path)
+    name = name or active_profile_name(config_path)
+    if name not in profiles:
+        raise ValueError(f"알 수 없는 인코딩 프로필: {name} (사용 가능: {', '.join(profiles)})")
+    profile = dict(profiles[name])
+    profile['name'] = name
+    return profile
+
+
+def video_args(profile: dict) -> list:
+    """영상 인코딩 ffmpeg 옵션"""
+    return [
+        "-c:v", profile['codec'],
+        "-preset", profile['preset'],
+        "-crf", str(profile['crf']),
+        "-pix_fmt", "yuv420p"
+    ]
+
+
+def audio_args(profile: dict) -> list:
+    """음성 인코딩 ffmpeg 옵션"""
+    return ["-c:a", "aac", "-b:a", profile['audio_bitrate']]
+
+
+def scale_filter(profile: dict) -> Optional[str]:
+    """해상도 축소 필터 (원본 크기면 None, 가로/세로는 짝수로 맞춤)"""
+    scale = profile.get('scale', 1.0)
+    if scale >= 1.0:
+        return None
+    return f"scale=trunc(iw*{scale}/2)*2:trunc(ih*{scale}/2)*2"
+
+
+def benchmark(sample_path: str, names: Optional[list] = None, config_path: str = "config.txt") -> list:
+    """샘플 영상을 프로필별로 인코딩해 속도(fps)와 용량 측정"""
+    profiles = load_profiles(config_path)
+    names = names or list(profiles)
+    results = []
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for name in names:
+            profile = get_profile(name, config_path)
+            output_path = os.path.join(temp_dir, f"{name}.mp4")
+
+            cmd = ["ffmpeg", "-y", "-i", sample_path]
+            vf = scale_filter(profile)
+            if vf:
+                cmd += ["-vf", vf]
+            cmd += video_args(profile) + audio_args(profile) + [output_path]
+
+            start = time.time()
+            result = subprocess.run(cmd, capture_output=True, text=True)
+            elapsed = time.time() - start
+
+            if result.returncode != 0:
+                results.append({'profile': name, 'error': result.stderr.strip().splitlines()[-1:]})
+                continue
+
+            # ffmpeg 진행 출력의 마지막 frame= 값이 인코딩한 프레임 수
+            frames = re.findall(r"frame=\s*(\d+)", result.stderr)
+            frame_count = int(frames[-1]) if frames else 0
+            results.append({
+                'profile': name,
+                'elapsed': elapsed,
+                'frames': frame_count,
+                'fps': frame_count / elapsed if elapsed > 0 else 0.0,
+                'size_mb': os.path.getsize(output_path) / (1024 * 1024)
+            })
+
+    return results
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("🎞️ 인코딩 프로필")
+        print("=" * 30)
+        print()
+        print("사용법:")
+        print("  python encoding_profiles.py list                         # 프로필 목록")
+        print("  python encoding_profiles.py bench <샘플영상> [프로필...]  # 인코딩 속도/용량 비교")
+        return
+
+    command = sys.argv[1]
+
+    if command == "list":
+        active = active_profile_name()
+        for name, profile in load_profiles().items():
+            marker = "👉" if name == active else "  "
+            scale = f"해상도 {profile['scale']:.0%}" if profile['scale'] < 1.0 else "원본 해상도"
+            print(f"{marker} {name:<10} {profile['description']}")
+            print(f"     {profile['codec']} preset={profile['preset']} CRF={profile['crf']} | {scale} | 음성 {profile['audio_bitrate']}")
+    elif command == "bench" and len(sys.argv) > 2:
+        sample_path = sys.argv[2]
+        if not os.path.exists(sample_path):
+            print(f"❌ 파일을 찾을 수 없습니다: {sample_path}")
+            return
+
+        names = sys.argv[3:] or None
+        print(f"⏱️  인코딩 프로필 비교: {sample_path}")
+        print()
+        try:
+            results = benchmark(sample_path, names)
+        except ValueError as e:
+            print(f"❌ {e}")
+            return
+
+        print(f"{'프로필':<10}{'시간':>9}{'인코딩 fps':>12}{'용량':>10}")
+        for r in results:
+            if 'error' in r:
+                print(f"{r['profile']:<10}  ❌ 실패: {' '.join(r['error'])}")
+            else:
+                print(f"{r['profile']:<10}{r['elapsed']:>8.1f}s{r['fps']:>12.1f}{r['size_mb']:>8.2f}MB")
+    else:
+        print("❌ 알 수 없는 명령어입니다.")
+        print("💡 사용 가능한 명령어: list, bench")
+
+
+if __name__ == "__main__":
+    main()
@@ -10,12 +10,26 @@ Base64로 인코딩하고 API 요구사항에 맞는지 검증합니다.
 1. python image_helper.py check <이미지파일>     # 이미지 검증
 2. python image_helper.py encode <이미지파일>    # Base64 인코딩
 3. python image_helper.py auto <이미지파일>      # 자동으로 config.txt 업데이트
+4. python image_helper.py scan [폴더] [워커수]   # 폴더 전체 검증/준비 후 목록(manifest) 저장
+
+scan은 images/ 폴더의 이미지를 프로세스 풀로 동시에 검증하고 동영상 생성기와 같은 방식으로
+업로드용 JPEG를 준비해 본 뒤, 결과를 .cache/image_manifest.json에 저장합니다.
+easy_video_maker.py의 이미지 선택 화면은 이 목록을 읽어 해상도/화면비/업로드 크기를 바로 보여줍니다.
+바뀌지 않은 파일(경로/크기/수정 시간)은 다시 검사하지 않습니다.
 """
 
 import os
 import sys
+import json
+import time
 import base64
 import mimetypes
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Optional
+
+MANIFEST_PATH = os.path.join(".cache", "image_manifest.json")
+IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.webp', '.bmp', '.tiff', '.gif'}
 
 def check_image(image_path: str) -> bool:
     """이미지 파일 검증"""
@@ -52,36 +66,37 @@ def check_image(image_path: str) -> bool:
     
     # 이미지 크기 검증 (PIL이 있는 경우)
     try:
-        from PIL import Image
-        
-        with Image.open(image_path) as img:
-            width, height = img.size
-            aspect_ratio = width / height
-            
-            print(f"📐 이미지 크기: {width} x {height}")
-            print(f"📊 화면비: {aspect_ratio:.2f}")
-            
-            # 화면비 확인 (0.4 ~ 2.5)
-            if aspect_ratio < 0.4 or aspect_ratio > 2.5:
-                print("❌ 화면비가 범위를 벗어남 (허용: 0.4 ~ 2.5)")
-                return False
-            else:
-                print("✅ 화면비 적합")
-            
-            # 픽셀 크기 확인
-            min_side = min(width, height)
-            max_side = max(width, height)
-            
-            if min_side < 300:
-                print(f"❌ 이미지가 너무 작음 (최소: 300px, 현재: {min_side}px)")
-                return False
-            
-            if max_side > 6000:
-                print(f"❌ 이미지가 너무 큼 (최대: 6000px, 현재: {max_side}px)")
-                return False
-            
-            print("✅ 이미지 크기 적합")
-            
+        import image_prep
+        
+        # 동영상 생성기와 같은 캐시 사용 (같은 내용의 이미지는 다시 읽지 않음)
+        info = image_prep.image_info(image_path)
+        width, height = info['width'], info['height']
+        aspect_ratio = info['aspect_ratio']
+        
+        print(f"📐 이미지 크기: {width} x {height}")
+        print(f"📊 화면비: {aspect_ratio:.2f}")
+        
+        # 화면비 확인 (0.4 ~ 2.5)
+        if aspect_ratio < 0.4 or aspect_ratio > 2.5:
+            print("❌ 화면비가 범위를 벗어남 (허용: 0.4 ~ 2.5)")
+            return False
+        else:
+            print("✅ 화면비 적합")
+        
+        # 픽셀 크기 확인
+        min_side = min(width, height)
+        max_side = max(width, height)
+        
+        if min_side < 300:
+            print(f"❌ 이미지가 너무 작음 (최소: 300px, 현재: {min_side}px)")
+            return False
+        
+        if max_side > 6000:
+            print(f"❌ 이미지가 너무 큼 (최대: 6000px, 현재: {max_side}px)")
+            return False
+        
+        print("✅ 이미지 크기 적합")
+        
     except ImportError:
         print("⚠️  PIL 라이브러리가 없어서 크기 검증을 건너뜁니다.")
         print("💡 정확한 검증을 위해 'pip install Pillow'를 실행하세요.")
@@ -101,12 +116,15 @@ def encode_image(image_path: str) -> str:
     print("📦 인코딩 중...")
     
     try:
-        mime_type, _ = mimetypes.guess_type(image_path)
-        
-        with open(image_path, 'rb') as image_file:
-            encoded_string = base64.b64encode(image_file.read()).decode('utf-8')
-        
-        data_url = f"data:{mime_type};base64,{encoded_string}"
+        try:
+            # 동영상 생성기가 실제로 보내는 것과 같은 JPEG (최대 1024px)로 준비
+            import image_prep
+            data_url = image_prep.data_url(image_path)
+        except ImportError:
+            mime_type, _ = mimetypes.guess_type(image_path)
+            with open(image_path, 'rb') as image_file:
+                encoded_string = base64.b64encode(image_file.read()).decode('utf-8')
+            data_url = f"data:{mime_type};base64,{encoded_string}"
         
         print("✅ 인코딩 완료!")
         print(f"📊 Base64 크기: {len(data_url):,} 문자")
@@ -178,7 +196,133 @@ def auto_update_config(image_path: str) -> bool:
         print(f"❌ config.txt 업데이트 실패: {e}")
         return False
 
+def _file_key(image_path: str) -> str:
+    """(절대 경로, 크기, 수정 시간) 키 (파일이 바뀌면 달라짐)"""
+    stat = os.stat(image_path)
+    return f"{os.path.abspath(image_path)}|{stat.st_size}|{stat.st_mtime_ns}"
+
+
+def _scan_image(image_path: str) -> dict:
+    """이미지 하나 검증 + 업로드용 JPEG 준비 (프로세스 풀 작업, Base64 자체는 돌려보내지 않음)"""
+    import image_prep
+
+    entry = {'file': os.path.basename(image_path), 'key': _file_key(image_path)}
+    try:
+        image_prep.check_file(image_path)
+        info = image_prep.image_info(image_path)
+        image_prep.check_dimensions(info)
+        prepared = image_prep.prepare(image_path)
+    except Exception as e:
+        entry['error'] = str(e)
+        return entry
+
+    entry.update({
+        'width': info['width'],
+        'height': info['height'],
+        'aspect_ratio': round(info['aspect_ratio'], 4),
+        'aspect_class': image_prep.aspect_class(info['width'], info['height']),
+        'mime_type': info['mime_type'],
+        'file_size': info['file_size'],
+        'prepared_width': prepared['width'],
+        'prepared_height': prepared['height'],
+        'payload_bytes': len(prepared['base64']),
+        'quality': prepared['quality'],
+        'elapsed': round(prepared['elapsed'], 3)
+    })
+    return entry
+
+
+def _read_manifest() -> Optional[dict]:
+    try:
+        with open(MANIFEST_PATH, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def load_manifest(folder: str = "images") -> dict:
+    """scan 결과 중 지금 폴더 상태와 맞는 항목만 (파일명 → 항목, 검사 실패 항목은 'error' 포함)
+
+    다른 폴더의 목록이거나 업로드 설정(image.*)이 바뀌었으면 빈 dict
+    """
+    import image_prep
+
+    manifest = _read_manifest()
+    if (not manifest or manifest.get('folder') != os.path.abspath(folder)
+            or manifest.get('settings') != image_prep.load_settings()):
+        return {}
+
+    entries = {}
+    for entry in manifest.get('images', []) + manifest.get('rejected', []):
+        path = os.path.join(folder, entry['file'])
+        try:
+            if _file_key(path) == entry['key']:
+                entries[entry['file']] = entry
+        except OSError:
+            continue
+    return entries
+
+
+def scan_folder(folder: str = "images", workers: Optional[int] = None) -> dict:
+    """폴더의 이미지를 프로세스 풀로 동시에 검증/준비하고 manifest 저장
+
+    Returns:
+        dict: {'folder', 'created_at', 'settings', 'images', 'rejected', 'scanned', 'reused', 'elapsed'}
+    """
+    import image_prep
+
+    started = time.time()
+    files = sorted(f for f in os.listdir(folder) if os.path.splitext(f.lower())[1] in IMAGE_EXTENSIONS)
+
+    # 바뀌지 않은 파일은 이전 결과 재사용
+    previous = load_manifest(folder)
+    reused = [previous[f] for f in files if f in previous]
+    pending = [os.path.join(folder, f) for f in files if f not in previous]
+
+    scanned = []
+    if pending:
+        # 디코딩/압축은 CPU 작업이라 GIL을 피해 프로세스로 나눔
+        workers = max(1, min(workers or os.cpu_count() or 1, len(pending)))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            scanned = list(executor.map(_scan_image, pending))
+
+    entries = sorted(reused + scanned, key=lambda e: e['file'])
+    manifest = {
+        'folder': os.path.abspath(folder),
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'settings': image_prep.load_settings(),
+        'images': [e for e in entries if 'error' not in e],
+        'rejected': [e for e in entries if 'error' in e]
+    }
+
+    os.makedirs(os.path.dirname(MANIFEST_PATH), exist_ok=True)
+    tmp_path = f"{MANIFEST_PATH}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, MANIFEST_PATH)
+
+    return dict(manifest, scanned=len(scanned), reused=len(reused), elapsed=time.time() - started)
+
+
+def print_scan_report(result: dict) -> None:
+    """scan 결과 표 출력"""
+    print(f"📁 폴더: {result['folder']}")
+    print("=" * 50)
+    for entry in result['images']:
+        print(f"✅ {entry['file'][:30]:<30} {entry['width']}x{entry['height']:<6} {entry['aspect_class']:>5}"
+              f"  → {entry['prepared_width']}x{entry['prepared_height']} {entry['payload_bytes'] / 1024:.0f}KB")
+    for entry in result['rejected']:
+        print(f"❌ {entry['file'][:30]:<30} {entry['error']}")
+    print()
+    print(f"📊 사용 가능 {len(result['images'])}개 / 사용 불가 {len(result['rejected'])}개 "
+          f"(새로 검사 {result['scanned']}개, 재사용 {result['reused']}개, {result['elapsed']:.2f}초)")
+    print(f"💾 목록 저장: {MANIFEST_PATH}")
+
+
 def main():
+    if len(sys.argv) == 2 and sys.argv[1] == "scan":
+        sys.argv.append("images")
+
     if len(sys.argv) < 3:
         print("🖼️ 이미지 도우미")
         print("=" * 30)
@@ -187,6 +331,7 @@ def main():
         print("  python image_helper.py check <이미지파일>   # 이미지 검증")
         print("  python image_helper.py encode <이미지파일>  # Base64 인코딩")
         print("  python image_helper.py auto <이미지파일>    # config.txt 자동 업데이트")
+        print("  python image_helper.py scan [폴더] [워커수]  # 폴더 전체 검증/준비 (기본: images)")
         print()
         print("예시:")
         print("  python image_helper.py check ./my_image.jpg")
@@ -202,9 +347,19 @@ def main():
         encode_image(image_path)
     elif command == "auto":
         auto_update_config(image_path)
+    elif command == "scan":
+        if not os.path.isdir(image_path):
+            print(f"❌ 폴더를 찾을 수 없습니다: {image_path}")
+            return
+        try:
+            workers = int(sys.argv[3]) if len(sys.argv) > 3 else None
+        except ValueError:
+            print("❌ 워커 수는 숫자여야 합니다.")
+            return
+        print_scan_report(scan_folder(image_path, workers))
     else:
         print("❌ 알 수 없는 명령어입니다.")
-        print("💡 사용 가능한 명령어: check, encode, auto")
+        print("💡 사용 가능한 명령어: check, encode, auto, scan")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,589 @@
+#!/usr/bin/env python3
+"""
+🖼️ 이미지 준비 캐시 (Image Prep)
+===============================
+
+이미지-투-비디오 요청에 넣을 이미지를 검증하고 JPEG + Base64로 준비합니다.
+배치 모드에서는 프롬프트마다 같은 이미지를 쓰므로, 한 번 준비한 결과를 실행 중에 재사용합니다.
+
+- 캐시 키: 파일 내용 해시 + 준비 설정(최대 크기, 품질) → 경로가 달라도 내용이 같으면 재사용
+- 내용 해시는 (경로, 크기, 수정 시간)별로 기억해 같은 파일을 다시 읽지 않음
+- 크기/화면비 검증 결과도 내용 해시별로 기억
+- 적중/새로 준비 횟수와 재사용으로 아낀 시간을 stats()로 확인
+
+축소 방식:
+- JPEG는 draft 모드로 필요한 크기에 가깝게 축소 디코딩 (원본 전체를 풀지 않음)
+- 축소 배율에 따라 필터 선택 (2배 이하 LANCZOS, 그 이상은 정수 배 평균 축소 후 BICUBIC/BILINEAR)
+- 동영상 프레임은 cv2 배열 그대로 INTER_AREA 축소 + imencode (PIL 변환 없음)
+
+easy_video_maker.py(배치, 체인)와 image_helper.py가 같은 캐시를 사용합니다.
+
+사용법:
+  python image_prep.py bench <이미지> [이미지...] [--video 동영상] [--repeat N]   # 기존 방식과 지연/최대 메모리 비교
+"""
+
+import io
+import os
+import sys
+import json
+import math
+import base64
+import hashlib
+import mimetypes
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+import cv2
+import numpy as np
+from PIL import Image
+
+MAX_SIZE = 1024                       # 업로드용 최대 가로/세로 (px)
+MIN_SIDE = 300                        # API 최소 가로/세로 (용량을 맞추려고 이보다 작게 줄이지 않음)
+MAX_FILE_BYTES = 30 * 1024 * 1024     # 원본 파일 최대 크기 (업로드 전에 줄이므로 넉넉하게)
+MAX_BASE64_BYTES = 8 * 1024 * 1024    # API에 보낼 Base64 최대 크기
+MAX_CACHE_ENTRIES = 32                # 준비된 이미지 캐시 수 (Base64 문자열이라 수를 제한)
+REDUCING_GAP = 2.0                    # 이 배율 이상 줄일 때는 정수 배 평균 축소를 먼저 함
+MAX_SIDE = 6000                       # API 최대 가로/세로 (px)
+MIN_ASPECT, MAX_ASPECT = 0.4, 2.5     # API 허용 화면비 (가로/세로)
+
+# 화면비 분류 (API ratio 값 중 가장 가까운 것)
+ASPECT_CLASSES = {'21:9': 21 / 9, '16:9': 16 / 9, '4:3': 4 / 3, '1:1': 1.0,
+                  '3:4': 3 / 4, '9:16': 9 / 16, '9:21': 9 / 21}
+
+# 업로드 용량 예산 (Base64 기준 KB)과 JPEG 품질 범위
+DEFAULT_SETTINGS = {'max_kb': 512, 'max_quality': 75, 'min_quality': 40}
+
+SUPPORTED_MIME_TYPES = ['image/jpeg', 'image/png', 'image/webp', 'image/bmp', 'image/tiff', 'image/gif']
+
+_hash_cache = {}
+_info_cache = {}
+_prepared_cache = OrderedDict()
+_stats = {'hits': 0, 'misses': 0, 'prepare_seconds': 0.0, 'saved_seconds': 0.0}
+_lock = threading.Lock()
+
+
+def content_hash(image_path: str) -> str:
+    """파일 내용 SHA-1 (같은 경로/크기/수정 시간이면 다시 읽지 않음)"""
+    stat = os.stat(image_path)
+    stat_key = f"{os.path.abspath(image_path)}|{stat.st_size}|{stat.st_mtime_ns}"
+    with _lock:
+        digest = _hash_cache.get(stat_key)
+    if digest:
+        return digest
+
+    sha1 = hashlib.sha1()
+    with open(image_path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            sha1.update(block)
+    digest = sha1.hexdigest()
+    with _lock:
+        _hash_cache[stat_key] = digest
+    return digest
+
+
+def image_info(image_path: str) -> dict:
+    """이미지 크기/형식 정보 (헤더만 읽음, 내용 해시별로 기억)
+
+    Returns:
+        dict: {'width', 'height', 'aspect_ratio', 'mime_type', 'file_size'}
+    """
+    digest = content_hash(image_path)
+    with _lock:
+        info = _info_cache.get(digest)
+    if info:
+        return info
+
+    with Image.open(image_path) as img:
+        width, height = img.size
+    info = {
+        'width': width,
+        'height': height,
+        'aspect_ratio': width / height,
+        'mime_type': mimetypes.guess_type(image_path)[0],
+        'file_size': os.path.getsize(image_path)
+    }
+    with _lock:
+        _info_cache[digest] = info
+    return info
+
+
+def check_file(image_path: str) -> None:
+    """업로드 가능한 파일인지 확인 (문제가 있으면 ValueError)"""
+    if not os.path.exists(image_path):
+        raise ValueError(f"이미지 파일을 찾을 수 없습니다: {image_path}")
+
+    file_size = os.path.getsize(image_path)
+    if file_size > MAX_FILE_BYTES:
+        raise ValueError(f"이미지 파일이 너무 큽니다: {file_size / (1024 * 1024):.1f}MB "
+                         f"(최대 {MAX_FILE_BYTES // (1024 * 1024)}MB)")
+
+    mime_type, _ = mimetypes.guess_type(image_path)
+    if mime_type not in SUPPORTED_MIME_TYPES:
+        raise ValueError(f"지원되지 않는 이미지 형식입니다: {mime_type or image_path} "
+                         "(지원 형식: JPEG, PNG, WEBP, BMP, TIFF, GIF)")
+
+
+def check_dimensions(info: dict) -> None:
+    """API 화면비/가로·세로 요구사항 확인 (image_info() 결과, 맞지 않으면 ValueError)"""
+    aspect_ratio = info['aspect_ratio']
+    if aspect_ratio < MIN_ASPECT or aspect_ratio > MAX_ASPECT:
+        raise ValueError(f"화면비가 범위를 벗어났습니다: {aspect_ratio:.2f} (허용: {MIN_ASPECT} ~ {MAX_ASPECT})")
+
+    min_side = min(info['width'], info['height'])
+    max_side = max(info['width'], info['height'])
+    if min_side < MIN_SIDE:
+        raise ValueError(f"이미지가 너무 작습니다: {min_side}px (최소 {MIN_SIDE}px)")
+    if max_side > MAX_SIDE:
+        raise ValueError(f"이미지가 너무 큽니다: {max_side}px (최대 {MAX_SIDE}px)")
+
+
+def aspect_class(width: int, height: int) -> str:
+    """가장 가까운 화면비 분류 (비율의 로그 거리 기준, 예: 1920x1080 → "16:9")"""
+    ratio = width / height
+    return min(ASPECT_CLASSES, key=lambda name: abs(math.log(ratio / ASPECT_CLASSES[name])))
+
+
+def _fit_size(size: tuple, max_size: int) -> tuple:
+    """가로/세로가 max_size를 넘지 않도록 비율을 유지한 크기"""
+    width, height = size
+    if width <= max_size and height <= max_size:
+        return size
+    ratio = min(max_size / width, max_size / height)
+    return max(1, int(width * ratio)), max(1, int(height * ratio))
+
+
+def _pick_filter(factor: float) -> tuple:
+    """축소 배율에 맞는 (리샘플링 필터, reducing_gap)
+
+    크게 줄일 때는 먼저 정수 배로 평균 축소(reduce)한 뒤 가벼운 필터로 마무리해도 품질 차이가 없음
+    """
+    if factor <= 2:
+        return Image.Resampling.LANCZOS, None
+    if factor <= 4:
+        return Image.Resampling.BICUBIC, REDUCING_GAP
+    return Image.Resampling.BILINEAR, REDUCING_GAP
+
+
+def load_image(image_path: str, max_size: int = MAX_SIZE) -> tuple:
+    """업로드 크기로 줄인 RGB 이미지
+
+    JPEG는 draft 모드로 DCT 단계에서 1/2, 1/4, 1/8 크기로 디코딩해 원본 전체를 풀지 않음
+
+    Returns:
+        tuple: (PIL RGB 이미지, 원본 (가로, 세로))
+    """
+    with Image.open(image_path) as src:
+        img = src
+        original_size = src.size
+        target = _fit_size(original_size, max_size)
+
+        if src.format == 'JPEG' and target != original_size:
+            src.draft('RGB', target)
+
+        # 팔레트/CMYK 등은 먼저 변환 (팔레트 이미지는 그대로 줄이면 NEAREST로만 줄어듦)
+        if img.mode == 'P':
+            img = img.convert('RGBA' if 'transparency' in img.info else 'RGB')
+        elif img.mode not in ('RGB', 'RGBA', 'LA'):
+            img = img.convert('RGB')
+
+        if img.size != target:
+            resample, reducing_gap = _pick_filter(img.width / target[0])
+            img = img.resize(target, resample, reducing_gap=reducing_gap)
+
+        # 투명 배경은 흰색으로 채움
+        if img.mode in ('RGBA', 'LA'):
+            background = Image.new('RGB', img.size, (255, 255, 255))
+            background.paste(img, mask=img.split()[-1])
+            img = background
+
+        # 변환 없이 원본 그대로면 파일을 닫기 전에 읽어 둠
+        if img is src:
+            img = src.copy()
+
+    return img, original_size
+
+
+def load_settings(config_path: str = "config.txt") -> dict:
+    """업로드 용량 예산과 JPEG 품질 범위 (config.txt의 image.<항목> 값 반영)"""
+    settings = dict(DEFAULT_SETTINGS)
+    if not os.path.exists(config_path):
+        return settings
+
+    try:
+        with open(config_path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line.startswith("image.") or "=" not in line:
+                    continue
+                key, value = line.split("=", 1)
+                field, value = key.strip()[len("image."):], value.strip()
+                if field == "max_kb" and value.isdigit() and int(value) > 0:
+                    settings['max_kb'] = min(int(value), MAX_BASE64_BYTES // 1024)
+                elif field in ("max_quality", "min_quality") and value.isdigit() and 1 <= int(value) <= 95:
+                    settings[field] = int(value)
+    except OSError:
+        pass
+
+    settings['min_quality'] = min(settings['min_quality'], settings['max_quality'])
+    return settings
+
+
+def _base64_length(byte_count: int) -> int:
+    return 4 * ((byte_count + 2) // 3)
+
+
+def fit_to_budget(image, size: tuple, encode, resize, settings: dict) -> dict:
+    """Base64 크기가 예산 안에 들어가는 가장 높은 품질(최대 max_quality)로 압축
+
+    디코딩한 이미지는 한 번만 만들고 압축만 반복함.
+    최대 품질로 들어가면 바로 끝나고, 아니면 품질을 이분 탐색하며,
+    최저 품질로도 넘으면 크기를 줄여 다시 찾음 (가로/세로 최소 MIN_SIDE까지)
+
+    encode(image, quality) -> bytes, resize(image, (가로, 세로)) -> image
+    Returns:
+        dict: {'jpeg', 'quality', 'width', 'height', 'attempts'}
+    Raises:
+        ValueError: 최소 크기/최저 품질로도 예산을 넘을 때
+    """
+    budget = settings['max_kb'] * 1024
+    max_quality, min_quality = settings['max_quality'], settings['min_quality']
+    original, current, current_size = image, image, size
+    attempts = 0
+
+    while True:
+        jpeg = encode(current, max_quality)
+        attempts += 1
+        if _base64_length(len(jpeg)) <= budget:
+            return {'jpeg': jpeg, 'quality': max_quality, 'width': current_size[0],
+                    'height': current_size[1], 'attempts': attempts}
+
+        best, smallest = None, len(jpeg)
+        low, high = min_quality, max_quality - 1
+        while low <= high:
+            quality = (low + high) // 2
+            jpeg = encode(current, quality)
+            attempts += 1
+            smallest = min(smallest, len(jpeg))
+            if _base64_length(len(jpeg)) <= budget:
+                best = (jpeg, quality)
+                low = quality + 1
+            else:
+                high = quality - 1
+        if best:
+            return {'jpeg': best[0], 'quality': best[1], 'width': current_size[0],
+                    'height': current_size[1], 'attempts': attempts}
+
+        # 최저 품질로도 넘으면 크기를 줄임 (용량은 대략 면적에 비례)
+        scale = max(0.5, min(0.9, 0.95 * (budget / _base64_length(smallest)) ** 0.5))
+        next_size = (int(current_size[0] * scale), int(current_size[1] * scale))
+        if min(next_size) < MIN_SIDE:
+            raise ValueError(f"이미지를 {settings['max_kb']}KB 안으로 줄일 수 없습니다 "
+                             f"(최소 {MIN_SIDE}px, 품질 {min_quality}에서 {_base64_length(smallest) / 1024:.0f}KB)")
+        current, current_size = resize(original, next_size), next_size
+
+
+def _encode_pil(img, quality: int) -> bytes:
+    buffer = io.BytesIO()
+    img.save(buffer, format='JPEG', quality=quality, optimize=True)
+    return buffer.getvalue()
+
+
+def _encode_jpeg(image_path: str, max_size: int, settings: dict) -> dict:
+    """최대 크기로 줄이고 용량 예산 안의 RGB JPEG로 압축한 뒤 Base64 인코딩"""
+    img, original_size = load_image(image_path, max_size)
+    fitted = fit_to_budget(img, img.size, _encode_pil,
+                           lambda image, size: image.resize(size, Image.Resampling.LANCZOS), settings)
+
+    return {
+        'base64': base64.b64encode(fitted['jpeg']).decode('utf-8'),
+        'width': fitted['width'],
+        'height': fitted['height'],
+        'original_width': original_size[0],
+        'original_height': original_size[1],
+        'jpeg_bytes': len(fitted['jpeg']),
+        'quality': fitted['quality'],
+        'attempts': fitted['attempts']
+    }
+
+
+def resize_array(frame: np.ndarray, max_size: int) -> np.ndarray:
+    """cv2 BGR 배열을 max_size 안으로 축소 (INTER_AREA: 축소 시 평균을 내므로 앨리어싱이 없음)"""
+    height, width = frame.shape[:2]
+    target = _fit_size((width, height), max_size)
+    if target == (width, height):
+        return frame
+    return cv2.resize(frame, target, interpolation=cv2.INTER_AREA)
+
+
+def encode_array(frame: np.ndarray, quality: int) -> bytes:
+    """cv2 BGR 배열을 바로 JPEG로 압축 (PIL 변환/색 공간 변환 없음)"""
+    ok, jpeg = cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, quality, cv2.IMWRITE_JPEG_OPTIMIZE, 1])
+    if not ok:
+        raise ValueError("프레임을 JPEG로 압축할 수 없습니다.")
+    return jpeg.tobytes()
+
+
+def _cache_key(digest: str, max_size: int, settings: dict) -> str:
+    return f"{digest}|{max_size}|{settings['max_kb']}|{settings['max_quality']}|{settings['min_quality']}"
+
+
+def _store(key: str, prepared: dict) -> None:
+    with _lock:
+        _prepared_cache[key] = prepared
+        _prepared_cache.move_to_end(key)
+        while len(_prepared_cache) > MAX_CACHE_ENTRIES:
+            _prepared_cache.popitem(last=False)
+
+
+def save_frame(frame: np.ndarray, output_path: str, max_size: int = MAX_SIZE) -> dict:
+    """동영상 프레임(cv2 BGR 배열)을 업로드용 JPEG로 저장하고 캐시에도 넣음
+
+    저장한 파일이 곧 다음 클립에 보낼 이미지이므로, 다음 요청에서 다시 디코딩/압축하지 않음
+
+    Returns:
+        dict: {'width', 'height', 'jpeg_bytes', 'quality'}
+    """
+    started = time.time()
+    settings = load_settings()
+    resized = resize_array(frame, max_size)
+    fitted = fit_to_budget(resized, (resized.shape[1], resized.shape[0]), encode_array,
+                           lambda image, size: cv2.resize(image, size, interpolation=cv2.INTER_AREA), settings)
+    with open(output_path, 'wb') as f:
+        f.write(fitted['jpeg'])
+
+    original_height, original_width = frame.shape[:2]
+    prepared = {
+        'base64': base64.b64encode(fitted['jpeg']).decode('utf-8'),
+        'width': fitted['width'],
+        'height': fitted['height'],
+        'original_width': original_width,
+        'original_height': original_height,
+        'jpeg_bytes': len(fitted['jpeg']),
+        'quality': fitted['quality'],
+        'attempts': fitted['attempts'],
+        'source_mime': 'image/jpeg',
+        'elapsed': time.time() - started
+    }
+    _store(_cache_key(content_hash(output_path), max_size, settings), prepared)
+    return {'width': fitted['width'], 'height': fitted['height'],
+            'jpeg_bytes': len(fitted['jpeg']), 'quality': fitted['quality']}
+
+
+def prepare(image_path: str, max_size: int = MAX_SIZE) -> dict:
+    """업로드용 JPEG Base64 준비 (같은 내용 + 같은 설정이면 캐시 재사용)
+
+    Returns:
+        dict: {'base64', 'width', 'height', 'original_width', 'original_height',
+               'jpeg_bytes', 'quality', 'attempts', 'source_mime', 'elapsed', 'cached'}
+    Raises:
+        ValueError: 파일이 없거나 너무 크거나 지원하지 않는 형식, 또는 용량 예산 안으로 줄일 수 없을 때
+    """
+    check_file(image_path)
+    settings = load_settings()
+    key = _cache_key(content_hash(image_path), max_size, settings)
+
+    with _lock:
+        prepared = _prepared_cache.get(key)
+        if prepared:
+            _prepared_cache.move_to_end(key)
+            _stats['hits'] += 1
+            _stats['saved_seconds'] += prepared['elapsed']
+            return dict(prepared, cached=True)
+
+    started = time.time()
+    prepared = _encode_jpeg(image_path, max_size, settings)
+    prepared['source_mime'] = mimetypes.guess_type(image_path)[0]
+    prepared['elapsed'] = time.time() - started
+
+    with _lock:
+        _stats['misses'] += 1
+        _stats['prepare_seconds'] += prepared['elapsed']
+    _store(key, prepared)
+    return dict(prepared, cached=False)
+
+
+def data_url(image_path: str, max_size: int = MAX_SIZE) -> str:
+    """API image_url에 넣을 data URL (data:image/jpeg;base64,...)"""
+    return f"data:image/jpeg;base64,{prepare(image_path, max_size)['base64']}"
+
+
+def stats() -> dict:
+    """캐시 적중/새로 준비 횟수, 준비에 쓴 시간, 재사용으로 아낀 시간 (초)"""
+    with _lock:
+        return dict(_stats)
+
+
+def format_stats() -> Optional[str]:
+    """캐시 통계 한 줄 요약 (이미지를 준비한 적이 없으면 None)"""
+    s = stats()
+    if not s['hits'] and not s['misses']:
+        return None
+    return (f"🖼️  이미지 준비: 새로 준비 {s['misses']}회 ({s['prepare_seconds']:.2f}초) / "
+            f"캐시 재사용 {s['hits']}회 (약 {s['saved_seconds']:.2f}초 절약)")
+
+
+def clear_cache() -> None:
+    """캐시와 통계 초기화"""
+    with _lock:
+        _hash_cache.clear()
+        _info_cache.clear()
+        _prepared_cache.clear()
+        _stats.update({'hits': 0, 'misses': 0, 'prepare_seconds': 0.0, 'saved_seconds': 0.0})
+
+
+def _legacy_prepare(image_path: str) -> str:
+    """비교용: 기존 방식 (원본 전체 디코딩 → LANCZOS 축소 → JPEG → Base64)"""
+    with Image.open(image_path) as img:
+        if img.width > MAX_SIZE or img.height > MAX_SIZE:
+            ratio = min(MAX_SIZE / img.width, MAX_SIZE / img.height)
+            img = img.resize((int(img.width * ratio), int(img.height * ratio)), Image.Resampling.LANCZOS)
+        if img.mode in ('RGBA', 'LA'):
+            background = Image.new('RGB', img.size, (255, 255, 255))
+            background.paste(img, mask=img.split()[-1] if img.mode == 'RGBA' else None)
+            img = background
+        elif img.mode != 'RGB':
+            img = img.convert('RGB')
+        buffer = io.BytesIO()
+        img.save(buffer, format='JPEG', quality=75, optimize=True)
+    return base64.b64encode(buffer.getvalue()).decode('utf-8')
+
+
+def _legacy_frame(frame: np.ndarray, output_path: str) -> str:
+    """비교용: 기존 체인 방식 (cvtColor → PIL → LANCZOS 1280 → 저장 → 다시 열어 업로드용 준비)"""
+    pil_image = Image.fromarray(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+    if pil_image.width > 1280 or pil_image.height > 1280:
+        ratio = min(1280 / pil_image.width, 1280 / pil_image.height)
+        pil_image = pil_image.resize((int(pil_image.width * ratio), int(pil_image.height * ratio)),
+                                     Image.Resampling.LANCZOS)
+    pil_image.save(output_path, "JPEG", quality=60, optimize=True)
+    return _legacy_prepare(output_path)
+
+
+def _fast_frame(frame: np.ndarray, output_path: str) -> str:
+    """비교용: 현재 체인 방식 (프레임 저장 + 업로드용 준비)"""
+    save_frame(frame, output_path)
+    return prepare(output_path)['base64']
+
+
+def _read_last_frame(video_path: str) -> np.ndarray:
+    cap = cv2.VideoCapture(video_path)
+    try:
+        cap.set(cv2.CAP_PROP_POS_FRAMES, int(cap.get(cv2.CAP_PROP_FRAME_COUNT)) - 1)
+        ok, frame = cap.read()
+    finally:
+        cap.release()
+    if not ok:
+        raise ValueError(f"프레임을 읽을 수 없습니다: {video_path}")
+    return frame
+
+
+def _peak_rss_mb() -> float:
+    """지금까지의 최대 메모리 사용량 (MB, macOS는 바이트 단위로 돌려줌)"""
+    import resource  # 벤치마크 전용 (Windows에는 없음)
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _measure(case: str, source_path: str, repeat: int) -> dict:
+    """한 가지 방식을 새 프로세스에서 repeat번 실행해 지연(중앙값)과 최대 메모리 증가량 측정"""
+    import statistics
+    import tempfile
+    with tempfile.TemporaryDirectory() as temp_dir:
+        output_path = os.path.join(temp_dir, "frame.jpg")
+        frame = _read_last_frame(source_path) if case.endswith("_frame") else None
+        run = {
+            'legacy': lambda: _legacy_prepare(source_path),
+            'fast': lambda: _encode_jpeg(source_path, MAX_SIZE, load_settings())['base64'],
+            'legacy_frame': lambda: _legacy_frame(frame, output_path),
+            'fast_frame': lambda: _fast_frame(frame, output_path),
+        }[case]
+
+        baseline = _peak_rss_mb()
+        timings = []
+        for _ in range(repeat):
+            clear_cache()
+            started = time.perf_counter()
+            result = run()
+            timings.append(time.perf_counter() - started)
+        return {
+            'latency_ms': round(statistics.median(timings) * 1000, 1),
+            'peak_mb': round(_peak_rss_mb() - baseline, 1),
+            'base64_kb': round(len(result) / 1024, 1)
+        }
+
+
+def benchmark(image_paths: list, video_path: Optional[str] = None, repeat: int = 5) -> list:
+    """기존 방식과 현재 방식의 이미지당 지연/최대 메모리 비교 (방식마다 새 프로세스에서 측정)"""
+    import subprocess
+    cases = [(path, ("legacy", "fast")) for path in image_paths]
+    if video_path:
+        cases.append((video_path, ("legacy_frame", "fast_frame")))
+
+    results = []
+    for source_path, names in cases:
+        row = {'source': source_path}
+        for name in names:
+            completed = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), "_measure", name, source_path, str(repeat)],
+                capture_output=True, text=True
+            )
+            if completed.returncode != 0:
+                row[name.replace("_frame", "")] = {'error': completed.stderr.strip().splitlines()[-1:]}
+            else:
+                row[name.replace("_frame", "")] = json.loads(completed.stdout)
+        results.append(row)
+    return results
+
+
+def main():
+    if len(sys.argv) >= 5 and sys.argv[1] == "_measure":
+        print(json.dumps(_measure(sys.argv[2], sys.argv[3], int(sys.argv[4]))))
+        return
+
+    if len(sys.argv) < 3 or sys.argv[1] != "bench":
+        print("🖼️ 이미지 준비")
+        print("=" * 30)
+        print()
+        print("사용법:")
+        print("  python image_prep.py bench <이미지> [이미지...] [--video 동영상] [--repeat N]   # 기존 방식과 비교")
+        return
+
+    args = sys.argv[2:]
+    video_path = None
+    repeat = 5
+    try:
+        if "--video" in args:
+            index = args.index("--video")
+            video_path = args[index + 1]
+            del args[index:index + 2]
+        if "--repeat" in args:
+            index = args.index("--repeat")
+            repeat = max(1, int(args[index + 1]))
+            del args[index:index + 2]
+    except (IndexError, ValueError):
+        print("❌ --video 에는 동영상 경로, --repeat 에는 숫자를 지정하세요.")
+        return
+
+    missing = [p for p in args + ([video_path] if video_path else []) if not os.path.exists(p)]
+    if missing:
+        print(f"❌ 파일을 찾을 수 없습니다: {', '.join(missing)}")
+        return
+
+    print(f"⏱️  이미지 준비 비교 (반복 {repeat}회, 중앙값)")
+    print()
+    print(f"{'파일':<28}{'기존':>10}{'현재':>10}{'속도':>8}{'기존 메모리':>12}{'현재 메모리':>12}")
+    for row in benchmark(args, video_path, repeat):
+        name = os.path.basename(row['source'])[:26]
+        legacy, fast = row['legacy'], row['fast']
+        if 'error' in legacy or 'error' in fast:
+            print(f"{name:<28}  ❌ 실패: {' '.join(legacy.get('error') or fast.get('error'))}")
+            continue
+        speedup = legacy['latency_ms'] / fast['latency_ms'] if fast['latency_ms'] else 0.0
+        print(f"{name:<28}{legacy['latency_ms']:>8.1f}ms{fast['latency_ms']:>8.1f}ms{speedup:>7.1f}x"
+              f"{legacy['peak_mb']:>10.1f}MB{fast['peak_mb']:>10.1f}MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,13 +2,25 @@
 """
 BytePlus API를 사용한 동영상 생성 및 다운로드 스크립트
 seedance-1-0-lite-i2v-250428 모델을 사용하여 이미지에서 동영상을 생성합니다.
+
+그리드 모드: 폴더의 모든 이미지 × 모션 프롬프트 목록을 한 번에 생성합니다.
+  python image_to_video_converter.py grid <이미지폴더> <프롬프트파일> [-o 출력폴더] [--concurrency N]
+
+- 이미지 × 프롬프트 조합은 필요할 때 하나씩 만들어 동시 작업 수(concurrency)만큼만 접수
+- 진행 중인 작업은 목록 API 한 번으로 묶어서 상태 확인
+- 결과는 <출력폴더>/<이미지>/prompt_NN.mp4 로 저장
+- 진행 상태를 <출력폴더>/grid_state.json에 기록 → 다시 실행하면 완료된 조합은 건너뛰고
+  접수된 작업은 다시 접수하지 않고 이어서 확인 (실패한 조합만 다시 생성)
 """
 
+import argparse
 import requests
 import time
 import json
 import os
-from typing import Dict, Any, Optional
+import sys
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Dict, Any, Iterator, Optional
 from urllib.parse import urlparse
 import logging
 
@@ -16,6 +28,12 @@ import logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+DEFAULT_MODEL = "seedance-1-0-lite-i2v-250428"
+GRID_STATE_FILE = "grid_state.json"
+IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.webp', '.bmp', '.tiff', '.gif'}
+FAILED_STATUSES = ('failed', 'expired', 'cancelled')
+DOWNLOAD_WORKERS = 4          # 동시에 받을 동영상 수 (생성 대기와 별도로 진행)
+
 class BytePlusVideoGenerator:
     """BytePlus API를 사용한 동영상 생성 클래스"""
     
@@ -34,7 +52,7 @@ class BytePlusVideoGenerator:
             "Authorization": f"Bearer {api_key}"
         }
         
-    def create_video_task(self, prompt_text: str, image_url: str, model: str = "seedance-1-0-lite-i2v-250428") -> Optional[str]:
+    def create_video_task(self, prompt_text: str, image_url: str, model: str = DEFAULT_MODEL) -> Optional[str]:
         """
         동영상 생성 작업을 시작합니다.
         
@@ -107,6 +125,40 @@ class BytePlusVideoGenerator:
             logger.error(f"상태 확인 중 오류 발생: {e}")
             return {"status": "error", "error": str(e)}
     
+    def query_tasks(self, task_ids: list) -> Dict[str, Dict[str, Any]]:
+        """
+        여러 작업 상태를 목록 API 한 번으로 확인합니다.
+        
+        목록 응답에 없는 작업은 하나씩 다시 확인합니다.
+        
+        Args:
+            task_ids (list): 확인할 작업 ID 목록
+            
+        Returns:
+            Dict[str, Dict[str, Any]]: 작업 ID → 작업 상태 정보
+        """
+        url = f"{self.base_url}/api/v3/contents/generations/tasks"
+        params = {
+            "page_num": 1,
+            "page_size": len(task_ids),
+            "filter.task_ids": task_ids
+        }
+        
+        results = {}
+        try:
+            response = requests.get(url, headers=self.headers, params=params)
+            response.raise_for_status()
+            for item in response.json().get("items", []):
+                if item.get("id") in task_ids:
+                    results[item["id"]] = item
+        except (requests.exceptions.RequestException, json.JSONDecodeError) as e:
+            logger.warning(f"작업 목록 조회 실패, 하나씩 확인합니다: {e}")
+        
+        for task_id in task_ids:
+            if task_id not in results:
+                results[task_id] = self.check_task_status(task_id)
+        return results
+    
     def wait_for_completion(self, task_id: str, max_wait_time: int = 300, check_interval: int = 10) -> Optional[str]:
         """
         작업 완료까지 대기하고 결과 URL을 반환합니다.
@@ -151,13 +203,14 @@ class BytePlusVideoGenerator:
         logger.error(f"시간 초과: {max_wait_time}초 내에 작업이 완료되지 않았습니다.")
         return None
     
-    def download_video(self, video_url: str, output_dir: str = "downloads") -> Optional[str]:
+    def download_video(self, video_url: str, output_dir: str = "downloads", filename: Optional[str] = None) -> Optional[str]:
         """
         동영상을 다운로드합니다.
         
         Args:
             video_url (str): 다운로드할 동영상 URL
             output_dir (str): 저장할 디렉토리
+            filename (Optional[str]): 저장할 파일명 (없으면 URL에서 추출)
             
         Returns:
             Optional[str]: 저장된 파일 경로, 실패시 None
@@ -167,22 +220,25 @@ class BytePlusVideoGenerator:
             os.makedirs(output_dir, exist_ok=True)
             
             # URL에서 파일명 추출
-            parsed_url = urlparse(video_url)
-            filename = os.path.basename(parsed_url.path)
-            if not filename or not filename.endswith('.mp4'):
-                filename = f"generated_video_{int(time.time())}.mp4"
+            if not filename:
+                parsed_url = urlparse(video_url)
+                filename = os.path.basename(parsed_url.path)
+                if not filename or not filename.endswith('.mp4'):
+                    filename = f"generated_video_{int(time.time())}.mp4"
             
             output_path = os.path.join(output_dir, filename)
             
             logger.info(f"동영상 다운로드 중: {filename}")
             
-            # 동영상 다운로드
+            # 동영상 다운로드 (받는 중에 중단되면 불완전한 파일이 남지 않도록 임시 파일에 받은 뒤 교체)
             response = requests.get(video_url, stream=True)
             response.raise_for_status()
             
-            with open(output_path, 'wb') as f:
+            tmp_path = f"{output_path}.part"
+            with open(tmp_path, 'wb') as f:
                 for chunk in response.iter_content(chunk_size=8192):
                     f.write(chunk)
+            os.replace(tmp_path, output_path)
             
             logger.info(f"다운로드 완료: {output_path}")
             return output_path
@@ -218,6 +274,271 @@ class BytePlusVideoGenerator:
         
         # 3. 동영상 다운로드
         return self.download_video(video_url, output_dir)
+    
+    def generate_grid(self, images: list, prompts: list, output_dir: str = "downloads/grid",
+                      concurrency: int = 4, poll_interval: int = 10, max_wait_time: int = 600,
+                      model: str = DEFAULT_MODEL) -> Dict[str, Any]:
+        """
+        이미지 × 프롬프트 모든 조합의 동영상을 생성합니다 (이어서 실행 가능).
+        
+        Args:
+            images (list): 로컬 이미지 경로 목록
+            prompts (list): 모션 프롬프트 목록
+            output_dir (str): 결과 폴더 (<output_dir>/<이미지>/prompt_NN.mp4)
+            concurrency (int): 동시에 생성 중인 작업 수
+            poll_interval (int): 상태 확인 간격 (초)
+            max_wait_time (int): 작업 하나당 최대 대기 시간 (초)
+            model (str): 사용할 모델명
+            
+        Returns:
+            Dict[str, Any]: {'cells', 'completed', 'failed', 'skipped', 'resumed', 'elapsed', 'videos_per_minute'}
+        """
+        # 로컬 이미지를 API에 보낼 JPEG로 준비 (같은 이미지는 한 번만 준비)
+        import image_prep
+        
+        os.makedirs(output_dir, exist_ok=True)
+        state_path = os.path.join(output_dir, GRID_STATE_FILE)
+        state = _load_grid_state(state_path)
+        
+        started = time.time()
+        cells = iter_grid_cells(images, prompts, output_dir)
+        in_flight = {}      # 작업 ID → 조합
+        deadlines = {}      # 작업 ID → 대기 한도 시각
+        downloads = {}      # 다운로드 future → 조합
+        counts = {'skipped': 0, 'resumed': 0}
+        exhausted = False
+        
+        def finish(cell: dict, status: str, **fields) -> None:
+            record = state[cell['id']]
+            record.update(fields, status=status, finished_at=time.time())
+            emoji = "✅" if status == 'completed' else "❌"
+            logger.info(f"{emoji} {cell['id']}: {status}" + (f" ({fields['error']})" if fields.get('error') else ""))
+        
+        with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as pool:
+            while True:
+                # 1. 빈 자리만큼 다음 조합 접수
+                while not exhausted and len(in_flight) < concurrency:
+                    cell = next(cells, None)
+                    if cell is None:
+                        exhausted = True
+                        break
+                    
+                    record = state.get(cell['id'], {})
+                    if record.get('status') == 'completed' and os.path.exists(record.get('video_path') or ""):
+                        counts['skipped'] += 1
+                        continue
+                    
+                    # 이전 실행에서 접수된 작업은 다시 접수하지 않고 상태만 이어서 확인
+                    if record.get('task_id') and record.get('status') not in ('completed',) + FAILED_STATUSES:
+                        in_flight[record['task_id']] = cell
+                        deadlines[record['task_id']] = time.time() + max_wait_time
+                        counts['resumed'] += 1
+                        continue
+                    
+                    state[cell['id']] = record = {
+                        'image': cell['image'],
+                        'prompt_index': cell['prompt_index'],
+                        'attempts': record.get('attempts', 0) + 1,
+                        'submitted_at': time.time()
+                    }
+                    try:
+                        image_url = image_prep.data_url(cell['image'])
+                    except Exception as e:
+                        finish(cell, 'failed', error=str(e))
+                        continue
+                    
+                    task_id = self.create_video_task(cell['prompt'], image_url, model)
+                    if not task_id:
+                        finish(cell, 'failed', error="작업 접수 실패")
+                        continue
+                    record.update(task_id=task_id, status='submitted')
+                    in_flight[task_id] = cell
+                    deadlines[task_id] = time.time() + max_wait_time
+                _save_grid_state(state_path, state)
+                
+                if exhausted and not in_flight and not downloads:
+                    break
+                
+                # 2. 진행 중인 작업을 한 번에 확인
+                if in_flight:
+                    time.sleep(poll_interval)
+                    for task_id, data in self.query_tasks(list(in_flight)).items():
+                        cell = in_flight[task_id]
+                        status = data.get("status")
+                        
+                        if status == "succeeded":
+                            video_url = data.get("content", {}).get("video_url")
+                            del in_flight[task_id]
+                            if not video_url:
+                                finish(cell, 'failed', error="동영상 URL 없음")
+                                continue
+                            state[cell['id']]['status'] = 'downloading'
+                            future = pool.submit(self.download_video, video_url,
+                                                 os.path.dirname(cell['output_path']),
+                                                 os.path.basename(cell['output_path']))
+                            downloads[future] = cell
+                        elif status in FAILED_STATUSES:
+                            del in_flight[task_id]
+                            error = data.get("error") or {}
+                            finish(cell, status, error=error.get("code") or error.get("message") or status)
+                        elif time.time() > deadlines[task_id]:
+                            # 작업 ID는 남겨 두어 다음 실행에서 이어서 확인
+                            del in_flight[task_id]
+                            finish(cell, 'timeout', error=f"{max_wait_time}초 초과")
+                        elif status:
+                            state[cell['id']]['status'] = status
+                elif downloads:
+                    wait(list(downloads), return_when=FIRST_COMPLETED)
+                
+                # 3. 끝난 다운로드 정리
+                for future in [f for f in downloads if f.done()]:
+                    cell = downloads.pop(future)
+                    video_path = future.result()
+                    if video_path:
+                        finish(cell, 'completed', video_path=video_path)
+                    else:
+                        # 작업은 성공했으므로 다음 실행에서 다시 조회해 받음
+                        finish(cell, 'download_failed', error="다운로드 실패")
+                _save_grid_state(state_path, state)
+        
+        elapsed = time.time() - started
+        records = [dict(state[cell['id']], id=cell['id'], prompt=cell['prompt'])
+                   for cell in iter_grid_cells(images, prompts, output_dir) if cell['id'] in state]
+        completed_now = sum(1 for r in records if r.get('status') == 'completed'
+                            and r.get('finished_at', 0) >= started)
+        return {
+            'output_dir': output_dir,
+            'images': len(images),
+            'prompts': len(prompts),
+            'cells': records,
+            'completed': sum(1 for r in records if r.get('status') == 'completed'),
+            'failed': sum(1 for r in records if r.get('status') != 'completed'),
+            'skipped': counts['skipped'],
+            'resumed': counts['resumed'],
+            'elapsed': elapsed,
+            'videos_per_minute': completed_now / (elapsed / 60) if elapsed else 0.0
+        }
+
+
+def list_grid_images(folder: str) -> list:
+    """폴더의 이미지 파일 경로 (이름순)"""
+    return [os.path.join(folder, f) for f in sorted(os.listdir(folder))
+            if os.path.splitext(f.lower())[1] in IMAGE_EXTENSIONS]
+
+
+def read_prompt_list(file_path: str) -> list:
+    """프롬프트 파일 읽기 (한 줄에 하나, 빈 줄과 # 주석 제외)"""
+    with open(file_path, "r", encoding="utf-8") as f:
+        return [line.strip() for line in f if line.strip() and not line.strip().startswith("#")]
+
+
+def iter_grid_cells(images: list, prompts: list, output_dir: str) -> Iterator[Dict[str, Any]]:
+    """이미지 × 프롬프트 조합을 하나씩 생성 (같은 이미지의 조합이 이어지도록 이미지 순서 우선)"""
+    for image in images:
+        # 확장자만 다른 이미지가 같은 폴더를 쓰지 않도록 점을 밑줄로 바꿔 폴더명으로 사용
+        image_dir = os.path.basename(image).replace('.', '_')
+        for index, prompt in enumerate(prompts, 1):
+            yield {
+                'id': f"{image_dir}/prompt_{index:02d}",
+                'image': image,
+                'prompt_index': index,
+                'prompt': prompt,
+                'output_path': os.path.join(output_dir, image_dir, f"prompt_{index:02d}.mp4")
+            }
+
+
+def _load_grid_state(state_path: str) -> Dict[str, Any]:
+    try:
+        with open(state_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def _save_grid_state(state_path: str, state: Dict[str, Any]) -> None:
+    """진행 상태 저장 (임시 파일에 쓴 뒤 교체해 중단돼도 깨지지 않음)"""
+    tmp_path = f"{state_path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(state, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, state_path)
+
+
+def print_grid_summary(report: Dict[str, Any]) -> None:
+    """그리드 결과 요약 (조합별 상태표, 처리량, 실패 목록)"""
+    status_emoji = {'completed': "✅", 'timeout': "⏰", 'download_failed': "📥"}
+    by_id = {r['id']: r for r in report['cells']}
+    image_dirs = sorted({cell_id.split('/')[0] for cell_id in by_id})
+    
+    print(f"\n{'='*50}")
+    print(f"📊 그리드 결과: 이미지 {report['images']}개 × 프롬프트 {report['prompts']}개")
+    print(f"{'이미지':<28}" + "".join(f"P{i:02d} " for i in range(1, report['prompts'] + 1)))
+    for image_dir in image_dirs:
+        row = ""
+        for i in range(1, report['prompts'] + 1):
+            record = by_id.get(f"{image_dir}/prompt_{i:02d}")
+            row += " " + (status_emoji.get(record.get('status'), "❌") if record else "⬜") + " "
+        print(f"{image_dir[:26]:<28}{row}")
+    
+    print()
+    print(f"✅ 완료: {report['completed']}개 (이전 실행에서 완료 {report['skipped']}개, 이어서 확인 {report['resumed']}개)")
+    print(f"❌ 실패: {report['failed']}개")
+    print(f"⏱️  소요 시간: {report['elapsed'] / 60:.1f}분 / 처리량: {report['videos_per_minute']:.2f}개/분")
+    
+    durations = [r['finished_at'] - r['submitted_at'] for r in report['cells']
+                 if r.get('status') == 'completed' and r.get('submitted_at') and r.get('finished_at')]
+    if durations:
+        print(f"⏱️  조합당 생성 시간: 평균 {sum(durations) / len(durations):.0f}초 / 최대 {max(durations):.0f}초")
+    
+    failures = [r for r in report['cells'] if r.get('status') != 'completed']
+    if failures:
+        print("\n실패한 조합:")
+        for r in failures:
+            print(f"  {status_emoji.get(r.get('status'), '❌')} {r['id']}: {r.get('error') or r.get('status')}"
+                  f" (시도 {r.get('attempts', 1)}회)")
+        print("💡 같은 명령을 다시 실행하면 실패한 조합만 이어서 생성합니다.")
+
+
+def run_grid(argv: list) -> None:
+    """그리드 모드 명령행 실행"""
+    parser = argparse.ArgumentParser(prog="image_to_video_converter.py grid",
+                                     description="폴더의 모든 이미지 × 프롬프트 조합으로 동영상 생성")
+    parser.add_argument("image_dir", help="이미지 폴더")
+    parser.add_argument("prompt_file", help="모션 프롬프트 파일 (한 줄에 하나)")
+    parser.add_argument("-o", "--output", default="downloads/grid", help="결과 폴더 (기본: downloads/grid)")
+    parser.add_argument("--concurrency", type=int, default=4, help="동시에 생성할 작업 수 (기본: 4)")
+    parser.add_argument("--poll", type=int, default=10, help="상태 확인 간격 초 (기본: 10)")
+    parser.add_argument("--timeout", type=int, default=600, help="작업당 최대 대기 초 (기본: 600)")
+    parser.add_argument("--model", default=DEFAULT_MODEL, help=f"모델명 (기본: {DEFAULT_MODEL})")
+    args = parser.parse_args(argv)
+    
+    API_KEY = os.getenv("ARK_API_KEY")
+    if not API_KEY:
+        print("❌ 오류: ARK_API_KEY 환경변수를 설정해주세요.")
+        return
+    
+    if not os.path.isdir(args.image_dir):
+        print(f"❌ 폴더를 찾을 수 없습니다: {args.image_dir}")
+        return
+    images = list_grid_images(args.image_dir)
+    try:
+        prompts = read_prompt_list(args.prompt_file)
+    except OSError as e:
+        print(f"❌ 프롬프트 파일을 읽을 수 없습니다: {e}")
+        return
+    if not images or not prompts:
+        print("❌ 이미지와 프롬프트가 하나 이상 있어야 합니다.")
+        return
+    
+    print(f"🎬 그리드 생성: 이미지 {len(images)}개 × 프롬프트 {len(prompts)}개 = {len(images) * len(prompts)}개 "
+          f"(동시 {args.concurrency}개)")
+    generator = BytePlusVideoGenerator(API_KEY)
+    try:
+        report = generator.generate_grid(images, prompts, args.output, max(1, args.concurrency),
+                                         max(1, args.poll), args.timeout, args.model)
+    except KeyboardInterrupt:
+        print(f"\n⏸️  중단했습니다. 같은 명령으로 다시 실행하면 이어서 진행합니다 ({args.output}/{GRID_STATE_FILE})")
+        return
+    print_grid_summary(report)
 
 
 def get_user_input() -> tuple[str, str]:
@@ -269,6 +590,10 @@ def get_user_input() -> tuple[str, str]:
 def main():
     """메인 실행 함수"""
     
+    if len(sys.argv) > 1 and sys.argv[1] == "grid":
+        run_grid(sys.argv[2:])
+        return
+    
     # [확실] 환경변수에서 API 키 읽기
     API_KEY = os.getenv("ARK_API_KEY")
     if not API_KEY:
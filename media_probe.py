@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+🔍 미디어 정보 조회 (Media Probe)
+================================
+
+ffprobe를 파일당 한 번만 실행해 길이, 코덱, 해상도, fps, 음성 트랙 여부 등
+전체 스트림 정보를 가져오고 결과를 캐시합니다.
+
+- 캐시 키: (절대 경로, 파일 크기, 수정 시간) → 파일이 바뀌면 자동으로 다시 조회
+- 메모리 캐시: 같은 프로세스 안에서는 ffprobe를 다시 실행하지 않음
+- 디스크 캐시: .cache/media_probe.json (다음 실행에서도 재사용)
+- probe_many(): 여러 파일을 동시에 조회
+
+사용법:
+  python media_probe.py <파일> [파일...]    # 미디어 정보 출력
+  python media_probe.py clear               # 디스크 캐시 삭제
+"""
+
+import os
+import sys
+import json
+import time
+import threading
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+CACHE_PATH = os.path.join(".cache", "media_probe.json")
+MAX_CACHE_ENTRIES = 2000
+
+_memory_cache = {}
+_disk_cache = None
+_disk_dirty = False
+_cache_lock = threading.Lock()
+
+
+def _cache_key(file_path: str) -> Optional[str]:
+    """(절대 경로, 크기, 수정 시간) 캐시 키 (파일이 없으면 None)"""
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return None
+    return f"{os.path.abspath(file_path)}|{stat.st_size}|{stat.st_mtime_ns}"
+
+
+def _load_disk_cache() -> dict:
+    """디스크 캐시를 처음 한 번만 읽음"""
+    global _disk_cache
+    if _disk_cache is None:
+        try:
+            with open(CACHE_PATH, 'r', encoding='utf-8') as f:
+                _disk_cache = json.load(f)
+        except (OSError, ValueError):
+            _disk_cache = {}
+    return _disk_cache
+
+
+def _save_disk_cache() -> None:
+    """디스크 캐시 저장 (오래된 항목부터 정리, 임시 파일에 쓴 뒤 교체)"""
+    global _disk_dirty
+    _disk_dirty = False
+    cache = _load_disk_cache()
+    if len(cache) > MAX_CACHE_ENTRIES:
+        oldest = sorted(cache, key=lambda k: cache[k].get('probed_at', 0))
+        for key in oldest[:len(cache) - MAX_CACHE_ENTRIES]:
+            del cache[key]
+
+    try:
+        os.makedirs(os.path.dirname(CACHE_PATH), exist_ok=True)
+        tmp_path = f"{CACHE_PATH}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(cache, f, ensure_ascii=False)
+        os.replace(tmp_path, CACHE_PATH)
+    except OSError:
+        pass
+
+
+def _parse_rate(rate: Optional[str]) -> float:
+    """"30000/1001" 형식의 프레임레이트를 숫자로 변환"""
+    try:
+        num, den = (rate or "0/0").split("/")
+        return float(num) / float(den) if float(den) else 0.0
+    except ValueError:
+        return 0.0
+
+
+def _to_float(value) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _summarize(data: dict) -> dict:
+    """ffprobe JSON에서 자주 쓰는 정보만 정리"""
+    fmt = data.get('format', {})
+    streams = data.get('streams', [])
+    video = next((s for s in streams if s.get('codec_type') == 'video'
+                  and not s.get('disposition', {}).get('attached_pic')), None)
+    audio = next((s for s in streams if s.get('codec_type') == 'audio'), None)
+
+    info = {
+        'duration': _to_float(fmt.get('duration')),
+        'size': int(fmt.get('size', 0) or 0),
+        'format': fmt.get('format_name'),
+        'bit_rate': int(fmt.get('bit_rate', 0) or 0),
+        'has_video': video is not None,
+        'has_audio': audio is not None,
+        'has_subtitles': any(s.get('codec_type') == 'subtitle' for s in streams),
+        'video': None,
+        'audio': None,
+        'streams': [
+            {'index': s.get('index'), 'type': s.get('codec_type'), 'codec': s.get('codec_name')}
+            for s in streams
+        ]
+    }
+
+    if video:
+        info['video'] = {
+            'codec': video.get('codec_name'),
+            'width': video.get('width', 0),
+            'height': video.get('height', 0),
+            'fps': round(_parse_rate(video.get('avg_frame_rate')) or _parse_rate(video.get('r_frame_rate')), 3),
+            'r_frame_rate': video.get('r_frame_rate'),
+            'pix_fmt': video.get('pix_fmt'),
+            'duration': _to_float(video.get('duration')) or info['duration']
+        }
+    if audio:
+        info['audio'] = {
+            'codec': audio.get('codec_name'),
+            'sample_rate': int(audio.get('sample_rate', 0) or 0),
+            'channels': audio.get('channels', 0),
+            'duration': _to_float(audio.get('duration')) or info['duration']
+        }
+    return info
+
+
+def _run_ffprobe(file_path: str) -> Optional[dict]:
+    """ffprobe 한 번으로 포맷/스트림 정보 전체 조회"""
+    try:
+        result = subprocess.run([
+            "ffprobe", "-v", "quiet", "-print_format", "json",
+            "-show_format", "-show_streams", file_path
+        ], capture_output=True, text=True, check=True)
+        return _summarize(json.loads(result.stdout))
+    except (subprocess.CalledProcessError, FileNotFoundError, ValueError):
+        return None
+
+
+def probe(file_path: str, use_cache: bool = True, save: bool = True) -> Optional[dict]:
+    """미디어 정보 조회 (실패하면 None)
+
+    Args:
+        save: 새로 조회한 결과를 바로 디스크 캐시에 저장할지 여부
+              (probe_many는 False로 호출하고 마지막에 한 번만 저장)
+
+    Returns:
+        dict: duration, size, format, has_video, has_audio, video{codec, width, height, fps...},
+              audio{codec, sample_rate, channels...}, streams
+    """
+    global _disk_dirty
+    key = _cache_key(file_path)
+    if key is None:
+        return None
+
+    if use_cache:
+        with _cache_lock:
+            info = _memory_cache.get(key) or _load_disk_cache().get(key)
+            if info:
+                _memory_cache[key] = info
+                return info
+
+    info = _run_ffprobe(file_path)
+    if info is None:
+        return None
+
+    info['probed_at'] = time.time()
+    with _cache_lock:
+        _memory_cache[key] = info
+        _load_disk_cache()[key] = info
+        if save:
+            _save_disk_cache()
+        else:
+            _disk_dirty = True
+    return info
+
+
+def probe_many(file_paths: list, workers: int = 8) -> dict:
+    """여러 파일을 동시에 조회 (디스크 캐시는 마지막에 한 번만 저장)
+
+    Returns:
+        dict: 파일 경로 → 미디어 정보 (실패한 파일은 None)
+    """
+    if not file_paths:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(workers, len(file_paths))) as executor:
+        results = dict(zip(file_paths, executor.map(lambda p: probe(p, save=False), file_paths)))
+    with _cache_lock:
+        if _disk_dirty:
+            _save_disk_cache()
+    return results
+
+
+def get_duration(file_path: str) -> float:
+    """미디어 길이 (초, 알 수 없으면 0.0)"""
+    info = probe(file_path)
+    return info['duration'] if info else 0.0
+
+
+def clear_cache() -> None:
+    """메모리/디스크 캐시 삭제"""
+    global _disk_cache
+    with _cache_lock:
+        _memory_cache.clear()
+        _disk_cache = {}
+        try:
+            os.remove(CACHE_PATH)
+        except OSError:
+            pass
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("🔍 미디어 정보 조회")
+        print("=" * 30)
+        print()
+        print("사용법:")
+        print("  python media_probe.py <파일> [파일...]   # 미디어 정보 출력")
+        print("  python media_probe.py clear              # 디스크 캐시 삭제")
+        return
+
+    if sys.argv[1] == "clear":
+        clear_cache()
+        print("🗑️  미디어 정보 캐시를 삭제했습니다.")
+        return
+
+    for file_path, info in probe_many(sys.argv[1:]).items():
+        print(f"📄 {file_path}")
+        if not info:
+            print("   ❌ 정보를 읽을 수 없습니다.")
+            continue
+        print(f"   길이: {info['duration']:.2f}초 | 형식: {info['format']} | {info['size'] / (1024 * 1024):.1f}MB")
+        if info['video']:
+            v = info['video']
+            print(f"   🎬 영상: {v['codec']} {v['width']}x{v['height']} {v['fps']}fps ({v['pix_fmt']})")
+        if info['audio']:
+            a = info['audio']
+            print(f"   🎵 음성: {a['codec']} {a['sample_rate']}Hz {a['channels']}ch")
+        else:
+            print("   🔇 음성 트랙 없음")
+
+
+if __name__ == "__main__":
+    main()
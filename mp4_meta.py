@@ -0,0 +1,463 @@
+#!/usr/bin/env python3
+"""
+📦 MP4 메타데이터 리더 (MP4 Meta)
+================================
+
+이 프로젝트가 만드는 MP4 파일은 길이, 해상도, fps, 키프레임 위치가 모두
+moov 박스(mvhd/tkhd/mdhd/stsd/stts/stss/ctts/elst)에 들어 있습니다.
+ffprobe 프로세스를 띄우지 않고 파일을 메모리 매핑해 이 박스들만 직접 읽습니다.
+
+- 파일 앞/뒤 어디에 moov가 있어도 mdat는 건너뛰므로 파일 크기와 관계없이 빠름
+- MP4/MOV/M4A가 아니거나 읽을 수 없는 파일(조각난 MP4 등)은 media_probe(ffprobe)로 대체
+- 반환 형식은 media_probe.probe()와 같은 키를 사용
+
+사용법:
+  python mp4_meta.py <파일> [파일...]                      # 메타데이터 출력
+  python mp4_meta.py bench <폴더> [ffprobe 비교 파일 수]    # ffprobe와 속도/정확도 비교
+"""
+
+import os
+import sys
+import json
+import mmap
+import time
+import struct
+import subprocess
+from fractions import Fraction
+from typing import Optional
+
+import media_probe
+
+MP4_EXTENSIONS = ('.mp4', '.m4v', '.mov', '.m4a', '.3gp')
+
+# 샘플 엔트리 형식(fourcc) → ffprobe 코덱 이름
+CODEC_NAMES = {
+    'avc1': 'h264', 'avc3': 'h264', 'hvc1': 'hevc', 'hev1': 'hevc',
+    'av01': 'av1', 'vp09': 'vp9', 'mp4v': 'mpeg4',
+    'mp4a': 'aac', 'ac-3': 'ac3', 'ec-3': 'eac3', 'Opus': 'opus', '.mp3': 'mp3',
+    'tx3g': 'mov_text',
+}
+
+# 트랙 핸들러 → 스트림 종류
+TRACK_TYPES = {'vide': 'video', 'soun': 'audio', 'text': 'subtitle', 'sbtl': 'subtitle', 'subt': 'subtitle'}
+
+
+def _iter_boxes(buf, start: int, end: int):
+    """[start, end) 구간의 박스 (종류, 내용 시작, 박스 끝) 순회"""
+    pos = start
+    while pos + 8 <= end:
+        size, box_type = struct.unpack_from(">I4s", buf, pos)
+        header = 8
+        if size == 1:
+            if pos + 16 > end:
+                return
+            size = struct.unpack_from(">Q", buf, pos + 8)[0]
+            header = 16
+        elif size == 0:
+            size = end - pos
+        if size < header or pos + size > end:
+            return
+        yield box_type, pos + header, pos + size
+        pos += size
+
+
+def _find_children(buf, start: int, end: int) -> dict:
+    """하위 박스를 종류별로 모음 (같은 종류가 여러 개면 목록)"""
+    children = {}
+    for box_type, body, box_end in _iter_boxes(buf, start, end):
+        children.setdefault(box_type, []).append((body, box_end))
+    return children
+
+
+def _full_box_version(buf, body: int) -> int:
+    return buf[body]
+
+
+def _parse_mvhd(buf, body: int) -> tuple:
+    """(timescale, duration)"""
+    if _full_box_version(buf, body) == 1:
+        return struct.unpack_from(">IQ", buf, body + 20)
+    return struct.unpack_from(">II", buf, body + 12)
+
+
+def _parse_elst(buf, body: int) -> tuple:
+    """편집 목록에서 (앞쪽 빈 구간 길이, 표시 구간 전체 길이[movie timescale], 미디어 시작 시간[media timescale])"""
+    version = _full_box_version(buf, body)
+    count = struct.unpack_from(">I", buf, body + 4)[0]
+    pos = body + 8
+    empty = 0
+    total = 0
+    media_start = None
+    for _ in range(count):
+        if version == 1:
+            segment_duration, media_time = struct.unpack_from(">Qq", buf, pos)
+            pos += 20
+        else:
+            segment_duration, media_time = struct.unpack_from(">Ii", buf, pos)
+            pos += 12
+        total += segment_duration
+        if media_time == -1:
+            if media_start is None:
+                empty += segment_duration
+        elif media_start is None:
+            media_start = media_time
+    return empty, total, media_start or 0
+
+
+def _parse_table(buf, body: int, fields: int, fmt: str = "I") -> tuple:
+    """stts/ctts/stss 같은 (개수 + 항목) 표를 한 번에 읽음"""
+    count = struct.unpack_from(">I", buf, body + 4)[0]
+    return struct.unpack_from(f">{count * fields}{fmt}", buf, body + 8)
+
+
+def _keyframe_times(stts: tuple, stss: Optional[tuple], ctts: Optional[tuple], ctts_signed: bool,
+                    media_start: int, frame_delta: int, timescale: int, offset_seconds: float) -> list:
+    """키프레임 표시 시간 (초) 목록 — stts 누적 시간 + ctts 보정 - 편집 목록 시작"""
+    if stss is None:
+        total = sum(stts[0::2])
+        sync_samples = range(1, total + 1)
+    else:
+        sync_samples = stss
+
+    ctts = ctts or ()
+
+    # ffmpeg처럼 편집 목록 시작을 그 이후 첫 프레임 위치에 맞춤 (키프레임 뒤에서 자른 스트림 복사 파일)
+    if media_start and frame_delta:
+        first_pts = ctts[1] if ctts else 0
+        if ctts_signed and first_pts >= 0x80000000:
+            first_pts -= 0x100000000
+        media_start += (first_pts - media_start) % frame_delta
+
+    # stts/ctts 모두 (개수, 값) 구간 표이므로 키프레임 번호 순서대로 두 표를 함께 따라감
+    times = []
+    run_index = run_dts = 0
+    run_first = 1
+    ctts_index = 0
+    ctts_first = 1
+    for sample in sync_samples:
+        while run_index < len(stts) and sample >= run_first + stts[run_index]:
+            run_first += stts[run_index]
+            run_dts += stts[run_index] * stts[run_index + 1]
+            run_index += 2
+        if run_index >= len(stts):
+            break
+        dts = run_dts + (sample - run_first) * stts[run_index + 1]
+
+        while ctts_index < len(ctts) and sample >= ctts_first + ctts[ctts_index]:
+            ctts_first += ctts[ctts_index]
+            ctts_index += 2
+        composition = ctts[ctts_index + 1] if ctts_index < len(ctts) else 0
+        if ctts_signed and composition >= 0x80000000:
+            composition -= 0x100000000
+
+        times.append(round((dts + composition - media_start) / timescale + offset_seconds, 6))
+    return sorted(times)
+
+
+def _parse_trak(buf, body: int, end: int, movie_timescale: int, with_keyframes: bool) -> Optional[dict]:
+    """트랙 하나의 종류, 코덱, 길이, 샘플 정보"""
+    trak = _find_children(buf, body, end)
+    if b'mdia' not in trak:
+        return None
+    mdia = _find_children(buf, *trak[b'mdia'][0])
+    if b'mdhd' not in mdia or b'hdlr' not in mdia or b'minf' not in mdia:
+        return None
+
+    mdhd = mdia[b'mdhd'][0][0]
+    if _full_box_version(buf, mdhd) == 1:
+        timescale, duration = struct.unpack_from(">IQ", buf, mdhd + 20)
+    else:
+        timescale, duration = struct.unpack_from(">II", buf, mdhd + 12)
+    if not timescale:
+        return None
+    handler = bytes(buf[mdia[b'hdlr'][0][0] + 8:mdia[b'hdlr'][0][0] + 12]).decode('latin-1')
+
+    minf = _find_children(buf, *mdia[b'minf'][0])
+    if b'stbl' not in minf:
+        return None
+    stbl = _find_children(buf, *minf[b'stbl'][0])
+    if b'stsd' not in stbl or b'stts' not in stbl:
+        return None
+
+    stsd = stbl[b'stsd'][0][0]
+    entry = stsd + 8
+    fourcc = bytes(buf[entry + 4:entry + 8]).decode('latin-1')
+    stts = _parse_table(buf, stbl[b'stts'][0][0], 2)
+
+    # 편집 목록이 있으면 실제 표시 구간 길이를 사용 (mvhd/mdhd는 잘린 앞부분까지 포함할 수 있음)
+    empty, presented, media_start = 0, 0, 0
+    edts = trak.get(b'edts')
+    if edts:
+        elst = _find_children(buf, *edts[0]).get(b'elst')
+        if elst:
+            empty, presented, media_start = _parse_elst(buf, elst[0][0])
+
+    track = {
+        'handler': handler,
+        'codec': CODEC_NAMES.get(fourcc, fourcc.strip()),
+        'timescale': timescale,
+        'duration': presented / movie_timescale if presented and movie_timescale else duration / timescale,
+        'media_duration': duration / timescale,
+        'samples': sum(stts[0::2]),
+    }
+
+    if handler == 'vide':
+        track['width'], track['height'] = struct.unpack_from(">HH", buf, entry + 32)
+        # 가장 많이 쓰인 프레임 간격으로 기준 프레임레이트 계산 (ffprobe r_frame_rate와 같은 방식)
+        delta = 0
+        if stts:
+            counts = {}
+            for i in range(0, len(stts), 2):
+                counts[stts[i + 1]] = counts.get(stts[i + 1], 0) + stts[i]
+            delta = max(counts, key=counts.get)
+        rate = Fraction(timescale, delta) if delta else None
+        track['r_frame_rate'] = f"{rate.numerator}/{rate.denominator}" if rate else "0/0"
+
+        if with_keyframes:
+            offset_seconds = empty / movie_timescale if movie_timescale else 0.0
+            stss = _parse_table(buf, stbl[b'stss'][0][0], 1) if b'stss' in stbl else None
+            ctts, ctts_signed = None, False
+            if b'ctts' in stbl:
+                ctts_body = stbl[b'ctts'][0][0]
+                ctts = _parse_table(buf, ctts_body, 2)
+                ctts_signed = _full_box_version(buf, ctts_body) == 1
+            track['keyframes'] = _keyframe_times(stts, stss, ctts, ctts_signed,
+                                                 media_start, delta, timescale, offset_seconds)
+    elif handler == 'soun':
+        track['channels'] = struct.unpack_from(">H", buf, entry + 24)[0]
+        track['sample_rate'] = struct.unpack_from(">I", buf, entry + 32)[0] >> 16
+
+    return track
+
+
+def read_metadata(file_path: str, with_keyframes: bool = False) -> Optional[dict]:
+    """MP4 박스를 직접 읽어 미디어 정보 반환 (MP4가 아니거나 읽을 수 없으면 None)
+
+    Returns:
+        dict: media_probe.probe()와 같은 키 (duration, size, has_video, has_audio, video, audio...)
+              with_keyframes=True면 video['keyframes']에 키프레임 시간 목록 포함
+    """
+    if not file_path.lower().endswith(MP4_EXTENSIONS):
+        return None
+
+    try:
+        with open(file_path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if size < 8:
+                return None
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+                return _read_boxes(buf, size, with_keyframes)
+    except (OSError, ValueError, struct.error, IndexError):
+        return None
+
+
+def _read_boxes(buf, size: int, with_keyframes: bool) -> Optional[dict]:
+    top = _find_children(buf, 0, size)
+    if b'ftyp' not in top or b'moov' not in top:
+        return None
+
+    moov_body, moov_end = top[b'moov'][0]
+    moov = _find_children(buf, moov_body, moov_end)
+    # 조각난 MP4는 moov에 샘플 정보가 없으므로 ffprobe에 맡김
+    if b'mvhd' not in moov or b'mvex' in moov:
+        return None
+
+    movie_timescale, movie_duration = _parse_mvhd(buf, moov[b'mvhd'][0][0])
+    tracks = [t for t in (_parse_trak(buf, body, end, movie_timescale, with_keyframes)
+                          for body, end in moov.get(b'trak', [])) if t]
+
+    video = next((t for t in tracks if t['handler'] == 'vide'), None)
+    audio = next((t for t in tracks if t['handler'] == 'soun'), None)
+    # ffprobe와 같이 가장 긴 스트림 길이를 전체 길이로 사용 (mvhd는 ms 단위로 올림되어 있음)
+    duration = max((t['duration'] for t in tracks), default=0.0)
+    if not duration and movie_timescale:
+        duration = movie_duration / movie_timescale
+    if not duration:
+        return None
+
+    info = {
+        'duration': duration,
+        'size': size,
+        'format': 'mov,mp4,m4a,3gp,3g2,mj2',
+        'bit_rate': int(size * 8 / duration),
+        'has_video': video is not None,
+        'has_audio': audio is not None,
+        'has_subtitles': any(TRACK_TYPES.get(t['handler']) == 'subtitle' for t in tracks),
+        'video': None,
+        'audio': None,
+        'streams': [
+            {'index': i, 'type': TRACK_TYPES.get(t['handler'], 'data'), 'codec': t['codec']}
+            for i, t in enumerate(tracks)
+        ]
+    }
+
+    if video:
+        info['video'] = {
+            'codec': video['codec'],
+            'width': video['width'],
+            'height': video['height'],
+            'fps': round(video['samples'] / video['media_duration'], 3) if video['media_duration'] else 0.0,
+            'r_frame_rate': video['r_frame_rate'],
+            'pix_fmt': None,
+            'duration': video['duration'],
+            'frames': video['samples'],
+            'timescale': video['timescale']
+        }
+        if with_keyframes:
+            info['video']['keyframes'] = video['keyframes']
+    if audio:
+        info['audio'] = {
+            'codec': audio['codec'],
+            'sample_rate': audio['sample_rate'],
+            'channels': audio['channels'],
+            'duration': audio['duration']
+        }
+    return info
+
+
+def probe(file_path: str) -> Optional[dict]:
+    """MP4는 직접 읽고, 나머지 형식은 media_probe(ffprobe, 캐시)로 조회"""
+    return read_metadata(file_path) or media_probe.probe(file_path)
+
+
+def probe_many(file_paths: list) -> dict:
+    """여러 파일 조회 (MP4가 아닌 파일만 모아서 ffprobe로 동시에 조회)"""
+    results = {path: read_metadata(path) for path in file_paths}
+    remaining = [path for path, info in results.items() if info is None]
+    results.update(media_probe.probe_many(remaining))
+    return results
+
+
+def get_duration(file_path: str) -> float:
+    """미디어 길이 (초, 알 수 없으면 0.0)"""
+    info = read_metadata(file_path)
+    if info:
+        return info['duration']
+    return media_probe.get_duration(file_path)
+
+
+def keyframe_times(file_path: str) -> Optional[list]:
+    """영상 키프레임 표시 시간 목록 (MP4가 아니면 None)"""
+    info = read_metadata(file_path, with_keyframes=True)
+    if not info or not info['video']:
+        return None
+    return info['video']['keyframes']
+
+
+def _ffprobe_duration(file_path: str) -> float:
+    """비교용: 캐시 없이 ffprobe를 직접 실행해 길이 조회 (기존 get_media_duration 방식)"""
+    try:
+        result = subprocess.run([
+            "ffprobe", "-v", "quiet", "-print_format", "json",
+            "-show_entries", "format=duration", file_path
+        ], capture_output=True, text=True, check=True)
+        return float(json.loads(result.stdout)["format"]["duration"])
+    except (subprocess.CalledProcessError, FileNotFoundError, KeyError, ValueError):
+        return 0.0
+
+
+def benchmark(folder: str, ffprobe_limit: int = 100) -> dict:
+    """폴더 안 MP4 전체를 직접 읽는 시간과 ffprobe 실행 시간 비교
+
+    ffprobe는 느리므로 앞쪽 ffprobe_limit개만 실행하고 파일당 평균으로 비교합니다.
+    """
+    files = sorted(
+        os.path.join(root, name)
+        for root, _, names in os.walk(folder)
+        for name in names if name.lower().endswith(MP4_EXTENSIONS)
+    )
+    if not files:
+        return {'files': 0}
+
+    start = time.perf_counter()
+    parsed = [read_metadata(path) for path in files]
+    parse_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for path in files:
+        read_metadata(path, with_keyframes=True)
+    keyframe_time = time.perf_counter() - start
+
+    sample = files[:ffprobe_limit]
+    start = time.perf_counter()
+    ffprobe_durations = [_ffprobe_duration(path) for path in sample]
+    ffprobe_time = time.perf_counter() - start
+
+    # 같은 파일에 대해 길이가 얼마나 일치하는지 확인
+    differences = [abs(info['duration'] - expected)
+                   for info, expected in zip(parsed, ffprobe_durations) if info and expected]
+
+    return {
+        'files': len(files),
+        'parsed': sum(1 for info in parsed if info),
+        'parse_per_file_us': parse_time / len(files) * 1e6,
+        'keyframes_per_file_us': keyframe_time / len(files) * 1e6,
+        'ffprobe_files': len(sample),
+        'ffprobe_per_file_ms': ffprobe_time / len(sample) * 1e3,
+        'max_duration_diff': max(differences, default=0.0),
+        'compared': len(differences)
+    }
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("📦 MP4 메타데이터 리더")
+        print("=" * 30)
+        print()
+        print("사용법:")
+        print("  python mp4_meta.py <파일> [파일...]                     # 메타데이터 출력")
+        print("  python mp4_meta.py bench <폴더> [ffprobe 비교 파일 수]   # ffprobe와 속도/정확도 비교")
+        return
+
+    if sys.argv[1] == "bench":
+        if len(sys.argv) < 3 or not os.path.isdir(sys.argv[2]):
+            print("❌ 비교할 폴더를 지정하세요.")
+            return
+        try:
+            limit = int(sys.argv[3]) if len(sys.argv) > 3 else 100
+        except ValueError:
+            print("❌ 비교 파일 수는 숫자여야 합니다.")
+            return
+
+        print(f"⏱️  MP4 메타데이터 읽기 비교: {sys.argv[2]}")
+        result = benchmark(sys.argv[2], limit)
+        if not result['files']:
+            print("❌ MP4 파일이 없습니다.")
+            return
+        print(f"   파일 수: {result['files']}개 (직접 읽기 성공 {result['parsed']}개)")
+        print(f"   mp4_meta (길이/해상도):   파일당 {result['parse_per_file_us']:.0f}µs")
+        print(f"   mp4_meta (+키프레임):     파일당 {result['keyframes_per_file_us']:.0f}µs")
+        print(f"   ffprobe ({result['ffprobe_files']}개 실행):     파일당 {result['ffprobe_per_file_ms']:.1f}ms")
+        if result['parse_per_file_us']:
+            speedup = result['ffprobe_per_file_ms'] * 1000 / result['parse_per_file_us']
+            print(f"⚡ 속도 향상: {speedup:.0f}배")
+        print(f"📊 길이 차이 (최대): {result['max_duration_diff'] * 1000:.1f}ms ({result['compared']}개 비교)")
+        return
+
+    for file_path in sys.argv[1:]:
+        info = read_metadata(file_path, with_keyframes=True)
+        source = "MP4 박스"
+        if info is None:
+            info = media_probe.probe(file_path)
+            source = "ffprobe"
+        print(f"📄 {file_path} ({source})")
+        if not info:
+            print("   ❌ 정보를 읽을 수 없습니다.")
+            continue
+        print(f"   길이: {info['duration']:.3f}초 | {info['size'] / (1024 * 1024):.1f}MB")
+        if info['video']:
+            v = info['video']
+            print(f"   🎬 영상: {v['codec']} {v['width']}x{v['height']} {v['fps']}fps")
+            keyframes = v.get('keyframes')
+            if keyframes:
+                preview = ", ".join(f"{t:.2f}" for t in keyframes[:8])
+                print(f"   🔑 키프레임 {len(keyframes)}개: {preview}{' ...' if len(keyframes) > 8 else ''}")
+        if info['audio']:
+            a = info['audio']
+            print(f"   🎵 음성: {a['codec']} {a['sample_rate']}Hz {a['channels']}ch")
+        else:
+            print("   🔇 음성 트랙 없음")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+⚡ 구간 병렬 인코딩 (Parallel Encoder)
+=====================================
+
+긴 영상을 재인코딩할 때 (제목 합성, 자막 새기기 등) ffmpeg 하나로 전체를 처리하면
+코어가 많아도 x264가 모든 코어를 활용하지 못합니다.
+키프레임 위치에서 영상을 여러 구간으로 나누고, 구간마다 ffmpeg를 따로 실행해 동시에 인코딩한 뒤
+재인코딩 없이 이어 붙입니다.
+
+- 구간 분할: 키프레임에서만 자르므로 구간 경계에서 프레임이 빠지거나 겹치지 않음
+- 타임스탬프: -copyts로 원본 시간을 유지하므로 drawtext/subtitles 필터가 전체 기준 시간으로 동작
+- 이어 붙이기: concat demuxer로 스트림 복사, 음성은 원본에서 그대로 복사
+
+사용법:
+  python parallel_encoder.py bench <동영상> [워커수] [자막.srt]   # 단일 인코딩과 속도 비교
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import tempfile
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+import encoding_profiles
+import media_probe
+import mp4_meta
+
+MIN_SEGMENT_SECONDS = 10      # 이보다 짧은 구간은 만들지 않음 (ffmpeg 시작 비용 대비 이득이 없음)
+SEGMENTS_PER_WORKER = 2       # 구간 길이가 달라도 워커가 쉬지 않도록 워커당 구간 수
+SEEK_EPSILON = 0.001          # 키프레임 시간 반올림 오차 방지용 여유 (초)
+
+
+def default_workers() -> int:
+    """동시에 실행할 ffmpeg 수 (x264 자체 스레드도 쓰므로 코어의 절반)"""
+    return max(1, (os.cpu_count() or 1) // 2)
+
+
+def keyframe_times(video_path: str) -> tuple:
+    """영상 키프레임 시간 목록, 전체 길이, 프레임레이트 (디코딩 없이 패킷 정보만 읽음)
+
+    Returns:
+        tuple: (키프레임 시간 list, 전체 길이 float, 프레임레이트 str 예: "24/1")
+    """
+    # MP4는 stss/stts 박스에서 바로 읽음 (ffprobe로 패킷 전체를 나열하지 않음)
+    info = mp4_meta.read_metadata(video_path, with_keyframes=True)
+    if info and info['video'] and info['video']['keyframes']:
+        return info['video']['keyframes'], info['duration'], info['video']['r_frame_rate']
+
+    # 길이/프레임레이트는 캐시된 미디어 정보 사용, 키프레임 위치만 패킷에서 읽음
+    info = media_probe.probe(video_path)
+    if not info or not info['video']:
+        raise ValueError(f"동영상 정보를 읽을 수 없습니다: {video_path}")
+
+    cmd = [
+        "ffprobe", "-v", "error", "-select_streams", "v:0",
+        "-show_entries", "packet=pts_time,flags",
+        "-of", "json", video_path
+    ]
+    result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+    data = json.loads(result.stdout)
+
+    keyframes = sorted(
+        float(p['pts_time']) for p in data.get('packets', [])
+        if 'K' in p.get('flags', '') and p.get('pts_time') not in (None, 'N/A')
+    )
+    return keyframes, info['duration'], info['video']['r_frame_rate'] or "0/0"
+
+
+def plan_segments(keyframes: list, duration: float, count: int,
+                  min_seconds: float = MIN_SEGMENT_SECONDS) -> list:
+    """전체를 비슷한 길이로 나누되 경계는 목표 지점에 가장 가까운 키프레임으로 맞춤
+
+    Returns:
+        list: (시작, 끝) 목록 (초)
+    """
+    count = max(1, min(count, int(duration // min_seconds)))
+    boundaries = [0.0]
+    for i in range(1, count):
+        target = duration * i / count
+        candidates = [k for k in keyframes if boundaries[-1] + min_seconds <= k <= duration - min_seconds]
+        if not candidates:
+            break
+        boundary = min(candidates, key=lambda k: abs(k - target))
+        if boundary > boundaries[-1]:
+            boundaries.append(boundary)
+    boundaries.append(duration)
+    return list(zip(boundaries, boundaries[1:]))
+
+
+def _encode_segment(args: tuple) -> tuple:
+    """구간 하나를 인코딩 (영상만, 타임스탬프는 0부터 시작하도록 맞춤)"""
+    input_path, start, end, is_last, video_filter, video_args, frame_rate, threads, output_path = args
+
+    # 시작 키프레임 바로 앞으로 찾아가면 키프레임 프레임이 반올림 때문에 빠지지 않음
+    seek = max(0.0, start - SEEK_EPSILON) if start > 0 else 0.0
+    cmd = ["ffmpeg", "-y", "-v", "error", "-copyts", "-ss", f"{seek:.6f}"]
+    if not is_last:
+        cmd += ["-t", f"{end - SEEK_EPSILON - seek:.6f}"]
+    cmd += ["-i", input_path]
+
+    # 필터는 원본 시간 기준으로 적용한 뒤 구간 시작을 0으로 되돌림
+    filters = [f for f in (video_filter, "setpts=PTS-STARTPTS") if f]
+    cmd += ["-map", "0:v:0", "-an", "-sn", "-vf", ",".join(filters)]
+    # 타임스탬프를 바꾸면 ffmpeg가 프레임레이트를 25로 가정해 프레임을 복제하므로 원본 값을 지정
+    if frame_rate not in ("0/0", "", None):
+        cmd += ["-r", frame_rate]
+    cmd += video_args + ["-threads", str(threads), output_path]
+
+    started = time.time()
+    result = subprocess.run(cmd, capture_output=True, text=True)
+    return result.returncode == 0, time.time() - started, result.stderr
+
+
+def encode_parallel(input_path: str, output_path: str, video_filter: Optional[str] = None,
+                    video_args: Optional[list] = None, workers: Optional[int] = None) -> dict:
+    """영상을 구간별로 병렬 인코딩하고 이어 붙이기 (음성은 원본에서 복사)
+
+    Returns:
+        dict: {'ok', 'segments', 'workers', 'elapsed', 'error'}
+    """
+    started = time.time()
+    workers = workers or default_workers()
+    video_args = video_args or encoding_profiles.video_args(encoding_profiles.get_profile())
+
+    try:
+        keyframes, duration, frame_rate = keyframe_times(input_path)
+    except (subprocess.CalledProcessError, FileNotFoundError, KeyError, ValueError) as e:
+        return {'ok': False, 'error': f"키프레임 정보를 읽을 수 없습니다: {e}"}
+
+    segments = plan_segments(keyframes, duration, workers * SEGMENTS_PER_WORKER)
+    threads = max(1, (os.cpu_count() or 1) // min(workers, len(segments)))
+
+    temp_dir = tempfile.mkdtemp(prefix="parallel_encode_")
+    try:
+        jobs = []
+        for i, (start, end) in enumerate(segments):
+            segment_path = os.path.join(temp_dir, f"segment_{i:04d}.mp4")
+            jobs.append((input_path, start, end, i == len(segments) - 1,
+                         video_filter, video_args, frame_rate, threads, segment_path))
+
+        # 실제 인코딩은 각 ffmpeg 프로세스가 하므로 스레드 풀로 프로세스만 관리
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_encode_segment, jobs))
+
+        failed = [stderr for ok, _, stderr in results if not ok]
+        if failed:
+            return {'ok': False, 'error': failed[0].strip(), 'segments': len(segments)}
+
+        # 구간 이어 붙이기 (스트림 복사) + 원본 음성 복사
+        concat_file = os.path.join(temp_dir, "segments.txt")
+        with open(concat_file, "w", encoding="utf-8") as f:
+            for job in jobs:
+                f.write(f"file '{os.path.abspath(job[-1])}'\n")
+
+        cmd = [
+            "ffmpeg", "-y", "-v", "error",
+            "-f", "concat", "-safe", "0", "-i", concat_file,
+            "-i", input_path,
+            "-map", "0:v:0", "-map", "1:a?",
+            "-c", "copy", "-movflags", "+faststart",
+            output_path
+        ]
+        result = subprocess.run(cmd, capture_output=True, text=True)
+        if result.returncode != 0:
+            return {'ok': False, 'error': result.stderr.strip(), 'segments': len(segments)}
+
+        return {
+            'ok': True,
+            'segments': len(segments),
+            'workers': workers,
+            'elapsed': time.time() - started,
+            'segment_times': [elapsed for _, elapsed, _ in results]
+        }
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def main():
+    if len(sys.argv) < 3 or sys.argv[1] != "bench":
+        print("⚡ 구간 병렬 인코딩")
+        print("=" * 30)
+        print()
+        print("사용법:")
+        print("  python parallel_encoder.py bench <동영상> [워커수] [자막.srt]   # 단일 인코딩과 속도 비교")
+        return
+
+    video_path = sys.argv[2]
+    if not os.path.exists(video_path):
+        print(f"❌ 파일을 찾을 수 없습니다: {video_path}")
+        return
+
+    try:
+        workers = int(sys.argv[3]) if len(sys.argv) > 3 else default_workers()
+    except ValueError:
+        print("❌ 워커 수는 숫자여야 합니다.")
+        return
+
+    video_filter = None
+    if len(sys.argv) > 4:
+        escaped = sys.argv[4].replace('\\', '/').replace(':', '\\:')
+        video_filter = f"subtitles='{escaped}'"
+
+    profile = encoding_profiles.get_profile()
+    video_args = encoding_profiles.video_args(profile)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        single_path = os.path.join(temp_dir, "single.mp4")
+        parallel_path = os.path.join(temp_dir, "parallel.mp4")
+
+        print(f"⏱️  인코딩 비교: {video_path} (프로필: {profile['name']})")
+
+        cmd = ["ffmpeg", "-y", "-v", "error", "-i", video_path]
+        if video_filter:
+            cmd += ["-vf", video_filter]
+        cmd += video_args + ["-c:a", "copy", single_path]
+        start = time.time()
+        single = subprocess.run(cmd, capture_output=True, text=True)
+        single_time = time.time() - start
+        if single.returncode != 0:
+            print(f"❌ 단일 인코딩 실패: {single.stderr.strip()}")
+            return
+        print(f"   단일 ffmpeg:        {single_time:.1f}초")
+
+        result = encode_parallel(video_path, parallel_path, video_filter, video_args, workers)
+        if not result['ok']:
+            print(f"❌ 병렬 인코딩 실패: {result['error']}")
+            return
+        print(f"   병렬 ({result['segments']}구간 × 워커 {result['workers']}개): {result['elapsed']:.1f}초")
+        print(f"⚡ 속도 향상: {single_time / result['elapsed']:.2f}배")
+
+        _, single_duration, _ = keyframe_times(single_path)
+        _, parallel_duration, _ = keyframe_times(parallel_path)
+        print(f"📊 길이 확인: 단일 {single_duration:.3f}초 / 병렬 {parallel_duration:.3f}초")
+
+
+if __name__ == "__main__":
+    main()
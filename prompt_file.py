@@ -0,0 +1,362 @@
+#!/usr/bin/env python3
+"""
+📝 프롬프트 파일 (Prompt File)
+=============================
+
+배치/체인용 프롬프트 파일을 읽어 프롬프트마다 설정(길이, 화면비, 시드, 이미지, 모델)과
+묶음(체인, 장면)을 붙입니다. 설정이 다른 클립이 섞인 작품도 한 번의 배치로 실행할 수 있습니다.
+
+지원 형식:
+- .txt: 한 줄에 프롬프트 하나 (#으로 시작하면 주석, 기존 파일은 그대로 동작)
+    아래 지시어가 아닌 @로 시작하는 줄, 설정 키가 아닌 '| ...'로 끝나는 줄은 프롬프트 내용 그대로 사용
+    해변을 걷는 고양이 | duration=5 seed=42 image=images/cat.png
+    @defaults ratio=9:16 model=pro     → 이후 줄의 기본 설정 (@defaults만 쓰면 해제)
+    @chain 오프닝                      → 이후 줄은 '오프닝' 체인 (이전 클립의 마지막 프레임에서 이어서 생성)
+    @scene 2장                         → 이후 줄은 '2장' 장면 묶음 (합칠 때 한 파일로)
+    @end                               → 체인/장면 묶음 끝
+- .jsonl: 한 줄에 JSON 객체 하나
+    {"prompt": "해변을 걷는 고양이", "duration": 5, "chain": "오프닝"}
+- .yaml / .yml (PyYAML 필요): 프롬프트 목록, 또는 {defaults: {...}, prompts: [...]}
+    목록 항목은 문자열, 설정이 붙은 dict, 또는 prompts를 가진 묶음 dict
+    - chain: 오프닝
+      duration: 5
+      prompts: [첫 장면, 둘째 장면]
+    (YAML에서 16:9 같은 화면비는 숫자로 읽히므로 따옴표로 감싸세요)
+
+프롬프트별 설정 키: duration, ratio, resolution, fps, seed, camerafixed, watermark, image, model(pro/lite)
+묶음 키: chain, scene
+
+사용법:
+  python prompt_file.py <파일>      # 읽은 결과와 묶음 확인
+"""
+
+import os
+import sys
+import json
+import shlex
+from typing import Optional
+
+RATIOS = ["16:9", "4:3", "1:1", "3:4", "9:16", "21:9", "9:21", "keep_ratio"]
+
+# 프롬프트마다 쓸 수 있는 설정 (callback_url은 실행 전체 설정이라 제외)
+PROMPT_SETTING_KEYS = ('duration', 'ratio', 'resolution', 'fps', 'seed', 'camerafixed', 'watermark',
+                       'image', 'image_file', 'model', 'use_pro_model')
+GROUP_KEYS = ('chain', 'scene')
+STRUCTURED_EXTENSIONS = ('.jsonl', '.yaml', '.yml')
+
+
+def parse_setting(key: str, value) -> tuple:
+    """설정 키/값 검증 → (config 키, 값)
+
+    config.txt와 프롬프트 파일이 같은 규칙을 사용합니다.
+    image는 image_file, model(pro/lite)은 use_pro_model로 바꿔 돌려줍니다.
+
+    Raises:
+        ValueError: 모르는 키이거나 값이 올바르지 않을 때
+    """
+    if key == 'ratio' and isinstance(value, int) and not isinstance(value, bool):
+        raise ValueError(f"ratio 값이 숫자로 읽혔습니다: {value} (YAML에서는 \"16:9\"처럼 따옴표로 감싸세요)")
+
+    text = str(value).strip()
+    lower = text.lower()
+
+    if key == 'resolution' and text in ["480p", "720p", "1080p"]:
+        return 'resolution', text
+    if key == 'ratio' and text in RATIOS:
+        return 'ratio', text
+    if key == 'duration' and text.isdigit() and int(text) in [5, 10]:
+        return 'duration', int(text)
+    if key == 'fps' and text.isdigit() and int(text) in [16, 24]:
+        return 'fps', int(text)
+    if key in ('watermark', 'camerafixed', 'use_pro_model') and lower in ["true", "false"]:
+        return key, lower == "true"
+    if key == 'seed' and (text == "-1" or (text.isdigit() and 0 <= int(text) <= 4294967295)):
+        return 'seed', int(text)
+    if key == 'callback_url' and text.startswith("http"):
+        return 'callback_url', text
+    if key in ('image', 'image_file') and text:
+        return 'image_file', text
+    if key == 'model' and lower in ["pro", "lite"]:
+        return 'use_pro_model', lower == "pro"
+
+    if key not in PROMPT_SETTING_KEYS and key != 'callback_url':
+        raise ValueError(f"알 수 없는 설정: {key}")
+    raise ValueError(f"{key} 값이 올바르지 않습니다: {value}")
+
+
+def _parse_settings(items: dict, where: str, base_dir: str) -> dict:
+    """{키: 값} → 검증된 config 설정 (이미지 경로 확인 포함)"""
+    settings = {}
+    for key, value in items.items():
+        if key not in PROMPT_SETTING_KEYS:
+            raise ValueError(f"{where}: 프롬프트별로 쓸 수 없는 설정입니다: {key}")
+        try:
+            config_key, config_value = parse_setting(key, value)
+        except ValueError as e:
+            raise ValueError(f"{where}: {e}")
+        if config_key == 'image_file':
+            config_value = _resolve_image(config_value, where, base_dir)
+        settings[config_key] = config_value
+    return settings
+
+
+def _resolve_image(image: str, where: str, base_dir: str) -> str:
+    """이미지 경로 확인 (현재 폴더 기준, 없으면 프롬프트 파일 폴더 기준)"""
+    if image.startswith(("http://", "https://", "data:")) or os.path.exists(image):
+        return image
+    candidate = os.path.join(base_dir, image)
+    if os.path.exists(candidate):
+        return candidate
+    raise ValueError(f"{where}: 이미지 파일을 찾을 수 없습니다: {image}")
+
+
+def _make_entry(prompt, settings: dict, chain: Optional[str], scene: Optional[str], where: str) -> dict:
+    if not isinstance(prompt, str) or not prompt.strip():
+        raise ValueError(f"{where}: 프롬프트가 비어 있습니다.")
+    return {
+        'index': 0,
+        'prompt': prompt.strip(),
+        'settings': settings,
+        'chain': str(chain) if chain not in (None, "") else None,
+        'scene': str(scene) if scene not in (None, "") else None,
+        'source': where
+    }
+
+
+def _split_tokens(text: str) -> Optional[dict]:
+    """'key=value key=value' → dict (key=value 형식이 아닌 토큰이 있으면 None)"""
+    try:
+        tokens = shlex.split(text)
+    except ValueError:
+        return None
+    items = {}
+    for token in tokens:
+        if "=" not in token:
+            return None
+        key, value = token.split("=", 1)
+        items[key.strip()] = value.strip()
+    return items
+
+
+def _read_text(lines: list, path: str, base_dir: str) -> list:
+    entries = []
+    defaults = {}
+    chain = scene = None
+
+    for line_num, line in enumerate(lines, 1):
+        line = line.strip()
+        where = f"{path}:{line_num}"
+        # 빈 줄이나 주석 줄 무시
+        if not line or line.startswith("#"):
+            continue
+
+        directive, _, rest = line[1:].partition(" ")
+        # 모르는 지시어("@someone said hi" 등)는 기존 파일처럼 프롬프트 내용으로 취급
+        if line.startswith("@") and directive in ("defaults", "end") + GROUP_KEYS:
+            rest = rest.strip()
+            if directive == "defaults":
+                items = _split_tokens(rest) if rest else {}
+                if items is None:
+                    raise ValueError(f"{where}: @defaults 뒤에는 key=value만 쓸 수 있습니다.")
+                defaults = _parse_settings(items, where, base_dir)
+            elif directive in GROUP_KEYS:
+                if not rest:
+                    raise ValueError(f"{where}: @{directive} 뒤에 이름을 쓰세요.")
+                if directive == "chain":
+                    chain = rest
+                else:
+                    scene, chain = rest, None
+            else:
+                chain = scene = None
+            continue
+
+        # 줄 끝의 '| key=value ...' 설정
+        # (모두 아는 설정/묶음 키일 때만 설정으로 보고, 아니면 '|'도 프롬프트 내용으로 취급)
+        prompt, items = line, {}
+        if "|" in line:
+            head, tail = line.rsplit("|", 1)
+            parsed = _split_tokens(tail)
+            if parsed and all(key in PROMPT_SETTING_KEYS + GROUP_KEYS for key in parsed):
+                prompt, items = head, parsed
+
+        entry_chain = items.pop('chain', chain)
+        entry_scene = items.pop('scene', scene)
+        settings = {**defaults, **_parse_settings(items, where, base_dir)}
+        entries.append(_make_entry(prompt, settings, entry_chain, entry_scene, where))
+
+    return entries
+
+
+def _read_jsonl(lines: list, path: str, base_dir: str) -> list:
+    entries = []
+    for line_num, line in enumerate(lines, 1):
+        line = line.strip()
+        where = f"{path}:{line_num}"
+        if not line or line.startswith("#"):
+            continue
+        try:
+            item = json.loads(line)
+        except ValueError as e:
+            raise ValueError(f"{where}: JSON 형식이 올바르지 않습니다 - {e}")
+        if isinstance(item, str):
+            item = {'prompt': item}
+        if not isinstance(item, dict):
+            raise ValueError(f"{where}: 줄마다 JSON 객체나 문자열이어야 합니다.")
+        entries.extend(_read_item(item, {}, None, None, where, base_dir))
+    return entries
+
+
+def _read_item(item, defaults: dict, chain: Optional[str], scene: Optional[str], where: str, base_dir: str) -> list:
+    """YAML/JSONL 항목 하나 → 항목 목록 (prompts가 있으면 묶음)"""
+    if isinstance(item, str):
+        return [_make_entry(item, dict(defaults), chain, scene, where)]
+    if not isinstance(item, dict):
+        raise ValueError(f"{where}: 프롬프트는 문자열이나 dict여야 합니다.")
+
+    item = dict(item)
+    chain = item.pop('chain', chain)
+    scene = item.pop('scene', scene)
+    children = item.pop('prompts', None)
+    prompt = item.pop('prompt', None)
+    settings = {**defaults, **_parse_settings(item, where, base_dir)}
+
+    if children is None:
+        return [_make_entry(prompt, settings, chain, scene, where)]
+    if prompt is not None:
+        raise ValueError(f"{where}: prompt와 prompts를 함께 쓸 수 없습니다.")
+    if not isinstance(children, list):
+        raise ValueError(f"{where}: prompts는 목록이어야 합니다.")
+
+    entries = []
+    for n, child in enumerate(children, 1):
+        entries.extend(_read_item(child, settings, chain, scene, f"{where} > {n}", base_dir))
+    return entries
+
+
+def _read_yaml(text: str, path: str, base_dir: str) -> list:
+    try:
+        import yaml
+    except ImportError:
+        raise ValueError("YAML 프롬프트 파일을 읽으려면 PyYAML이 필요합니다: pip install pyyaml")
+    try:
+        data = yaml.safe_load(text)
+    except yaml.YAMLError as e:
+        raise ValueError(f"{path}: YAML 형식이 올바르지 않습니다 - {e}")
+
+    defaults = {}
+    if isinstance(data, dict):
+        defaults = _parse_settings(data.get('defaults') or {}, f"{path} > defaults", base_dir)
+        data = data.get('prompts')
+    if not isinstance(data, list):
+        raise ValueError(f"{path}: 프롬프트 목록(prompts)이 없습니다.")
+
+    entries = []
+    for n, item in enumerate(data, 1):
+        entries.extend(_read_item(item, defaults, None, None, f"{path} > {n}", base_dir))
+    return entries
+
+
+def load_prompt_file(path: str) -> list:
+    """프롬프트 파일 읽기 → 항목 목록
+
+    항목: {'index', 'prompt', 'settings'(config 키로 덮어쓸 값), 'chain', 'scene', 'source'(파일:줄)}
+
+    Raises:
+        OSError: 파일을 읽지 못할 때
+        ValueError: 형식이나 설정 값이 올바르지 않을 때 (위치 포함)
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        text = f.read()
+
+    base_dir = os.path.dirname(os.path.abspath(path))
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".jsonl":
+        entries = _read_jsonl(text.splitlines(), path, base_dir)
+    elif extension in (".yaml", ".yml"):
+        entries = _read_yaml(text, path, base_dir)
+    else:
+        entries = _read_text(text.splitlines(), path, base_dir)
+
+    for i, entry in enumerate(entries, 1):
+        entry['index'] = i
+    return entries
+
+
+def normalize_entries(prompts: list) -> list:
+    """프롬프트 문자열 목록도 항목 목록으로 (이미 항목이면 그대로)"""
+    entries = []
+    for i, prompt in enumerate(prompts, 1):
+        if isinstance(prompt, dict):
+            entries.append(prompt)
+        else:
+            entries.append({'index': i, 'prompt': prompt.strip(), 'settings': {}, 'chain': None, 'scene': None, 'source': None})
+    return entries
+
+
+def group_units(entries: list) -> list:
+    """실행 단위로 묶기 → [[항목, ...], ...]
+
+    같은 chain 항목은 (파일 순서대로) 한 단위, 나머지는 항목마다 한 단위.
+    단위는 처음 나온 위치 순서를 따릅니다.
+    """
+    units = []
+    chains = {}
+    for entry in entries:
+        if entry.get('chain'):
+            if entry['chain'] not in chains:
+                chains[entry['chain']] = []
+                units.append(chains[entry['chain']])
+            chains[entry['chain']].append(entry)
+        else:
+            units.append([entry])
+    return units
+
+
+def describe_settings(entry: dict) -> str:
+    """화면 표시용 설정 요약 (예: "5초 seed=42 pro 체인:오프닝")"""
+    settings = entry.get('settings', {})
+    parts = []
+    if 'duration' in settings:
+        parts.append(f"{settings['duration']}초")
+    for key in ('ratio', 'resolution'):
+        if key in settings:
+            parts.append(settings[key])
+    if 'fps' in settings:
+        parts.append(f"{settings['fps']}fps")
+    if 'seed' in settings:
+        parts.append(f"seed={settings['seed']}")
+    if 'use_pro_model' in settings:
+        parts.append("pro" if settings['use_pro_model'] else "lite")
+    if settings.get('camerafixed'):
+        parts.append("카메라 고정")
+    if 'image_file' in settings:
+        parts.append(f"이미지:{os.path.basename(settings['image_file'])}")
+    if entry.get('chain'):
+        parts.append(f"체인:{entry['chain']}")
+    if entry.get('scene'):
+        parts.append(f"장면:{entry['scene']}")
+    return " ".join(parts)
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("사용법: python prompt_file.py <프롬프트 파일>")
+        sys.exit(1)
+
+    try:
+        entries = load_prompt_file(sys.argv[1])
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    units = group_units(entries)
+    print(f"📝 프롬프트 {len(entries)}개 → 실행 단위 {len(units)}개 "
+          f"(체인 {sum(1 for u in units if u[0].get('chain'))}개)")
+    for entry in entries:
+        prompt = entry['prompt'][:50] + ('...' if len(entry['prompt']) > 50 else '')
+        detail = describe_settings(entry)
+        print(f"{entry['index']:3d}. {prompt}" + (f"  [{detail}]" if detail else ""))
+
+
+if __name__ == "__main__":
+    main()
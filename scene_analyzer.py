@@ -0,0 +1,439 @@
+#!/usr/bin/env python3
+"""
+🔎 장면 분석기 (Scene Analyzer)
+==============================
+
+생성된 클립의 장면 전환(컷)과 멈춰 있는 구간(정지 구간)을 자동으로 찾습니다.
+특히 클립 마지막 1초가 거의 멈춰 있는 경우(정지 꼬리)를 찾아 자르기/합치기에 활용합니다.
+
+- 샘플링: n번째 프레임만 꺼내거나(나머지는 grab으로 건너뜀) 키프레임만 읽음
+- 축소: 프레임을 가로 160px로 줄인 뒤 비교 (해상도와 관계없이 빠름)
+- 비교: 프레임 차이(밝기 평균 차)와 색상 히스토그램 거리를 NumPy로 묶음 단위 계산
+- 결과: 장면 전환 시점, 정지 구간, 정지 꼬리, 추천 종료 시간(content_end)을 JSON으로 저장
+- 캐시: .cache/scene_analysis.json (파일과 분석 설정이 같으면 다시 분석하지 않음)
+
+config.txt 설정 (scene.<항목>=값):
+  scene.step=2                  # n번째 프레임마다 분석 (1이면 모든 프레임)
+  scene.cut_threshold=0.35      # 장면 전환으로 볼 히스토그램 거리 (0~1)
+  scene.static_threshold=0.004  # 정지로 볼 프레임 차이 (0~1, 픽셀 평균)
+  scene.min_static=0.5          # 정지 구간 최소 길이 (초)
+  scene.trim_tail=false         # true면 동영상 합치기에서 정지 꼬리를 잘라냄 (잘린 클립은 스마트 컷)
+
+사용법:
+  python scene_analyzer.py <동영상> [동영상...]            # 분석 후 scene_analysis_YYYYMMDD_HHMMSS.json 저장
+  python scene_analyzer.py videos/*.mp4 --keyframes        # 키프레임만 읽어 빠르게 장면 전환 확인
+  python scene_analyzer.py clip.mp4 --step 1 --output clip_scenes.json
+"""
+
+import os
+import json
+import time
+import argparse
+import threading
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+import cv2
+import numpy as np
+
+import mp4_meta
+import parallel_encoder
+
+CACHE_PATH = os.path.join(".cache", "scene_analysis.json")
+MAX_CACHE_ENTRIES = 2000
+
+ANALYSIS_WIDTH = 160          # 비교용 축소 가로 크기 (px)
+BATCH_SIZE = 64               # 한 번에 비교할 샘플 수
+HIST_BITS = 3                 # 채널당 히스토그램 비트 수 (3 → 8×8×8 = 512칸)
+MIN_CUT_GAP = 0.5             # 이보다 가까운 장면 전환은 점수가 높은 하나만 남김 (초)
+
+DEFAULT_SETTINGS = {
+    'step': 2,
+    'cut_threshold': 0.35,
+    'static_threshold': 0.004,
+    'min_static': 0.5,
+    'trim_tail': False,
+}
+
+_memory_cache = {}
+_disk_cache = None
+_cache_lock = threading.Lock()
+
+
+def load_settings(config_path: str = "config.txt") -> dict:
+    """기본 설정에 config.txt의 scene.<항목> 값을 반영"""
+    settings = dict(DEFAULT_SETTINGS)
+    if not os.path.exists(config_path):
+        return settings
+
+    try:
+        with open(config_path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line.startswith("scene.") or "=" not in line:
+                    continue
+                key, value = line.split("=", 1)
+                field, value = key.strip()[len("scene."):], value.strip()
+                if field == "step" and value.isdigit() and int(value) >= 1:
+                    settings['step'] = int(value)
+                elif field == "trim_tail" and value.lower() in ("true", "false"):
+                    settings['trim_tail'] = value.lower() == "true"
+                elif field in ("cut_threshold", "static_threshold", "min_static"):
+                    try:
+                        settings[field] = max(0.0, float(value))
+                    except ValueError:
+                        pass
+    except OSError:
+        pass
+
+    return settings
+
+
+def _downscale(frame: np.ndarray) -> np.ndarray:
+    """비교용으로 가로 ANALYSIS_WIDTH 크기로 축소"""
+    height, width = frame.shape[:2]
+    if width <= ANALYSIS_WIDTH:
+        return frame
+    size = (ANALYSIS_WIDTH, max(1, round(height * ANALYSIS_WIDTH / width)))
+    return cv2.resize(frame, size, interpolation=cv2.INTER_AREA)
+
+
+def _iter_step_samples(cap, fps: float, step: int):
+    """n번째 프레임마다 (시간, 축소 프레임) (건너뛰는 프레임은 grab만 해서 색 변환/복사를 생략)"""
+    index = 0
+    while True:
+        if index % step:
+            if not cap.grab():
+                return
+        else:
+            ok, frame = cap.read()
+            if not ok:
+                return
+            yield index / fps, _downscale(frame)
+        index += 1
+
+
+def _iter_keyframe_samples(cap, keyframes: list):
+    """키프레임 위치만 (시간, 축소 프레임) (키프레임으로 찾아가면 앞 프레임을 디코딩하지 않음)"""
+    for t in keyframes:
+        cap.set(cv2.CAP_PROP_POS_MSEC, t * 1000)
+        ok, frame = cap.read()
+        if ok:
+            yield t, _downscale(frame)
+
+
+def _batch_scores(frames: np.ndarray) -> tuple:
+    """연속한 축소 프레임 묶음 (N, H, W, 3)의 인접 프레임 차이와 히스토그램 거리
+
+    Returns:
+        tuple: (프레임 차이 (N-1,), 히스토그램 거리 (N-1,)) 모두 0~1
+    """
+    count = len(frames)
+
+    # 밝기 평균 차이 (BT.601 가중치, 0~1)
+    gray = frames.astype(np.float32) @ np.array([0.114, 0.587, 0.299], dtype=np.float32)
+    diffs = np.abs(np.diff(gray, axis=0)).mean(axis=(1, 2)) / 255.0
+
+    # 색상 히스토그램: 채널별 상위 비트를 합쳐 칸 번호를 만든 뒤 프레임마다 칸 번호를 띄워 bincount 한 번으로 계산
+    shift = 8 - HIST_BITS
+    q = (frames >> shift).astype(np.int32)
+    bins = 1 << (3 * HIST_BITS)
+    index = (q[..., 0] << (2 * HIST_BITS)) | (q[..., 1] << HIST_BITS) | q[..., 2]
+    index += (np.arange(count, dtype=np.int32) * bins)[:, None, None]
+    hist = np.bincount(index.ravel(), minlength=count * bins).reshape(count, bins).astype(np.float32)
+    hist /= hist.sum(axis=1, keepdims=True)
+    distances = 0.5 * np.abs(np.diff(hist, axis=0)).sum(axis=1)
+
+    return diffs, distances
+
+
+def _pick_cuts(times: np.ndarray, distances: np.ndarray, threshold: float) -> list:
+    """히스토그램 거리가 기준을 넘는 시점 (가까이 붙은 후보는 점수가 가장 높은 것만)"""
+    cuts = []
+    for i in np.flatnonzero(distances >= threshold):
+        t, score = float(times[i + 1]), float(distances[i])
+        if cuts and t - cuts[-1]['time'] < MIN_CUT_GAP:
+            if score > cuts[-1]['score']:
+                cuts[-1] = {'time': round(t, 3), 'score': round(score, 3)}
+            continue
+        cuts.append({'time': round(t, 3), 'score': round(score, 3)})
+    return cuts
+
+
+def _static_segments(times: np.ndarray, diffs: np.ndarray, threshold: float, min_seconds: float) -> list:
+    """프레임 차이가 기준 이하로 이어지는 구간 (첫 정지 프레임 ~ 마지막 정지 프레임)"""
+    still = np.concatenate(([False], diffs <= threshold, [False]))
+    edges = np.flatnonzero(np.diff(still.astype(np.int8)))
+    segments = []
+    for begin, end in zip(edges[::2], edges[1::2]):
+        # diffs[i]는 샘플 i와 i+1의 비교이므로 구간은 샘플 begin ~ end
+        start, stop = float(times[begin]), float(times[end])
+        if stop - start >= min_seconds:
+            segments.append({'start': round(start, 3), 'end': round(stop, 3), 'duration': round(stop - start, 3)})
+    return segments
+
+
+def analyze(video_path: str, step: Optional[int] = None, keyframes_only: bool = False,
+            settings: Optional[dict] = None) -> dict:
+    """동영상 하나 분석
+
+    Returns:
+        dict: duration, fps, sampling, samples, scene_cuts[{time, score}],
+              static_segments[{start, end, duration}], static_tail{start, duration} 또는 None,
+              content_end (정지 꼬리를 뺀 추천 종료 시간), elapsed
+    """
+    settings = settings or load_settings()
+    step = step or settings['step']
+    started = time.time()
+
+    cap = cv2.VideoCapture(video_path)
+    if not cap.isOpened():
+        raise ValueError(f"동영상을 열 수 없습니다: {video_path}")
+
+    try:
+        fps = cap.get(cv2.CAP_PROP_FPS) or 0.0
+        if fps <= 0:
+            raise ValueError(f"프레임레이트를 알 수 없습니다: {video_path}")
+        duration = mp4_meta.get_duration(video_path) or cap.get(cv2.CAP_PROP_FRAME_COUNT) / fps
+
+        if keyframes_only:
+            keyframes, _, _ = parallel_encoder.keyframe_times(video_path)
+            samples = _iter_keyframe_samples(cap, keyframes)
+            sampling = {'mode': "keyframes"}
+        else:
+            samples = _iter_step_samples(cap, fps, step)
+            sampling = {'mode': "step", 'step': step}
+
+        # 묶음 단위로 비교하고, 앞 묶음의 마지막 프레임을 다음 묶음 맨 앞에 붙여 경계도 비교
+        times, diffs, distances, batch = [], [], [], []
+        for t, frame in samples:
+            times.append(t)
+            batch.append(frame)
+            if len(batch) >= BATCH_SIZE:
+                d, h = _batch_scores(np.stack(batch))
+                diffs.append(d)
+                distances.append(h)
+                batch = batch[-1:]
+        if len(batch) > 1:
+            d, h = _batch_scores(np.stack(batch))
+            diffs.append(d)
+            distances.append(h)
+    finally:
+        cap.release()
+
+    times = np.array(times, dtype=np.float64)
+    diffs = np.concatenate(diffs) if diffs else np.zeros(0, dtype=np.float32)
+    distances = np.concatenate(distances) if distances else np.zeros(0, dtype=np.float32)
+
+    static = _static_segments(times, diffs, settings['static_threshold'], settings['min_static'])
+    frame_duration = 1.0 / fps
+
+    # 마지막 샘플까지 이어지는 정지 구간이 정지 꼬리 (영상 전체가 정지 화면이면 꼬리로 보지 않음)
+    static_tail = None
+    content_end = duration
+    if static and len(times) and static[-1]['end'] >= times[-1] and static[-1]['start'] > 0:
+        tail_start = static[-1]['start']
+        static_tail = {'start': tail_start, 'duration': round(duration - tail_start, 3)}
+        # 멈춘 첫 프레임은 남김
+        content_end = round(min(duration, tail_start + frame_duration), 3)
+
+    return {
+        'video': video_path,
+        'duration': round(duration, 3),
+        'fps': round(fps, 3),
+        'sampling': sampling,
+        'samples': int(len(times)),
+        'scene_cuts': _pick_cuts(times, distances, settings['cut_threshold']),
+        'static_segments': static,
+        'static_tail': static_tail,
+        'content_end': content_end,
+        'elapsed': round(time.time() - started, 3)
+    }
+
+
+def _cache_key(video_path: str, step: int, keyframes_only: bool, settings: dict) -> Optional[str]:
+    """(절대 경로, 크기, 수정 시간, 분석 설정) 캐시 키 (파일이 없으면 None)"""
+    try:
+        stat = os.stat(video_path)
+    except OSError:
+        return None
+    sampling = "keyframes" if keyframes_only else f"step{step}"
+    thresholds = f"{settings['cut_threshold']}|{settings['static_threshold']}|{settings['min_static']}"
+    return f"{os.path.abspath(video_path)}|{stat.st_size}|{stat.st_mtime_ns}|{sampling}|{thresholds}"
+
+
+def _load_disk_cache() -> dict:
+    """디스크 캐시를 처음 한 번만 읽음"""
+    global _disk_cache
+    if _disk_cache is None:
+        try:
+            with open(CACHE_PATH, 'r', encoding='utf-8') as f:
+                _disk_cache = json.load(f)
+        except (OSError, ValueError):
+            _disk_cache = {}
+    return _disk_cache
+
+
+def _save_disk_cache() -> None:
+    """디스크 캐시 저장 (오래된 항목부터 정리, 임시 파일에 쓴 뒤 교체)"""
+    cache = _load_disk_cache()
+    if len(cache) > MAX_CACHE_ENTRIES:
+        oldest = sorted(cache, key=lambda k: cache[k].get('analyzed_at', 0))
+        for key in oldest[:len(cache) - MAX_CACHE_ENTRIES]:
+            del cache[key]
+
+    try:
+        os.makedirs(os.path.dirname(CACHE_PATH), exist_ok=True)
+        tmp_path = f"{CACHE_PATH}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(cache, f, ensure_ascii=False)
+        os.replace(tmp_path, CACHE_PATH)
+    except OSError:
+        pass
+
+
+def get_analysis(video_path: str, step: Optional[int] = None, keyframes_only: bool = False,
+                 use_cache: bool = True) -> Optional[dict]:
+    """캐시된 분석 결과 (없으면 분석, 실패하면 None)"""
+    settings = load_settings()
+    step = step or settings['step']
+    key = _cache_key(video_path, step, keyframes_only, settings)
+    if key is None:
+        return None
+
+    if use_cache:
+        with _cache_lock:
+            result = _memory_cache.get(key) or _load_disk_cache().get(key)
+            if result:
+                _memory_cache[key] = result
+                return result
+
+    try:
+        result = analyze(video_path, step, keyframes_only, settings)
+    except (ValueError, OSError, cv2.error):
+        return None
+
+    result['analyzed_at'] = time.time()
+    with _cache_lock:
+        _memory_cache[key] = result
+        _load_disk_cache()[key] = result
+        _save_disk_cache()
+    return result
+
+
+def analyze_many(video_paths: list, step: Optional[int] = None, keyframes_only: bool = False,
+                 workers: Optional[int] = None, use_cache: bool = True) -> dict:
+    """여러 동영상을 동시에 분석 (디코딩은 OpenCV 안에서 GIL 없이 진행)
+
+    Returns:
+        dict: 동영상 경로 → 분석 결과 (실패하면 None)
+    """
+    if not video_paths:
+        return {}
+    workers = workers or parallel_encoder.default_workers()
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(video_paths)))) as executor:
+        results = executor.map(lambda p: get_analysis(p, step, keyframes_only, use_cache), video_paths)
+        return dict(zip(video_paths, results))
+
+
+def content_end(video_path: str) -> Optional[float]:
+    """정지 꼬리를 뺀 추천 종료 시간 (정지 꼬리가 없으면 None)"""
+    result = get_analysis(video_path)
+    if not result or not result['static_tail']:
+        return None
+    return result['content_end']
+
+
+def _read_frame_at(video_path: str, t: float) -> Optional[np.ndarray]:
+    """t초 위치의 축소 프레임 (영상 끝을 넘으면 마지막 프레임)"""
+    cap = cv2.VideoCapture(video_path)
+    try:
+        fps = cap.get(cv2.CAP_PROP_FPS) or 0.0
+        frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        if fps <= 0 or frame_count <= 0:
+            return None
+        cap.set(cv2.CAP_PROP_POS_FRAMES, min(frame_count - 1, max(0, int(round(t * fps)))))
+        ok, frame = cap.read()
+        return _downscale(frame) if ok else None
+    finally:
+        cap.release()
+
+
+def handoff_jumps(video_paths: list, ends: Optional[list] = None) -> list:
+    """이어 붙일 클립 경계에서 화면이 튀는 곳 (앞 클립 끝 프레임과 다음 클립 첫 프레임 비교)
+
+    ends: 클립별로 실제로 사용할 종료 시간 (None이면 클립 끝)
+    Returns:
+        list: [{'index': 앞 클립 번호(0부터), 'score': 히스토그램 거리}] (cut_threshold 이상만)
+    """
+    threshold = load_settings()['cut_threshold']
+    ends = ends or [None] * len(video_paths)
+    jumps = []
+    for i in range(len(video_paths) - 1):
+        end = ends[i] if ends[i] is not None else mp4_meta.get_duration(video_paths[i])
+        last = _read_frame_at(video_paths[i], max(0.0, end - 0.001))
+        first = _read_frame_at(video_paths[i + 1], 0.0)
+        if last is None or first is None:
+            continue
+        if last.shape != first.shape:
+            first = cv2.resize(first, (last.shape[1], last.shape[0]), interpolation=cv2.INTER_AREA)
+        _, distances = _batch_scores(np.stack([last, first]))
+        if distances[0] >= threshold:
+            jumps.append({'index': i, 'score': round(float(distances[0]), 3)})
+    return jumps
+
+
+def print_summary(result: dict) -> None:
+    """분석 결과 요약 출력"""
+    sampling = "키프레임만" if result['sampling']['mode'] == "keyframes" else f"{result['sampling']['step']}프레임마다"
+    print(f"🎬 {result['video']} ({result['duration']:.2f}초, {result['fps']}fps, "
+          f"{sampling} {result['samples']}장, {result['elapsed']:.2f}초 소요)")
+    if result['scene_cuts']:
+        cuts = ", ".join(f"{c['time']:.2f}초({c['score']:.2f})" for c in result['scene_cuts'])
+        print(f"   ✂️  장면 전환: {cuts}")
+    else:
+        print("   ✂️  장면 전환 없음")
+    for segment in result['static_segments']:
+        print(f"   ⏸️  정지 구간: {segment['start']:.2f} ~ {segment['end']:.2f}초 ({segment['duration']:.2f}초)")
+    if result['static_tail']:
+        print(f"   💡 정지 꼬리 {result['static_tail']['duration']:.2f}초 → 추천 종료 시간 {result['content_end']:.3f}초")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="장면 전환 / 정지 구간 분석")
+    parser.add_argument("videos", nargs="+", help="분석할 동영상")
+    parser.add_argument("--step", type=int, help="n번째 프레임마다 분석 (기본: config.txt scene.step 또는 2)")
+    parser.add_argument("--keyframes", action="store_true", help="키프레임만 읽기 (가장 빠름, 정지 구간은 대략적)")
+    parser.add_argument("--workers", type=int, help="동시에 분석할 동영상 수")
+    parser.add_argument("--no-cache", action="store_true", help="캐시를 쓰지 않고 다시 분석")
+    parser.add_argument("--output", help="결과 JSON 파일 (기본: scene_analysis_YYYYMMDD_HHMMSS.json)")
+    args = parser.parse_args()
+
+    missing = [p for p in args.videos if not os.path.exists(p)]
+    if missing:
+        print(f"❌ 파일을 찾을 수 없습니다: {', '.join(missing)}")
+        return
+
+    started = time.time()
+    results = analyze_many(args.videos, args.step, args.keyframes, args.workers, not args.no_cache)
+    for video_path, result in results.items():
+        if result:
+            print_summary(result)
+        else:
+            print(f"❌ {video_path}: 분석할 수 없습니다.")
+    print(f"\n⏱️  전체 {time.time() - started:.2f}초")
+
+    report = {
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'settings': load_settings(),
+        'videos': [r for r in results.values() if r]
+    }
+    output = args.output or f"scene_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"📁 결과 저장: {output}")
+
+
+if __name__ == "__main__":
+    main()
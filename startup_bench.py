@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+⏱️ 시작 시간 벤치마크 (Startup Bench)
+===================================
+
+명령마다 파이썬이 시작해서 명령을 끝내기까지 불러오는 모듈과 시간을 측정합니다.
+(-X importtime 출력 분석, 빈 인터프리터가 시작할 때 불러오는 모듈은 제외)
+
+- 명령별 import 시간 합계, 전체 실행 시간, 오래 걸린 모듈 순위
+- 가벼운 명령(--check, --list, 사용법 출력)에서 무거운 라이브러리(OpenCV, numpy, Pillow,
+  torch, whisper)를 불러오면 실패
+- --save로 현재 값을 기준으로 저장해 두면, 이후 실행에서 기준보다 크게 느려진 명령도 실패
+- 실패가 있으면 종료 코드 1 (커밋 전 확인용)
+
+네트워크를 쓰는 명령은 요청을 보내지 않도록 requests를 오프라인으로 바꿔 실행하고,
+폴더를 만드는 명령이 있어 임시 폴더에서 실행합니다.
+
+사용법:
+  python startup_bench.py                # 명령별 측정 + 검사
+  python startup_bench.py --repeat 5     # 반복 횟수 (중앙값, 기본 3)
+  python startup_bench.py --save         # 현재 결과를 기준값으로 저장
+"""
+
+import os
+import sys
+import json
+import time
+import statistics
+import subprocess
+import tempfile
+from typing import Optional
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+BASELINE_PATH = os.path.join(REPO_DIR, ".cache", "startup_baseline.json")
+
+HEAVY_MODULES = ('cv2', 'numpy', 'PIL', 'torch', 'whisper', 'faster_whisper', 'ctranslate2')
+ASR_MODULES = ('torch', 'whisper', 'faster_whisper', 'ctranslate2')
+
+REGRESSION_RATIO = 1.3        # 기준보다 30% 넘게 느려지면 실패
+REGRESSION_FLOOR_MS = 15      # 측정 잡음 때문에 이 이하의 차이는 무시
+
+# (이름, 스크립트와 인수, 불러오면 안 되는 모듈, 네트워크 차단 여부)
+COMMANDS = [
+    ("easy_video_maker --check", ["easy_video_maker.py", "--check", "cgt-startup-bench"], HEAVY_MODULES, True),
+    ("easy_video_maker --list", ["easy_video_maker.py", "--list", "1"], HEAVY_MODULES, True),
+    ("image_to_video_converter grid -h", ["image_to_video_converter.py", "grid", "-h"], HEAVY_MODULES, True),
+    ("image_helper (사용법)", ["image_helper.py"], HEAVY_MODULES, False),
+    ("video_trimmer --ranges (사용법)", ["video_trimmer.py", "--ranges"], HEAVY_MODULES, False),
+    ("add_audio_to_video --batch (사용법)", ["add_audio_to_video.py", "--batch"], HEAVY_MODULES, False),
+    ("scene_analyzer -h", ["scene_analyzer.py", "-h"], ASR_MODULES, False),
+]
+
+RUNNER = """
+import sys, runpy
+sys.path.insert(0, {repo!r})
+sys.argv = {argv!r}
+if {offline!r}:
+    import requests
+    def _offline(*args, **kwargs):
+        raise requests.exceptions.ConnectionError("startup_bench: offline")
+    requests.get = requests.post = _offline
+runpy.run_path({script!r}, run_name="__main__")
+"""
+
+
+def parse_importtime(stderr: str) -> list:
+    """-X importtime 출력 → [(모듈, 깊이, 누적 시간 us)] (불러온 순서)"""
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3:
+            continue
+        raw = parts[2][1:]
+        depth = (len(raw) - len(raw.lstrip(" "))) // 2
+        entries.append((raw.strip(), depth, int(parts[1])))
+    return entries
+
+
+def _run(code: str, cwd: str) -> tuple:
+    env = dict(os.environ, ARK_API_KEY=os.environ.get("ARK_API_KEY") or "startup-bench")
+    started = time.perf_counter()
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code], cwd=cwd, env=env,
+                            stdin=subprocess.DEVNULL, capture_output=True, text=True)
+    return (time.perf_counter() - started) * 1000, parse_importtime(result.stderr)
+
+
+def measure(argv: list, offline: bool, baseline_modules: set, cwd: str, repeat: int) -> dict:
+    """명령 하나를 repeat번 실행해 중앙값 측정
+
+    Returns:
+        dict: {'import_ms', 'wall_ms', 'modules', 'top'}
+    """
+    code = RUNNER.format(repo=REPO_DIR, argv=argv, offline=offline,
+                         script=os.path.join(REPO_DIR, argv[0]))
+    import_ms, wall_ms = [], []
+    modules, top = set(), []
+    for i in range(repeat):
+        wall, entries = _run(code, cwd)
+        top_level = [(name, us) for name, depth, us in entries if depth == 0 and name not in baseline_modules]
+        import_ms.append(sum(us for _, us in top_level) / 1000)
+        wall_ms.append(wall)
+        if i == 0:
+            modules = {name for name, _, _ in entries}
+            top = sorted(top_level, key=lambda e: e[1], reverse=True)[:4]
+    return {
+        'import_ms': statistics.median(import_ms),
+        'wall_ms': statistics.median(wall_ms),
+        'modules': modules,
+        'top': [(name, us / 1000) for name, us in top]
+    }
+
+
+def check(name: str, result: dict, forbidden: tuple, baseline: Optional[dict]) -> list:
+    """검사 실패 이유 목록 (문제가 없으면 빈 list)"""
+    problems = []
+    loaded = sorted({m.split(".")[0] for m in result['modules']} & set(forbidden))
+    if loaded:
+        problems.append(f"무거운 모듈을 불러옴: {', '.join(loaded)}")
+
+    previous = (baseline or {}).get(name)
+    if previous is not None:
+        limit = max(previous * REGRESSION_RATIO, previous + REGRESSION_FLOOR_MS)
+        if result['import_ms'] > limit:
+            problems.append(f"import 시간 {previous:.0f}ms → {result['import_ms']:.0f}ms (기준의 {result['import_ms'] / previous:.1f}배)")
+    return problems
+
+
+def load_baseline() -> Optional[dict]:
+    try:
+        with open(BASELINE_PATH, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def main():
+    args = sys.argv[1:]
+    repeat = 3
+    if "--repeat" in args:
+        try:
+            repeat = max(1, int(args[args.index("--repeat") + 1]))
+        except (IndexError, ValueError):
+            print("❌ --repeat 값은 숫자여야 합니다.")
+            sys.exit(2)
+    save = "--save" in args
+    baseline = None if save else load_baseline()
+
+    with tempfile.TemporaryDirectory(prefix="startup_bench_") as cwd:
+        _, entries = _run("pass", cwd)
+        baseline_modules = {name for name, depth, _ in entries if depth == 0}
+
+        print(f"⏱️  시작 시간 벤치마크 (반복 {repeat}회 중앙값, 빈 인터프리터 시작 비용 제외)")
+        if baseline:
+            print(f"📏 기준값: {BASELINE_PATH}")
+        print()
+        print(f"{'명령':<40}{'import':>9}{'전체':>9}  결과")
+
+        results, failures = {}, 0
+        for name, argv, forbidden, offline in COMMANDS:
+            result = measure(argv, offline, baseline_modules, cwd, repeat)
+            problems = check(name, result, forbidden, baseline)
+            results[name] = result['import_ms']
+            failures += bool(problems)
+
+            status = "❌ " + " / ".join(problems) if problems else "✅"
+            print(f"{name:<40}{result['import_ms']:>7.0f}ms{result['wall_ms']:>7.0f}ms  {status}")
+            print(f"{'':<4}상위: " + ", ".join(f"{m} {ms:.0f}ms" for m, ms in result['top']))
+
+    print()
+    if save:
+        os.makedirs(os.path.dirname(BASELINE_PATH), exist_ok=True)
+        with open(BASELINE_PATH, "w", encoding="utf-8") as f:
+            json.dump({k: round(v, 1) for k, v in results.items()}, f, ensure_ascii=False, indent=2)
+        print(f"💾 기준값 저장: {BASELINE_PATH}")
+
+    if failures:
+        print(f"❌ {failures}개 명령이 검사를 통과하지 못했습니다.")
+        sys.exit(1)
+    print("✅ 모든 명령이 검사를 통과했습니다.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""
+🧭 작업 단계별 시간 기록 (Task Trace)
+====================================
+
+동영상 생성/후처리 작업마다 단계별 시간을 JSON Lines 파일(기본 traces/tasks.jsonl)에 한 줄씩 남기고,
+단계별 p50/p95/p99를 요약해 전체 시간이 어디에 쓰이는지 보여줍니다.
+
+기록하는 곳:
+- easy_video_maker.py (단일/배치/체인): TraceRecorder가 엔진 이벤트를 받아 클립마다 기록
+- webhook_server.py: 콜백을 받은 작업마다 기록
+- add_audio_to_video.py --batch: 작업마다 기록
+
+단계 (초):
+- image_prep: 업로드할 이미지 준비 (JPEG 변환/축소/Base64, 캐시 재사용이면 거의 0)
+- submit: 작업 접수 요청 왕복 시간
+- queue_wait: 접수 → 처음 running 상태 확인 (상태 확인 간격만큼 오차)
+- render: running → 완료 (API의 완료 시각이 있으면 그 시각 기준)
+- detect_lag: 완료 → 완료를 알아챈 시각 (상태 확인 간격/콜백 전달 지연)
+- queue_render: 접수 → 완료 (콜백처럼 대기/생성을 나눌 수 없을 때, API 시각 기준)
+- download: 다운로드 (download_mbps로 속도도 기록)
+- frame_extract: 체인용 마지막 프레임 추출
+- merge: 클립 합치기
+- transcribe / encode / mux: 음성 인식, 오디오 합치기 인코딩, 자막 트랙 추가
+
+사용법:
+  python task_trace.py summary                       # traces/tasks.jsonl 요약
+  python task_trace.py summary 파일.jsonl --workflow batch --since 2025-01-01
+"""
+
+import os
+import sys
+import json
+import threading
+from typing import Optional
+
+DEFAULT_TRACE_FILE = os.path.join("traces", "tasks.jsonl")
+
+STAGES = [
+    ('image_prep', "이미지 준비"),
+    ('submit', "접수 요청"),
+    ('queue_wait', "대기열"),
+    ('render', "생성"),
+    ('queue_render', "대기열+생성"),
+    ('detect_lag', "완료 감지 지연"),
+    ('download', "다운로드"),
+    ('frame_extract', "프레임 추출"),
+    ('merge', "합치기"),
+    ('transcribe', "음성 인식"),
+    ('encode', "인코딩"),
+    ('mux', "자막 트랙"),
+]
+
+_write_lock = threading.Lock()
+
+
+def write_record(record: dict, path: str = DEFAULT_TRACE_FILE):
+    """기록 한 줄 추가 (폴더가 없으면 만듦, 실패해도 작업은 계속)"""
+    line = json.dumps(record, ensure_ascii=False, default=str)
+    try:
+        with _write_lock:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            with open(path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+    except OSError as e:
+        print(f"⚠️  시간 기록 저장 실패: {e}")
+
+
+def task_record(workflow: str, stages: dict, **fields) -> dict:
+    """기록 형식 맞추기 (단계 값은 0 이상, 소수 셋째 자리까지)"""
+    return {
+        'kind': fields.pop('kind', 'task'),
+        'workflow': workflow,
+        **fields,
+        'stages': {key: round(max(0.0, value), 3) for key, value in stages.items() if value is not None}
+    }
+
+
+class TraceRecorder:
+    """엔진 이벤트 → 클립별 단계 시간 기록 (이벤트 버스 구독자)
+
+    이벤트는 보낸 스레드에서 바로 전달되므로 스레드마다 진행 중인 클립을 따로 모읍니다.
+    (동시 배치에서도 기록이 섞이지 않음)
+    접수 뒤에 준비한 이미지(체인의 다음 클립용 프레임)는 같은 스레드의 다음 클립 기록에 들어갑니다.
+    """
+
+    def __init__(self, path: str = DEFAULT_TRACE_FILE):
+        self.path = path
+        self._clips = {}
+        self._pending_prep = {}
+
+    def __call__(self, event: dict):
+        handler = getattr(self, f"_on_{event['event']}", None)
+        if handler is not None:
+            handler(event, threading.get_ident())
+
+    def _on_clip_started(self, event, thread):
+        self._clips[thread] = {
+            'workflow': event['mode'],
+            'index': event['index'],
+            'prompt': event['prompt'][:80],
+            'chain': event.get('chain'),
+            'scene': event.get('scene'),
+            'task_id': None,
+            'started': event['time'],
+            'marks': {},
+            'stages': {'image_prep': self._pending_prep.pop(thread, None)},
+            'download_bytes': None
+        }
+
+    def _on_image_prepared(self, event, thread):
+        clip = self._clips.get(thread)
+        elapsed = event.get('elapsed', 0.0)
+        if clip is None or 'submitted' in clip['marks']:
+            self._pending_prep[thread] = self._pending_prep.get(thread, 0.0) + elapsed
+        else:
+            clip['stages']['image_prep'] = (clip['stages']['image_prep'] or 0.0) + elapsed
+
+    def _on_submitted(self, event, thread):
+        clip = self._clips.get(thread)
+        if clip is not None:
+            clip['task_id'] = event['task_id']
+            clip['marks']['submitted'] = event['time']
+            clip['stages']['submit'] = event.get('elapsed')
+
+    def _on_submit_failed(self, event, thread):
+        clip = self._clips.get(thread)
+        if clip is not None:
+            clip['stages']['submit'] = event.get('elapsed')
+
+    def _on_polled(self, event, thread):
+        clip = self._clips.get(thread)
+        if clip is not None and event['status'] == 'running':
+            clip['marks'].setdefault('running', event['time'])
+
+    def _on_succeeded(self, event, thread):
+        clip = self._clips.get(thread)
+        if clip is not None:
+            clip['marks']['detected'] = event['time']
+            if event.get('completed_at'):
+                clip['marks']['completed'] = event['completed_at']
+
+    def _on_failed(self, event, thread):
+        clip = self._clips.get(thread)
+        if clip is not None:
+            clip['marks']['detected'] = event['time']
+
+    def _on_downloaded(self, event, thread):
+        clip = self._clips.get(thread)
+        if clip is not None:
+            clip['stages']['download'] = event['elapsed']
+            clip['download_bytes'] = event['size_bytes']
+
+    def _on_frame_extracted(self, event, thread):
+        clip = self._clips.get(thread)
+        if clip is not None:
+            clip['stages']['frame_extract'] = event.get('elapsed')
+
+    def _on_clip_finished(self, event, thread):
+        clip = self._clips.pop(thread, None)
+        if clip is None:
+            return
+        marks = clip['marks']
+        stages = clip['stages']
+        submitted, running, detected = marks.get('submitted'), marks.get('running'), marks.get('detected')
+        # API 완료 시각은 초 단위라 감지 시각보다 늦게 찍힐 수 있음 → 감지 시각을 넘지 않게
+        completed = min(marks['completed'], detected) if detected and marks.get('completed') else detected
+        if submitted and running:
+            stages['queue_wait'] = running - submitted
+        if running and completed:
+            stages['render'] = completed - running
+        if detected and marks.get('completed'):
+            stages['detect_lag'] = detected - completed
+
+        download_mbps = None
+        if clip['download_bytes'] and stages.get('download'):
+            download_mbps = round(clip['download_bytes'] / (1024 * 1024) / stages['download'], 2)
+
+        write_record(task_record(
+            clip['workflow'], stages,
+            task_id=clip['task_id'] or event.get('task_id'),
+            index=event['index'],
+            prompt=clip['prompt'],
+            chain=clip['chain'],
+            scene=clip['scene'],
+            status=event['status'],
+            started=clip['started'],
+            finished=event['time'],
+            total=round(event['time'] - clip['started'], 3),
+            download_bytes=clip['download_bytes'],
+            download_mbps=download_mbps
+        ), self.path)
+
+    def _on_merged(self, event, thread):
+        write_record(task_record(
+            'merge', {'merge': event['elapsed']}, kind='merge', path=event['path'], clips=event['clips'],
+            status='completed', finished=event['time'], total=event['elapsed']
+        ), self.path)
+
+
+def percentile(values: list, q: float) -> Optional[float]:
+    """백분위수 (선형 보간, 값이 없으면 None)"""
+    ordered = sorted(values)
+    if not ordered:
+        return None
+    position = (len(ordered) - 1) * q / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def load_records(path: str = DEFAULT_TRACE_FILE, workflow: str = None, since: float = None) -> list:
+    """기록 읽기 (깨진 줄은 건너뜀)"""
+    records = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if workflow and record.get('workflow') != workflow:
+                continue
+            if since and (record.get('finished') or 0) < since:
+                continue
+            records.append(record)
+    return records
+
+
+def summarize(records: list) -> dict:
+    """단계별 {'count', 'p50', 'p95', 'p99', 'max', 'sum'} + 전체 시간/다운로드 속도"""
+    values = {}
+    for record in records:
+        for stage, seconds in record.get('stages', {}).items():
+            values.setdefault(stage, []).append(seconds)
+        if record.get('kind', 'task') == 'task' and record.get('total') is not None:
+            values.setdefault('total', []).append(record['total'])
+        if record.get('download_mbps'):
+            values.setdefault('download_mbps', []).append(record['download_mbps'])
+
+    return {
+        stage: {
+            'count': len(samples),
+            'p50': percentile(samples, 50),
+            'p95': percentile(samples, 95),
+            'p99': percentile(samples, 99),
+            'max': max(samples),
+            'sum': sum(samples)
+        }
+        for stage, samples in values.items()
+    }
+
+
+def print_summary(records: list):
+    from rich.console import Console
+    from rich.table import Table
+
+    stats = summarize(records)
+    workflows = {}
+    for record in records:
+        workflows[record.get('workflow')] = workflows.get(record.get('workflow'), 0) + 1
+
+    labels = STAGES + [(stage, stage) for stage in stats if stage not in dict(STAGES) and stage not in ('total', 'download_mbps')]
+    stage_total = sum(stats[stage]['sum'] for stage, _ in labels if stage in stats)
+
+    table = Table(title=f"🧭 작업 기록 {len(records)}개 ({', '.join(f'{w} {n}개' for w, n in workflows.items())})",
+                  show_header=True, header_style="bold magenta")
+    table.add_column("단계", style="cyan", no_wrap=True)
+    for column in ("개수", "p50", "p95", "p99", "최대", "합계", "비중"):
+        table.add_column(column, justify="right")
+
+    for stage, label in labels + [('total', "작업 전체")]:
+        s = stats.get(stage)
+        if not s:
+            continue
+        share = f"{s['sum'] / stage_total * 100:.0f}%" if stage != 'total' and stage_total else ""
+        table.add_row(label, str(s['count']), *(f"{s[key]:.2f}초" for key in ('p50', 'p95', 'p99', 'max')),
+                      f"{s['sum']:.1f}초", share, style="bold" if stage == 'total' else None)
+
+    console = Console()
+    console.print(table)
+    if 'download_mbps' in stats:
+        speeds = [r['download_mbps'] for r in records if r.get('download_mbps')]
+        console.print(f"📥 다운로드 속도: p50 {stats['download_mbps']['p50']:.1f}MB/s, 느린 쪽 5% {percentile(speeds, 5):.1f}MB/s, "
+                      f"최저 {min(speeds):.1f}MB/s")
+
+
+def main():
+    import argparse
+    from datetime import datetime
+
+    parser = argparse.ArgumentParser(description="작업 단계별 시간 기록 요약 (p50/p95/p99)")
+    sub = parser.add_subparsers(dest="command", required=True)
+    summary = sub.add_parser("summary", help="단계별 시간 요약")
+    summary.add_argument("path", nargs="?", default=DEFAULT_TRACE_FILE, help=f"기록 파일 (기본 {DEFAULT_TRACE_FILE})")
+    summary.add_argument("--workflow", help="single / batch / chain / webhook / audio / merge 중 하나만")
+    summary.add_argument("--since", help="이 날짜 이후 기록만 (예: 2025-01-31 또는 2025-01-31T09:00)")
+    args = parser.parse_args()
+
+    since = None
+    if args.since:
+        try:
+            since = datetime.fromisoformat(args.since).timestamp()
+        except ValueError:
+            print(f"❌ 날짜 형식이 올바르지 않습니다: {args.since}")
+            sys.exit(2)
+
+    try:
+        records = load_records(args.path, args.workflow, since)
+    except FileNotFoundError:
+        print(f"❌ 기록 파일이 없습니다: {args.path}")
+        sys.exit(1)
+    if not records:
+        print("ℹ️  조건에 맞는 기록이 없습니다.")
+        return
+    print_summary(records)
+
+
+if __name__ == "__main__":
+    main()
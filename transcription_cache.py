@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+🗂️ 음성 인식 결과 캐시 (Transcription Cache)
+===========================================
+
+같은 노래로 여러 번 작업할 때 (예: 제목 폰트 크기만 바꿔서 다시 만들 때)
+Whisper 인식을 반복하지 않도록 결과를 디스크에 저장합니다.
+
+캐시 키: 오디오 파일 내용의 SHA-256 + 인식 엔진 + 모델 이름 + 언어
+용량 제한: 최대 크기를 넘으면 가장 오래 사용하지 않은 항목부터 삭제
+
+사용법:
+1. python transcription_cache.py list     # 캐시 항목 목록
+2. python transcription_cache.py stats    # 캐시 사용량
+3. python transcription_cache.py clear    # 캐시 전체 삭제
+"""
+
+import os
+import sys
+import json
+import time
+import hashlib
+from typing import Optional
+
+CACHE_DIR = os.path.join(".cache", "transcriptions")
+MAX_CACHE_BYTES = 100 * 1024 * 1024  # 100MB
+
+
+def hash_file(file_path: str, chunk_size: int = 1024 * 1024) -> str:
+    """파일 내용의 SHA-256 해시 계산"""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def cache_key(audio_hash: str, model_name: str, language: str, backend: str = "whisper") -> str:
+    """오디오 해시 + 엔진 + 모델 + 언어로 캐시 키 생성"""
+    return f"{audio_hash[:32]}_{backend}_{model_name}_{language or 'auto'}"
+
+
+def _entry_path(key: str) -> str:
+    return os.path.join(CACHE_DIR, f"{key}.json")
+
+
+def get(audio_path: str, model_name: str, language: str, backend: str = "whisper") -> Optional[dict]:
+    """캐시된 인식 결과 조회 (없으면 None)"""
+    try:
+        key = cache_key(hash_file(audio_path), model_name, language, backend)
+    except OSError:
+        return None
+
+    path = _entry_path(key)
+    if not os.path.exists(path):
+        return None
+
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        # 손상된 항목은 삭제
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+        return None
+
+    # 최근 사용 시간 갱신 (LRU 삭제 순서에 사용)
+    try:
+        os.utime(path, None)
+    except OSError:
+        pass
+
+    return entry.get('result')
+
+
+def put(audio_path: str, model_name: str, language: str, result: dict, backend: str = "whisper") -> Optional[str]:
+    """인식 결과를 캐시에 저장하고 용량 제한 적용"""
+    try:
+        audio_hash = hash_file(audio_path)
+        os.makedirs(CACHE_DIR, exist_ok=True)
+
+        entry = {
+            'audio_file': os.path.basename(audio_path),
+            'audio_hash': audio_hash,
+            'backend': backend,
+            'model': model_name,
+            'language': language,
+            'created_at': time.time(),
+            'result': {
+                'text': result.get('text', ''),
+                'language': result.get('language'),
+                'segments': result.get('segments', [])
+            }
+        }
+
+        path = _entry_path(cache_key(audio_hash, model_name, language, backend))
+        # 쓰는 도중 중단되어도 손상된 파일이 남지 않도록 임시 파일에 쓴 뒤 교체
+        tmp_path = path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(entry, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+        evict()
+        return path
+    except (OSError, TypeError, ValueError):
+        return None
+
+
+def list_entries() -> list:
+    """캐시 항목 목록 (최근 사용 순)"""
+    if not os.path.exists(CACHE_DIR):
+        return []
+
+    entries = []
+    for file in os.listdir(CACHE_DIR):
+        if not file.endswith('.json'):
+            continue
+        path = os.path.join(CACHE_DIR, file)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        entries.append({'path': path, 'size': stat.st_size, 'last_used': stat.st_mtime})
+
+    return sorted(entries, key=lambda e: e['last_used'], reverse=True)
+
+
+def evict(max_bytes: int = MAX_CACHE_BYTES) -> int:
+    """용량 제한을 넘으면 가장 오래 사용하지 않은 항목부터 삭제
+
+    Returns:
+        int: 삭제한 항목 수
+    """
+    entries = list_entries()
+    total = sum(e['size'] for e in entries)
+    removed = 0
+
+    # 오래된 항목부터 삭제
+    for entry in reversed(entries):
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(entry['path'])
+            total -= entry['size']
+            removed += 1
+        except OSError:
+            pass
+
+    return removed
+
+
+def clear() -> int:
+    """캐시 전체 삭제
+
+    Returns:
+        int: 삭제한 항목 수
+    """
+    removed = 0
+    for entry in list_entries():
+        try:
+            os.remove(entry['path'])
+            removed += 1
+        except OSError:
+            pass
+    return removed
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("🗂️ 음성 인식 결과 캐시")
+        print("=" * 30)
+        print()
+        print("사용법:")
+        print("  python transcription_cache.py list    # 캐시 항목 목록")
+        print("  python transcription_cache.py stats   # 캐시 사용량")
+        print("  python transcription_cache.py clear   # 캐시 전체 삭제")
+        return
+
+    command = sys.argv[1]
+
+    if command == "list":
+        entries = list_entries()
+        if not entries:
+            print("📭 캐시가 비어 있습니다.")
+            return
+
+        print(f"🗂️ 캐시 항목 {len(entries)}개 (최근 사용 순):")
+        print()
+        for i, entry in enumerate(entries, 1):
+            try:
+                with open(entry['path'], 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            except (OSError, ValueError):
+                continue
+            last_used = time.strftime('%Y-%m-%d %H:%M', time.localtime(entry['last_used']))
+            segments = len(data.get('result', {}).get('segments', []))
+            print(f"{i:2d}. {data.get('audio_file', '?')} [{data.get('backend', 'whisper')}/{data.get('model')}/{data.get('language')}]")
+            print(f"     세그먼트 {segments}개 | {entry['size'] / 1024:.1f}KB | 마지막 사용 {last_used}")
+    elif command == "stats":
+        entries = list_entries()
+        total = sum(e['size'] for e in entries)
+        print(f"📁 캐시 위치: {os.path.abspath(CACHE_DIR)}")
+        print(f"📊 항목 수: {len(entries)}개")
+        print(f"📊 사용량: {total / (1024 * 1024):.2f}MB / {MAX_CACHE_BYTES / (1024 * 1024):.0f}MB")
+    elif command == "clear":
+        removed = clear()
+        print(f"🗑️  캐시 항목 {removed}개를 삭제했습니다.")
+    else:
+        print("❌ 알 수 없는 명령어입니다.")
+        print("💡 사용 가능한 명령어: list, stats, clear")
+
+
+if __name__ == "__main__":
+    main()
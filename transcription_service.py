@@ -0,0 +1,366 @@
+#!/usr/bin/env python3
+"""
+🎤 음성 인식 서비스 (Transcription Service)
+==========================================
+
+음성 인식 모델을 프로세스당 한 번만 로드하고 메모리에 유지합니다.
+상주 워커로 실행하면 유닉스 소켓으로 요청을 받기 때문에
+CLI를 여러 번 실행하거나 배치 작업을 돌려도 모델 로딩 시간이 들지 않습니다.
+
+사용법:
+1. python transcription_service.py serve [모델] [엔진]          # 상주 워커 실행
+2. python transcription_service.py status                       # 워커 상태 확인
+3. python transcription_service.py stop                         # 워커 종료
+4. python transcription_service.py bench <음성파일> [모델] [엔진] # 콜드/웜 지연시간 측정
+
+엔진(whisper, faster-whisper)과 모델 크기는 asr_backends.py를 참고하세요.
+"""
+
+import os
+import sys
+import json
+import time
+import socket
+import tempfile
+import threading
+import socketserver
+import multiprocessing
+from typing import Optional
+
+import asr_backends
+
+DEFAULT_BACKEND = asr_backends.DEFAULT_BACKEND
+DEFAULT_MODEL = asr_backends.DEFAULT_MODEL
+DEFAULT_LANGUAGE = "ko"
+
+# 상주 워커 소켓 경로 (환경변수로 변경 가능)
+SOCKET_PATH = os.getenv(
+    "WHISPER_WORKER_SOCKET",
+    os.path.join(tempfile.gettempdir(), "modelark_whisper.sock")
+)
+
+
+def is_available(backend: str = DEFAULT_BACKEND) -> bool:
+    """음성 인식 엔진 설치 여부 확인 (torch 등을 불러오지 않고 패키지 존재만 확인)"""
+    return backend in asr_backends.BACKENDS and asr_backends.BACKENDS[backend].is_available()
+
+
+def is_model_loaded(model_name: str = DEFAULT_MODEL, backend: str = DEFAULT_BACKEND) -> bool:
+    """현재 프로세스에 모델이 이미 로드되어 있는지 확인"""
+    return asr_backends.is_loaded(backend, model_name)
+
+
+def get_model(model_name: str = DEFAULT_MODEL, backend: str = DEFAULT_BACKEND) -> asr_backends.ASRBackend:
+    """모델을 처음 요청될 때 한 번만 로드하고 이후에는 재사용"""
+    engine = asr_backends.get_backend(backend, model_name)
+    engine.load()
+    return engine
+
+
+def transcribe_local(audio_path: str, model_name: str = DEFAULT_MODEL, language: str = DEFAULT_LANGUAGE,
+                     backend: str = DEFAULT_BACKEND) -> dict:
+    """현재 프로세스에서 음성 인식 (모델은 캐시에서 재사용)"""
+    return get_model(model_name, backend).transcribe(audio_path, language)
+
+
+def _send_request(request: dict, timeout: Optional[float] = None) -> Optional[dict]:
+    """상주 워커에 JSON 요청 한 줄을 보내고 응답 한 줄을 받음"""
+    if not hasattr(socket, "AF_UNIX") or not os.path.exists(SOCKET_PATH):
+        return None
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(1.0)
+            sock.connect(SOCKET_PATH)
+            # 음성 인식은 오래 걸릴 수 있으므로 연결 후에는 요청별 타임아웃 사용
+            sock.settimeout(timeout)
+            sock.sendall((json.dumps(request, ensure_ascii=False) + "\n").encode("utf-8"))
+
+            chunks = []
+            while True:
+                chunk = sock.recv(65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+                if chunk.endswith(b"\n"):
+                    break
+
+        if not chunks:
+            return None
+        return json.loads(b"".join(chunks).decode("utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def worker_status() -> Optional[dict]:
+    """상주 워커 상태 조회 (실행 중이 아니면 None)"""
+    return _send_request({"cmd": "ping"}, timeout=2.0)
+
+
+def transcribe(audio_path: str, model_name: str = DEFAULT_MODEL, language: str = DEFAULT_LANGUAGE,
+               backend: str = DEFAULT_BACKEND, use_worker: bool = True, chunked: bool = False) -> dict:
+    """음성 인식 실행 (상주 워커가 있으면 워커 사용, 없으면 현재 프로세스에서 실행)
+
+    chunked=True이면 긴 오디오를 무음 구간에서 나눠 여러 프로세스로 병렬 인식합니다.
+    반환값의 'worker' 항목으로 어느 경로로 처리됐는지 알 수 있습니다.
+    """
+    if chunked:
+        from chunked_transcription import transcribe_chunked
+        result = transcribe_chunked(audio_path, model_name=model_name, language=language, backend=backend)
+        result['worker'] = False
+        return result
+
+    if use_worker:
+        response = _send_request({
+            "cmd": "transcribe",
+            "audio_path": os.path.abspath(audio_path),
+            "model": model_name,
+            "language": language,
+            "backend": backend
+        })
+        if response and response.get("ok"):
+            result = response["result"]
+            result['worker'] = True
+            return result
+
+    result = transcribe_local(audio_path, model_name, language, backend)
+    result['worker'] = False
+    return result
+
+
+def _background_main(sender, audio_path: str, model_name: str, language: str, backend: str, chunked: bool) -> None:
+    """백그라운드 프로세스: 음성 인식 후 결과를 파이프로 전달"""
+    start = time.time()
+    try:
+        outcome = {'result': transcribe(audio_path, model_name, language, backend, chunked=chunked)}
+    except Exception as e:
+        outcome = {'error': str(e)}
+    outcome['elapsed'] = time.time() - start
+    sender.send(outcome)
+    sender.close()
+
+
+class BackgroundTranscription:
+    """별도 프로세스에서 실행되는 음성 인식 작업
+
+    ffmpeg 합치기처럼 다른 작업과 동시에 진행하고, 결과가 필요할 때 result()로 기다립니다.
+    """
+
+    def __init__(self, audio_path: str, model_name: str = DEFAULT_MODEL, language: str = DEFAULT_LANGUAGE,
+                 backend: str = DEFAULT_BACKEND, chunked: bool = False):
+        # torch는 fork 이후 스레드 풀이 꼬일 수 있으므로 spawn 사용
+        # (분할 인식은 자식 프로세스에서 다시 프로세스 풀을 만들기 때문에 daemon이 아니어야 함)
+        context = multiprocessing.get_context("spawn")
+        self._receiver, sender = context.Pipe(duplex=False)
+        self._outcome = None
+        self.started_at = time.time()
+        self.process = context.Process(
+            target=_background_main,
+            args=(sender, audio_path, model_name, language, backend, chunked)
+        )
+        self.process.start()
+        sender.close()
+
+    def done(self) -> bool:
+        """인식이 끝났는지 확인 (기다리지 않음)"""
+        return self._outcome is not None or self._receiver.poll()
+
+    def result(self) -> dict:
+        """인식이 끝날 때까지 기다린 뒤 {'result' 또는 'error', 'elapsed'} 반환"""
+        if self._outcome is None:
+            try:
+                self._outcome = self._receiver.recv()
+            except EOFError:
+                self._outcome = {'error': "음성 인식 프로세스가 비정상 종료되었습니다.",
+                                 'elapsed': time.time() - self.started_at}
+            self._receiver.close()
+            self.process.join()
+        return self._outcome
+
+    def cancel(self) -> None:
+        """진행 중인 인식 중단"""
+        if self.process.is_alive():
+            self.process.terminate()
+        self.process.join()
+
+
+class _WorkerHandler(socketserver.StreamRequestHandler):
+    """상주 워커 요청 처리"""
+
+    def handle(self):
+        line = self.rfile.readline()
+        if not line:
+            return
+
+        shutdown_requested = False
+        try:
+            request = json.loads(line.decode("utf-8"))
+            cmd = request.get("cmd")
+
+            if cmd == "ping":
+                response = {
+                    "ok": True,
+                    "pid": os.getpid(),
+                    "models": asr_backends.loaded_models(),
+                    "uptime": time.time() - self.server.started_at,
+                    "requests": self.server.request_count
+                }
+            elif cmd == "transcribe":
+                self.server.request_count += 1
+                start = time.time()
+                result = transcribe_local(
+                    request["audio_path"],
+                    request.get("model", DEFAULT_MODEL),
+                    request.get("language", DEFAULT_LANGUAGE),
+                    request.get("backend", DEFAULT_BACKEND)
+                )
+                response = {"ok": True, "result": result, "elapsed": time.time() - start}
+            elif cmd == "shutdown":
+                response = {"ok": True}
+                shutdown_requested = True
+            else:
+                response = {"ok": False, "error": f"알 수 없는 명령: {cmd}"}
+        except Exception as e:
+            response = {"ok": False, "error": str(e)}
+
+        self.wfile.write((json.dumps(response, ensure_ascii=False) + "\n").encode("utf-8"))
+        self.wfile.flush()
+
+        # 응답을 보낸 뒤에 종료해야 클라이언트가 결과를 받을 수 있음
+        if shutdown_requested:
+            threading.Thread(target=self.server.shutdown, daemon=True).start()
+
+
+class _WorkerServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def serve(model_name: str = DEFAULT_MODEL, backend: str = DEFAULT_BACKEND) -> None:
+    """상주 워커 실행 (모델을 미리 로드한 뒤 소켓 요청을 기다림)"""
+    if not hasattr(socket, "AF_UNIX"):
+        print("❌ 이 운영체제는 유닉스 소켓을 지원하지 않습니다.")
+        return
+
+    if worker_status():
+        print(f"ℹ️  워커가 이미 실행 중입니다: {SOCKET_PATH}")
+        return
+
+    # 이전 실행에서 남은 소켓 파일 정리
+    if os.path.exists(SOCKET_PATH):
+        os.unlink(SOCKET_PATH)
+
+    print(f"🎤 {backend} '{model_name}' 모델을 로드하는 중...")
+    start = time.time()
+    get_model(model_name, backend)
+    print(f"✅ 모델 로드 완료 ({time.time() - start:.1f}초)")
+
+    server = _WorkerServer(SOCKET_PATH, _WorkerHandler)
+    server.started_at = time.time()
+    server.request_count = 0
+
+    print(f"🔌 워커 소켓: {SOCKET_PATH}")
+    print("🔄 요청을 기다리는 중... (Ctrl+C로 종료)")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n🛑 워커를 종료합니다.")
+    finally:
+        server.server_close()
+        if os.path.exists(SOCKET_PATH):
+            os.unlink(SOCKET_PATH)
+
+
+def benchmark(audio_path: str, model_name: str = DEFAULT_MODEL, language: str = DEFAULT_LANGUAGE,
+              backend: str = DEFAULT_BACKEND) -> dict:
+    """콜드(모델 로드 포함) / 웜(캐시된 모델) / 워커 경로 지연시간 측정"""
+    results = {}
+
+    # 콜드: 모델 로드 + 첫 인식
+    start = time.time()
+    get_model(model_name, backend)
+    results['model_load'] = time.time() - start
+
+    start = time.time()
+    transcribe_local(audio_path, model_name, language, backend)
+    results['cold_total'] = results['model_load'] + (time.time() - start)
+
+    # 웜: 이미 로드된 모델로 재인식
+    start = time.time()
+    transcribe_local(audio_path, model_name, language, backend)
+    results['warm'] = time.time() - start
+
+    # 워커: 소켓 왕복 포함 (워커가 실행 중일 때만)
+    if worker_status():
+        start = time.time()
+        response = _send_request({
+            "cmd": "transcribe",
+            "audio_path": os.path.abspath(audio_path),
+            "model": model_name,
+            "language": language,
+            "backend": backend
+        })
+        if response and response.get("ok"):
+            results['worker'] = time.time() - start
+
+    return results
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("🎤 음성 인식 서비스")
+        print("=" * 30)
+        print()
+        print("사용법:")
+        print("  python transcription_service.py serve [모델] [엔진]            # 상주 워커 실행")
+        print("  python transcription_service.py status                        # 워커 상태 확인")
+        print("  python transcription_service.py stop                          # 워커 종료")
+        print("  python transcription_service.py bench <음성파일> [모델] [엔진]  # 지연시간 측정")
+        return
+
+    command = sys.argv[1]
+
+    if command == "serve":
+        serve(sys.argv[2] if len(sys.argv) > 2 else DEFAULT_MODEL,
+              sys.argv[3] if len(sys.argv) > 3 else DEFAULT_BACKEND)
+    elif command == "status":
+        status = worker_status()
+        if status:
+            print(f"✅ 워커 실행 중 (PID {status['pid']})")
+            print(f"   로드된 모델: {', '.join(status['models']) or '없음'}")
+            print(f"   처리한 요청: {status['requests']}개")
+            print(f"   실행 시간: {status['uptime']:.0f}초")
+        else:
+            print("⏹️  실행 중인 워커가 없습니다.")
+    elif command == "stop":
+        if _send_request({"cmd": "shutdown"}, timeout=5.0):
+            print("🛑 워커를 종료했습니다.")
+        else:
+            print("⏹️  실행 중인 워커가 없습니다.")
+    elif command == "bench" and len(sys.argv) > 2:
+        audio_path = sys.argv[2]
+        model_name = sys.argv[3] if len(sys.argv) > 3 else DEFAULT_MODEL
+        backend = sys.argv[4] if len(sys.argv) > 4 else DEFAULT_BACKEND
+        if not os.path.exists(audio_path):
+            print(f"❌ 파일을 찾을 수 없습니다: {audio_path}")
+            return
+        if not is_available(backend):
+            print(f"❌ 음성 인식 엔진이 설치되지 않았습니다: {backend}")
+            return
+
+        print(f"⏱️  지연시간 측정: {audio_path} (엔진: {backend}, 모델: {model_name})")
+        results = benchmark(audio_path, model_name, backend=backend)
+        print(f"   모델 로드:          {results['model_load']:.2f}초")
+        print(f"   콜드 (로드+인식):   {results['cold_total']:.2f}초")
+        print(f"   웜 (캐시된 모델):   {results['warm']:.2f}초")
+        if 'worker' in results:
+            print(f"   상주 워커:          {results['worker']:.2f}초")
+        else:
+            print("   상주 워커:          (실행 중 아님)")
+    else:
+        print("❌ 알 수 없는 명령어입니다.")
+        print("💡 사용 가능한 명령어: serve, status, stop, bench")
+
+
+if __name__ == "__main__":
+    main()
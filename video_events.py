@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+📡 동영상 생성 이벤트 (Video Events)
+===================================
+
+EasyVideoMaker 엔진은 화면에 직접 출력하지 않고 진행 상황을 이벤트로 알립니다.
+이벤트를 받아 처리하는 쪽(구독자)을 바꾸면 같은 엔진을 터미널, 헤드리스, 서비스에서 그대로 씁니다.
+
+- EventBus: 이벤트 종류와 필수 필드를 검사하고 구독자에게 전달 (구독자가 없으면 바로 반환)
+- JsonlLogger: 한 줄에 이벤트 하나씩 JSON Lines로 기록 (stdout 또는 파일)
+- MetricsAggregator: 접수/성공/실패 수, 생성 시간, 실패 코드, 다운로드 용량 집계
+- 터미널 화면(rich 패널, 진행 막대)은 easy_video_maker.py의 RichRenderer
+
+이벤트는 dict입니다: {"event": 종류, "time": 유닉스 시간, ...필드}
+구독자는 이벤트를 보낸 스레드에서 바로 호출되므로, 여러 작업을 동시에 돌릴 때는 스레드에 안전해야 합니다.
+"""
+
+import json
+import time
+import logging
+import threading
+from collections import Counter
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# 이벤트 종류 → 필수 필드
+EVENT_TYPES = {
+    # 실행 단위 (헤드리스 모드처럼 엔진을 호출하는 쪽에서 보냄)
+    'run_started': ('mode',),
+    'run_finished': ('mode', 'exit_code'),
+    'run_failed': ('mode', 'message'),
+    # 배치/체인 단위
+    'batch_started': ('start', 'end', 'total', 'concurrency'),
+    'batch_finished': ('completed', 'failed', 'pending'),
+    'chain_started': ('start', 'end'),
+    'chain_finished': ('completed', 'failed', 'clips'),
+    # 클립 단위 (mode: single, batch, chain)
+    'clip_started': ('mode', 'index', 'total', 'prompt'),
+    'clip_finished': ('mode', 'index', 'total', 'status'),
+    # 생성 작업 단위
+    'image_prepared': ('path', 'width', 'height', 'cached'),
+    'submitted': ('task_id', 'model', 'mode'),
+    'submit_failed': ('message',),
+    'waiting': ('task_id',),
+    'polled': ('task_id', 'status', 'elapsed'),
+    'succeeded': ('task_id', 'video_url', 'elapsed'),
+    'failed': ('task_id', 'code', 'message', 'elapsed'),
+    # 파일 처리
+    'downloading': ('path',),
+    'downloaded': ('path', 'size_bytes', 'elapsed'),
+    'download_failed': ('path', 'message'),
+    'frame_extracted': ('video_path', 'frame_path', 'width', 'height'),
+    'merging': ('clips',),
+    'merge_analyzed': ('trimmed', 'jumps'),
+    'merged': ('path', 'clips', 'size_bytes', 'elapsed'),
+    'merge_failed': ('code', 'message'),
+    'merge_skipped': ('clips',),
+    # 그 밖의 안내 (level: info, success, warning, error / title이 있으면 패널로 표시)
+    'notice': ('level', 'message'),
+}
+
+
+class EventBus:
+    """이벤트 버스 (구독자 등록 + 이벤트 전달)"""
+
+    def __init__(self):
+        self._subscribers = []
+        self._lock = threading.Lock()
+
+    def subscribe(self, handler, events: Optional[list] = None):
+        """구독자 등록 (handler(event) 호출, events를 주면 그 종류만 받음)"""
+        if events is not None:
+            unknown = [e for e in events if e not in EVENT_TYPES]
+            if unknown:
+                raise ValueError(f"알 수 없는 이벤트 종류: {', '.join(unknown)}")
+            events = frozenset(events)
+        with self._lock:
+            self._subscribers = self._subscribers + [(handler, events)]
+        return handler
+
+    def unsubscribe(self, handler):
+        with self._lock:
+            self._subscribers = [(h, e) for h, e in self._subscribers if h is not handler]
+
+    def emit(self, event_type: str, **fields) -> Optional[dict]:
+        """이벤트 전달 (구독자가 없으면 검사만 하고 None)
+
+        구독자에서 난 오류는 로그만 남기고 엔진 작업은 계속합니다.
+        """
+        required = EVENT_TYPES.get(event_type)
+        if required is None:
+            raise ValueError(f"알 수 없는 이벤트 종류: {event_type}")
+        missing = [name for name in required if name not in fields]
+        if missing:
+            raise ValueError(f"{event_type} 이벤트에 필수 필드가 없습니다: {', '.join(missing)}")
+
+        subscribers = self._subscribers
+        if not subscribers:
+            return None
+
+        event = {'event': event_type, 'time': round(time.time(), 3), **fields}
+        for handler, events in subscribers:
+            if events is None or event_type in events:
+                try:
+                    handler(event)
+                except Exception as e:
+                    logger.warning(f"이벤트 구독자 오류 ({event_type}): {e}")
+        return event
+
+
+class JsonlLogger:
+    """이벤트를 JSON Lines로 기록 (stream 또는 파일 경로, 파일은 이어서 씀)"""
+
+    def __init__(self, target):
+        if isinstance(target, str):
+            self.stream = open(target, "a", encoding="utf-8")
+            self._owned = True
+        else:
+            self.stream = target
+            self._owned = False
+        self._lock = threading.Lock()
+
+    def __call__(self, event: dict):
+        line = json.dumps(event, ensure_ascii=False, default=str)
+        with self._lock:
+            self.stream.write(line + "\n")
+            self.stream.flush()
+
+    def close(self):
+        if self._owned:
+            self.stream.close()
+
+
+class MetricsAggregator:
+    """이벤트 통계 집계 (summary()로 dict, format_summary()로 출력용 문자열)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counts = Counter()
+        self.failure_codes = Counter()
+        self.polls = Counter()
+        self.render_seconds = []
+        self.downloaded_bytes = 0
+        self.first_time = None
+        self.last_time = None
+
+    def __call__(self, event: dict):
+        event_type = event['event']
+        with self._lock:
+            self.counts[event_type] += 1
+            if self.first_time is None:
+                self.first_time = event['time']
+            self.last_time = event['time']
+
+            if event_type == 'polled':
+                self.polls[event['task_id']] += 1
+            elif event_type == 'succeeded':
+                self.render_seconds.append(event['elapsed'])
+            elif event_type == 'failed':
+                self.failure_codes[event['code']] += 1
+            elif event_type == 'submit_failed':
+                self.failure_codes['SubmitFailed'] += 1
+            elif event_type == 'downloaded':
+                self.downloaded_bytes += event['size_bytes']
+
+    def summary(self) -> dict:
+        with self._lock:
+            renders = sorted(self.render_seconds)
+            return {
+                'submitted': self.counts['submitted'],
+                'succeeded': self.counts['succeeded'],
+                'failed': self.counts['failed'] + self.counts['submit_failed'],
+                'downloaded': self.counts['downloaded'],
+                'downloaded_mb': round(self.downloaded_bytes / (1024 * 1024), 1),
+                'merged': self.counts['merged'],
+                'failure_codes': dict(self.failure_codes),
+                'render_seconds': {
+                    'mean': round(sum(renders) / len(renders), 1),
+                    'max': renders[-1]
+                } if renders else None,
+                'polls_per_task': round(sum(self.polls.values()) / len(self.polls), 1) if self.polls else 0,
+                'wall_seconds': round(self.last_time - self.first_time, 1) if self.first_time is not None else 0,
+                'events': dict(self.counts)
+            }
+
+    def format_summary(self) -> str:
+        s = self.summary()
+        lines = [f"📈 작업 통계: 접수 {s['submitted']}개 / 성공 {s['succeeded']}개 / 실패 {s['failed']}개 "
+                 f"(경과 {s['wall_seconds']:.0f}초)"]
+        if s['render_seconds']:
+            lines.append(f"   생성 시간 평균 {s['render_seconds']['mean']:.0f}초, 최대 {s['render_seconds']['max']:.0f}초, "
+                         f"작업당 상태 확인 {s['polls_per_task']:.1f}회")
+        if s['downloaded']:
+            lines.append(f"   다운로드 {s['downloaded']}개 ({s['downloaded_mb']:.1f}MB)")
+        if s['failure_codes']:
+            lines.append("   실패 원인: " + ", ".join(f"{code} {n}개" for code, n in s['failure_codes'].items()))
+        return "\n".join(lines)
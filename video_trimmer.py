@@ -1,8 +1,24 @@
 #!/usr/bin/env python3
 import os
+import json
+import math
 import subprocess
 import sys
+import time
+import tempfile
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+import encoding_profiles
+import media_probe
+import mp4_meta
+import parallel_encoder
+
+# scene_analyzer(OpenCV/numpy)는 종료 시간을 자동으로 정할 때만 불러옴
+
+# 스마트 컷에서 앞/뒤 일부 구간만 재인코딩할 때 사용할 인코더와 프로필 (짧은 구간이라 고품질 설정 사용)
+SMART_CUT_ENCODERS = {'h264': 'libx264', 'hevc': 'libx265'}
+SMART_CUT_PROFILE = "final"
 
 def get_video_files():
     """videos 폴더에서 동영상 파일 목록을 가져옵니다."""
@@ -21,11 +37,12 @@ def get_video_files():
     return sorted(video_files)
 
 def format_time(seconds):
-    """초를 HH:MM:SS 형태로 변환합니다."""
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
-    return f"{hours:02d}:{minutes:02d}:{secs:02d}"
+    """초를 HH:MM:SS.mmm 형태로 변환합니다. (밀리초까지 유지)"""
+    total_ms = int(round(seconds * 1000))
+    hours, rest = divmod(total_ms, 3600 * 1000)
+    minutes, rest = divmod(rest, 60 * 1000)
+    secs, ms = divmod(rest, 1000)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}.{ms:03d}"
 
 def parse_time(time_str):
     """HH:MM:SS, MM:SS 또는 초 단위 문자열을 초로 변환합니다."""
@@ -48,46 +65,598 @@ def parse_time(time_str):
         raise ValueError("시간 형식이 올바르지 않습니다. (예: 120 또는 2:30 또는 1:02:30)")
 
 def get_video_duration(video_path):
-    """ffprobe를 사용하여 동영상의 길이를 가져옵니다."""
+    """동영상의 길이를 가져옵니다. (MP4는 파일에서 직접 읽고, 나머지는 캐시된 ffprobe 결과 사용)"""
+    duration = mp4_meta.get_duration(video_path)
+    return duration if duration > 0 else None
+
+def _run_ffmpeg(cmd):
+    """ffmpeg 실행 (성공 여부, 오류 메시지)"""
+    result = subprocess.run(cmd, capture_output=True, text=True)
+    return result.returncode == 0, result.stderr.strip()
+
+def find_cut_points(keyframes, start_time, end_time, frame_duration):
+    """자르는 구간 안쪽의 첫 키프레임과 마지막 키프레임을 찾습니다.
+
+    Returns:
+        tuple: (복사 시작 키프레임, 복사 끝 키프레임) 또는 구간 안에 키프레임이 2개 미만이면 None
+    """
+    # 반 프레임 이내의 차이는 같은 위치로 봄
+    tolerance = frame_duration / 2
+    inside = [k for k in keyframes if start_time - tolerance <= k <= end_time + tolerance]
+    if len(inside) < 2:
+        return None
+    return inside[0], inside[-1]
+
+def _smart_cut_setup(input_path):
+    """스마트 컷에 필요한 원본 정보 (fps, 키프레임, 앞/뒤 재인코딩 옵션)
+
+    Returns:
+        dict: 성공하면 {'fps', 'keyframes', 'encode_args'},
+              지원하지 않는 코덱이면 {'fallback': 이유}, 실패하면 {'error': 메시지}
+    """
+    info = media_probe.probe(input_path)
+    if not info or not info['video']:
+        return {'error': "동영상 정보를 읽을 수 없습니다."}
+
+    video = info['video']
+    encoder = SMART_CUT_ENCODERS.get(video['codec'])
+    if not encoder:
+        return {'fallback': f"{video['codec']} 코덱은 스마트 컷을 지원하지 않아 전체를 재인코딩했습니다."}
+
     try:
-        cmd = [
-            'ffprobe', '-v', 'quiet', '-show_entries', 'format=duration',
-            '-of', 'csv=p=0', video_path
-        ]
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-        return float(result.stdout.strip())
-    except (subprocess.CalledProcessError, ValueError):
+        keyframes, _, frame_rate = parallel_encoder.keyframe_times(input_path)
+    except (subprocess.CalledProcessError, FileNotFoundError, KeyError, ValueError) as e:
+        return {'error': f"키프레임 정보를 읽을 수 없습니다: {e}"}
+
+    profile = encoding_profiles.get_profile(SMART_CUT_PROFILE)
+    encode_args = [
+        "-c:v", encoder, "-preset", profile['preset'], "-crf", str(profile['crf']),
+        "-pix_fmt", video['pix_fmt'] or "yuv420p"
+    ]
+    if frame_rate not in ("0/0", "", None):
+        encode_args += ["-r", frame_rate]
+    # 이어 붙일 때 시간 단위가 달라 반올림 오차가 생기지 않도록 원본과 맞춤
+    mp4_info = mp4_meta.read_metadata(input_path)
+    if mp4_info and mp4_info['video']:
+        encode_args += ["-video_track_timescale", str(mp4_info['video']['timescale'])]
+
+    return {'fps': video['fps'] or 25.0, 'keyframes': keyframes, 'encode_args': encode_args}
+
+def _plan_smart_cut(setup, start_time, end_time):
+    """구간 하나의 복사/재인코딩 계획 (구간 안에 복사할 GOP가 없으면 None)"""
+    fps = setup['fps']
+    cut_points = find_cut_points(setup['keyframes'], start_time, end_time, 1 / fps)
+    if cut_points is None:
         return None
+    copy_start, copy_end = cut_points
+    # 시작을 다음 프레임 시각(첫 키프레임 기준 1/fps 간격)으로 맞춤
+    # (프레임 사이에서 시작하면 -r 때문에 첫 프레임이 한 번 더 들어가고 뒤쪽 프레임 하나가 빠짐)
+    start_time = copy_start - max(0, math.floor((copy_start - start_time) * fps + 1e-6)) / fps
+
+    # 조각마다 프레임 수로 잘라야 B-프레임이 있어도 경계에서 프레임이 빠지거나 겹치지 않음
+    # (프레임은 키프레임 기준 1/fps 간격이므로 시간 차이로 프레임 수 계산)
+    return {
+        'start': start_time,
+        'end': end_time,
+        'copy_start': copy_start,
+        'copy_end': copy_end,
+        'head_frames': int(round((copy_start - start_time) * fps)),
+        'middle_frames': int(round((copy_end - copy_start) * fps)),
+        'tail_frames': math.ceil((end_time - copy_end) * fps - 1e-6)
+    }
+
+def _encode_piece(input_path, start_time, frames, encode_args, output_path):
+    """start_time부터 frames개 프레임만 재인코딩 (입력 쪽에서 탐색)
+
+    start_time은 프레임 시각이어야 하며, 반올림 때문에 그 프레임이 빠지지 않도록 살짝 앞으로 찾아감
+    """
+    seek = max(0.0, start_time - parallel_encoder.SEEK_EPSILON)
+    return _run_ffmpeg([
+        "ffmpeg", "-y", "-v", "error", "-ss", f"{seek:.6f}", "-i", input_path,
+        "-frames:v", str(frames), "-map", "0:v:0", "-an", "-sn"
+    ] + encode_args + [output_path])
+
+def _join_parts(parts, input_path, start_time, end_time, output_path, temp_dir, tag="parts"):
+    """영상 조각 이어 붙이기 (스트림 복사) + 원본 음성 구간 복사"""
+    concat_file = os.path.join(temp_dir, f"{tag}.txt")
+    with open(concat_file, "w", encoding="utf-8") as f:
+        for part in parts:
+            f.write(f"file '{os.path.abspath(part)}'\n")
+
+    return _run_ffmpeg([
+        "ffmpeg", "-y", "-v", "error",
+        "-f", "concat", "-safe", "0", "-i", concat_file,
+        "-ss", f"{start_time:.6f}", "-t", f"{end_time - start_time:.6f}", "-i", input_path,
+        "-map", "0:v:0", "-map", "1:a?", "-c", "copy", "-movflags", "+faststart",
+        output_path
+    ])
+
+def _finish_smart_cut(input_path, plan, middle_parts, encode_args, output_path, temp_dir, tag="cut"):
+    """앞/뒤 걸친 GOP를 재인코딩하고 가운데 복사 조각과 이어 붙임 (성공 여부, 오류 메시지)"""
+    parts = []
+    # 앞쪽: 시작 지점 ~ 첫 키프레임 (재인코딩)
+    if plan['head_frames'] > 0:
+        head = os.path.join(temp_dir, f"{tag}_head.mp4")
+        ok, error = _encode_piece(input_path, plan['start'], plan['head_frames'], encode_args, head)
+        if not ok:
+            return False, error
+        parts.append(head)
+
+    parts += middle_parts
+
+    # 뒤쪽: 마지막 키프레임 ~ 끝 지점 (재인코딩)
+    if plan['tail_frames'] > 0:
+        tail = os.path.join(temp_dir, f"{tag}_tail.mp4")
+        ok, error = _encode_piece(input_path, plan['copy_end'], plan['tail_frames'], encode_args, tail)
+        if not ok:
+            return False, error
+        parts.append(tail)
+
+    return _join_parts(parts, input_path, plan['start'], plan['end'], output_path, temp_dir, tag)
+
+def _smart_result(plan, started):
+    return {
+        'ok': True,
+        'mode': "smart",
+        'copied': plan['copy_end'] - plan['copy_start'],
+        'reencoded': (plan['copy_start'] - plan['start']) + (plan['end'] - plan['copy_end']),
+        'elapsed': time.time() - started
+    }
+
+def smart_trim(input_path, output_path, start_time, end_time):
+    """스마트 컷: 키프레임 사이 구간은 스트림 복사, 앞/뒤 걸친 GOP만 재인코딩합니다.
+
+    - 입력 쪽에서 탐색(-ss를 -i 앞에)하므로 앞부분을 디코딩하지 않음
+    - 시작/끝이 키프레임이 아니어도 프레임 단위로 정확하게 자름
+    - 음성은 스트림 복사 (AAC 프레임 단위, 약 20ms)
+
+    Returns:
+        dict: {'ok', 'mode', 'copied', 'reencoded', 'elapsed', 'error'}
+    """
+    started = time.time()
+    setup = _smart_cut_setup(input_path)
+    if 'error' in setup:
+        return {'ok': False, 'error': setup['error']}
+    if 'fallback' in setup:
+        # 같은 코덱으로 이어 붙일 수 없으면 전체를 정확하게 재인코딩
+        result = reencode_trim(input_path, output_path, start_time, end_time)
+        result['reason'] = setup['fallback']
+        return result
+
+    plan = _plan_smart_cut(setup, start_time, end_time)
+    if plan is None:
+        # 구간이 GOP 하나보다 짧으면 복사할 부분이 없음
+        return reencode_trim(input_path, output_path, start_time, end_time)
+
+    with tempfile.TemporaryDirectory(prefix="smart_cut_") as temp_dir:
+        # 가운데: 키프레임 ~ 키프레임 (스트림 복사)
+        middle = os.path.join(temp_dir, "middle.mp4")
+        ok, error = _run_ffmpeg([
+            "ffmpeg", "-y", "-v", "error", "-ss", f"{plan['copy_start']:.6f}", "-i", input_path,
+            "-frames:v", str(plan['middle_frames']), "-map", "0:v:0", "-an", "-sn", "-c", "copy", middle
+        ])
+        if not ok:
+            return {'ok': False, 'error': error}
+
+        ok, error = _finish_smart_cut(input_path, plan, [middle], setup['encode_args'], output_path, temp_dir)
+        if not ok:
+            return {'ok': False, 'error': error}
+
+    return _smart_result(plan, started)
+
+def reencode_trim(input_path, output_path, start_time, end_time):
+    """전체 구간을 재인코딩해서 프레임 단위로 정확하게 자릅니다. (입력 쪽에서 탐색)"""
+    started = time.time()
+    profile = encoding_profiles.get_profile(SMART_CUT_PROFILE)
+    # 시작을 다음 프레임 시각으로 맞춰야 첫 프레임이 한 번 더 들어가지 않음
+    info = media_probe.probe(input_path)
+    fps = info['video']['fps'] if info and info['video'] else 0
+    if fps:
+        start_time = math.ceil(start_time * fps - 1e-6) / fps
+    seek = max(0.0, start_time - parallel_encoder.SEEK_EPSILON)
+    ok, error = _run_ffmpeg(
+        ["ffmpeg", "-y", "-v", "error", "-ss", f"{seek:.6f}", "-i", input_path,
+         "-t", f"{end_time - start_time:.6f}"]
+        + encoding_profiles.video_args(profile) + encoding_profiles.audio_args(profile)
+        + ["-movflags", "+faststart", output_path]
+    )
+    if not ok:
+        return {'ok': False, 'error': error}
+    return {'ok': True, 'mode': "reencode", 'copied': 0.0, 'reencoded': end_time - start_time,
+            'elapsed': time.time() - started}
+
+def copy_trim(input_path, output_path, start_time, end_time):
+    """스트림 복사로만 자릅니다. (가장 빠르지만 시작이 앞쪽 키프레임으로 당겨짐)"""
+    started = time.time()
+    ok, error = _run_ffmpeg([
+        "ffmpeg", "-y", "-v", "error", "-ss", format_time(start_time), "-i", input_path,
+        "-t", f"{end_time - start_time:.3f}",
+        "-c", "copy", "-avoid_negative_ts", "make_zero", output_path
+    ])
+    if not ok:
+        return {'ok': False, 'error': error}
+    return {'ok': True, 'mode': "copy", 'copied': end_time - start_time, 'reencoded': 0.0,
+            'elapsed': time.time() - started}
+
+TRIM_MODES = {
+    'smart': smart_trim,
+    'copy': copy_trim,
+    'reencode': reencode_trim,
+}
+
+def trim_video(input_path, output_path, start_time, end_time, mode="smart"):
+    """ffmpeg을 사용하여 동영상을 자릅니다.
+
+    mode:
+        smart    - 키프레임 사이는 복사, 앞/뒤 일부만 재인코딩 (정확 + 빠름, 기본값)
+        copy     - 스트림 복사만 (가장 빠름, 시작이 키프레임에 맞춰짐)
+        reencode - 전체 재인코딩 (정확하지만 느림)
+    """
+    print(f"\n동영상 자르는 중... ({mode}: {format_time(start_time)} ~ {format_time(end_time)})")
 
-def trim_video(input_path, output_path, start_time, end_time):
-    """ffmpeg을 사용하여 동영상을 자릅니다."""
     try:
-        cmd = [
-            'ffmpeg', '-i', input_path,
-            '-ss', format_time(start_time),
-            '-to', format_time(end_time),
-            '-c', 'copy',  # 빠른 복사를 위해 re-encoding 하지 않음
-            '-avoid_negative_ts', 'make_zero',
-            output_path, '-y'  # 기존 파일 덮어쓰기
-        ]
-        
-        print(f"\n동영상 자르는 중...")
-        print(f"명령어: {' '.join(cmd)}")
-        
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        
-        if result.returncode == 0:
-            print(f"✅ 성공적으로 저장되었습니다: {output_path}")
-            return True
-        else:
-            print(f"❌ 오류가 발생했습니다:")
-            print(result.stderr)
-            return False
+        result = TRIM_MODES[mode](input_path, output_path, start_time, end_time)
     except FileNotFoundError:
         print("❌ ffmpeg이 설치되어 있지 않습니다. ffmpeg을 먼저 설치해주세요.")
         return False
 
+    if not result['ok']:
+        print(f"❌ 오류가 발생했습니다:")
+        print(result['error'])
+        return False
+
+    if result.get('reason'):
+        print(f"ℹ️  {result['reason']}")
+    print(f"⏱️  {result['elapsed']:.1f}초 소요 (복사 {result['copied']:.1f}초 / 재인코딩 {result['reencoded']:.1f}초 구간)")
+    print(f"✅ 성공적으로 저장되었습니다: {output_path}")
+    return True
+
+def _segment_at_keyframes(input_path, boundaries, fps, temp_dir, tag="seg", with_audio=False):
+    """원본을 한 번만 읽으면서 키프레임 경계마다 조각 파일로 나눔 (segment muxer, 스트림 복사)
+
+    Returns:
+        list: 조각 파일 경로 (boundaries[i] ~ boundaries[i+1]), 실패하면 None
+    """
+    first, last = boundaries[0], boundaries[-1]
+    # 첫 경계로 입력 탐색하고 마지막 경계까지만 읽음 (segment_times는 탐색 지점 기준)
+    split_times = ",".join(f"{b - first - parallel_encoder.SEEK_EPSILON:.6f}" for b in boundaries[1:-1])
+    pattern = os.path.join(temp_dir, f"{tag}_%04d.mp4")
+    cmd = ["ffmpeg", "-y", "-v", "error", "-ss", f"{first:.6f}", "-i", input_path,
+           "-map", "0:v:0"]
+    cmd += ["-map", "0:a?", "-t", f"{last - first:.6f}"] if with_audio else \
+        ["-frames:v", str(int(round((last - first) * fps)))]
+    cmd += ["-sn", "-c", "copy", "-f", "segment", "-reset_timestamps", "1"]
+    # 나눌 지점이 없으면 segment muxer 기본값(2초마다 나눔)이 적용되지 않도록 한 조각으로 유지
+    cmd += ["-segment_times", split_times] if split_times else ["-segment_time", str(int(last - first) + 1)]
+    ok, _ = _run_ffmpeg(cmd + [pattern])
+    if not ok:
+        return None
+
+    segments = sorted(os.path.join(temp_dir, f) for f in os.listdir(temp_dir)
+                      if f.startswith(f"{tag}_") and f.endswith(".mp4"))
+    # 경계가 키프레임과 어긋나 조각 수가 다르면 사용하지 않음
+    return segments if len(segments) == len(boundaries) - 1 else None
+
+def _boundary_index(boundaries, t):
+    return min(range(len(boundaries)), key=lambda i: abs(boundaries[i] - t))
+
+def _smart_ranges(input_path, ranges, outputs, workers):
+    """여러 구간 스마트 컷: 복사할 GOP는 segment muxer 한 번으로 모두 잘라내고
+    구간마다 앞/뒤 일부만 재인코딩해서 이어 붙임"""
+    setup = _smart_cut_setup(input_path)
+    if 'error' in setup:
+        return [{'ok': False, 'error': setup['error']} for _ in ranges]
+    if 'fallback' in setup:
+        return _reencode_ranges(input_path, ranges, outputs)
+
+    plans = [_plan_smart_cut(setup, r['start'], r['end']) for r in ranges]
+    boundaries = sorted({round(t, 6) for p in plans if p for t in (p['copy_start'], p['copy_end'])})
+
+    results = [None] * len(ranges)
+    with tempfile.TemporaryDirectory(prefix="smart_ranges_") as temp_dir:
+        segments = _segment_at_keyframes(input_path, boundaries, setup['fps'], temp_dir) if boundaries else None
+
+        def finish(i):
+            started = time.time()
+            plan = plans[i]
+            if plan is None or segments is None:
+                # GOP보다 짧은 구간 (또는 한 번에 나누기 실패): 이 구간만 따로 처리
+                return smart_trim(input_path, outputs[i], ranges[i]['start'], ranges[i]['end'])
+            first = _boundary_index(boundaries, plan['copy_start'])
+            last = _boundary_index(boundaries, plan['copy_end'])
+            ok, error = _finish_smart_cut(input_path, plan, segments[first:last], setup['encode_args'],
+                                          outputs[i], temp_dir, tag=f"range{i:03d}")
+            return _smart_result(plan, started) if ok else {'ok': False, 'error': error}
+
+        # 앞/뒤 재인코딩과 이어 붙이기는 구간마다 독립적이므로 동시에 실행
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+            for i, result in enumerate(executor.map(finish, range(len(ranges)))):
+                results[i] = result
+    return results
+
+def _copy_ranges(input_path, ranges, outputs):
+    """여러 구간 스트림 복사: 구간을 감싸는 키프레임에서 한 번에 나눈 뒤 구간별로 이어 붙임"""
+    started = time.time()
+    try:
+        keyframes, duration, _ = parallel_encoder.keyframe_times(input_path)
+    except (subprocess.CalledProcessError, FileNotFoundError, KeyError, ValueError) as e:
+        return [{'ok': False, 'error': f"키프레임 정보를 읽을 수 없습니다: {e}"} for _ in ranges]
+
+    # 시작은 앞쪽 키프레임으로, 끝은 뒤쪽 키프레임으로 넓힘
+    spans = []
+    for r in ranges:
+        before = [k for k in keyframes if k <= r['start'] + 1e-6]
+        after = [k for k in keyframes if k >= r['end'] - 1e-6]
+        spans.append((before[-1] if before else 0.0, after[0] if after else duration))
+    boundaries = sorted({round(t, 6) for span in spans for t in span})
+
+    results = []
+    with tempfile.TemporaryDirectory(prefix="copy_ranges_") as temp_dir:
+        segments = _segment_at_keyframes(input_path, boundaries, 0, temp_dir, with_audio=True)
+        for i, (span_start, span_end) in enumerate(spans):
+            if segments is None:
+                results.append(copy_trim(input_path, outputs[i], ranges[i]['start'], ranges[i]['end']))
+                continue
+            first = _boundary_index(boundaries, span_start)
+            last = _boundary_index(boundaries, span_end)
+            concat_file = os.path.join(temp_dir, f"range{i:03d}.txt")
+            with open(concat_file, "w", encoding="utf-8") as f:
+                for segment in segments[first:last]:
+                    f.write(f"file '{os.path.abspath(segment)}'\n")
+            ok, error = _run_ffmpeg([
+                "ffmpeg", "-y", "-v", "error", "-f", "concat", "-safe", "0", "-i", concat_file,
+                "-map", "0", "-c", "copy", outputs[i]
+            ])
+            results.append({'ok': True, 'mode': "copy", 'copied': span_end - span_start, 'reencoded': 0.0,
+                            'elapsed': time.time() - started} if ok else {'ok': False, 'error': error})
+    return results
+
+def _reencode_ranges(input_path, ranges, outputs):
+    """여러 구간 전체 재인코딩: 한 번 디코딩한 프레임을 split/trim 필터로 나눠 동시에 인코딩"""
+    started = time.time()
+    info = media_probe.probe(input_path)
+    has_audio = bool(info and info['has_audio'])
+    profile = encoding_profiles.get_profile(SMART_CUT_PROFILE)
+
+    # 첫 구간 앞과 마지막 구간 뒤는 읽지 않음 (-copyts로 원본 시간 기준 trim 유지)
+    first = min(r['start'] for r in ranges)
+    last = max(r['end'] for r in ranges)
+    count = len(ranges)
+    graph = [f"[0:v]split={count}" + "".join(f"[v{i}]" for i in range(count))]
+    if has_audio:
+        graph.append(f"[0:a]asplit={count}" + "".join(f"[a{i}]" for i in range(count)))
+    for i, r in enumerate(ranges):
+        graph.append(f"[v{i}]trim=start={r['start']:.6f}:end={r['end']:.6f},setpts=PTS-STARTPTS[vo{i}]")
+        if has_audio:
+            graph.append(f"[a{i}]atrim=start={r['start']:.6f}:end={r['end']:.6f},asetpts=PTS-STARTPTS[ao{i}]")
+
+    cmd = ["ffmpeg", "-y", "-v", "error", "-copyts", "-ss", f"{first:.6f}", "-t", f"{last - first:.6f}",
+           "-i", input_path, "-filter_complex", ";".join(graph)]
+    # 타임스탬프를 바꾸면 ffmpeg가 프레임레이트를 25로 가정해 프레임을 복제하므로 원본 값을 지정
+    frame_rate = info['video']['r_frame_rate'] if info and info['video'] else None
+    rate_args = ["-r", frame_rate] if frame_rate not in ("0/0", "", None) else []
+    for i, output_path in enumerate(outputs):
+        cmd += ["-map", f"[vo{i}]"] + rate_args + encoding_profiles.video_args(profile)
+        if has_audio:
+            cmd += ["-map", f"[ao{i}]"] + encoding_profiles.audio_args(profile)
+        cmd += ["-movflags", "+faststart", output_path]
+
+    ok, error = _run_ffmpeg(cmd)
+    elapsed = time.time() - started
+    return [{'ok': True, 'mode': "reencode", 'copied': 0.0, 'reencoded': r['end'] - r['start'], 'elapsed': elapsed}
+            if ok else {'ok': False, 'error': error} for r in ranges]
+
+def clip_output_paths(input_path, ranges, output_dir, mode):
+    """구간별 출력 파일 경로 (이름이 없으면 시작~끝 시간으로)"""
+    base_name, extension = os.path.splitext(os.path.basename(input_path))
+    if mode != "copy":
+        extension = ".mp4"
+    outputs = []
+    for i, r in enumerate(ranges, 1):
+        end = f"{r['end']:g}" if r['end'] is not None else "auto"
+        label = r.get('name') or f"{r['start']:g}-{end}"
+        outputs.append(os.path.join(output_dir, f"{base_name}_{i:02d}_{label}{extension}"))
+    return outputs
+
+def trim_ranges(input_path, ranges, output_dir, mode="smart", workers=None):
+    """한 동영상에서 여러 구간을 잘라냅니다. (원본은 한 번만 읽음)
+
+    ranges: [{'start': 초, 'end': 초, 'name': 선택}]
+    Returns:
+        list: 구간별 {'name', 'start', 'end', 'output', 'ok', 'mode', 'copied', 'reencoded', 'error'}
+    """
+    if mode not in TRIM_MODES:
+        raise ValueError(f"알 수 없는 자르기 방식입니다: {mode} ({', '.join(TRIM_MODES)})")
+
+    # 동영상 길이를 벗어나는 구간은 처리하지 않음
+    duration = get_video_duration(input_path)
+    if any(r['end'] is None for r in ranges):
+        import scene_analyzer
+        auto_end = scene_analyzer.content_end(input_path) or duration
+        ranges = [dict(r, end=auto_end) if r['end'] is None else r for r in ranges]
+    invalid = {}
+    for i, r in enumerate(ranges):
+        if r['end'] is None or r['end'] <= r['start']:
+            invalid[i] = "종료 시간(auto)을 정할 수 없습니다."
+        elif duration and (r['start'] >= duration or r['end'] > duration + 0.001):
+            invalid[i] = f"구간이 동영상 길이({format_time(duration)})를 벗어납니다."
+
+    os.makedirs(output_dir, exist_ok=True)
+    outputs = clip_output_paths(input_path, ranges, output_dir, mode)
+    workers = workers or parallel_encoder.default_workers()
+    valid = [i for i in range(len(ranges)) if i not in invalid]
+    results = [{'ok': False, 'error': invalid[i]} if i in invalid else None for i in range(len(ranges))]
+    if valid:
+        valid_ranges = [ranges[i] for i in valid]
+        valid_outputs = [outputs[i] for i in valid]
+        if mode == "smart":
+            processed = _smart_ranges(input_path, valid_ranges, valid_outputs, workers)
+        elif mode == "copy":
+            processed = _copy_ranges(input_path, valid_ranges, valid_outputs)
+        else:
+            processed = _reencode_ranges(input_path, valid_ranges, valid_outputs)
+        for i, result in zip(valid, processed):
+            results[i] = result
+
+    for r, output_path, result in zip(ranges, outputs, results):
+        result.update({'name': r.get('name'), 'start': r['start'], 'end': r['end'], 'output': output_path})
+    return results
+
+def parse_ranges(lines):
+    """구간 목록 해석: "시작 끝 [이름]" 문자열, [시작, 끝, 이름] 목록, {'start', 'end', 'name'} 모두 지원
+
+    끝을 auto로 쓰면 'end'는 None (trim_ranges에서 정지 꼬리 앞 또는 동영상 끝으로 정함)
+    """
+    ranges = []
+    for line in lines:
+        if isinstance(line, dict):
+            start, end, name = line.get('start'), line.get('end'), line.get('name')
+        elif isinstance(line, (list, tuple)):
+            start, end, name = (list(line) + [None])[:3]
+        else:
+            line = line.split('#', 1)[0].strip()
+            if not line:
+                continue
+            parts = line.split(None, 2)
+            if len(parts) < 2:
+                raise ValueError(f"구간 형식이 올바르지 않습니다: {line} (예: 0:10 0:25 인트로)")
+            start, end, name = (parts + [None])[:3]
+        # 종료 시간이 auto면 정지 꼬리를 뺀 위치까지 (자를 때 장면 분석으로 정함)
+        start = parse_time(str(start))
+        end = None if str(end).lower() == "auto" else parse_time(str(end))
+        if end is not None and end <= start:
+            raise ValueError(f"종료 시간이 시작 시간보다 작거나 같습니다: {format_time(start)} ~ {format_time(end)}")
+        ranges.append({'start': start, 'end': end, 'name': name})
+    return ranges
+
+def load_trim_spec(spec_path):
+    """작업 파일 읽기
+
+    - .txt: 한 줄에 "시작 끝 [이름]" (동영상은 명령행에서 지정)
+    - .json: {"jobs": [{"input": 동영상, "ranges": [...], "mode": "smart", "output_dir": 폴더}]}
+    """
+    with open(spec_path, 'r', encoding='utf-8') as f:
+        if not spec_path.lower().endswith('.json'):
+            return parse_ranges(f.read().splitlines())
+        data = json.load(f)
+
+    jobs = data['jobs'] if isinstance(data, dict) else data
+    for i, job in enumerate(jobs, 1):
+        # 방식 오타("smrt" 등)가 조용히 전체 재인코딩으로 처리되지 않도록 미리 확인
+        if 'mode' in job and job['mode'] not in TRIM_MODES:
+            raise ValueError(f"작업 {i}: 알 수 없는 자르기 방식입니다: {job['mode']} ({', '.join(TRIM_MODES)})")
+        try:
+            job['ranges'] = parse_ranges(job.get('ranges', []))
+        except ValueError as e:
+            raise ValueError(f"작업 {i}: {e}")
+    return jobs
+
+def trim_jobs(jobs, mode="smart", workers=None):
+    """여러 동영상을 동시에 자름 (동영상마다 trim_ranges 한 번)"""
+    workers = workers or parallel_encoder.default_workers()
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+    def run(job):
+        input_path = job['input']
+        base_name = os.path.splitext(os.path.basename(input_path))[0]
+        output_dir = job.get('output_dir') or os.path.join("videos", f"{base_name}_clips_{timestamp}")
+        if not os.path.exists(input_path):
+            return {'input': input_path, 'error': "파일을 찾을 수 없습니다.", 'clips': []}
+        started = time.time()
+        # 동영상 여러 개를 동시에 처리할 때는 동영상 안에서 다시 나누지 않음
+        clips = trim_ranges(input_path, job['ranges'], output_dir, job.get('mode', mode),
+                            workers if len(jobs) == 1 else 1)
+        return {'input': input_path, 'output_dir': output_dir, 'elapsed': time.time() - started, 'clips': clips}
+
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(jobs)))) as executor:
+        return list(executor.map(run, jobs))
+
+def print_trim_report(reports):
+    """여러 구간 자르기 결과 출력"""
+    for report in reports:
+        print(f"\n📹 {report['input']}")
+        if report.get('error'):
+            print(f"   ❌ {report['error']}")
+            continue
+        for clip in report['clips']:
+            end = format_time(clip['end']) if clip['end'] is not None else "auto"
+            label = f"{format_time(clip['start'])} ~ {end}"
+            if clip['ok']:
+                print(f"   ✅ {label} → {os.path.basename(clip['output'])} "
+                      f"(복사 {clip['copied']:.1f}초 / 재인코딩 {clip['reencoded']:.1f}초)")
+            else:
+                print(f"   ❌ {label}: {clip['error']}")
+        succeeded = sum(1 for clip in report['clips'] if clip['ok'])
+        print(f"   📁 {report['output_dir']} ({succeeded}/{len(report['clips'])}개, {report['elapsed']:.1f}초)")
+
+def tail_trim_jobs(video_paths):
+    """정지 꼬리가 있는 동영상만 [0, 추천 종료 시간] 구간 작업으로 만듭니다."""
+    import scene_analyzer
+
+    analyses = scene_analyzer.analyze_many([p for p in video_paths if os.path.exists(p)])
+    jobs = []
+    for video_path in video_paths:
+        analysis = analyses.get(video_path)
+        if not os.path.exists(video_path):
+            print(f"❌ 파일을 찾을 수 없습니다: {video_path}")
+            continue
+        if not analysis or not analysis['static_tail']:
+            print(f"⏭️  {video_path}: 정지 꼬리가 없습니다.")
+            continue
+        jobs.append({
+            'input': video_path,
+            'ranges': [{'start': 0.0, 'end': analysis['content_end'], 'name': "trimmed"}],
+            'output_dir': os.path.dirname(video_path) or "."
+        })
+    return jobs
+
+def run_cli(args):
+    """명령행 모드: 여러 구간 / 여러 동영상 자르기"""
+    options = [a for a in args if a.startswith("--")]
+    values = [a for a in args if not a.startswith("--")]
+    mode = next((v for v in values if v in TRIM_MODES), "smart")
+    values = [v for v in values if v not in TRIM_MODES]
+    workers = None
+    if "--workers" in options:
+        index = args.index("--workers")
+        try:
+            workers = int(args[index + 1])
+        except (IndexError, ValueError):
+            print("❌ --workers 값은 숫자여야 합니다.")
+            return
+        values = [v for v in values if v != args[index + 1]]
+
+    try:
+        if args[0] == "--ranges" and len(values) >= 2:
+            jobs = [{'input': values[0], 'ranges': load_trim_spec(values[1])}]
+        elif args[0] == "--spec" and values:
+            jobs = load_trim_spec(values[0])
+        elif args[0] == "--trim-tail" and values:
+            jobs = tail_trim_jobs(values)
+            if not jobs:
+                return
+        else:
+            print("사용법:")
+            print("  python video_trimmer.py --ranges <동영상> <구간.txt> [smart|copy|reencode]")
+            print("  python video_trimmer.py --spec <작업.json> [smart|copy|reencode] [--workers N]")
+            print("  python video_trimmer.py --trim-tail <동영상...> [smart|copy|reencode]   # 끝의 정지 구간 잘라내기")
+            return
+    except (OSError, ValueError, KeyError) as e:
+        print(f"❌ 작업 파일을 읽을 수 없습니다: {e}")
+        return
+
+    total = sum(len(job['ranges']) for job in jobs)
+    print(f"✂️  동영상 {len(jobs)}개에서 {total}개 구간을 자릅니다. (기본 방식: {mode})")
+    started = time.time()
+    reports = trim_jobs(jobs, mode, workers)
+    print_trim_report(reports)
+    print(f"\n🎉 전체 {time.time() - started:.1f}초 소요")
+
 def main():
+    if len(sys.argv) > 1 and sys.argv[1].startswith("--"):
+        run_cli(sys.argv[1:])
+        return
+
     print("=== 동영상 자르기 도구 ===")
     
     # 동영상 파일 목록 가져오기
@@ -122,6 +691,19 @@ def main():
     else:
         print(f"\n선택된 파일: {selected_file}")
         print("동영상 길이를 가져올 수 없습니다.")
+
+    # 장면 전환 / 정지 꼬리 자동 분석 (종료 시간 추천)
+    import scene_analyzer
+
+    suggested_end = None
+    analysis = scene_analyzer.get_analysis(input_path)
+    if analysis:
+        cuts = ", ".join(format_time(c['time']) for c in analysis['scene_cuts'])
+        print(f"장면 전환: {cuts or '없음'}")
+        if analysis['static_tail']:
+            suggested_end = analysis['content_end']
+            print(f"끝부분 {analysis['static_tail']['duration']:.1f}초가 멈춰 있습니다. "
+                  f"(추천 종료 시간: {format_time(suggested_end)})")
     
     # 시작 시간 입력
     print("\n시작 시간을 입력하세요 (예: 30, 1:30, 0:01:30)")
@@ -138,9 +720,11 @@ def main():
     
     # 종료 시간 입력
     print("종료 시간을 입력하세요 (예: 90, 2:30, 0:02:30)")
+    if suggested_end:
+        print(f"(비워두면 추천 종료 시간 {format_time(suggested_end)} 사용)")
     try:
         end_str = input("종료 시간: ").strip()
-        end_time = parse_time(end_str)
+        end_time = suggested_end if not end_str and suggested_end else parse_time(end_str)
         
         if end_time <= start_time:
             print("❌ 종료 시간이 시작 시간보다 작거나 같습니다.")
@@ -153,9 +737,20 @@ def main():
         print(f"❌ {e}")
         return
     
+    # 자르기 방식 선택
+    print("\n자르기 방식을 선택하세요:")
+    print("1. 스마트 컷 - 정확한 위치, 앞/뒤 일부만 재인코딩 (기본)")
+    print("2. 빠른 복사 - 가장 빠름, 시작 위치가 가까운 키프레임으로 당겨질 수 있음")
+    print("3. 전체 재인코딩 - 정확하지만 느림")
+    mode_choice = input("선택 (1-3, 기본 1): ").strip() or "1"
+    mode = {'1': 'smart', '2': 'copy', '3': 'reencode'}.get(mode_choice, 'smart')
+    
     # 출력 파일명 생성
     base_name = os.path.splitext(selected_file)[0]
     extension = os.path.splitext(selected_file)[1]
+    if mode != "copy":
+        # 재인코딩 조각은 MP4로 만들기 때문에 원본 확장자(.mov, .mkv 등)를 쓰지 않음
+        extension = ".mp4"
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     output_filename = f"{base_name}_trimmed_{timestamp}{extension}"
     output_path = os.path.join("videos", output_filename)
@@ -166,6 +761,7 @@ def main():
     print(f"시작 시간: {format_time(start_time)}")
     print(f"종료 시간: {format_time(end_time)}")
     print(f"잘린 길이: {format_time(end_time - start_time)}")
+    print(f"자르기 방식: {mode}")
     print(f"출력 파일: {output_filename}")
     
     # 확인
@@ -175,7 +771,7 @@ def main():
         return
     
     # 동영상 자르기 실행
-    success = trim_video(input_path, output_path, start_time, end_time)
+    success = trim_video(input_path, output_path, start_time, end_time, mode)
     
     if success:
         print(f"\n🎉 작업 완료!")
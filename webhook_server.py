@@ -11,6 +11,10 @@
 2. config.txt에 콜백 URL 설정: callback_url=http://localhost:8000/webhook
 3. 동영상 생성기 실행
 4. 작업 완료 시 자동으로 알림받고 다운로드
+
+완료/실패 알림을 받은 작업마다 대기열+생성 시간, 알림 도착 지연, 다운로드 시간/속도를
+traces/tasks.jsonl에 기록합니다. (python task_trace.py summary --workflow webhook)
+running 알림을 먼저 받은 작업은 대기열과 생성 시간을 나눠서 기록합니다.
 """
 
 from http.server import HTTPServer, BaseHTTPRequestHandler
@@ -18,9 +22,14 @@ import json
 import threading
 import time
 import os
+from typing import Optional
 import requests
+import task_trace
 
 class WebhookHandler(BaseHTTPRequestHandler):
+    # 작업 ID → running 알림 시각 (완료 알림에서 대기열/생성 시간을 나눌 때 사용)
+    running_at = {}
+
     def do_POST(self):
         if self.path == '/webhook':
             try:
@@ -29,7 +38,10 @@ class WebhookHandler(BaseHTTPRequestHandler):
                 post_data = self.rfile.read(content_length)
                 
                 # JSON 파싱
+                received = time.time()
                 webhook_data = json.loads(post_data.decode('utf-8'))
+                stages = {}
+                download = None
                 
                 print("🔔 웹훅 알림을 받았습니다!")
                 print("=" * 50)
@@ -60,7 +72,9 @@ class WebhookHandler(BaseHTTPRequestHandler):
                         
                         # 자동 다운로드
                         print("\n📥 자동 다운로드를 시작합니다...")
-                        download_video(video_url, task_id)
+                        download = download_video(video_url, task_id)
+                        if download:
+                            stages['download'] = download['elapsed']
                         
                 elif status == "failed":
                     print("❌ 동영상 생성에 실패했습니다.")
@@ -72,6 +86,37 @@ class WebhookHandler(BaseHTTPRequestHandler):
                 print("=" * 50)
                 print()
                 
+                # 단계별 시간 기록 (created_at/updated_at은 API가 준 작업 접수/상태 변경 시각)
+                created_at, updated_at = webhook_data.get('created_at'), webhook_data.get('updated_at')
+                if status == "running":
+                    self.running_at[task_id] = updated_at or received
+                elif status in ("succeeded", "failed"):
+                    running = self.running_at.pop(task_id, None)
+                    if created_at and updated_at:
+                        if running:
+                            stages['queue_wait'] = running - created_at
+                            stages['render'] = updated_at - running
+                        else:
+                            stages['queue_render'] = updated_at - created_at
+                        stages['detect_lag'] = received - updated_at
+                    if download:
+                        status = 'completed'
+                    elif status == "succeeded":
+                        status = 'download_failed'
+                    finished = round(time.time(), 3)
+                    task_trace.write_record(task_trace.task_record(
+                        'webhook', stages,
+                        task_id=task_id,
+                        model=model,
+                        status=status,
+                        started=created_at,
+                        finished=finished,
+                        total=round(finished - created_at, 3) if created_at else None,
+                        download_bytes=download['size_bytes'] if download else None,
+                        download_mbps=round(download['size_bytes'] / (1024 * 1024) / download['elapsed'], 2)
+                        if download and download['elapsed'] else None
+                    ))
+                
                 # 응답 전송
                 self.send_response(200)
                 self.send_header('Content-type', 'application/json')
@@ -136,9 +181,10 @@ class WebhookHandler(BaseHTTPRequestHandler):
         # 기본 로그 메시지 숨기기 (깔끔한 출력을 위해)
         pass
 
-def download_video(video_url: str, task_id: str) -> bool:
-    """동영상 자동 다운로드"""
+def download_video(video_url: str, task_id: str) -> Optional[dict]:
+    """동영상 자동 다운로드 → {'path', 'size_bytes', 'elapsed'} (실패하면 None)"""
     try:
+        started = time.time()
         # 다운로드 폴더 만들기
         if not os.path.exists("videos"):
             os.makedirs("videos")
@@ -161,18 +207,19 @@ def download_video(video_url: str, task_id: str) -> bool:
                 if total_size > 1024 * 1024:  # 1MB마다 표시
                     print(".", end="", flush=True)
         
-        print(f"\n✅ 다운로드 완료!")
+        elapsed = time.time() - started
+        print(f"\n✅ 다운로드 완료! ({elapsed:.1f}초)")
         
         # 파일 크기 표시
         file_size = os.path.getsize(filepath) / (1024 * 1024)
         print(f"📊 파일 크기: {file_size:.1f} MB")
         print(f"📁 저장 위치: {os.path.abspath(filepath)}")
         
-        return True
+        return {'path': filepath, 'size_bytes': os.path.getsize(filepath), 'elapsed': round(elapsed, 3)}
         
     except Exception as e:
         print(f"❌ 다운로드 실패: {e}")
-        return False
+        return None
 
 def main():
     print("🔔 동영상 생성 웹훅 서버")